@@ -0,0 +1,42 @@
+"""Add message history index
+
+Revision ID: 4a6f2b8c9d10
+Revises: dd9e0804ebd1
+Create Date: 2025-02-10 10:12:41.418203
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4a6f2b8c9d10"
+down_revision: Union[str, None] = "dd9e0804ebd1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_message_flow_id_session_id_timestamp"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    if "message" not in inspector.get_table_names():
+        return
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        if INDEX_NAME not in indexes_names:
+            batch_op.create_index(INDEX_NAME, ["flow_id", "session_id", "timestamp"], unique=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    if "message" not in inspector.get_table_names():
+        return
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        if INDEX_NAME in indexes_names:
+            batch_op.drop_index(INDEX_NAME)
@@ -0,0 +1,36 @@
+"""Add mcp_tool_schema column to flow
+
+Revision ID: 5c9e3a7b1d24
+Revises: 4a6f2b8c9d10
+Create Date: 2025-02-17 14:32:08.512907
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c9e3a7b1d24"
+down_revision: Union[str, None] = "4a6f2b8c9d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    with op.batch_alter_table("flow", schema=None) as batch_op:
+        if "mcp_tool_schema" not in column_names:
+            batch_op.add_column(sa.Column("mcp_tool_schema", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    with op.batch_alter_table("flow", schema=None) as batch_op:
+        if "mcp_tool_schema" in column_names:
+            batch_op.drop_column("mcp_tool_schema")
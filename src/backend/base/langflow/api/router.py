@@ -8,6 +8,7 @@ from langflow.api.v1 import (
     files_router,
     flows_router,
     folders_router,
+    jobs_router,
     login_router,
     monitor_router,
     starter_projects_router,
@@ -28,6 +29,7 @@ router_v2 = APIRouter(
 
 router.include_router(chat_router)
 router.include_router(endpoints_router)
+router.include_router(jobs_router)
 router.include_router(validate_router)
 router.include_router(store_router)
 router.include_router(flows_router)
@@ -11,12 +11,13 @@ from sqlalchemy import delete
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.graph.graph.base import Graph
+from langflow.processing.flow_plan import invalidate_flow_plan
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models import User
 from langflow.services.database.models.flow import Flow
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
-from langflow.services.deps import get_session, session_scope
+from langflow.services.deps import get_build_log_service, get_session, session_scope
 from langflow.services.store.utils import get_lf_version_from_pypi
 
 if TYPE_CHECKING:
@@ -281,6 +282,8 @@ def parse_value(value: Any, input_type: str) -> Any:
 
 async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None:
     try:
+        # Buffered rows of this flow would otherwise be written after the flow is gone
+        await get_build_log_service().flush()
         await session.exec(delete(TransactionTable).where(TransactionTable.flow_id == flow_id))
         await session.exec(delete(VertexBuildTable).where(VertexBuildTable.flow_id == flow_id))
         # TODO: Verify if deleting messages is safe in terms of session id relevance
@@ -289,6 +292,7 @@ async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None
         # used elsewhere to search for these messages.
         # await session.exec(delete(MessageTable).where(MessageTable.flow_id == flow_id))
         await session.exec(delete(Flow).where(Flow.id == flow_id))
+        invalidate_flow_plan(flow_id)
     except Exception as e:
         msg = f"Unable to cascade delete flow: ${flow_id}"
         raise RuntimeError(msg, e) from e
@@ -4,6 +4,7 @@ from langflow.api.v1.endpoints import router as endpoints_router
 from langflow.api.v1.files import router as files_router
 from langflow.api.v1.flows import router as flows_router
 from langflow.api.v1.folders import router as folders_router
+from langflow.api.v1.jobs import router as jobs_router
 from langflow.api.v1.login import router as login_router
 from langflow.api.v1.mcp import router as mcp_router
 from langflow.api.v1.monitor import router as monitor_router
@@ -20,6 +21,7 @@ __all__ = [
     "files_router",
     "flows_router",
     "folders_router",
+    "jobs_router",
     "login_router",
     "mcp_router",
     "monitor_router",
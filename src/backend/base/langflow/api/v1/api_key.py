@@ -9,7 +9,7 @@ from langflow.services.auth import utils as auth_utils
 # Assuming you have these methods in your service layer
 from langflow.services.database.models.api_key.crud import create_api_key, delete_api_key, get_api_keys
 from langflow.services.database.models.api_key.model import ApiKeyCreate, UnmaskedApiKeyRead
-from langflow.services.deps import get_settings_service
+from langflow.services.deps import get_auth_service, get_settings_service
 
 router = APIRouter(tags=["APIKey"], prefix="/api_key")
 
@@ -71,6 +71,7 @@ async def save_store_api_key(
         current_user.store_api_key = encrypted
         db.add(current_user)
         await db.commit()
+        get_auth_service().invalidate_user(current_user.id)
 
         response.set_cookie(
             "apikey_tkn_lflw",
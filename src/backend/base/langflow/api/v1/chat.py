@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import time
 import traceback
 import typing
 import uuid
 from typing import TYPE_CHECKING, Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Body, HTTPException
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from loguru import logger
 from sqlmodel import select
@@ -35,16 +35,24 @@ from langflow.api.v1.schemas import (
     VertexBuildResponse,
     VerticesOrderResponse,
 )
-from langflow.events.event_manager import EventManager, create_default_event_manager
+from langflow.events.event_log import BuildEventLog
+from langflow.events.event_manager import EventManager, StreamMode, create_default_event_manager
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.graph.base import Graph
 from langflow.graph.utils import log_vertex_build
 from langflow.schema.message import ErrorMessage
 from langflow.schema.schema import OutputValue
+from langflow.services.auth.utils import get_current_active_user
 from langflow.services.cache.utils import CacheMiss
 from langflow.services.chat.service import ChatService
 from langflow.services.database.models.flow.model import Flow
-from langflow.services.deps import get_chat_service, get_session, get_telemetry_service, session_scope
+from langflow.services.deps import (
+    get_chat_service,
+    get_job_service,
+    get_session,
+    get_telemetry_service,
+    session_scope,
+)
 from langflow.services.telemetry.schema import ComponentPayload, PlaygroundPayload
 
 if TYPE_CHECKING:
@@ -52,6 +60,8 @@ if TYPE_CHECKING:
 
 router = APIRouter(tags=["Chat"])
 
+BUILD_ID_HEADER = "X-Langflow-Build-Id"
+
 
 async def try_running_celery_task(vertex, user_id):
     # Try running the task in celery
@@ -151,8 +161,15 @@ async def build_flow(
     stop_component_id: str | None = None,
     start_component_id: str | None = None,
     log_builds: bool | None = True,
+    stream_mode: StreamMode = "per_token",
+    detached: bool = False,
     current_user: CurrentActiveUser,
 ):
+    """Builds a flow and streams the build events.
+
+    A detached build runs as a job: it keeps going when the client disconnects, and the client can
+    reconnect to its events with the id sent in the `X-Langflow-Build-Id` header.
+    """
     chat_service = get_chat_service()
     telemetry_service = get_telemetry_service()
     if not inputs:
@@ -344,7 +361,6 @@ async def build_flow(
     async def build_vertices(
         vertex_id: str,
         graph: Graph,
-        client_consumed_queue: asyncio.Queue,
         event_manager: EventManager,
     ) -> None:
         build_task = asyncio.create_task(_build_vertex(vertex_id, graph, event_manager))
@@ -358,17 +374,16 @@ async def build_flow(
 
         # send built event or error event
         try:
-            vertex_build_response_json = vertex_build_response.model_dump_json()
-            build_data = json.loads(vertex_build_response_json)
+            # Serialized once, the event manager embeds the JSON as it is
+            build_data = orjson.Fragment(vertex_build_response.model_dump_json())
         except Exception as exc:
             msg = f"Error serializing vertex build response: {exc}"
             raise ValueError(msg) from exc
         event_manager.on_end_vertex(data={"build_data": build_data})
-        await client_consumed_queue.get()
         if vertex_build_response.valid and vertex_build_response.next_vertices_ids:
             tasks = []
             for next_vertex_id in vertex_build_response.next_vertices_ids:
-                task = asyncio.create_task(build_vertices(next_vertex_id, graph, client_consumed_queue, event_manager))
+                task = asyncio.create_task(build_vertices(next_vertex_id, graph, event_manager))
                 tasks.append(task)
             try:
                 await asyncio.gather(*tasks)
@@ -377,7 +392,14 @@ async def build_flow(
                     task.cancel()
                 return
 
-    async def event_generator(event_manager: EventManager, client_consumed_queue: asyncio.Queue) -> None:
+    async def event_generator(event_manager: EventManager, event_log: BuildEventLog) -> None:
+        try:
+            await build_graph_and_run(event_manager)
+        finally:
+            event_manager.flush_tokens()
+            event_log.close()
+
+    async def build_graph_and_run(event_manager: EventManager) -> None:
         try:
             ids, vertices_to_run, graph = await build_graph_and_get_order()
         except Exception as e:
@@ -388,10 +410,9 @@ async def build_flow(
             event_manager.on_error(data=error_message.data)
             raise
         event_manager.on_vertices_sorted(data={"ids": ids, "to_run": vertices_to_run})
-        await client_consumed_queue.get()
         tasks = []
         for vertex_id in ids:
-            task = asyncio.create_task(build_vertices(vertex_id, graph, client_consumed_queue, event_manager))
+            task = asyncio.create_task(build_vertices(vertex_id, graph, event_manager))
             tasks.append(task)
         try:
             await asyncio.gather(*tasks)
@@ -413,39 +434,50 @@ async def build_flow(
             event_manager.on_error(data=error_message.data)
             raise
         event_manager.on_end(data={})
-        await event_manager.queue.put((None, None, time.time))
 
-    async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio.Queue) -> typing.AsyncGenerator:
-        while True:
-            event_id, value, put_time = await queue.get()
-            if value is None:
-                break
-            get_time = time.time()
-            yield value
-            get_time_yield = time.time()
-            client_consumed_queue.put_nowait(event_id)
-            logger.debug(
-                f"consumed event {event_id} "
-                f"(time in queue, {get_time - put_time:.4f}, "
-                f"client {get_time_yield - get_time:.4f})"
-            )
+    # The build writes into the log at its own pace, the response reads from it at the client's pace
+    event_log = BuildEventLog(flow_id=str(flow_id))
+    event_manager = create_default_event_manager(queue=event_log, stream_mode=stream_mode)
+    on_disconnect: typing.Callable | None = None
+    if detached:
+        job = get_job_service().submit(
+            lambda: event_generator(event_manager, event_log),
+            flow_id=str(flow_id),
+            user_id=str(current_user.id),
+            event_log=event_log,
+        )
+        build_id = job.id
+    else:
+        build_id = str(uuid.uuid4())
+        main_task = asyncio.create_task(event_generator(event_manager, event_log))
 
-    asyncio_queue: asyncio.Queue = asyncio.Queue()
-    asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
-    event_manager = create_default_event_manager(queue=asyncio_queue)
-    main_task = asyncio.create_task(event_generator(event_manager, asyncio_queue_client_consumed))
+        def on_disconnect() -> None:
+            logger.debug("Client disconnected, closing tasks")
+            main_task.cancel()
 
-    def on_disconnect() -> None:
-        logger.debug("Client disconnected, closing tasks")
-        main_task.cancel()
+    chat_service.build_event_logs.add(build_id, event_log)
 
     return DisconnectHandlerStreamingResponse(
-        consume_and_yield(asyncio_queue, asyncio_queue_client_consumed),
+        event_log.subscribe(),
         media_type="application/x-ndjson",
+        headers={BUILD_ID_HEADER: build_id},
         on_disconnect=on_disconnect,
     )
 
 
+@router.get("/build/{flow_id}/events/{build_id}", dependencies=[Depends(get_current_active_user)])
+async def get_build_events(flow_id: uuid.UUID, build_id: str, after_seq: int = -1):
+    """Replays the events of a build that come after `after_seq`, then follows the build until it ends.
+
+    Reconnecting does not restart the build. The id of a build is sent in the `X-Langflow-Build-Id`
+    header of the response of `POST /build/{flow_id}/flow`, and every event carries its `seq`.
+    """
+    event_log = get_chat_service().build_event_logs.get(build_id)
+    if event_log is None or event_log.flow_id != str(flow_id):
+        raise HTTPException(status_code=404, detail="Build not found")
+    return StreamingResponse(event_log.subscribe(after=after_seq), media_type="application/x-ndjson")
+
+
 class DisconnectHandlerStreamingResponse(StreamingResponse):
     def __init__(
         self,
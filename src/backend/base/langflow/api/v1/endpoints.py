@@ -7,28 +7,32 @@ from http import HTTPStatus
 from typing import TYPE_CHECKING, Annotated
 from uuid import UUID
 
+import orjson
 import sqlalchemy as sa
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Request, UploadFile, status
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from loguru import logger
 from sqlmodel import select
 
 from langflow.api.utils import CurrentActiveUser, DbSession, parse_value
 from langflow.api.v1.schemas import (
+    BatchRunRequest,
+    BatchRunResponse,
     ConfigResponse,
     CustomComponentRequest,
     CustomComponentResponse,
     InputValueRequest,
     RunResponse,
     SimplifiedAPIRequest,
+    TaskStatsResponse,
     TaskStatusResponse,
     UpdateCustomComponentRequest,
     UploadFileResponse,
 )
 from langflow.custom.custom_component.component import Component
 from langflow.custom.utils import build_custom_component_template, get_instance_name, update_component_build_config
-from langflow.events.event_manager import create_stream_tokens_event_manager
+from langflow.events.event_manager import StreamMode, create_stream_tokens_event_manager
 from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.exceptions.serialization import SerializationError
 from langflow.graph.graph.base import Graph
@@ -36,17 +40,26 @@ from langflow.graph.schema import RunOutputs
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
-from langflow.processing.process import process_tweaks, run_graph_internal
+from langflow.processing.flow_plan import FlowPlan, get_flow_plan_cache
+from langflow.processing.process import process_tweaks, run_graph_batch_internal, run_graph_internal
 from langflow.schema.graph import Tweaks
+from langflow.serialization import serialize_json
 from langflow.services.auth.utils import api_key_security, get_current_active_user
 from langflow.services.cache.utils import save_uploaded_file
 from langflow.services.database.models.flow import Flow
 from langflow.services.database.models.flow.model import FlowRead
 from langflow.services.database.models.flow.utils import get_all_webhook_components_in_flow
 from langflow.services.database.models.user.model import User, UserRead
-from langflow.services.deps import get_session_service, get_settings_service, get_task_service, get_telemetry_service
+from langflow.services.deps import (
+    get_session_service,
+    get_settings_service,
+    get_task_service,
+    get_telemetry_service,
+    get_webhook_queue_service,
+)
 from langflow.services.settings.feature_flags import FEATURE_FLAGS
 from langflow.services.telemetry.schema import RunPayload
+from langflow.services.webhook_queue.service import WebhookQueueFullError
 from langflow.utils.version import get_version_info
 
 if TYPE_CHECKING:
@@ -57,15 +70,25 @@ router = APIRouter(tags=["Base"])
 
 
 @router.get("/all", dependencies=[Depends(get_current_active_user)])
-async def get_all():
-    from langflow.interface.components import get_and_cache_all_types_dict
+async def get_all(request: Request) -> Response:
+    """Returns the templates of all components, serialized and compressed once per set of components."""
+    from langflow.interface.components import get_and_cache_all_types_catalog
 
     try:
-        return await get_and_cache_all_types_dict(settings_service=get_settings_service())
+        catalog = await get_and_cache_all_types_catalog(settings_service=get_settings_service())
 
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
+    headers = {"ETag": catalog.etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+    if catalog.matches(request.headers.get("if-none-match")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    encoding = catalog.negotiate(request.headers.get("accept-encoding"))
+    if encoding is None:
+        return Response(catalog.body, media_type="application/json", headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(catalog.encodings[encoding], media_type="application/json", headers=headers)
+
 
 def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
     # If the input_value is not None and the input_type is "chat"
@@ -99,6 +122,35 @@ def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
             raise InvalidChatInputError(msg)
 
 
+def get_output_ids(graph: Graph, input_request: SimplifiedAPIRequest | BatchRunRequest) -> list[str]:
+    """Returns the vertices whose results are returned by a run."""
+    if input_request.output_component:
+        return [input_request.output_component]
+    return [
+        vertex.id
+        for vertex in graph.vertices
+        if input_request.output_type == "debug"
+        or (
+            vertex.is_output and (input_request.output_type == "any" or input_request.output_type in vertex.id.lower())  # type: ignore[operator]
+        )
+    ]
+
+
+def get_flow_plan(flow: Flow, tweaks: Tweaks | None, *, stream: bool = False) -> FlowPlan:
+    """Returns the compiled plan of the flow's current version."""
+    if flow.data is None:
+        msg = f"Flow {flow.id} has no data"
+        raise ValueError(msg)
+    return get_flow_plan_cache().get_or_build(
+        flow_id=str(flow.id),
+        flow_name=flow.name,
+        flow_data=flow.data,
+        updated_at=flow.updated_at,
+        tweaks=tweaks,
+        stream=stream,
+    )
+
+
 async def simple_run_flow(
     flow: Flow,
     input_request: SimplifiedAPIRequest,
@@ -112,12 +164,8 @@ async def simple_run_flow(
         task_result: list[RunOutputs] = []
         user_id = api_key_user.id if api_key_user else None
         flow_id_str = str(flow.id)
-        if flow.data is None:
-            msg = f"Flow {flow_id_str} has no data"
-            raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+        flow_plan = get_flow_plan(flow, input_request.tweaks, stream=stream)
+        graph = flow_plan.instantiate(user_id=str(user_id))
         inputs = None
         if input_request.input_value is not None:
             inputs = [
@@ -127,18 +175,7 @@ async def simple_run_flow(
                     type=input_request.input_type,
                 )
             ]
-        if input_request.output_component:
-            outputs = [input_request.output_component]
-        else:
-            outputs = [
-                vertex.id
-                for vertex in graph.vertices
-                if input_request.output_type == "debug"
-                or (
-                    vertex.is_output
-                    and (input_request.output_type == "any" or input_request.output_type in vertex.id.lower())  # type: ignore[operator]
-                )
-            ]
+        outputs = get_output_ids(graph, input_request)
         task_result, session_id = await run_graph_internal(
             graph=graph,
             flow_id=flow_id_str,
@@ -177,6 +214,12 @@ async def simple_run_flow_task(
         logger.exception(f"Error running flow {flow.id} task")
 
 
+def run_end_event_data(result: RunResponse) -> dict:
+    """Returns the data of the `end` event of a streamed run, holding the whole result like a non-streamed run."""
+    # Encoded in one pass, the event manager embeds the JSON as it is
+    return {"result": orjson.Fragment(serialize_json(result, max_length=None, max_items=None))}
+
+
 async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio.Queue) -> AsyncGenerator:
     """Consumes events from a queue and yields them to the client while tracking timing metrics.
 
@@ -251,7 +294,7 @@ async def run_flow_generator(
             api_key_user=api_key_user,
             event_manager=event_manager,
         )
-        event_manager.on_end(data={"result": result.model_dump()})
+        event_manager.on_end(data=run_end_event_data(result))
         await client_consumed_queue.get()
     except (ValueError, InvalidChatInputError, SerializationError) as e:
         logger.error(f"Error running flow: {e}")
@@ -267,6 +310,7 @@ async def simplified_run_flow(
     flow: Annotated[FlowRead | None, Depends(get_flow_by_id_or_endpoint_name)],
     input_request: SimplifiedAPIRequest | None = None,
     stream: bool = False,
+    stream_mode: StreamMode = "per_token",
     api_key_user: Annotated[UserRead, Depends(api_key_security)],
 ):
     """Executes a specified flow by ID with support for streaming and telemetry.
@@ -279,6 +323,8 @@ async def simplified_run_flow(
         flow (FlowRead | None): The flow to execute, loaded via dependency
         input_request (SimplifiedAPIRequest | None): Input parameters for the flow
         stream (bool): Whether to stream the response
+        stream_mode (StreamMode): When streaming, "per_token" sends one event per token and "coalesced"
+            groups tokens into small frames
         api_key_user (UserRead): Authenticated user from API key
         request (Request): The incoming HTTP request
 
@@ -309,7 +355,7 @@ async def simplified_run_flow(
     if stream:
         asyncio_queue: asyncio.Queue = asyncio.Queue()
         asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
-        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
+        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue, stream_mode=stream_mode)
         main_task = asyncio.create_task(
             run_flow_generator(
                 flow=flow,
@@ -381,6 +427,82 @@ async def simplified_run_flow(
     return result
 
 
+@router.post("/run/batch/{flow_id_or_name}", response_model_exclude_none=True)  # noqa: RUF100, FAST003
+async def batch_run_flow(
+    *,
+    background_tasks: BackgroundTasks,
+    flow: Annotated[FlowRead | None, Depends(get_flow_by_id_or_endpoint_name)],
+    batch_request: BatchRunRequest,
+    api_key_user: Annotated[UserRead, Depends(api_key_security)],
+) -> BatchRunResponse:
+    """Runs a flow once for each of the input values and returns the results in the same order.
+
+    The flow is compiled once and every input runs on its own copy of it, up to `max_concurrency`
+    (bounded by the `batch_run_max_concurrency` setting) at the same time. Components that do not
+    depend on the input are built once and their results are shared by every run. Each input runs
+    in its own session, from `session_ids` or `{session_id}-{index}`, returned in `session_ids`.
+
+    Raises:
+        HTTPException: For flow not found (404) or invalid input (400)
+        APIException: For internal execution errors (500)
+    """
+    telemetry_service = get_telemetry_service()
+    if flow is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Flow not found")
+    start_time = time.perf_counter()
+    max_concurrency = get_settings_service().settings.batch_run_max_concurrency
+    if batch_request.max_concurrency is not None:
+        max_concurrency = min(batch_request.max_concurrency, max_concurrency)
+
+    try:
+        validate_input_and_tweaks(
+            SimplifiedAPIRequest(
+                input_value=batch_request.input_values[0],
+                input_type=batch_request.input_type,
+                tweaks=batch_request.tweaks,
+            )
+        )
+        graph = get_flow_plan(flow, batch_request.tweaks).instantiate(user_id=str(api_key_user.id))
+        outputs, session_ids = await run_graph_batch_internal(
+            graph=graph,
+            flow_id=str(flow.id),
+            session_id=batch_request.session_id,
+            session_ids=batch_request.session_ids,
+            inputs=[
+                InputValueRequest(components=[], input_value=input_value, type=batch_request.input_type)
+                for input_value in batch_request.input_values
+            ],
+            outputs=get_output_ids(graph, batch_request),
+            max_concurrency=max_concurrency,
+        )
+    except InvalidChatInputError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except Exception as exc:
+        background_tasks.add_task(
+            telemetry_service.log_package_run,
+            RunPayload(
+                run_is_webhook=False,
+                run_seconds=int(time.perf_counter() - start_time),
+                run_success=False,
+                run_error_message=str(exc),
+            ),
+        )
+        raise APIException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, exception=exc, flow=flow) from exc
+
+    background_tasks.add_task(
+        telemetry_service.log_package_run,
+        RunPayload(
+            run_is_webhook=False,
+            run_seconds=int(time.perf_counter() - start_time),
+            run_success=True,
+            run_error_message="",
+        ),
+    )
+    return BatchRunResponse(
+        outputs=outputs, session_id=batch_request.session_id or str(flow.id), session_ids=session_ids
+    )
+
+
 @router.post("/webhook/{flow_id_or_name}", response_model=dict, status_code=HTTPStatus.ACCEPTED)  # noqa: RUF100, FAST003
 async def webhook_run_flow(
     flow: Annotated[Flow, Depends(get_flow_by_id_or_endpoint_name)],
@@ -390,6 +512,8 @@ async def webhook_run_flow(
 ):
     """Run a flow using a webhook request.
 
+    The run is stored in the webhook queue and executed by its workers, follow it with `GET /task/{task_id}`.
+
     Args:
         flow (Flow, optional): The flow to be executed. Defaults to Depends(get_flow_by_id).
         user (User): The flow user.
@@ -397,10 +521,11 @@ async def webhook_run_flow(
         background_tasks (BackgroundTasks): The background tasks manager.
 
     Returns:
-        dict: A dictionary containing the status of the task.
+        dict: A dictionary containing the status and the id of the task.
 
     Raises:
-        HTTPException: If the flow is not found or if there is an error processing the request.
+        HTTPException: If the flow is not found, if the webhook queue is full or if there is an error
+            processing the request.
     """
     telemetry_service = get_telemetry_service()
     start_time = time.perf_counter()
@@ -432,13 +557,17 @@ async def webhook_run_flow(
                 session_id=None,
             )
 
-            logger.debug("Starting background task")
-            background_tasks.add_task(
-                simple_run_flow_task,
-                flow=flow,
-                input_request=input_request,
-                api_key_user=user,
+            logger.debug("Queueing webhook run")
+            task_id = await get_webhook_queue_service().enqueue(
+                flow_id=str(flow.id),
+                user_id=str(user.id),
+                payload=input_request.model_dump_json(),
             )
+        except WebhookQueueFullError as exc:
+            error_msg = str(exc)
+            raise HTTPException(
+                status_code=HTTPStatus.TOO_MANY_REQUESTS, detail=error_msg, headers={"Retry-After": "1"}
+            ) from exc
         except Exception as exc:
             error_msg = str(exc)
             raise HTTPException(status_code=500, detail=error_msg) from exc
@@ -453,7 +582,7 @@ async def webhook_run_flow(
             ),
         )
 
-    return {"message": "Task started in the background", "status": "in progress"}
+    return {"message": "Task started in the background", "status": "in progress", "task_id": task_id}
 
 
 @router.post(
@@ -599,10 +728,17 @@ async def process() -> None:
     )
 
 
+@router.get("/task/stats", dependencies=[Depends(get_current_active_user)])
+async def get_task_stats() -> TaskStatsResponse:
+    """Returns the number of queued and running background tasks and their recent latencies."""
+    return TaskStatsResponse(**get_task_service().get_stats())
+
+
 @router.get("/task/{task_id}")
 async def get_task_status(task_id: str) -> TaskStatusResponse:
-    task_service = get_task_service()
-    task = task_service.get_task(task_id)
+    task = await get_webhook_queue_service().get_task(task_id)
+    if task is None:
+        task = get_task_service().get_task(task_id)
     result = None
     if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
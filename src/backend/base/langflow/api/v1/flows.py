@@ -20,6 +20,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
 from langflow.api.v1.schemas import FlowListCreate
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
+from langflow.processing.flow_plan import invalidate_flow_plan
 from langflow.services.database.models.flow import Flow, FlowCreate, FlowRead, FlowUpdate
 from langflow.services.database.models.flow.model import FlowHeader
 from langflow.services.database.models.flow.utils import get_webhook_component_in_flow
@@ -295,6 +296,7 @@ async def update_flow(
         session.add(db_flow)
         await session.commit()
         await session.refresh(db_flow)
+        invalidate_flow_plan(db_flow.id)
 
     except Exception as e:
         if "UNIQUE constraint failed" in str(e):
@@ -442,7 +444,7 @@ async def download_multiple_file(
     if not flows:
         raise HTTPException(status_code=404, detail="No flows found.")
 
-    flows_without_api_keys = [remove_api_keys(flow.model_dump()) for flow in flows]
+    flows_without_api_keys = [remove_api_keys(flow.model_dump(exclude={"mcp_tool_schema"})) for flow in flows]
 
     if len(flows_without_api_keys) > 1:
         # Create a byte stream to hold the ZIP file
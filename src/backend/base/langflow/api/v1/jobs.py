@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Annotated
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+
+from langflow.api.v1.endpoints import run_end_event_data, simple_run_flow, validate_input_and_tweaks
+from langflow.api.v1.schemas import JobResponse, RunResponse, SimplifiedAPIRequest
+from langflow.events.event_log import BuildEventLog
+from langflow.events.event_manager import StreamMode, create_stream_tokens_event_manager
+from langflow.exceptions.api import InvalidChatInputError
+from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
+from langflow.services.auth.utils import api_key_security
+from langflow.services.database.models.flow.model import FlowRead
+from langflow.services.database.models.user.model import UserRead
+from langflow.services.deps import get_job_service
+from langflow.services.job.service import Job
+
+if TYPE_CHECKING:
+    from langflow.events.event_manager import EventManager
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+def _to_datetime(timestamp: float | None) -> datetime | None:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp is not None else None
+
+
+def job_response(job: Job) -> JobResponse:
+    return JobResponse(
+        job_id=job.id,
+        flow_id=job.flow_id,
+        status=job.status,
+        result=job.result if isinstance(job.result, RunResponse) else None,
+        error=job.error,
+        created_at=_to_datetime(job.created_at),
+        finished_at=_to_datetime(job.finished_at),
+        last_seq=job.event_log.last_seq,
+    )
+
+
+def get_user_job(job_id: str, api_key_user: Annotated[UserRead, Depends(api_key_security)]) -> Job:
+    job = get_job_service().get(job_id, user_id=str(api_key_user.id))
+    if job is None:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Job not found")
+    return job
+
+
+async def run_flow_job(
+    flow: FlowRead,
+    input_request: SimplifiedAPIRequest,
+    api_key_user: UserRead,
+    event_manager: EventManager,
+) -> RunResponse:
+    """Runs a flow for a job, sending the same events as a streamed run."""
+    try:
+        result = await simple_run_flow(
+            flow=flow,
+            input_request=input_request,
+            stream=True,
+            api_key_user=api_key_user,
+            event_manager=event_manager,
+        )
+    except Exception as exc:
+        event_manager.on_error(data={"error": str(exc)})
+        raise
+    event_manager.on_end(data=run_end_event_data(result))
+    return result
+
+
+@router.post("/run/{flow_id_or_name}", status_code=HTTPStatus.ACCEPTED)  # noqa: RUF100, FAST003
+async def create_run_job(
+    *,
+    flow: Annotated[FlowRead | None, Depends(get_flow_by_id_or_endpoint_name)],
+    input_request: SimplifiedAPIRequest | None = None,
+    stream_mode: StreamMode = "per_token",
+    api_key_user: Annotated[UserRead, Depends(api_key_security)],
+) -> JobResponse:
+    """Starts a run of a flow that keeps going when the client disconnects.
+
+    The run is queued when `max_concurrent_jobs` jobs are already running. Follow its events with
+    `GET /jobs/{job_id}/events` or poll `GET /jobs/{job_id}` for its result.
+    """
+    if flow is None:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Flow not found")
+    input_request = input_request if input_request is not None else SimplifiedAPIRequest()
+    try:
+        validate_input_and_tweaks(input_request)
+    except InvalidChatInputError as exc:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(exc)) from exc
+
+    event_log = BuildEventLog(flow_id=str(flow.id))
+    event_manager = create_stream_tokens_event_manager(queue=event_log, stream_mode=stream_mode)
+    job = get_job_service().submit(
+        lambda: run_flow_job(flow, input_request, api_key_user, event_manager),
+        flow_id=str(flow.id),
+        user_id=str(api_key_user.id),
+        event_log=event_log,
+    )
+    return job_response(job)
+
+
+@router.get("/{job_id}")
+async def get_job(job: Annotated[Job, Depends(get_user_job)]) -> JobResponse:
+    """Returns the status of a job, with its result once it completed."""
+    return job_response(job)
+
+
+@router.get("/{job_id}/events")
+async def get_job_events(job: Annotated[Job, Depends(get_user_job)], after_seq: int = -1):
+    """Streams the events of a job that come after `after_seq`, then follows the job until it ends.
+
+    Disconnecting does not stop the job, reconnect with the `seq` of the last event received.
+    """
+    return StreamingResponse(job.event_log.subscribe(after=after_seq), media_type="text/event-stream")
+
+
+@router.delete("/{job_id}")
+async def cancel_job(job: Annotated[Job, Depends(get_user_job)]) -> JobResponse:
+    """Cancels a job that is queued or running."""
+    await get_job_service().cancel(job)
+    return job_response(job)
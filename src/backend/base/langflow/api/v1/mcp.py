@@ -17,11 +17,12 @@ from mcp import types
 from mcp.server import NotificationOptions, Server
 from mcp.server.sse import SseServerTransport
 from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.background import BackgroundTasks
 
 from langflow.api.v1.chat import build_flow
 from langflow.api.v1.schemas import InputValueRequest
-from langflow.helpers.flow import json_schema_from_flow
+from langflow.helpers.flow import json_schema_from_flow_data
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models import Flow, User
 from langflow.services.deps import get_db_service, get_session, get_settings_service, get_storage_service
@@ -149,23 +150,41 @@ async def handle_read_resource(uri: str) -> bytes:
         raise
 
 
+async def get_missing_tool_schemas(session: AsyncSession, flow_ids: list[UUID]) -> dict[UUID, dict]:
+    """Computes and stores the tool schemas of flows saved before schemas were stored with the flows."""
+    if not flow_ids:
+        return {}
+    schemas = {}
+    flows = (await session.exec(select(Flow).where(Flow.id.in_(flow_ids)))).all()  # type: ignore[attr-defined]
+    for flow in flows:
+        try:
+            schemas[flow.id] = flow.mcp_tool_schema = json_schema_from_flow_data(flow.data)
+        except Exception:  # noqa: BLE001
+            logger.warning("Could not compute the input schema of flow %s, it is not listed as a tool", flow.id)
+            continue
+        session.add(flow)
+    await session.commit()
+    return schemas
+
+
 @server.list_tools()
 async def handle_list_tools():
     tools = []
     try:
         session = await anext(get_session())
-        flows = (await session.exec(select(Flow))).all()
+        current_user = current_user_ctx.get()
+        # Only the columns of the tools are read, the data of the flows holds their whole graph
+        stmt = select(Flow.id, Flow.name, Flow.description, Flow.mcp_tool_schema).where(Flow.user_id == current_user.id)
+        flows = (await session.exec(stmt)).all()
+        schemas = await get_missing_tool_schemas(session, [flow_id for flow_id, *_, schema in flows if schema is None])
 
-        for flow in flows:
-            if flow.user_id is None:
+        for flow_id, name, description, schema in flows:
+            if schema is None and flow_id not in schemas:
                 continue
-
             tool = types.Tool(
-                name=str(flow.id),  # Use flow.id instead of name
-                description=f"{flow.name}: {flow.description}"
-                if flow.description
-                else f"Tool generated from flow: {flow.name}",
-                inputSchema=json_schema_from_flow(flow),
+                name=str(flow_id),  # Use flow.id instead of name
+                description=f"{name}: {description}" if description else f"Tool generated from flow: {name}",
+                inputSchema=schema if schema is not None else schemas[flow_id],
             )
             tools.append(tool)
     except Exception as e:
@@ -1,7 +1,7 @@
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlmodel import paginate
 from sqlalchemy import delete
@@ -10,6 +10,11 @@ from sqlmodel import col, select
 from langflow.api.utils import DbSession, custom_params
 from langflow.schema.message import MessageResponse
 from langflow.services.auth.utils import get_current_active_user
+from langflow.services.database.models.message.crud import (
+    decode_message_cursor,
+    encode_message_cursor,
+    paginate_messages,
+)
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
 from langflow.services.database.models.transactions.crud import transform_transaction_table
 from langflow.services.database.models.transactions.model import TransactionTable
@@ -18,6 +23,7 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.deps import get_build_log_service
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
@@ -25,6 +31,7 @@ router = APIRouter(prefix="/monitor", tags=["Monitor"])
 @router.get("/builds")
 async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
     try:
+        await get_build_log_service().flush()
         vertex_builds = await get_vertex_builds_by_flow_id(session, flow_id)
         return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
     except Exception as e:
@@ -34,6 +41,7 @@ async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSessio
 @router.delete("/builds", status_code=204)
 async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> None:
     try:
+        await get_build_log_service().flush()
         await delete_vertex_builds_by_flow_id(session, flow_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -42,12 +50,28 @@ async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSes
 @router.get("/messages")
 async def get_messages(
     session: DbSession,
+    response: Response,
     flow_id: Annotated[UUID | None, Query()] = None,
     session_id: Annotated[str | None, Query()] = None,
     sender: Annotated[str | None, Query()] = None,
     sender_name: Annotated[str | None, Query()] = None,
     order_by: Annotated[str | None, Query()] = "timestamp",
+    order: Annotated[Literal["ASC", "DESC"], Query()] = "ASC",
+    limit: Annotated[int | None, Query(ge=1)] = None,
+    cursor: Annotated[str | None, Query()] = None,
 ) -> list[MessageResponse]:
+    """Returns the messages matching the filters.
+
+    When ordering by timestamp, pass `limit` to page through the history: the cursor for the next
+    page is returned in the `X-Next-Cursor` header and is absent on the last page.
+    """
+    if cursor:
+        if order_by != "timestamp":
+            raise HTTPException(status_code=400, detail="Cursor pagination requires ordering by timestamp")
+        try:
+            decode_message_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
     try:
         stmt = select(MessageTable)
         if flow_id:
@@ -58,10 +82,16 @@ async def get_messages(
             stmt = stmt.where(MessageTable.sender == sender)
         if sender_name:
             stmt = stmt.where(MessageTable.sender_name == sender_name)
-        if order_by:
-            col = getattr(MessageTable, order_by).asc()
-            stmt = stmt.order_by(col)
-        messages = await session.exec(stmt)
+        if order_by == "timestamp" and (limit or cursor):
+            stmt = paginate_messages(stmt, cursor, descending=order == "DESC")
+        elif order_by:
+            col = getattr(MessageTable, order_by)
+            stmt = stmt.order_by(col.desc() if order == "DESC" else col.asc())
+        if limit:
+            stmt = stmt.limit(limit)
+        messages = list(await session.exec(stmt))
+        if limit and len(messages) == limit and order_by == "timestamp":
+            response.headers["X-Next-Cursor"] = encode_message_cursor(messages[-1])
         return [MessageResponse.model_validate(d, from_attributes=True) for d in messages]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -165,6 +195,7 @@ async def get_transactions(
     params: Annotated[Params | None, Depends(custom_params)],
 ) -> Page[TransactionTable]:
     try:
+        await get_build_log_service().flush()
         stmt = (
             select(TransactionTable)
             .where(TransactionTable.flow_id == flow_id)
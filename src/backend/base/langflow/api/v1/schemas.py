@@ -4,7 +4,15 @@ from pathlib import Path
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator, model_serializer
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_serializer,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
 
 from langflow.graph.schema import RunOutputs
 from langflow.schema import dotdict
@@ -83,6 +91,20 @@ class PreloadResponse(BaseModel):
     is_clear: bool | None = None
 
 
+class JobResponse(BaseModel):
+    """Status of a detached run or build, with its result once it completed."""
+
+    job_id: str
+    flow_id: str
+    status: str
+    result: RunResponse | None = None
+    error: str | None = None
+    created_at: datetime
+    finished_at: datetime | None = None
+    last_seq: int = -1
+    """Sequence number of the last event the job sent."""
+
+
 class TaskStatusResponse(BaseModel):
     """Task status response schema."""
 
@@ -90,6 +112,19 @@ class TaskStatusResponse(BaseModel):
     result: Any | None = None
 
 
+class TaskStatsResponse(BaseModel):
+    """Load of the task service. The fields the backend does not track are None."""
+
+    backend: str
+    queue_depth: int | None = None
+    running: int | None = None
+    results: int | None = None
+    queue_latency: float | None = None
+    """Average seconds the recent tasks waited for a worker."""
+    run_latency: float | None = None
+    """Average seconds the recent tasks ran."""
+
+
 class ChatMessage(BaseModel):
     """Chat message schema."""
 
@@ -357,6 +392,44 @@ class SimplifiedAPIRequest(BaseModel):
     session_id: str | None = Field(default=None, description="The session id")
 
 
+class BatchRunRequest(BaseModel):
+    input_values: list[str] = Field(min_length=1, description="The input value of each run")
+    input_type: InputType | None = Field(default="chat", description="The input type")
+    output_type: OutputType | None = Field(default="chat", description="The output type")
+    output_component: str | None = Field(
+        default="",
+        description="If there are multiple output components, you can specify the component to get the output from.",
+    )
+    tweaks: Tweaks | None = Field(default=None, description="The tweaks")
+    session_id: str | None = Field(
+        default=None,
+        description="The session id the session of each run derives from, as '{session_id}-{index}'",
+    )
+    session_ids: list[str] | None = Field(default=None, description="The session id of each run")
+    max_concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        description="The maximum number of inputs run at the same time, up to the server's limit.",
+    )
+
+    @model_validator(mode="after")
+    def validate_session_ids(self):
+        if self.session_ids is not None and len(self.session_ids) != len(self.input_values):
+            msg = "session_ids must have one session id per input value"
+            raise ValueError(msg)
+        return self
+
+
+class BatchRunResponse(RunResponse):
+    """Batch run response schema."""
+
+    session_ids: list[str] = []
+
+    @model_serializer(mode="plain")
+    def serialize(self):
+        return {**super().serialize(), "session_ids": self.session_ids}
+
+
 # (alias) type ReactFlowJsonObject<NodeData = any, EdgeData = any> = {
 #     nodes: Node<NodeData>[];
 #     edges: Edge<EdgeData>[];
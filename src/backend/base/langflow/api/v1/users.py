@@ -17,7 +17,7 @@ from langflow.services.auth.utils import (
 )
 from langflow.services.database.models.user import User, UserCreate, UserRead, UserUpdate
 from langflow.services.database.models.user.crud import get_user_by_id, update_user
-from langflow.services.deps import get_settings_service
+from langflow.services.deps import get_auth_service, get_settings_service
 
 router = APIRouter(tags=["Users"], prefix="/users")
 
@@ -118,6 +118,7 @@ async def reset_password(
     new_password = get_password_hash(user_update.password)
     user.password = new_password
     await session.commit()
+    get_auth_service().invalidate_user(user.id)
     await session.refresh(user)
 
     return user
@@ -142,5 +143,6 @@ async def delete_user(
 
     await session.delete(user_db)
     await session.commit()
+    get_auth_service().invalidate_user(user_id)
 
     return {"detail": "User deleted"}
@@ -0,0 +1,277 @@
+"""A disk-backed cache for the embeddings computed by vector store components.
+
+Vectors are stored per embedding model as a memory-mapped float32 array, next to the
+hashes of the texts they were computed from, so ingesting the same documents again
+only embeds the ones that were not seen before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import orjson
+from filelock import FileLock
+from langchain_core.embeddings import Embeddings
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+KEY_SIZE = 32
+# Random bytes at the start of the keys file, replaced each time a full store starts over
+GENERATION_SIZE = 16
+# Attributes that name the model behind an Embeddings instance, credentials excluded
+MODEL_NAME_ATTRIBUTES = (
+    "model",
+    "model_name",
+    "model_id",
+    "repo_id",
+    "model_path",
+    "deployment",
+    "base_url",
+    "openai_api_base",
+    "azure_endpoint",
+    "endpoint_url",
+)
+# Attributes that change the vectors of a model
+MODEL_OPTION_ATTRIBUTES = ("dimensions", "task_type")
+
+
+def embedding_model_identity(embeddings: Embeddings) -> str | None:
+    """Returns a string identifying the model an Embeddings instance computes vectors with.
+
+    Returns None when the instance has none of the attributes that name its model, since
+    instances of the same class could then compute different vectors.
+    """
+    cls = type(embeddings)
+    identity: dict[str, str] = {}
+    for name in MODEL_NAME_ATTRIBUTES:
+        value = getattr(embeddings, name, None)
+        if value is not None:
+            identity[name] = str(value)
+    if not identity:
+        return None
+    for name in MODEL_OPTION_ATTRIBUTES:
+        value = getattr(embeddings, name, None)
+        if value is not None:
+            identity[name] = str(value)
+    identity["class"] = f"{cls.__module__}.{cls.__qualname__}"
+    return orjson.dumps(identity, option=orjson.OPT_SORT_KEYS).decode()
+
+
+class EmbeddingStore:
+    """Append-only store of the vectors computed by one embedding model.
+
+    The store is a directory with the raw sha256 digests of the embedded texts (`keys.bin`)
+    and a float32 array with one row per key (`vectors.f32`). Rows are read through a memory
+    map and appended under a file lock, so several workers can share the same directory.
+
+    When appending would make the files larger than `max_bytes`, the store starts over with
+    empty files. They are replaced rather than truncated, so workers keep reading the rows they
+    have mapped, and the keys file starts with a random generation that tells them to reload.
+    """
+
+    def __init__(self, path: Path, identity: str, max_bytes: int = 0) -> None:
+        self.path = path
+        self.identity = identity
+        self.max_bytes = max_bytes
+        self.dimensions: int | None = None
+        self._keys_path = path / "keys.bin"
+        self._vectors_path = path / "vectors.f32"
+        self._meta_path = path / "meta.json"
+        self._file_lock = FileLock(path / "store.lock")
+        self._lock = threading.Lock()
+        self._generation: bytes | None = None
+        self._rows: dict[bytes, int] = {}
+        self._vectors: np.memmap | None = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get_many(self, keys: Sequence[bytes]) -> dict[bytes, list[float]]:
+        """Returns the stored vectors for the keys that are in the store."""
+        with self._lock:
+            if self._has_new_rows():
+                with self._file_lock:
+                    self._sync()
+            rows = {key: self._rows[key] for key in keys if key in self._rows}
+            if not rows or self._vectors is None:
+                return {}
+            return {key: self._vectors[row].tolist() for key, row in rows.items()}
+
+    def add_many(self, keys: Sequence[bytes], vectors: Sequence[Sequence[float]]) -> None:
+        """Stores the vectors of the keys that are not in the store yet."""
+        if not keys:
+            return
+        array = np.asarray(vectors, dtype=np.float32)
+        if array.ndim != 2 or array.shape[0] != len(keys):  # noqa: PLR2004
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._file_lock:
+            self._sync()
+            if self.dimensions is None:
+                self.dimensions = int(array.shape[1])
+                self._meta_path.write_bytes(orjson.dumps({"identity": self.identity, "dimensions": self.dimensions}))
+            elif array.shape[1] != self.dimensions:
+                logger.warning(
+                    f"Not caching {array.shape[1]}-dimensional embeddings in a {self.dimensions}-dimensional store"
+                )
+                return
+            new_rows: dict[bytes, int] = {}
+            for index, key in enumerate(keys):
+                if key not in self._rows and key not in new_rows:
+                    new_rows[key] = index
+            if not new_rows:
+                return
+            added_bytes = len(new_rows) * (KEY_SIZE + array.shape[1] * array.itemsize)
+            if self.max_bytes and GENERATION_SIZE + added_bytes > self.max_bytes:
+                logger.debug(f"Not caching {len(new_rows)} embeddings larger than the embedding cache")
+                return
+            if self._generation is None or (self.max_bytes and self._size() + added_bytes > self.max_bytes):
+                self._start_over()
+            # Vectors are written before their keys so that a key always has a vector
+            with self._vectors_path.open("ab") as vectors_file:
+                vectors_file.write(array[list(new_rows.values())].tobytes())
+            with self._keys_path.open("ab") as keys_file:
+                keys_file.write(b"".join(new_rows))
+            self._sync()
+
+    def _size(self) -> int:
+        return sum(path.stat().st_size for path in (self._keys_path, self._vectors_path) if path.exists())
+
+    def _start_over(self) -> None:
+        """Replaces the files of the store with empty ones of a new generation, under the file lock."""
+        for target, content in ((self._vectors_path, b""), (self._keys_path, os.urandom(GENERATION_SIZE))):
+            temporary = target.with_suffix(".tmp")
+            temporary.write_bytes(content)
+            temporary.replace(target)
+        self._sync()
+
+    def _row_count(self) -> int:
+        if self.dimensions is None or not self._keys_path.exists() or not self._vectors_path.exists():
+            return 0
+        row_size = self.dimensions * np.dtype(np.float32).itemsize
+        keys_size = max(self._keys_path.stat().st_size - GENERATION_SIZE, 0)
+        return min(keys_size // KEY_SIZE, self._vectors_path.stat().st_size // row_size)
+
+    def _has_new_rows(self) -> bool:
+        if self.dimensions is None:
+            return self._meta_path.exists()
+        return self._row_count() > len(self._rows)
+
+    def _sync(self) -> None:
+        """Loads the keys and vectors appended since the last call, by this or another worker.
+
+        Must be called with the file lock held.
+        """
+        if self.dimensions is None:
+            if not self._meta_path.exists():
+                return
+            self.dimensions = orjson.loads(self._meta_path.read_bytes())["dimensions"]
+        if not self._keys_path.exists():
+            return
+        with self._keys_path.open("rb") as keys_file:
+            generation = keys_file.read(GENERATION_SIZE)
+            if generation != self._generation:
+                # The store started over, the rows loaded so far are gone
+                self._generation = generation
+                self._rows = {}
+                self._vectors = None
+            count = self._row_count()
+            if count <= len(self._rows):
+                return
+            keys_file.seek(GENERATION_SIZE + len(self._rows) * KEY_SIZE)
+            new_keys = keys_file.read((count - len(self._rows)) * KEY_SIZE)
+        start = len(self._rows)
+        for offset in range(0, len(new_keys), KEY_SIZE):
+            self._rows.setdefault(new_keys[offset : offset + KEY_SIZE], start + offset // KEY_SIZE)
+        self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(count, self.dimensions))
+
+
+_stores: dict[Path, EmbeddingStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_embedding_store(embeddings: Embeddings, cache_dir: str | Path, max_bytes: int = 0) -> EmbeddingStore | None:
+    """Returns the store shared by every Embeddings instance of the same model.
+
+    Returns None when the model of the instance cannot be identified, see `embedding_model_identity`.
+    """
+    identity = embedding_model_identity(embeddings)
+    if identity is None:
+        return None
+    path = Path(cache_dir) / hashlib.sha256(identity.encode()).hexdigest()[:32]
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = EmbeddingStore(path, identity, max_bytes)
+        _stores[path].max_bytes = max_bytes
+        return _stores[path]
+
+
+class CachedEmbeddings(Embeddings):
+    """Wraps an Embeddings instance to reuse the vectors of texts it has already embedded.
+
+    Documents and queries are cached separately because some models embed them differently.
+    Texts repeated within a call are embedded once.
+    """
+
+    def __init__(self, embeddings: Embeddings, store: EmbeddingStore) -> None:
+        self.embeddings = embeddings
+        self.store = store
+
+    def __getattr__(self, name: str):
+        if name in {"embeddings", "store"}:
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    @staticmethod
+    def _key(kind: str, text: str) -> bytes:
+        return hashlib.sha256(f"{kind}\0{text}".encode()).digest()
+
+    def _missing(self, kind: str, texts: list[str]) -> tuple[list[bytes], dict[bytes, list[float]], dict[bytes, str]]:
+        keys = [self._key(kind, text) for text in texts]
+        found = self.store.get_many(keys)
+        missing: dict[bytes, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in found:
+                missing.setdefault(key, text)
+        return keys, found, missing
+
+    def _store_missing(self, found: dict, missing: dict[bytes, str], vectors: list[list[float]]) -> None:
+        found.update(zip(missing, vectors, strict=True))
+        try:
+            self.store.add_many(list(missing), vectors)
+        except OSError:
+            logger.opt(exception=True).warning("Could not write to the embedding cache")
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, found, missing = self._missing("document", texts)
+        if missing:
+            self._store_missing(found, missing, self.embeddings.embed_documents(list(missing.values())))
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> list[float]:
+        keys, found, missing = self._missing("query", [text])
+        if missing:
+            self._store_missing(found, missing, [self.embeddings.embed_query(text)])
+        return found[keys[0]]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, found, missing = await asyncio.to_thread(self._missing, "document", texts)
+        if missing:
+            vectors = await self.embeddings.aembed_documents(list(missing.values()))
+            await asyncio.to_thread(self._store_missing, found, missing, vectors)
+        return [found[key] for key in keys]
+
+    async def aembed_query(self, text: str) -> list[float]:
+        keys, found, missing = await asyncio.to_thread(self._missing, "query", [text])
+        if missing:
+            vectors = [await self.embeddings.aembed_query(text)]
+            await asyncio.to_thread(self._store_missing, found, missing, vectors)
+        return found[keys[0]]
@@ -14,6 +14,8 @@ from langflow.field_typing import LanguageModel
 from langflow.inputs import MessageInput
 from langflow.inputs.inputs import BoolInput, InputTypes, MultilineInput
 from langflow.schema.message import Message
+from langflow.services.deps import get_llm_cache_service
+from langflow.services.llm_cache.service import CachedResponse, is_cacheable_message, llm_cache_key
 from langflow.template.field.base import Output
 
 
@@ -92,11 +94,12 @@ class LCModelComponent(Component):
         Returns:
             The result obtained from the output object.
         """
+        cache_key = self._get_llm_cache_key(runnable, [HumanMessage(content=input_value)])
         try:
             if stream:
-                result = runnable.stream(input_value)
+                result = self._invoke_or_stream(runnable, input_value, stream=True, cache_key=cache_key)
             else:
-                message = runnable.invoke(input_value)
+                message = self._invoke_or_stream(runnable, input_value, stream=False, cache_key=cache_key)
                 result = message.content if hasattr(message, "content") else message
                 self.status = result
         except Exception as e:
@@ -167,6 +170,8 @@ class LCModelComponent(Component):
         if not input_value and not system_message:
             msg = "The message you want to send to the model is empty."
             raise ValueError(msg)
+        model = runnable
+        prompt = None
         system_message_added = False
         if input_value:
             if isinstance(input_value, Message):
@@ -189,6 +194,7 @@ class LCModelComponent(Component):
         if system_message and not system_message_added:
             messages.insert(0, SystemMessage(content=system_message))
         inputs: list | dict = messages or {}
+        cache_key = self._get_llm_cache_key(model, messages, prompt)
         try:
             # TODO: Depreciated Feature to be removed in upcoming release
             if hasattr(self, "output_parser") and self.output_parser is not None:
@@ -202,8 +208,8 @@ class LCModelComponent(Component):
                 }
             )
             if stream:
-                return runnable.stream(inputs)
-            message = runnable.invoke(inputs)
+                return self._invoke_or_stream(runnable, inputs, stream=True, cache_key=cache_key)
+            message = self._invoke_or_stream(runnable, inputs, stream=False, cache_key=cache_key)
             result = message.content if hasattr(message, "content") else message
             if isinstance(message, AIMessage):
                 status_message = self.build_status_message(message)
@@ -220,6 +226,32 @@ class LCModelComponent(Component):
 
         return result
 
+    def _get_llm_cache_key(self, model: LanguageModel, messages: list[BaseMessage], prompt=None) -> str | None:
+        """Returns the key of the response in the LLM cache, or None if the response is not cached."""
+        if not get_llm_cache_service().enabled or getattr(self, "output_parser", None) is not None:
+            return None
+        if prompt is not None:
+            try:
+                messages = [*prompt.format_messages(), *messages]
+            except (KeyError, ValueError):
+                return None
+        return llm_cache_key(model, messages)
+
+    def _invoke_or_stream(self, runnable, inputs, *, stream: bool, cache_key: str | None):
+        """Streams or invokes the runnable, going through the LLM cache when there is a cache key."""
+        if cache_key is None:
+            return runnable.stream(inputs) if stream else runnable.invoke(inputs)
+        llm_cache = get_llm_cache_service()
+        if (cached := llm_cache.get(cache_key)) is not None:
+            # A cached response is streamed chunk by chunk, so clients get the same token events as on a miss
+            return cached.to_chunks() if stream else cached.to_message()
+        if stream:
+            return llm_cache.record(cache_key, runnable.stream(inputs))
+        message = runnable.invoke(inputs)
+        if isinstance(message, AIMessage) and is_cacheable_message(message):
+            llm_cache.set(cache_key, CachedResponse((message.content,), message.response_metadata))
+        return message
+
     @abstractmethod
     def build_model(self) -> LanguageModel:  # type: ignore[type-var]
         """Implement this method to build the model."""
@@ -1,12 +1,15 @@
 from abc import abstractmethod
 from functools import wraps
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from langflow.base.embeddings.cache import CachedEmbeddings, get_embedding_store
 from langflow.custom import Component
-from langflow.field_typing import Text, VectorStore
+from langflow.field_typing import Embeddings, Text, VectorStore
 from langflow.helpers.data import docs_to_data
 from langflow.io import DataInput, MultilineInput, Output
 from langflow.schema import Data, DataFrame
+from langflow.services.deps import get_settings_service
 
 if TYPE_CHECKING:
     from langchain_core.documents import Document
@@ -26,6 +29,7 @@ def check_cached_vector_store(f):
         if self._cached_vector_store is not None:
             return self._cached_vector_store
 
+        self._use_embedding_cache()
         result = f(self, *args, **kwargs)
         self._cached_vector_store = result
         return result
@@ -88,6 +92,20 @@ class LCVectorStoreComponent(Component):
                 msg = f"Method '{method_name}' must be defined."
                 raise ValueError(msg)
 
+    def _use_embedding_cache(self) -> None:
+        """Wraps the embedding input so that texts embedded before are read from the embedding cache."""
+        embedding = self._attributes.get("embedding")
+        if not isinstance(embedding, Embeddings) or isinstance(embedding, CachedEmbeddings):
+            return
+        settings = get_settings_service().settings
+        if not settings.embedding_cache or not settings.config_dir:
+            return
+        store = get_embedding_store(
+            embedding, Path(settings.config_dir) / "embedding_cache", settings.embedding_cache_max_size * 1024 * 1024
+        )
+        if store is not None:
+            self._attributes["embedding"] = CachedEmbeddings(embedding, store)
+
     def search_with_vector_store(
         self,
         input_value: Text,
@@ -1,3 +1,7 @@
+import hashlib
+
+import orjson
+
 from langflow.schema import Data
 
 
@@ -20,3 +24,9 @@ def chroma_collection_to_data(collection_dict: dict):
             data_dict.update(collection_dict["metadatas"][i].items())
         data.append(Data(**data_dict))
     return data
+
+
+def data_fingerprint(data: Data) -> str:
+    """Returns a hash of the content of the data, the same for data that compare equal."""
+    content = orjson.dumps(data.data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=repr)
+    return hashlib.sha256(content).hexdigest()
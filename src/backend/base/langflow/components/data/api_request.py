@@ -28,6 +28,7 @@ from langflow.io import (
 )
 from langflow.schema import Data
 from langflow.schema.dotdict import dotdict
+from langflow.services.deps import get_http_client_service
 
 
 class APIRequestComponent(Component):
@@ -524,23 +525,24 @@ class APIRequestComponent(Component):
 
         urls = [self.add_query_params(url, query_params) for url in urls]
 
-        async with httpx.AsyncClient() as client:
-            results = await asyncio.gather(
-                *[
-                    self.make_request(
-                        client,
-                        method,
-                        u,
-                        headers,
-                        rec,
-                        timeout,
-                        follow_redirects=follow_redirects,
-                        save_to_file=save_to_file,
-                        include_httpx_metadata=include_httpx_metadata,
-                    )
-                    for u, rec in zip(urls, bodies, strict=False)
-                ]
-            )
+        # The pooled client keeps its connections open for the next runs
+        client = get_http_client_service().get_async_client("api_request")
+        results = await asyncio.gather(
+            *[
+                self.make_request(
+                    client,
+                    method,
+                    u,
+                    headers,
+                    rec,
+                    timeout,
+                    follow_redirects=follow_redirects,
+                    save_to_file=save_to_file,
+                    include_httpx_metadata=include_httpx_metadata,
+                )
+                for u, rec in zip(urls, bodies, strict=False)
+            ]
+        )
         self.status = results
         return results
 
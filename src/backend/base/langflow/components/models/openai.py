@@ -6,6 +6,7 @@ from langflow.base.models.openai_constants import OPENAI_MODEL_NAMES
 from langflow.field_typing import LanguageModel
 from langflow.field_typing.range_spec import RangeSpec
 from langflow.inputs import BoolInput, DictInput, DropdownInput, IntInput, SecretStrInput, SliderInput, StrInput
+from langflow.services.deps import get_http_client_service
 
 
 class OpenAIModelComponent(LCModelComponent):
@@ -97,6 +98,9 @@ class OpenAIModelComponent(LCModelComponent):
         timeout = self.timeout
 
         api_key = SecretStr(openai_api_key).get_secret_value() if openai_api_key else None
+        # Runs with the same endpoint and key share the connections of pooled clients
+        http_client_service = get_http_client_service()
+        client_key = {"base_url": openai_api_base, "credential": api_key, "timeout": timeout}
         output = ChatOpenAI(
             max_tokens=max_tokens or None,
             model_kwargs=model_kwargs,
@@ -107,6 +111,8 @@ class OpenAIModelComponent(LCModelComponent):
             seed=seed,
             max_retries=max_retries,
             request_timeout=timeout,
+            http_client=http_client_service.get_client("openai", **client_key),
+            http_async_client=http_client_service.get_async_client("openai", **client_key),
         )
         if json_mode:
             output = output.bind(response_format={"type": "json_object"})
@@ -7,6 +7,7 @@ class DataFrameOperationsComponent(Component):
     display_name = "DataFrame Operations"
     description = "Perform various operations on a DataFrame."
     icon = "table"
+    cpu_bound = True
 
     # Available operations
     OPERATION_CHOICES = [
@@ -1,6 +1,6 @@
 from langflow.custom import Component
 from langflow.io import DataInput, MessageTextInput, Output
-from langflow.schema import Data
+from langflow.schema import Data, DataBatch
 
 
 class FilterDataComponent(Component):
@@ -15,6 +15,7 @@ class FilterDataComponent(Component):
             name="data",
             display_name="Data",
             info="Data object to filter.",
+            input_types=["Data", "DataBatch"],
         ),
         MessageTextInput(
             name="filter_criteria",
@@ -28,8 +29,13 @@ class FilterDataComponent(Component):
         Output(display_name="Filtered Data", name="filtered_data", method="filter_data"),
     ]
 
-    def filter_data(self) -> Data:
+    def filter_data(self) -> Data | DataBatch:
         filter_criteria: list[str] = self.filter_criteria
+        if isinstance(self.data, DataBatch):
+            # The filtered batch shares the columns of the input
+            filtered_batch = self.data.select(filter_criteria)
+            self.status = filtered_batch
+            return filtered_batch
         data = self.data.data if isinstance(self.data, Data) else {}
 
         # Filter the data
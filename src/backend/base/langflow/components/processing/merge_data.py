@@ -1,11 +1,12 @@
 from enum import Enum
 from typing import cast
 
+import pandas as pd
 from loguru import logger
 
 from langflow.custom import Component
 from langflow.io import DataInput, DropdownInput, Output
-from langflow.schema import DataFrame
+from langflow.schema import Data, DataBatch, DataFrame
 
 
 class DataOperation(str, Enum):
@@ -22,7 +23,14 @@ class MergeDataComponent(Component):
     MIN_INPUTS_REQUIRED = 2
 
     inputs = [
-        DataInput(name="data_inputs", display_name="Data Inputs", info="Data to combine", is_list=True, required=True),
+        DataInput(
+            name="data_inputs",
+            display_name="Data Inputs",
+            info="Data to combine",
+            is_list=True,
+            required=True,
+            input_types=["Data", "DataBatch"],
+        ),
         DropdownInput(
             name="operation",
             display_name="Operation Type",
@@ -33,14 +41,15 @@ class MergeDataComponent(Component):
     outputs = [Output(display_name="DataFrame", name="combined_data", method="combine_data")]
 
     def combine_data(self) -> DataFrame:
-        if not self.data_inputs or len(self.data_inputs) < self.MIN_INPUTS_REQUIRED:
+        data_inputs = self._get_data_inputs()
+        if not data_inputs or len(data_inputs) < self.MIN_INPUTS_REQUIRED:
             empty_dataframe = DataFrame()
             self.status = empty_dataframe
             return empty_dataframe
 
         operation = DataOperation(self.operation)
         try:
-            combined_dataframe = self._process_operation(operation)
+            combined_dataframe = self._process_operation(operation, data_inputs)
             self.status = combined_dataframe
         except Exception as e:
             logger.error(f"Error during operation {operation}: {e!s}")
@@ -48,10 +57,42 @@ class MergeDataComponent(Component):
         else:
             return combined_dataframe
 
-    def _process_operation(self, operation: DataOperation) -> DataFrame:
+    def _get_data_inputs(self) -> list[Data] | DataBatch:
+        data_inputs = self.data_inputs or []
+        if not any(isinstance(data_input, DataBatch) for data_input in data_inputs):
+            return data_inputs
+        # Every record of a batch is combined as one input
+        return DataBatch.concat(
+            [
+                data_input if isinstance(data_input, DataBatch) else DataBatch.from_data([data_input])
+                for data_input in data_inputs
+            ]
+        )
+
+    def _process_batch(self, operation: DataOperation, batch: DataBatch) -> DataFrame:
+        if operation == DataOperation.APPEND:
+            return batch.to_dataframe()
+        combined_data: dict[str, object] = {}
+        for key in batch.columns:
+            values = batch.values(key)
+            if pd.api.types.infer_dtype(values, skipna=False) == "string":
+                combined_data[key] = "\n".join(values)
+                continue
+            for value in values:
+                if key in combined_data and isinstance(combined_data[key], str) and isinstance(value, str):
+                    combined_data[key] = f"{combined_data[key]}\n{value}"
+                else:
+                    combined_data[key] = value
+        return DataFrame([combined_data])
+
+    def _process_operation(self, operation: DataOperation, data_inputs: list[Data] | DataBatch) -> DataFrame:
+        if isinstance(data_inputs, DataBatch) and operation in {DataOperation.APPEND, DataOperation.CONCATENATE}:
+            # Appending and concatenating go column by column, other operations go through the records
+            return self._process_batch(operation, data_inputs)
+
         if operation == DataOperation.CONCATENATE:
             combined_data: dict[str, str | object] = {}
-            for data_input in self.data_inputs:
+            for data_input in data_inputs:
                 for key, value in data_input.data.items():
                     if key in combined_data:
                         if isinstance(combined_data[key], str) and isinstance(value, str):
@@ -63,12 +104,12 @@ class MergeDataComponent(Component):
             return DataFrame([combined_data])
 
         if operation == DataOperation.APPEND:
-            rows = [data_input.data for data_input in self.data_inputs]
+            rows = [data_input.data for data_input in data_inputs]
             return DataFrame(rows)
 
         if operation == DataOperation.MERGE:
             result_data: dict[str, str | list[str] | object] = {}
-            for data_input in self.data_inputs:
+            for data_input in data_inputs:
                 for key, value in data_input.data.items():
                     if key in result_data and isinstance(value, str):
                         if isinstance(result_data[key], list):
@@ -81,7 +122,7 @@ class MergeDataComponent(Component):
 
         if operation == DataOperation.JOIN:
             combined_data = {}
-            for idx, data_input in enumerate(self.data_inputs, 1):
+            for idx, data_input in enumerate(data_inputs, 1):
                 for key, value in data_input.data.items():
                     new_key = f"{key}_doc{idx}" if idx > 1 else key
                     combined_data[new_key] = value
@@ -1,7 +1,7 @@
 from langflow.custom import Component
 from langflow.helpers.data import data_to_text, data_to_text_list
 from langflow.io import DataInput, MultilineInput, Output, StrInput
-from langflow.schema import Data
+from langflow.schema import Data, DataBatch
 from langflow.schema.message import Message
 
 
@@ -10,9 +10,17 @@ class ParseDataComponent(Component):
     description = "Convert Data objects into Messages using any {field_name} from input data."
     icon = "message-square"
     name = "ParseData"
+    memoize_outputs = True
 
     inputs = [
-        DataInput(name="data", display_name="Data", info="The data to convert to text.", is_list=True, required=True),
+        DataInput(
+            name="data",
+            display_name="Data",
+            info="The data to convert to text.",
+            is_list=True,
+            required=True,
+            input_types=["Data", "DataBatch"],
+        ),
         MultilineInput(
             name="template",
             display_name="Template",
@@ -39,8 +47,12 @@ class ParseDataComponent(Component):
         ),
     ]
 
-    def _clean_args(self) -> tuple[list[Data], str, str]:
+    def _clean_args(self) -> tuple[list[Data] | DataBatch, str, str]:
         data = self.data if isinstance(self.data, list) else [self.data]
+        if any(isinstance(item, DataBatch) for item in data):
+            # Batches are formatted column by column, Data connected with them are added as rows
+            batches = [item if isinstance(item, DataBatch) else DataBatch.from_data([item]) for item in data]
+            data = DataBatch.concat(batches) if len(batches) > 1 else batches[0]
         template = self.template
         sep = self.sep
         return data, template, sep
@@ -53,6 +65,10 @@ class ParseDataComponent(Component):
 
     def parse_data_as_list(self) -> list[Data]:
         data, template, _ = self._clean_args()
+        if isinstance(data, DataBatch):
+            data_list = data.with_column(data.text_key, data.format(template)).to_data_list()
+            self.status = data_list
+            return data_list
         text_list, data_list = data_to_text_list(template, data)
         for item, text in zip(data_list, text_list, strict=True):
             item.set_text(text)
@@ -11,6 +11,7 @@ class ParseDataFrameComponent(Component):
     )
     icon = "braces"
     name = "ParseDataFrame"
+    memoize_outputs = True
 
     inputs = [
         DataFrameInput(name="df", display_name="DataFrame", info="The DataFrame to convert to text rows."),
@@ -11,6 +11,8 @@ class SplitTextComponent(Component):
     description: str = "Split text into chunks based on specified criteria."
     icon = "scissors-line-dashed"
     name = "SplitText"
+    memoize_outputs = True
+    cpu_bound = True
 
     inputs = [
         HandleInput(
@@ -10,6 +10,8 @@ from langflow.components.tools.mcp_stdio import create_input_schema_from_json_sc
 from langflow.custom import Component
 from langflow.field_typing import Tool
 from langflow.io import MessageTextInput, Output
+from langflow.services.deps import get_mcp_session_pool_service
+from langflow.services.mcp_session_pool.service import MCPServer, mcp_server_key
 from langflow.utils.async_helpers import timeout_context
 
 # Define constant for status code
@@ -17,12 +19,7 @@ HTTP_TEMPORARY_REDIRECT = 307
 
 
 class MCPSseClient:
-    def __init__(self):
-        # Initialize session and client objects
-        self.write = None
-        self.sse = None
-        self.session: ClientSession | None = None
-        self.exit_stack = AsyncExitStack()
+    """Connects to MCP servers over SSE, through the shared MCP session pool."""
 
     async def pre_check_redirect(self, url: str):
         """Check if the URL responds with a 307 Redirect."""
@@ -32,25 +29,30 @@ class MCPSseClient:
                 return response.headers.get("Location")  # Return the redirect URL
         return url  # Return the original URL if no redirect
 
-    async def connect_to_server(
+    def get_server(
         self, url: str, headers: dict[str, str] | None, timeout_seconds: int = 500, sse_read_timeout_seconds: int = 500
-    ):
+    ) -> MCPServer:
+        """Returns a handle to the server at `url`, which reuses its open session."""
         if headers is None:
             headers = {}
-        url = await self.pre_check_redirect(url)
 
-        async with timeout_context(timeout_seconds):
-            sse_transport = await self.exit_stack.enter_async_context(
-                sse_client(url, headers, timeout_seconds, sse_read_timeout_seconds)
-            )
-            self.sse, self.write = sse_transport
-            self.session = await self.exit_stack.enter_async_context(ClientSession(self.sse, self.write))
+        async def connect(exit_stack: AsyncExitStack) -> ClientSession:
+            redirected_url = await self.pre_check_redirect(url)
+            async with timeout_context(timeout_seconds):
+                sse, write = await exit_stack.enter_async_context(
+                    sse_client(redirected_url, headers, timeout_seconds, sse_read_timeout_seconds)
+                )
+                session = await exit_stack.enter_async_context(ClientSession(sse, write))
+                await session.initialize()
+                return session
 
-            await self.session.initialize()
+        key = mcp_server_key("sse", url, headers, timeout_seconds, sse_read_timeout_seconds)
+        return get_mcp_session_pool_service().get_server(key, connect)
 
-            # List available tools
-            response = await self.session.list_tools()
-            return response.tools
+    async def connect_to_server(
+        self, url: str, headers: dict[str, str] | None, timeout_seconds: int = 500, sse_read_timeout_seconds: int = 500
+    ):
+        return await self.get_server(url, headers, timeout_seconds, sse_read_timeout_seconds).list_tools()
 
 
 class MCPSse(Component):
@@ -78,8 +80,8 @@ class MCPSse(Component):
     ]
 
     async def build_output(self) -> list[Tool]:
-        if self.client.session is None:
-            self.tools = await self.client.connect_to_server(self.url, {})
+        server = self.client.get_server(self.url, {})
+        self.tools = await server.list_tools()
 
         tool_list = []
 
@@ -89,8 +91,8 @@ class MCPSse(Component):
                 Tool(
                     name=tool.name,  # maybe format this
                     description=tool.description,
-                    coroutine=create_tool_coroutine(tool.name, args_schema, self.client.session),
-                    func=create_tool_func(tool.name, self.client.session),
+                    coroutine=create_tool_coroutine(tool.name, args_schema, server),
+                    func=create_tool_func(tool.name, server),
                 )
             )
 
@@ -11,29 +11,31 @@ from langflow.base.mcp.util import create_tool_coroutine, create_tool_func
 from langflow.custom import Component
 from langflow.field_typing import Tool
 from langflow.io import MessageTextInput, Output
+from langflow.services.deps import get_mcp_session_pool_service
+from langflow.services.mcp_session_pool.service import MCPServer, mcp_server_key
 
 
 class MCPStdioClient:
-    def __init__(self):
-        # Initialize session and client objects
-        self.session: ClientSession | None = None
-        self.exit_stack = AsyncExitStack()
+    """Connects to MCP servers that run as subprocesses, through the shared MCP session pool."""
 
-    async def connect_to_server(self, command_str: str):
+    def get_server(self, command_str: str) -> MCPServer:
+        """Returns a handle to the server started by `command_str`, which reuses its open session."""
         command = command_str.split(" ")
         server_params = StdioServerParameters(
             command=command[0], args=command[1:], env={"DEBUG": "true", "PATH": os.environ["PATH"]}
         )
 
-        stdio_transport = await self.exit_stack.enter_async_context(stdio_client(server_params))
-        self.stdio, self.write = stdio_transport
-        self.session = await self.exit_stack.enter_async_context(ClientSession(self.stdio, self.write))
+        async def connect(exit_stack: AsyncExitStack) -> ClientSession:
+            stdio, write = await exit_stack.enter_async_context(stdio_client(server_params))
+            session = await exit_stack.enter_async_context(ClientSession(stdio, write))
+            await session.initialize()
+            return session
 
-        await self.session.initialize()
+        key = mcp_server_key("stdio", server_params.command, server_params.args, server_params.env)
+        return get_mcp_session_pool_service().get_server(key, connect)
 
-        # List available tools
-        response = await self.session.list_tools()
-        return response.tools
+    async def connect_to_server(self, command_str: str):
+        return await self.get_server(command_str).list_tools()
 
 
 def create_input_schema_from_json_schema(schema: dict[str, Any]) -> type[BaseModel]:
@@ -103,8 +105,8 @@ class MCPStdio(Component):
     ]
 
     async def build_output(self) -> list[Tool]:
-        if self.client.session is None:
-            self.tools = await self.client.connect_to_server(self.command)
+        server = self.client.get_server(self.command)
+        self.tools = await server.list_tools()
 
         tool_list = []
 
@@ -114,8 +116,8 @@ class MCPStdio(Component):
                 Tool(
                     name=tool.name,
                     description=tool.description,
-                    coroutine=create_tool_coroutine(tool.name, args_schema, self.client.session),
-                    func=create_tool_func(tool.name, args_schema),
+                    coroutine=create_tool_coroutine(tool.name, args_schema, server),
+                    func=create_tool_func(tool.name, server),
                 )
             )
         self.tool_names = [tool.name for tool in self.tools]
@@ -5,7 +5,7 @@ from langchain_chroma import Chroma
 from typing_extensions import override
 
 from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
-from langflow.base.vectorstores.utils import chroma_collection_to_data
+from langflow.base.vectorstores.utils import chroma_collection_to_data, data_fingerprint
 from langflow.io import BoolInput, DropdownInput, HandleInput, IntInput, StrInput
 from langflow.schema import Data
 
@@ -126,19 +126,17 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
             self.status = ""
             return
 
-        stored_documents_without_id = []
-        if self.allow_duplicates:
-            stored_data = []
-        else:
+        stored_fingerprints = set()
+        if not self.allow_duplicates:
             stored_data = chroma_collection_to_data(vector_store.get(limit=self.limit))
             for value in deepcopy(stored_data):
                 del value.id
-                stored_documents_without_id.append(value)
+                stored_fingerprints.add(data_fingerprint(value))
 
         documents = []
         for _input in self.ingest_data or []:
             if isinstance(_input, Data):
-                if _input not in stored_documents_without_id:
+                if data_fingerprint(_input) not in stored_fingerprints:
                     documents.append(_input.to_lc_document())
             else:
                 msg = "Vector Store Inputs must be Data objects."
@@ -33,6 +33,7 @@ from langflow.schema.data import Data
 from langflow.schema.message import ErrorMessage, Message
 from langflow.schema.properties import Source
 from langflow.schema.table import FieldParserType, TableOptions
+from langflow.services.deps import get_process_pool_service
 from langflow.services.tracing.schema import Log
 from langflow.template.field.base import UNDEFINED, Input, Output
 from langflow.template.frontend_node.custom_components import ComponentFrontendNode
@@ -95,6 +96,11 @@ class Component(CustomComponent):
     inputs: list[InputTypes] = []
     outputs: list[Output] = []
     code_class_base_inheritance: ClassVar[str] = "Component"
+    memoize_outputs: ClassVar[bool] = False
+    """Whether the outputs only depend on the inputs and can be reused by builds with the same inputs."""
+    cpu_bound: ClassVar[bool] = False
+    """Whether the sync output methods are CPU-heavy and should run in the component process pool when it is enabled.
+    They must only depend on the inputs, not on the graph or the services of the server."""
 
     def __init__(self, **kwargs) -> None:
         # Initialize instance-specific attributes first
@@ -949,7 +955,12 @@ class Component(CustomComponent):
 
         method = getattr(self, output.method)
         try:
-            result = await method() if inspect.iscoroutinefunction(method) else await asyncio.to_thread(method)
+            if inspect.iscoroutinefunction(method):
+                result = await method()
+            elif self.cpu_bound and self._code and (process_pool := get_process_pool_service()).enabled:
+                result = await process_pool.run_component_output(self, output.method)
+            else:
+                result = await asyncio.to_thread(method)
         except TypeError as e:
             msg = f'Error running method "{output.method}": {e}'
             raise TypeError(msg) from e
@@ -1188,47 +1199,51 @@ class Component(CustomComponent):
 
         if isinstance(iterator, AsyncIterator):
             return await self._handle_async_iterator(iterator, message.id, message)
+        chunks: list[str] = []
         try:
-            complete_message = ""
             first_chunk = True
             for chunk in iterator:
-                complete_message = await self._process_chunk(
-                    chunk.content, complete_message, message.id, message, first_chunk=first_chunk
-                )
+                await self._process_chunk(chunk.content, chunks, message.id, message, first_chunk=first_chunk)
                 first_chunk = False
         except Exception as e:
             raise StreamingError(cause=e, source=message.properties.source) from e
-        else:
-            return complete_message
+        finally:
+            self._flush_tokens()
+        return "".join(chunks)
 
     async def _handle_async_iterator(self, iterator: AsyncIterator, message_id: str, message: Message) -> str:
-        complete_message = ""
+        chunks: list[str] = []
         first_chunk = True
-        async for chunk in iterator:
-            complete_message = await self._process_chunk(
-                chunk.content, complete_message, message_id, message, first_chunk=first_chunk
-            )
-            first_chunk = False
-        return complete_message
+        try:
+            async for chunk in iterator:
+                await self._process_chunk(chunk.content, chunks, message_id, message, first_chunk=first_chunk)
+                first_chunk = False
+        finally:
+            self._flush_tokens()
+        return "".join(chunks)
 
     async def _process_chunk(
-        self, chunk: str, complete_message: str, message_id: str, message: Message, *, first_chunk: bool = False
-    ) -> str:
-        complete_message += chunk
+        self, chunk: str, chunks: list[str], message_id: str, message: Message, *, first_chunk: bool = False
+    ) -> None:
+        chunks.append(chunk)
         if self._event_manager:
             if first_chunk:
                 # Send the initial message only on the first chunk
                 msg_copy = message.model_copy()
-                msg_copy.text = complete_message
+                msg_copy.text = chunk
                 await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
-        return complete_message
+            data = {"chunk": chunk, "id": str(message_id)}
+            on_token = self._event_manager.on_token
+            if on_token == getattr(self._event_manager, "send_token", None):
+                # The default token callback only encodes the token and puts it in the queue,
+                # so it runs on the event loop instead of hopping to a thread for every token.
+                on_token(data=data)
+            else:
+                await asyncio.to_thread(on_token, data=data)
+
+    def _flush_tokens(self) -> None:
+        if self._event_manager and hasattr(self._event_manager, "flush_tokens"):
+            self._event_manager.flush_tokens()
 
     async def send_error(
         self,
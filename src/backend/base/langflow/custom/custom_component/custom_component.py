@@ -452,6 +452,9 @@ class CustomComponent(BaseComponent):
         else:
             msg = f"Invalid user id: {self.user_id}"
             raise TypeError(msg)
+        if self._vertex is not None:
+            # The variables of the whole run are fetched at once
+            return await self._vertex.graph.get_variable_resolver(user_id).get_variable(name, field)
         async with session_scope() as session:
             return await variable_service.get_variable(user_id=user_id, name=name, field=field, session=session)
 
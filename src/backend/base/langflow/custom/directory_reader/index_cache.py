@@ -0,0 +1,190 @@
+"""A persistent index of the component templates built from the components paths.
+
+Building the templates parses and evaluates every component file, which takes seconds and is
+the same work on every start of every worker. The index stores the template built from each
+file next to the file's size, modification time and content hash, so a start only rebuilds the
+files that changed. The whole index is dropped when Langflow, Python, an installed distribution
+or any module of the `langflow` package outside of the bundled components changes, since templates
+and import errors of components depend on the packages they import.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+import orjson
+from loguru import logger
+
+INDEX_VERSION = 1
+
+
+@dataclass
+class IndexEntry:
+    """The template built from one component file."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+    menu: str
+    name: str
+    template: dict[str, Any] | None
+    valid: bool
+
+
+def _file_digest(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def environment_fingerprint() -> str:
+    """Returns a hash of everything, besides the component files, that the templates depend on."""
+    import langflow
+    from langflow.utils.version import get_version_info
+
+    package_root = Path(langflow.__file__).parent
+    components_root = package_root / "components"
+    fingerprint = hashlib.sha256(f"{INDEX_VERSION}|{get_version_info()['version']}|{sys.version}".encode())
+    for path in sorted(package_root.rglob("*.py")):
+        if path.is_relative_to(components_root):
+            continue
+        stat = path.stat()
+        fingerprint.update(f"{path.relative_to(package_root)}|{stat.st_mtime_ns}|{stat.st_size}\n".encode())
+    # Installing or upgrading a dependency can fix a component that failed to import or change its options
+    for distribution in sorted(f"{dist.name}=={dist.version}" for dist in metadata.distributions()):
+        fingerprint.update(f"{distribution}\n".encode())
+    return fingerprint.hexdigest()
+
+
+class ComponentIndexCache:
+    """An on-disk index of component templates keyed by file path.
+
+    The index is read in one go by `load` and written back atomically by `save`, only if
+    something changed. Entries of files that were not looked up since `load` are dropped on
+    `save`, so deleted components do not linger in the index.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.fingerprint = ""
+        self._entries: dict[str, IndexEntry] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> None:
+        """Reads the index, discarding it if it was written for a different environment."""
+        self.fingerprint = environment_fingerprint()
+        self._entries = {}
+        self._seen = set()
+        self._dirty = False
+        try:
+            index = orjson.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, orjson.JSONDecodeError):
+            logger.opt(exception=True).warning(f"Could not read the component index at {self.path}")
+            return
+        if index.get("fingerprint") != self.fingerprint:
+            logger.debug("The component index was built for another version, rebuilding it")
+            self._dirty = True
+            return
+        try:
+            self._entries = {file_path: IndexEntry(**entry) for file_path, entry in index["files"].items()}
+        except (KeyError, TypeError):
+            logger.opt(exception=True).warning(f"Ignoring the malformed component index at {self.path}")
+            self._entries = {}
+            self._dirty = True
+
+    def get(self, file_path: str) -> IndexEntry | None:
+        """Returns the entry of a file, or None if the file changed since it was indexed."""
+        with self._lock:
+            self._seen.add(file_path)
+            entry = self._entries.get(file_path)
+        if entry is None:
+            self.misses += 1
+            return None
+        try:
+            stat = Path(file_path).stat()
+            if stat.st_mtime_ns != entry.mtime_ns or stat.st_size != entry.size:
+                # Touched but maybe not changed, e.g. by a checkout
+                if _file_digest(Path(file_path).read_bytes()) != entry.digest:
+                    self._drop(file_path)
+                    self.misses += 1
+                    return None
+                entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+                self._dirty = True
+        except OSError:
+            self._drop(file_path)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def peek(self, file_path: str) -> IndexEntry | None:
+        """Returns the entry of a file without checking whether the file changed."""
+        return self._entries.get(file_path)
+
+    def _drop(self, file_path: str) -> None:
+        with self._lock:
+            self._entries.pop(file_path, None)
+
+    def set(self, file_path: str, *, menu: str, name: str, template: dict[str, Any] | None, valid: bool) -> None:
+        """Stores the template built from a file."""
+        try:
+            content = Path(file_path).read_bytes()
+            stat = Path(file_path).stat()
+        except OSError:
+            return
+        entry = IndexEntry(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            digest=_file_digest(content),
+            menu=menu,
+            name=name,
+            template=template,
+            valid=valid,
+        )
+        with self._lock:
+            self._seen.add(file_path)
+            self._entries[file_path] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """Writes the index if it changed since it was loaded."""
+        with self._lock:
+            stale = self._entries.keys() - self._seen
+            for file_path in stale:
+                del self._entries[file_path]
+            if not self._dirty and not stale:
+                return
+            payload = {
+                "fingerprint": self.fingerprint,
+                "files": {file_path: asdict(entry) for file_path, entry in self._entries.items()},
+            }
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Written to a temporary file first so that other workers never read a partial index
+            fd, temp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        except OSError:
+            logger.opt(exception=True).warning(f"Could not write the component index at {self.path}")
+            return
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(orjson.dumps(payload))
+            Path(temp_name).replace(self.path)
+        except (OSError, TypeError):
+            logger.opt(exception=True).warning(f"Could not write the component index at {self.path}")
+            Path(temp_name).unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,10 +1,17 @@
+from __future__ import annotations
+
 import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
 from langflow.custom.directory_reader import DirectoryReader
 from langflow.template.frontend_node.custom_components import CustomComponentFrontendNode
 
+if TYPE_CHECKING:
+    from langflow.custom.directory_reader.index_cache import ComponentIndexCache
+
 
 def merge_nested_dicts_with_renaming(dict1, dict2):
     for key, value in dict2.items():
@@ -83,17 +90,69 @@ def build_custom_component_list_from_path(path: str):
     return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
 
 
-async def abuild_custom_component_list_from_path(path: str):
-    """Build a list of custom components for the langchain from a given path."""
+async def abuild_custom_component_list_from_path(path: str, index_cache: ComponentIndexCache | None = None):
+    """Build a list of custom components for the langchain from a given path.
+
+    If an index cache is given, only the files that changed since they were indexed are built.
+    """
     file_list = await asyncio.to_thread(load_files_from_path, path)
     reader = DirectoryReader(path, compress_code_field=False)
+    if index_cache is None:
+        valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list)
+
+        valid_menu = build_valid_menu(valid_components)
+        invalid_menu = build_invalid_menu(invalid_components)
+
+        return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
+
+    entries = await asyncio.to_thread(lambda: {file_path: index_cache.get(file_path) for file_path in file_list})
+    changed_files = [file_path for file_path, entry in entries.items() if entry is None]
+    if changed_files:
+        logger.debug(f"Building {len(changed_files)} changed component(s) from {path}")
+        valid_components, invalid_components = await abuild_and_validate_all_files(reader, changed_files)
+        await asyncio.to_thread(index_built_files, index_cache, changed_files, valid_components, invalid_components)
+        entries.update({file_path: index_cache.peek(file_path) for file_path in changed_files})
+
+    valid_menu: dict = {}
+    invalid_menu: dict = {}
+    for entry in entries.values():
+        if entry is None or entry.template is None:
+            continue
+        menu = valid_menu if entry.valid else invalid_menu
+        menu.setdefault(entry.menu, {})[entry.name] = entry.template
+    return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
 
-    valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list)
 
-    valid_menu = build_valid_menu(valid_components)
-    invalid_menu = build_invalid_menu(invalid_components)
-
-    return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
+def index_built_files(index_cache: ComponentIndexCache, file_list, valid_components, invalid_components) -> None:
+    """Stores the templates built from the files in the index cache."""
+    for menu_item in valid_components["menu"]:
+        for component_name, component_template, component in menu_item["components"]:
+            index_cache.set(
+                str(Path(menu_item["path"]) / component["file"]),
+                menu=menu_item["name"],
+                name=component_name,
+                template=component_template,
+                valid=True,
+            )
+    for menu_item in invalid_components["menu"]:
+        for component in menu_item["components"]:
+            try:
+                component_name, component_template = build_invalid_component(component)
+            except Exception:  # noqa: BLE001
+                logger.exception(f"Error while creating custom component [{component['name']}]")
+                continue
+            index_cache.set(
+                str(Path(menu_item["path"]) / component["file"]),
+                menu=menu_item["name"],
+                name=component_name,
+                template=component_template,
+                valid=False,
+            )
+    # Files that could not be loaded at all are indexed too, so they are not built on every start
+    for file_path in file_list:
+        if index_cache.peek(file_path) is None:
+            file_path_ = Path(file_path)
+            index_cache.set(file_path, menu=file_path_.parent.name, name=file_path_.stem, template=None, valid=False)
 
 
 def create_invalid_component_template(component, component_name):
@@ -1,12 +1,73 @@
+import hashlib
+import threading
 from typing import TYPE_CHECKING
 
+from cachetools import LRUCache
+
 from langflow.utils import validate
 
 if TYPE_CHECKING:
     from langflow.custom import CustomComponent
 
+CLASS_CACHE_MAX_SIZE = 512
+
+
+class ComponentClassCache:
+    """A bounded, thread-safe cache of component classes keyed by a hash of their code.
+
+    Evaluating component code parses it, imports every module it references and executes
+    the class body, so identical components across flows and runs share the class object.
+    Code that fails to evaluate is never cached.
+    """
+
+    def __init__(self, max_size: int = CLASS_CACHE_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self._cache: LRUCache[str, type[CustomComponent]] = LRUCache(maxsize=max_size)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(code: str) -> str:
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    def get(self, code: str) -> type["CustomComponent"] | None:
+        key = self.key(code)
+        with self._lock:
+            class_object = self._cache.get(key)
+            if class_object is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return class_object
+
+    def set(self, code: str, class_object: type["CustomComponent"]) -> None:
+        key = self.key(code)
+        with self._lock:
+            self._cache[key] = class_object
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+component_class_cache = ComponentClassCache()
+
 
 def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
+    """Evaluate custom component code.
+
+    The resulting class is cached by the hash of the code, so evaluating the same code again
+    returns the same class object.
+    """
+    if (class_object := component_class_cache.get(code)) is not None:
+        return class_object
     class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    class_object = validate.create_class(code, class_name)
+    component_class_cache.set(code, class_object)
+    return class_object
@@ -13,6 +13,7 @@ from pydantic import BaseModel
 
 from langflow.custom import CustomComponent
 from langflow.custom.custom_component.component import Component
+from langflow.custom.directory_reader.index_cache import ComponentIndexCache
 from langflow.custom.directory_reader.utils import (
     abuild_custom_component_list_from_path,
     build_custom_component_list_from_path,
@@ -483,8 +484,8 @@ def build_custom_components(components_paths: list[str]):
     return custom_components_from_file
 
 
-async def abuild_custom_components(components_paths: list[str]):
-    """Build custom components from the specified paths."""
+async def abuild_custom_components(components_paths: list[str], index_cache: ComponentIndexCache | None = None):
+    """Build custom components from the specified paths, reusing the templates in `index_cache` if given."""
     if not components_paths:
         return {}
 
@@ -496,7 +497,7 @@ async def abuild_custom_components(components_paths: list[str]):
         if path_str in processed_paths:
             continue
 
-        custom_component_dict = await abuild_custom_component_list_from_path(path_str)
+        custom_component_dict = await abuild_custom_component_list_from_path(path_str, index_cache=index_cache)
         if custom_component_dict:
             category = next(iter(custom_component_dict))
             logger.info(f"Loading {len(custom_component_dict[category])} component(s) from category {category}")
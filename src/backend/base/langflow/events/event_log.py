@@ -0,0 +1,120 @@
+"""A bounded, replayable log of the events of a build.
+
+The build writes its events into the log without waiting for anyone to read them, so a slow
+client does not slow down the build. Every event gets a sequence number, which is added to its
+JSON payload as `seq`. A client that lost its connection can subscribe again with the last
+sequence number it saw and get the events it missed, as long as they are still in the log.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+BUILD_EVENT_LOG_SIZE = 10_000
+"""Number of events a build event log keeps before dropping the oldest ones."""
+MAX_BUILD_EVENT_LOGS = 100
+"""Number of build event logs kept for reconnecting clients."""
+
+_EVENT_SUFFIX = b"}\n\n"
+
+
+class BuildEventLog:
+    """A ring buffer of the encoded events of one build.
+
+    The log can be passed to an `EventManager` in place of its queue: `put_nowait` takes the same
+    `(event_id, payload, put_time)` items.
+    """
+
+    def __init__(self, max_size: int = BUILD_EVENT_LOG_SIZE, *, flow_id: str | None = None) -> None:
+        self.flow_id = flow_id
+        self._events: deque[tuple[int, bytes]] = deque(maxlen=max_size)
+        self._sequence = itertools.count()
+        self._next_seq = 0
+        self._changed = asyncio.Event()
+        self.closed = False
+
+    @property
+    def last_seq(self) -> int:
+        """The sequence number of the last event, -1 if there is none."""
+        return self._next_seq - 1
+
+    def append(self, payload: bytes) -> int:
+        """Adds an encoded event to the log and returns its sequence number."""
+        if self.closed:
+            msg = "Cannot add events to a closed build event log"
+            raise RuntimeError(msg)
+        seq = next(self._sequence)
+        if payload.endswith(_EVENT_SUFFIX):
+            payload = b'%b,"seq":%d%b' % (payload[: -len(_EVENT_SUFFIX)], seq, _EVENT_SUFFIX)
+        self._events.append((seq, payload))
+        self._next_seq = seq + 1
+        self._notify()
+        return seq
+
+    def put_nowait(self, item: tuple[str | None, bytes | None, float]) -> None:
+        _, payload, _ = item
+        if payload is None:
+            self.close()
+        else:
+            self.append(payload)
+
+    def close(self) -> None:
+        """Marks the end of the build. Subscribers stop once they read the last event."""
+        self.closed = True
+        self._notify()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def subscribe(self, after: int = -1) -> AsyncIterator[bytes]:
+        """Yields the events that come after the sequence number `after`, then the new ones until the log is closed."""
+        next_seq = after + 1
+        while True:
+            changed = self._changed
+            if self._events and next_seq < self._events[0][0]:
+                logger.warning(f"Build events {next_seq} to {self._events[0][0] - 1} were dropped from the log")
+                next_seq = self._events[0][0]
+            if next_seq < self._next_seq:
+                start = next_seq - self._events[0][0]
+                for seq, payload in list(itertools.islice(self._events, start, None)):
+                    yield payload
+                    next_seq = seq + 1
+                continue
+            if self.closed:
+                return
+            await changed.wait()
+
+
+class BuildEventLogRegistry:
+    """Keeps the event logs of the most recent builds so that clients can reconnect to them."""
+
+    def __init__(self, max_logs: int = MAX_BUILD_EVENT_LOGS) -> None:
+        self.max_logs = max_logs
+        self._logs: OrderedDict[str, BuildEventLog] = OrderedDict()
+
+    def add(self, build_id: str, event_log: BuildEventLog) -> None:
+        self._logs[build_id] = event_log
+        while len(self._logs) > self.max_logs:
+            oldest_id, oldest = next(iter(self._logs.items()))
+            if not oldest.closed:
+                # Never evict a running build while there are finished ones to evict
+                finished = next((key for key, value in self._logs.items() if value.closed), None)
+                if finished is None:
+                    break
+                oldest_id = finished
+            del self._logs[oldest_id]
+
+    def get(self, build_id: str) -> BuildEventLog | None:
+        return self._logs.get(build_id)
+
+    def __len__(self) -> int:
+        return len(self._logs)
@@ -1,11 +1,13 @@
 import asyncio
 import inspect
-import json
+import itertools
 import time
 import uuid
+from datetime import datetime, timezone
 from functools import partial
 from typing import Literal
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from loguru import logger
 from typing_extensions import Protocol
@@ -22,10 +24,35 @@ class PartialEventCallback(Protocol):
     def __call__(self, *, data: LoggableType): ...
 
 
+StreamMode = Literal["per_token", "coalesced"]
+
+TOKEN_FRAME_INTERVAL = 0.02
+"""Maximum time in seconds a token waits in the buffer when tokens are coalesced."""
+TOKEN_FRAME_SIZE = 256
+"""Number of buffered characters that triggers sending a frame when tokens are coalesced."""
+
+_TOKEN_EVENT_PREFIX = b'{"event":"token","data":'
+_TOKEN_EVENT_SUFFIX = b"}\n\n"
+
+
 class EventManager:
-    def __init__(self, queue: asyncio.Queue):
+    def __init__(
+        self,
+        queue: asyncio.Queue,
+        *,
+        stream_mode: StreamMode = "per_token",
+        token_frame_interval: float = TOKEN_FRAME_INTERVAL,
+        token_frame_size: int = TOKEN_FRAME_SIZE,
+    ):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        self.stream_mode = stream_mode
+        self.token_frame_interval = token_frame_interval
+        self.token_frame_size = token_frame_size
+        self._token_buffers: dict[str, list[str]] = {}
+        self._token_buffer_sizes: dict[str, int] = {}
+        self._token_flush_handle: asyncio.TimerHandle | None = None
+        self._token_sequence = itertools.count()
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -54,7 +81,9 @@ class EventManager:
         if not name.startswith("on_"):
             msg = "Event name must start with 'on_'"
             raise ValueError(msg)
-        if callback is None:
+        if callback is None and event_type == "token":
+            callback_ = self.send_token
+        elif callback is None:
             callback_ = partial(self.send_event, event_type=event_type)
         else:
             callback_ = partial(callback, manager=self, event_type=event_type)
@@ -68,11 +97,64 @@ class EventManager:
             logger.debug(f"Error creating playground event: {e}")
         except Exception:
             raise
-        jsonable_data = jsonable_encoder(data)
+        if event_type != "token":
+            # Keep the order of the stream: buffered tokens go out before any other event.
+            self.flush_tokens()
+        # Fragments hold data that is already encoded as JSON and are embedded as they are
+        jsonable_data = jsonable_encoder(data, custom_encoder={orjson.Fragment: lambda fragment: fragment})
         json_data = {"event": event_type, "data": jsonable_data}
         event_id = f"{event_type}-{uuid.uuid4()}"
-        str_data = json.dumps(json_data) + "\n\n"
-        self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+        self.queue.put_nowait((event_id, orjson.dumps(json_data) + b"\n\n", time.time()))
+
+    def send_token(self, *, data: LoggableType) -> None:
+        """Sends a token event without going through `send_event`.
+
+        Token events are encoded with orjson around a prebuilt envelope. When `stream_mode` is
+        "coalesced", chunks of the same message are buffered and sent as a single token event once
+        `token_frame_size` characters are buffered or `token_frame_interval` seconds have passed.
+        """
+        if not isinstance(data, dict) or "chunk" not in data:
+            self.send_event(event_type="token", data=data)
+            return
+        message_id = str(data.get("id"))
+        if self.stream_mode != "coalesced":
+            self._put_token(data["chunk"], message_id)
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not on the event loop, so there is no way to schedule the flush.
+            self.flush_tokens()
+            self._put_token(data["chunk"], message_id)
+            return
+        buffer = self._token_buffers.setdefault(message_id, [])
+        buffer.append(data["chunk"])
+        size = self._token_buffer_sizes.get(message_id, 0) + len(data["chunk"])
+        self._token_buffer_sizes[message_id] = size
+        if size >= self.token_frame_size:
+            self._flush_message_tokens(message_id)
+        elif self._token_flush_handle is None:
+            self._token_flush_handle = loop.call_later(self.token_frame_interval, self.flush_tokens)
+
+    def flush_tokens(self) -> None:
+        """Sends every buffered token."""
+        if self._token_flush_handle is not None:
+            self._token_flush_handle.cancel()
+            self._token_flush_handle = None
+        for message_id in list(self._token_buffers):
+            self._flush_message_tokens(message_id)
+
+    def _flush_message_tokens(self, message_id: str) -> None:
+        buffer = self._token_buffers.pop(message_id, None)
+        self._token_buffer_sizes.pop(message_id, None)
+        if buffer:
+            self._put_token("".join(buffer), message_id)
+
+    def _put_token(self, chunk: str, message_id: str) -> None:
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
+        data = orjson.dumps({"chunk": chunk, "id": message_id, "timestamp": timestamp})
+        event_id = f"token-{next(self._token_sequence)}"
+        self.queue.put_nowait((event_id, _TOKEN_EVENT_PREFIX + data + _TOKEN_EVENT_SUFFIX, time.time()))
 
     def noop(self, *, data: LoggableType) -> None:
         pass
@@ -81,8 +163,8 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
-def create_default_event_manager(queue):
-    manager = EventManager(queue)
+def create_default_event_manager(queue, *, stream_mode: StreamMode = "per_token"):
+    manager = EventManager(queue, stream_mode=stream_mode)
     manager.register_event("on_token", "token")
     manager.register_event("on_vertices_sorted", "vertices_sorted")
     manager.register_event("on_error", "error")
@@ -95,8 +177,8 @@ def create_default_event_manager(queue):
     return manager
 
 
-def create_stream_tokens_event_manager(queue):
-    manager = EventManager(queue)
+def create_stream_tokens_event_manager(queue, *, stream_mode: StreamMode = "per_token"):
+    manager = EventManager(queue, stream_mode=stream_mode)
     manager.register_event("on_message", "add_message")
     manager.register_event("on_token", "token")
     manager.register_event("on_end", "end")
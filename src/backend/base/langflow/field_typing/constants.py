@@ -20,6 +20,7 @@ from langchain_core.vectorstores import VectorStore, VectorStoreRetriever
 from langchain_text_splitters import TextSplitter
 
 from langflow.schema.data import Data
+from langflow.schema.data_batch import DataBatch
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.message import Message
 
@@ -83,6 +84,7 @@ CUSTOM_COMPONENT_SUPPORTED_TYPES = {
     "LanguageModel": LanguageModel,
     "Retriever": Retriever,
     "DataFrame": DataFrame,
+    "DataBatch": DataBatch,
 }
 
 DEFAULT_IMPORT_STRING = """from langchain.agents.agent import AgentExecutor
@@ -130,6 +132,7 @@ from langflow.io import (
     TableInput,
 )
 from langflow.schema.data import Data
+from langflow.schema.data_batch import DataBatch
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.message import Message
 """
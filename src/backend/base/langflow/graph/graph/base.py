@@ -11,13 +11,14 @@ from collections import defaultdict, deque
 from datetime import datetime, timezone
 from functools import partial
 from itertools import chain
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from loguru import logger
 
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.edge.base import CycleEdge, Edge
 from langflow.graph.graph.constants import Finish, lazy_load_vertex_dict
+from langflow.graph.graph.limits import get_flow_vertex_build_limiter, get_global_vertex_build_limiter
 from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
 from langflow.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
 from langflow.graph.graph.state_manager import GraphStateManager
@@ -38,11 +39,12 @@ from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import get_chat_service, get_settings_service, get_tracing_service
+from langflow.services.variable.resolver import VariableResolver
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable
+    from collections.abc import Awaitable, Callable, Generator, Iterable
 
     from langflow.api.v1.schemas import InputValueRequest
     from langflow.custom.custom_component.component import Component
@@ -97,6 +99,8 @@ class Graph:
         self._is_output_vertices: list[str] = []
         self._is_state_vertices: list[str] = []
         self.has_session_id_vertices: list[str] = []
+        # Vertices built once and shared by every run of a batch, see `arun_batch`
+        self.shared_vertex_ids: set[str] = set()
         self._sorted_vertices_layers: list[list[str]] = []
         self._run_id = ""
         self._session_id = ""
@@ -110,6 +114,7 @@ class Graph:
         self.edges: list[CycleEdge] = []
         self.vertices: list[Vertex] = []
         self.run_manager = RunnableVerticesManager()
+        self._variable_resolver: VariableResolver | None = None
         self.state_manager = GraphStateManager()
         self._vertices: list[NodeData] = []
         self._edges: list[EdgeData] = []
@@ -130,6 +135,11 @@ class Graph:
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        # Changes to the run state of the vertices, see `mark_vertex_changed`
+        self._vertex_changes = 0
+        self._vertex_changed_at: dict[str, int] = {}
+        # Set by `graph_definition_key`
+        self._definition_key: tuple | None = None
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -645,6 +655,7 @@ class Graph:
             run_id = uuid.uuid4()
 
         self._run_id = str(run_id)
+        self._variable_resolver = None
         if self.tracing_service:
             self.tracing_service.set_run_id(run_id)
 
@@ -698,7 +709,9 @@ class Graph:
             if vertex.is_state:
                 self._is_state_vertices.append(vertex.id)
 
-    def _set_inputs(self, input_components: list[str], inputs: dict[str, str], input_type: InputType | None) -> None:
+    def _get_input_vertex_ids(self, input_components: list[str], input_type: InputType | None) -> list[str]:
+        """Returns the input vertices that receive the inputs of a run."""
+        vertex_ids = []
         for vertex_id in self._is_input_vertices:
             vertex = self.get_vertex(vertex_id)
             # If the vertex is not in the input_components list
@@ -708,10 +721,12 @@ class Graph:
             # Example: input_type = "chat" and vertex.id = "OpenAI-19ddn"
             if input_type is not None and input_type != "any" and input_type not in vertex.id.lower():
                 continue
-            if vertex is None:
-                msg = f"Vertex {vertex_id} not found"
-                raise ValueError(msg)
-            vertex.update_raw_params(inputs, overwrite=True)
+            vertex_ids.append(vertex_id)
+        return vertex_ids
+
+    def _set_inputs(self, input_components: list[str], inputs: dict[str, str], input_type: InputType | None) -> None:
+        for vertex_id in self._get_input_vertex_ids(input_components, input_type):
+            self.get_vertex(vertex_id).update_raw_params(inputs, overwrite=True)
 
     async def _run(
         self,
@@ -859,6 +874,166 @@ class Graph:
             vertex_outputs.append(run_output_object)
         return vertex_outputs
 
+    async def arun_batch(
+        self,
+        inputs: list[dict[str, str]],
+        *,
+        inputs_components: list[list[str]] | None = None,
+        types: list[InputType | None] | None = None,
+        outputs: list[str] | None = None,
+        session_id: str | None = None,
+        session_ids: list[str] | None = None,
+        fallback_to_env_vars: bool = False,
+        max_concurrency: int | None = None,
+    ) -> list[RunOutputs]:
+        """Runs the graph once per input, running up to `max_concurrency` inputs at the same time.
+
+        Each input runs on its own fork of this graph, so runs do not share any vertex state,
+        except for the vertices that do not depend on the inputs at all. Those are built once
+        before the batch starts and every run reuses their results. Each input also runs in its
+        own session, so chat messages and memories of one run are not seen by the others.
+
+        Args:
+            inputs (list[Dict[str, str]]): The input values for each run.
+            inputs_components (Optional[list[list[str]]], optional): Components to run for each input.
+            types (Optional[list[Optional[InputType]]], optional): The type of each input. Defaults to "chat".
+            outputs (Optional[list[str]], optional): The outputs to retrieve from the graph. Defaults to None.
+            session_id (Optional[str], optional): The session ID the sessions of the runs derive from, the run
+                of the input at `index` uses `{session_id}-{index}`. Defaults to None.
+            session_ids (Optional[list[str]], optional): The session ID of each run, instead of deriving them
+                from `session_id`. Defaults to None.
+            fallback_to_env_vars (bool, optional): Whether to fallback to environment variables. Defaults to False.
+            max_concurrency (Optional[int], optional): The maximum number of inputs run at the same time.
+                Defaults to the `batch_run_max_concurrency` setting.
+
+        Returns:
+            List[RunOutputs]: The outputs of each run, in the order of the inputs.
+        """
+        if not inputs:
+            return []
+        if session_ids is None:
+            session_ids = [f"{session_id}-{index}" if session_id else "" for index in range(len(inputs))]
+        elif len(session_ids) != len(inputs):
+            msg = f"Expected {len(inputs)} session IDs, one per input, got {len(session_ids)}"
+            raise ValueError(msg)
+        inputs_components = list(inputs_components or [])
+        inputs_components.extend([] for _ in range(len(inputs) - len(inputs_components)))
+        types = list(types or [])
+        types.extend("chat" for _ in range(len(inputs) - len(types)))
+        if max_concurrency is None:
+            max_concurrency = get_settings_service().settings.batch_run_max_concurrency
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+        shared = self.fork()
+        shared.shared_vertex_ids = self._get_batch_shared_vertex_ids(inputs, inputs_components, types)
+        await shared._build_shared_vertices(fallback_to_env_vars=fallback_to_env_vars)
+
+        async def run(
+            run_inputs: dict[str, str], components: list[str], input_type: InputType | None, run_session_id: str
+        ) -> RunOutputs:
+            async with semaphore:
+                graph = shared.fork()
+                graph.shared_vertex_ids = shared.shared_vertex_ids
+                graph.session_id = run_session_id
+                graph._copy_shared_vertices(shared)
+                run_outputs = await graph._run(
+                    inputs=run_inputs,
+                    input_components=components,
+                    input_type=input_type,
+                    outputs=outputs or [],
+                    stream=False,
+                    session_id=run_session_id,
+                    fallback_to_env_vars=fallback_to_env_vars,
+                )
+                return RunOutputs(inputs=run_inputs, outputs=run_outputs)
+
+        tasks = [
+            asyncio.create_task(run(run_inputs, components, input_type, run_session_id))
+            for run_inputs, components, input_type, run_session_id in zip(
+                inputs, inputs_components, types, session_ids, strict=True
+            )
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def _get_batch_shared_vertex_ids(
+        self,
+        inputs: list[dict[str, str]],
+        inputs_components: list[list[str]],
+        types: list[InputType | None],
+    ) -> set[str]:
+        """Returns the vertices of a batch whose result is the same for every input.
+
+        A vertex can be shared if neither it nor any of its predecessors receives the inputs,
+        reads the session or holds state. Outputs are always built per input, and so is
+        every vertex of a graph with cycles.
+        """
+        if self.is_cyclic:
+            return set()
+        per_run_vertex_ids = {*self.has_session_id_vertices, *self._is_state_vertices}
+        for run_inputs, components, input_type in zip(inputs, inputs_components, types, strict=True):
+            if run_inputs:
+                per_run_vertex_ids.update(self._get_input_vertex_ids(components, input_type))
+        to_visit = list(per_run_vertex_ids)
+        while to_visit:
+            for successor_id in self.successor_map.get(to_visit.pop(), []):
+                if successor_id not in per_run_vertex_ids:
+                    per_run_vertex_ids.add(successor_id)
+                    to_visit.append(successor_id)
+        return {vertex.id for vertex in self.vertices if vertex.id not in per_run_vertex_ids and not vertex.is_output}
+
+    async def _build_shared_vertices(self, *, fallback_to_env_vars: bool) -> None:
+        """Builds the shared vertices of a batch, each after its predecessors."""
+        chat_service = get_chat_service()
+        remaining = set(self.shared_vertex_ids)
+        while remaining:
+            ready = sorted(
+                vertex_id
+                for vertex_id in remaining
+                if not any(predecessor_id in remaining for predecessor_id in self.predecessor_map.get(vertex_id, []))
+            )
+            await asyncio.gather(
+                *(
+                    self.build_vertex(
+                        vertex_id,
+                        user_id=self.user_id,
+                        inputs_dict={},
+                        fallback_to_env_vars=fallback_to_env_vars,
+                        get_cache=chat_service.get_cache,
+                        set_cache=chat_service.set_cache,
+                    )
+                    for vertex_id in ready
+                )
+            )
+            remaining.difference_update(ready)
+
+    def _copy_shared_vertices(self, source: Graph) -> None:
+        """Points the shared vertices of this graph to the results built in `source`."""
+        for vertex_id in self.shared_vertex_ids:
+            built_vertex = source.get_vertex(vertex_id)
+            vertex = self.get_vertex(vertex_id)
+            for field in (
+                "built",
+                "built_object",
+                "built_result",
+                "use_result",
+                "result",
+                "results",
+                "artifacts",
+                "artifacts_raw",
+                "artifacts_type",
+                "outputs_logs",
+                "logs",
+                "custom_component",
+                "state",
+            ):
+                setattr(vertex, field, getattr(built_vertex, field))
+            vertex.steps_ran = list(built_vertex.steps_ran)
+
     def next_vertex_to_build(self):
         """Returns the next vertex to be built.
 
@@ -1040,9 +1215,26 @@ class Graph:
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         self.state_manager = GraphStateManager()
         self.tracing_service = get_tracing_service()
+        self._vertex_changes = 0
+        self._vertex_changed_at = {}
+        self._definition_key = None
         self.set_run_id(self._run_id)
         self.set_run_name()
 
+    @property
+    def vertex_changes(self) -> int:
+        """The number of changes to the run state of the vertices so far."""
+        return self._vertex_changes
+
+    def mark_vertex_changed(self, vertex_id: str) -> None:
+        """Records that the run state of a vertex changed, so that snapshots of the graph dump it again."""
+        self._vertex_changes += 1
+        self._vertex_changed_at[vertex_id] = self._vertex_changes
+
+    def get_changed_vertex_ids(self, since: int) -> list[str]:
+        """Returns the IDs of the vertices whose run state changed after the first `since` changes."""
+        return [vertex_id for vertex_id, change in self._vertex_changed_at.items() if change > since]
+
     @classmethod
     def from_payload(
         cls,
@@ -1080,6 +1272,96 @@ class Graph:
         else:
             return graph
 
+    def get_variable_resolver(self, user_id: uuid.UUID) -> VariableResolver:
+        """Returns the resolver of the variables of the current run.
+
+        The resolver starts with every variable name the vertices load from the database, so they are
+        all fetched by the first lookup.
+
+        Args:
+            user_id: The user the variables belong to.
+
+        Returns:
+            VariableResolver: The resolver, shared by the vertices until the run ID changes.
+        """
+        if self._variable_resolver is None or self._variable_resolver.user_id != user_id:
+            names = {
+                vertex.params[field]
+                for vertex in self.vertices
+                for field in vertex.load_from_db_fields
+                if vertex.params.get(field) and isinstance(vertex.params[field], str)
+            }
+            self._variable_resolver = VariableResolver(user_id, names)
+        return self._variable_resolver
+
+    def fork(self, user_id: str | None = None) -> Graph:
+        """Creates a copy of the graph that can be run independently of this one.
+
+        The parsed payload, edges and adjacency maps are shared with this graph,
+        while every vertex gets a fresh run state and a new component instance.
+        This is much cheaper than building the graph again from its payload.
+
+        Args:
+            user_id: The user ID for the new graph. Defaults to this graph's user ID.
+
+        Returns:
+            Graph: The forked graph.
+        """
+        graph = type(self)(
+            flow_id=self.flow_id,
+            flow_name=self.flow_name,
+            description=self.description,
+            user_id=user_id if user_id is not None else self.user_id,
+            context=dict(self.context),
+        )
+        graph._vertices = self._vertices
+        graph._edges = self._edges
+        graph.raw_graph_data = self.raw_graph_data
+        graph._definition_key = self._definition_key
+        graph.top_level_vertices = self.top_level_vertices
+        graph._is_cyclic = self._is_cyclic
+        graph._cycles = self._cycles
+        graph._cycle_vertices = self._cycle_vertices
+        graph.vertices = [vertex.fork(graph) for vertex in self.vertices]
+        graph.vertex_map = {vertex.id: vertex for vertex in graph.vertices}
+        graph.edges = []
+        for edge in self.edges:
+            new_edge = copy.copy(edge)
+            if isinstance(new_edge, CycleEdge):
+                new_edge.is_fulfilled = False
+                new_edge.result = None
+            graph.edges.append(new_edge)
+        for vertex in graph.vertices:
+            vertex.params = graph._remap_vertex_params(vertex.params)
+            vertex.raw_params = graph._remap_vertex_params(vertex.raw_params)
+        graph.predecessor_map = defaultdict(list, {k: v.copy() for k, v in self.predecessor_map.items()})
+        graph.successor_map = defaultdict(list, {k: v.copy() for k, v in self.successor_map.items()})
+        graph.in_degree_map = defaultdict(int, self.in_degree_map)
+        graph.parent_child_map = defaultdict(list, {k: v.copy() for k, v in self.parent_child_map.items()})
+        graph._is_input_vertices = self._is_input_vertices.copy()
+        graph._is_output_vertices = self._is_output_vertices.copy()
+        graph._is_state_vertices = self._is_state_vertices.copy()
+        graph.has_session_id_vertices = self.has_session_id_vertices.copy()
+        graph._instantiate_components_in_vertices()
+        graph._set_cache_to_vertices_in_cycle()
+        for vertex_id in self.run_manager.cycle_vertices:
+            graph.run_manager.add_to_cycle_vertices(vertex_id)
+        return graph
+
+    def _remap_vertex_params(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Returns a copy of `params` where vertices point to the vertices of this graph."""
+
+        def remap(value: Any) -> Any:
+            if isinstance(value, Vertex):
+                return self.vertex_map.get(value.id, value)
+            if isinstance(value, list):
+                return [remap(item) for item in value]
+            if isinstance(value, dict):
+                return {key: remap(item) for key, item in value.items()}
+            return value
+
+        return {key: remap(value) for key, value in params.items()}
+
     def __eq__(self, /, other: object) -> bool:
         if not isinstance(other, Graph):
             return False
@@ -1184,6 +1466,7 @@ class Graph:
             vertex.artifacts = {}
             vertex.set_top_level(self.top_level_vertices)
         self.reset_all_edges_of_vertex(vertex)
+        self.mark_vertex_changed(vertex.id)
 
     def reset_all_edges_of_vertex(self, vertex: Vertex) -> None:
         """Resets all the edges of a vertex."""
@@ -1405,7 +1688,9 @@ class Graph:
         try:
             params = ""
             should_build = False
-            if not vertex.frozen:
+            if vertex_id in self.shared_vertex_ids:
+                should_build = not vertex.built
+            elif not vertex.frozen:
                 should_build = True
             else:
                 # Check the cache for the vertex
@@ -1460,6 +1745,8 @@ class Graph:
             if not isinstance(exc, ComponentBuildError):
                 logger.exception("Error building Component")
             raise
+        finally:
+            self.mark_vertex_changed(vertex_id)
 
         if vertex.result is not None:
             params = f"{vertex.built_object_repr()}{params}"
@@ -1508,16 +1795,63 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        scheduler: Literal["dataflow", "layered"] | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph, building independent vertices concurrently.
+
+        Args:
+            fallback_to_env_vars (bool): Whether to fallback to environment variables.
+            start_component_id (str | None): The component to start the run from.
+            event_manager (EventManager | None): The event manager for the graph.
+            scheduler (str | None): 'dataflow' starts each vertex as soon as its own predecessors are built,
+                'layered' runs the vertices of a layer in parallel and waits for all of them before starting
+                the next layer. Defaults to the `graph_scheduler` setting.
+        """
+        settings = get_settings_service().settings
+        scheduler = scheduler or settings.graph_scheduler
         first_layer = self.sort_vertices(start_component_id=start_component_id)
-        vertex_task_run_count: dict[str, int] = {}
-        to_process = deque(first_layer)
-        layer_index = 0
         chat_service = get_chat_service()
         self.set_run_id()
         self.set_run_name()
         await self.initialize_run()
+        limiters = [
+            limiter
+            for limiter in (
+                get_flow_vertex_build_limiter(settings.max_concurrent_vertex_builds_per_flow),
+                get_global_vertex_build_limiter(settings.max_concurrent_vertex_builds),
+            )
+            if limiter is not None
+        ]
+
+        async def build_vertex(vertex_id: str) -> VertexBuildResult:
+            async with contextlib.AsyncExitStack() as stack:
+                for limiter in limiters:
+                    await stack.enter_async_context(limiter)
+                return await self.build_vertex(
+                    vertex_id=vertex_id,
+                    user_id=self.user_id,
+                    inputs_dict={},
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    get_cache=chat_service.get_cache,
+                    set_cache=chat_service.set_cache,
+                    event_manager=event_manager,
+                )
+
+        if scheduler == "layered":
+            await self._process_layers(first_layer, build_vertex)
+        else:
+            await self._process_dataflow(first_layer, build_vertex)
+
+        logger.debug("Graph processing complete")
+        return self
+
+    async def _process_layers(
+        self, first_layer: list[str], build_vertex: Callable[[str], Awaitable[VertexBuildResult]]
+    ) -> None:
+        """Runs the graph layer by layer, waiting for a whole layer before starting the next one."""
+        vertex_task_run_count: dict[str, int] = {}
+        to_process = deque(first_layer)
+        layer_index = 0
         lock = asyncio.Lock()
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
@@ -1526,15 +1860,7 @@ class Graph:
             for vertex_id in current_batch:
                 vertex = self.get_vertex(vertex_id)
                 task = asyncio.create_task(
-                    self.build_vertex(
-                        vertex_id=vertex_id,
-                        user_id=self.user_id,
-                        inputs_dict={},
-                        fallback_to_env_vars=fallback_to_env_vars,
-                        get_cache=chat_service.get_cache,
-                        set_cache=chat_service.set_cache,
-                        event_manager=event_manager,
-                    ),
+                    build_vertex(vertex_id),
                     name=f"{vertex.display_name} Run {vertex_task_run_count.get(vertex_id, 0)}",
                 )
                 tasks.append(task)
@@ -1551,8 +1877,51 @@ class Graph:
             to_process.extend(next_runnable_vertices)
             layer_index += 1
 
-        logger.debug("Graph processing complete")
-        return self
+    async def _process_dataflow(
+        self, first_layer: list[str], build_vertex: Callable[[str], Awaitable[VertexBuildResult]]
+    ) -> None:
+        """Runs the graph as a dataflow, starting each vertex as soon as its predecessors are built.
+
+        Unlike `_process_layers`, a slow vertex only delays its own successors, not every other branch.
+        """
+        vertex_task_run_count: dict[str, int] = {}
+        running: dict[asyncio.Task, str] = {}
+        lock = asyncio.Lock()
+
+        def start(vertex_id: str) -> None:
+            if vertex_id in running.values():
+                return
+            if vertex_task_run_count.get(vertex_id) and vertex_id not in self.run_manager.cycle_vertices:
+                # Already built in this run. Only vertices in a cycle are built more than once.
+                return
+            vertex = self.get_vertex(vertex_id)
+            task = asyncio.create_task(
+                build_vertex(vertex_id),
+                name=f"{vertex.display_name} Run {vertex_task_run_count.get(vertex_id, 0)}",
+            )
+            running[task] = vertex_id
+            vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
+
+        for vertex_id in first_layer:
+            start(vertex_id)
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    running.pop(task)
+                    result = task.result()
+                    if not isinstance(result, VertexBuildResult):
+                        msg = f"Invalid result from task {task.get_name()}: {result}"
+                        raise TypeError(msg)
+                    vertex = result.vertex
+                    logger.debug(f"Vertex {vertex.id}, result: {vertex.built_result}, object: {vertex.built_object}")
+                    for next_vertex_id in await self.get_next_runnable_vertices(lock, vertex=vertex, cache=False):
+                        start(next_vertex_id)
+        except Exception as exc:
+            logger.error(f"Task failed with exception: {exc}")
+            for task in running:
+                task.cancel()
+            raise
 
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         next_runnable_vertices = set()
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+
+# asyncio.Semaphore binds to the event loop it is first awaited on, so the process-wide limiter is kept per loop.
+_global_limiters: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[int, asyncio.Semaphore]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_global_vertex_build_limiter(limit: int) -> asyncio.Semaphore | None:
+    """Returns the semaphore shared by every graph run in the current event loop.
+
+    Returns None when `limit` is not positive, which means vertex builds are not limited.
+    """
+    if limit <= 0:
+        return None
+    loop = asyncio.get_running_loop()
+    current = _global_limiters.get(loop)
+    if current is None or current[0] != limit:
+        current = (limit, asyncio.Semaphore(limit))
+        _global_limiters[loop] = current
+    return current[1]
+
+
+def get_flow_vertex_build_limiter(limit: int) -> asyncio.Semaphore | None:
+    """Returns a semaphore for a single graph run or None when `limit` is not positive."""
+    if limit <= 0:
+        return None
+    return asyncio.Semaphore(limit)
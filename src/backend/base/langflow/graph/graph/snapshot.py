@@ -0,0 +1,158 @@
+"""Compact snapshots of a graph's run state.
+
+A snapshot holds what changes while a graph is being built (the run manager, the sorted
+layers and each vertex's results and status) and none of what can be derived from the flow
+payload. It is restored on top of a fork of a graph built from the same payload.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from langflow.graph.utils import UnbuiltObject, UnbuiltResult
+from langflow.graph.vertex.base import Vertex, VertexStates
+
+if TYPE_CHECKING:
+    from langflow.graph.graph.base import Graph
+
+GRAPH_SNAPSHOT_VERSION = 1
+
+# Graph attributes set by sorting and running the graph
+GRAPH_STATE_FIELDS = (
+    "inactivated_vertices",
+    "activated_vertices",
+    "vertices_layers",
+    "vertices_to_run",
+    "stop_vertex",
+    "_first_layer",
+    "_sorted_vertices_layers",
+)
+RUN_MANAGER_FIELDS = ("run_map", "run_predecessors", "vertices_to_run", "vertices_being_run")
+# Vertex attributes set by building the vertex
+VERTEX_STATE_FIELDS = (
+    "built",
+    "built_object",
+    "built_result",
+    "use_result",
+    "result",
+    "results",
+    "artifacts",
+    "artifacts_raw",
+    "artifacts_type",
+    "outputs_logs",
+    "logs",
+    "build_times",
+)
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+def graph_definition_key(graph: Graph) -> str:
+    """Returns a key identifying the payload and identity the graph was built from.
+
+    The key is kept on the graph and only computed again when its payload or identity is replaced.
+    """
+    identity = (graph.flow_id, graph.flow_name, graph.user_id)
+    cached = graph._definition_key
+    if cached is not None and cached[0] is graph.raw_graph_data and cached[1] == identity:
+        return cached[2]
+    definition = dump_graph_definition(graph)
+    key = hashlib.sha256(orjson.dumps(definition, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    graph._definition_key = (graph.raw_graph_data, identity, key)
+    return key
+
+
+def dump_graph_definition(graph: Graph) -> dict[str, Any]:
+    """Returns what is needed to build a graph that snapshots of `graph` can be restored on."""
+    return {
+        "payload": graph.dump()["data"],
+        "flow_id": graph.flow_id,
+        "flow_name": graph.flow_name,
+        "user_id": graph.user_id,
+    }
+
+
+def load_graph_definition(definition: dict[str, Any]) -> Graph:
+    """Builds the graph a snapshot is restored on from a definition created by `dump_graph_definition`."""
+    from langflow.graph.graph.base import Graph
+
+    return Graph.from_payload(
+        orjson.loads(orjson.dumps(definition["payload"])),
+        flow_id=definition["flow_id"],
+        flow_name=definition["flow_name"],
+        user_id=definition["user_id"],
+    )
+
+
+def dump_graph_state(graph: Graph) -> dict[str, Any]:
+    """Returns the graph-level run state of `graph`.
+
+    The state of each vertex is dumped separately with `dump_vertex_state` so that
+    vertices that did not change can be left out of later snapshots.
+    """
+    state = {field: getattr(graph, field) for field in GRAPH_STATE_FIELDS}
+    state["_run_queue"] = list(graph._run_queue)
+    state["run_manager"] = {field: getattr(graph.run_manager, field) for field in RUN_MANAGER_FIELDS}
+    return {
+        "version": GRAPH_SNAPSHOT_VERSION,
+        "run_id": graph._run_id,
+        "state": state,
+    }
+
+
+def dump_vertex_state(vertex: Vertex) -> dict[str, Any]:
+    state = {field: getattr(vertex, field) for field in VERTEX_STATE_FIELDS}
+    state["built_object"] = None if isinstance(vertex.built_object, UnbuiltObject) else vertex.built_object
+    state["built_result"] = None if isinstance(vertex.built_result, UnbuiltResult) else vertex.built_result
+    state["state"] = vertex.state.value
+    state["raw_params"] = _raw_param_overrides(vertex)
+    return state
+
+
+def restore_graph(template: Graph, graph_state: dict[str, Any], vertex_states: dict[str, dict[str, Any]]) -> Graph:
+    """Returns a fork of `template` with the run state of a snapshot applied.
+
+    Raises:
+        ValueError: If the snapshot was created by an incompatible version.
+    """
+    if graph_state.get("version") != GRAPH_SNAPSHOT_VERSION:
+        msg = f"Unsupported graph snapshot version: {graph_state.get('version')}"
+        raise ValueError(msg)
+    graph = template.fork()
+    state = graph_state["state"]
+    for field in GRAPH_STATE_FIELDS:
+        setattr(graph, field, state[field])
+    graph._run_queue = deque(state["_run_queue"])
+    for field in RUN_MANAGER_FIELDS:
+        setattr(graph.run_manager, field, state["run_manager"][field])
+    graph.set_run_id(graph_state["run_id"])
+    graph.set_run_name()
+
+    for vertex_id, vertex_state in vertex_states.items():
+        vertex = graph.vertex_map.get(vertex_id)
+        if vertex is None:
+            continue
+        if vertex_state["raw_params"]:
+            vertex.update_raw_params(vertex_state["raw_params"], overwrite=True)
+        for field in VERTEX_STATE_FIELDS:
+            setattr(vertex, field, vertex_state[field])
+        if vertex.built_object is None:
+            vertex.built_object = UnbuiltObject()
+        vertex.state = VertexStates(vertex_state["state"])
+    return graph
+
+
+def _raw_param_overrides(vertex: Vertex) -> dict[str, Any]:
+    """Returns the raw params that were changed after the vertex was built from its node data."""
+    template = vertex.data["node"].get("template", {})
+    overrides = {}
+    for key, value in vertex.raw_params.items():
+        if not isinstance(value, _PRIMITIVE_TYPES):
+            continue
+        field = template.get(key)
+        if not isinstance(field, dict) or field.get("value") != value:
+            overrides[key] = value
+    return overrides
@@ -12,12 +12,9 @@ from langflow.interface.utils import extract_input_variables_from_prompt
 from langflow.schema.data import Data
 from langflow.schema.message import Message
 from langflow.serialization import serialize
-from langflow.services.database.models.transactions.crud import log_transaction as crud_log_transaction
 from langflow.services.database.models.transactions.model import TransactionBase
-from langflow.services.database.models.vertex_builds.crud import log_vertex_build as crud_log_vertex_build
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase
-from langflow.services.database.utils import session_getter
-from langflow.services.deps import get_db_service, get_settings_service
+from langflow.services.deps import get_build_log_service, get_settings_service
 
 if TYPE_CHECKING:
     from langflow.api.v1.schemas import ResultDataResponse
@@ -134,9 +131,7 @@ async def log_transaction(
             error=error,
             flow_id=flow_id if isinstance(flow_id, UUID) else UUID(flow_id),
         )
-        async with session_getter(get_db_service()) as session:
-            inserted = await crud_log_transaction(session, transaction)
-            logger.debug(f"Logged transaction: {inserted.id}")
+        await get_build_log_service().put(transaction)
     except Exception:  # noqa: BLE001
         logger.exception("Error logging transaction")
 
@@ -164,9 +159,7 @@ async def log_vertex_build(
             # Serialize artifacts using our custom serializer
             artifacts=serialize(artifacts) if artifacts else None,
         )
-        async with session_getter(get_db_service()) as session:
-            inserted = await crud_log_vertex_build(session, vertex_build)
-            logger.debug(f"Logged vertex build: {inserted.build_id}")
+        await get_build_log_service().put(vertex_build)
     except Exception:  # noqa: BLE001
         logger.exception("Error logging vertex build")
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import ast
 import asyncio
+import copy
 import inspect
 import os
 import traceback
@@ -16,13 +17,14 @@ from loguru import logger
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.schema import INPUT_COMPONENTS, OUTPUT_COMPONENTS, InterfaceComponentTypes, ResultData
 from langflow.graph.utils import UnbuiltObject, UnbuiltResult, log_transaction
+from langflow.graph.vertex.memo import vertex_memo_key
 from langflow.interface import initialize
 from langflow.interface.listing import lazy_load_dict
 from langflow.schema.artifact import ArtifactType
 from langflow.schema.data import Data
 from langflow.schema.message import Message
 from langflow.schema.schema import INPUT_FIELD_NAME, OutputValue, build_output_logs
-from langflow.services.deps import get_storage_service
+from langflow.services.deps import get_storage_service, get_vertex_memo_service
 from langflow.utils.constants import DIRECT_TYPES
 from langflow.utils.schemas import ChatOutputResponse
 from langflow.utils.util import sync_to_async, unescape_string
@@ -124,6 +126,7 @@ class Vertex:
 
     def add_result(self, name: str, result: Any) -> None:
         self.results[name] = result
+        self.graph.mark_vertex_changed(self.id)
 
     def update_graph_state(self, key, new_state, *, append: bool) -> None:
         if append:
@@ -133,6 +136,7 @@ class Vertex:
 
     def set_state(self, state: str) -> None:
         self.state = VertexStates[state]
+        self.graph.mark_vertex_changed(self.id)
         if self.state == VertexStates.INACTIVE and self.graph.in_degree_map[self.id] <= 1:
             # If the vertex is inactive and has only one in degree
             # it means that it is not a merge point in the graph
@@ -215,6 +219,45 @@ class Vertex:
         self.built_object = state.get("built_object") or UnbuiltObject()
         self.built_result = state.get("built_result") or UnbuiltResult()
 
+    def fork(self, graph: Graph) -> Vertex:
+        """Creates a copy of the vertex bound to `graph` with a clean run state.
+
+        The parsed node data is shared with the original vertex, while everything
+        that changes during a build (results, artifacts, logs, component instance)
+        starts empty. Vertex references in the params are remapped by the graph
+        once every vertex has been forked.
+
+        Args:
+            graph (Graph): The graph the new vertex belongs to.
+
+        Returns:
+            Vertex: The forked vertex.
+        """
+        vertex = copy.copy(self)
+        vertex.graph = graph
+        vertex._lock = asyncio.Lock()
+        vertex.steps = [getattr(vertex, step.__name__) for step in self.steps]
+        vertex.steps_ran = []
+        vertex.custom_component = None
+        vertex.built = False
+        vertex.built_object = UnbuiltObject()
+        vertex.built_result = None
+        vertex.will_stream = False
+        vertex.updated_raw_params = False
+        vertex.task_id = None
+        vertex.result = None
+        vertex.results = {}
+        vertex.artifacts = {}
+        vertex.artifacts_raw = {}
+        vertex.artifacts_type = {}
+        vertex.outputs_logs = {}
+        vertex.logs = {}
+        vertex.build_times = self.build_times.copy()
+        vertex.state = VertexStates.ACTIVE
+        vertex.log_transaction_tasks = set()
+        vertex._successors_ids = None
+        return vertex
+
     def set_top_level(self, top_level_vertices: list[str]) -> None:
         self.parent_is_top_level = self.parent_node_id in top_level_vertices
 
@@ -476,6 +519,7 @@ class Vertex:
         self.raw_params.update(new_params)
         self.params = self.raw_params.copy()
         self.updated_raw_params = True
+        self.graph.mark_vertex_changed(self.id)
 
     def instantiate_component(self, user_id=None) -> None:
         if not self.custom_component:
@@ -508,12 +552,16 @@ class Vertex:
                 self.custom_component.set_event_manager(event_manager)
             custom_params = initialize.loading.get_params(self.params)
 
-        await self._build_results(
-            custom_component=custom_component,
-            custom_params=custom_params,
-            fallback_to_env_vars=fallback_to_env_vars,
-            base_type=self.base_type,
-        )
+        memo_key = self._get_memo_key(custom_component, custom_params)
+        if memo_key is None or not await self._restore_memoized_outputs(custom_component, memo_key):
+            await self._build_results(
+                custom_component=custom_component,
+                custom_params=custom_params,
+                fallback_to_env_vars=fallback_to_env_vars,
+                base_type=self.base_type,
+            )
+            if memo_key is not None:
+                await self._memoize_outputs(memo_key)
 
         self._validate_built_object()
 
@@ -763,6 +811,38 @@ class Vertex:
             msg = f"Error building Component {self.display_name}: \n\n{exc}"
             raise ComponentBuildError(msg, tb) from exc
 
+    def _get_memo_key(self, custom_component, custom_params) -> str | None:
+        """Returns the key the outputs of this build are memoized under, or None if they are not memoized."""
+        if self.base_type != "component" or not getattr(custom_component, "memoize_outputs", False):
+            return None
+        if not get_vertex_memo_service().enabled:
+            return None
+        return vertex_memo_key(self, custom_params)
+
+    async def _restore_memoized_outputs(self, custom_component, memo_key: str) -> bool:
+        """Restores the outputs of an earlier build with the same inputs, if there is one."""
+        memoized = await get_vertex_memo_service().get(memo_key)
+        if memoized is None:
+            return False
+        logger.debug(f"Reusing the memoized outputs of {self.display_name}")
+        custom_component._output_logs = memoized["logs"]
+        for name, value in memoized["results"].items():
+            custom_component.get_output(name).value = value
+        self._update_built_object_and_artifacts((custom_component, memoized["results"], memoized["artifacts"]))
+        self.outputs_logs = memoized["outputs_logs"]
+        return True
+
+    async def _memoize_outputs(self, memo_key: str) -> None:
+        await get_vertex_memo_service().set(
+            memo_key,
+            {
+                "results": self.built_object,
+                "artifacts": self.artifacts,
+                "outputs_logs": self.outputs_logs,
+                "logs": self.logs,
+            },
+        )
+
     def _update_built_object_and_artifacts(self, result: Any | tuple[Any, dict] | tuple[Component, Any, dict]) -> None:
         """Updates the built object and its artifacts."""
         if isinstance(result, tuple):
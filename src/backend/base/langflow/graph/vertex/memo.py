@@ -0,0 +1,85 @@
+"""Content-addressed keys for memoizing the outputs of a vertex.
+
+A component that sets `memoize_outputs = True` promises that its outputs only depend on its
+code and its params. The key of a build hashes exactly that: the component's code, the outputs
+that are connected and the resolved params, which include the results of the upstream vertices.
+The ids and timestamps of messages and other models change on every run without changing
+their content, so they are left out.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import date, datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import orjson
+import pandas as pd
+from pydantic import BaseModel
+
+from langflow.schema.message import Message
+
+if TYPE_CHECKING:
+    from langflow.graph.vertex.base import Vertex
+
+MEMO_VERSION = 1
+VOLATILE_FIELDS = frozenset({"id", "timestamp", "flow_id"})
+
+
+class UnfingerprintableValueError(TypeError):
+    """Raised for a param whose content cannot be hashed, such as a model client."""
+
+
+def fingerprint_value(value: Any) -> Any:
+    """Returns a JSON-serializable value that only changes when the content of `value` changes.
+
+    Raises:
+        UnfingerprintableValueError: If the value is an object whose content is unknown.
+    """
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, bytes):
+        return {"__bytes__": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return fingerprint_value(value.value)
+    if isinstance(value, pd.DataFrame):
+        return {"__dataframe__": value.to_json(orient="split", date_format="iso", default_handler=str)}
+    if isinstance(value, BaseModel):
+        dumped = {key: item for key, item in value.model_dump().items() if key not in VOLATILE_FIELDS}
+        if isinstance(value, Message) and isinstance(dumped.get("data"), dict):
+            # A message mirrors its fields in its data
+            dumped["data"] = {key: item for key, item in dumped["data"].items() if key not in VOLATILE_FIELDS}
+        return {"__model__": type(value).__qualname__, **fingerprint_value(dumped)}
+    if isinstance(value, dict):
+        return {str(key): fingerprint_value(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [fingerprint_value(item) for item in value]
+    if isinstance(value, set | frozenset):
+        return sorted((fingerprint_value(item) for item in value), key=repr)
+    msg = f"Cannot fingerprint a value of type {type(value).__name__}"
+    raise UnfingerprintableValueError(msg)
+
+
+def vertex_memo_key(vertex: Vertex, params: dict[str, Any]) -> str | None:
+    """Returns the memoization key of a build of `vertex` with `params`.
+
+    Returns None if any of the params cannot be fingerprinted, in which case the build is not memoized.
+    """
+    code = vertex.data["node"].get("template", {}).get("code", {}).get("value", "")
+    try:
+        fingerprint = {
+            "version": MEMO_VERSION,
+            "code": hashlib.sha256(str(code).encode()).hexdigest(),
+            "outputs": sorted(str(name) for name in vertex.edges_source_names),
+            "params": {key: fingerprint_value(value) for key, value in params.items() if key != "code"},
+        }
+        payload = orjson.dumps(fingerprint, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    except (UnfingerprintableValueError, orjson.JSONEncodeError):
+        return None
+    return hashlib.sha256(payload).hexdigest()
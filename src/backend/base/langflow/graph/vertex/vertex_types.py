@@ -425,6 +425,7 @@ class InterfaceVertex(ComponentVertex):
         # Update artifacts with the message
         # and remove the stream_url
         self.finalize_build()
+        self.graph.mark_vertex_changed(self.id)
         logger.debug(f"Streamed message: {complete_message}")
         # Set the result in the vertex of origin
         edges = self.get_edge_with_target(self.id)
@@ -433,6 +434,7 @@ class InterfaceVertex(ComponentVertex):
             for key, value in origin_vertex.results.items():
                 if isinstance(value, AsyncIterator | Iterator):
                     origin_vertex.results[key] = complete_message
+            self.graph.mark_vertex_changed(origin_vertex.id)
         if (
             self.custom_component
             and hasattr(self.custom_component, "should_store_message")
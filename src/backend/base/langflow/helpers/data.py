@@ -1,6 +1,6 @@
 from langchain_core.documents import Document
 
-from langflow.schema import Data
+from langflow.schema import Data, DataBatch
 from langflow.schema.message import Message
 
 
@@ -16,7 +16,7 @@ def docs_to_data(documents: list[Document]) -> list[Data]:
     return [Data.from_document(document) for document in documents]
 
 
-def data_to_text_list(template: str, data: Data | list[Data]) -> tuple[list[str], list[Data]]:
+def data_to_text_list(template: str, data: Data | list[Data] | DataBatch) -> tuple[list[str], list[Data]]:
     r"""Formats `text` within Data objects based on a given template.
 
     Converts a Data object or a list of Data objects into a tuple containing a list of formatted strings
@@ -24,7 +24,7 @@ def data_to_text_list(template: str, data: Data | list[Data]) -> tuple[list[str]
 
     Args:
         template (str): The format string template to be used for formatting the data.
-        data (Data | list[Data]): A single Data object or a list of Data objects to be formatted.
+        data (Data | list[Data] | DataBatch): A single Data object or a list of Data objects to be formatted.
 
     Returns:
         tuple[list[str], list[Data]]: A tuple containing a list of formatted strings based on the
@@ -41,6 +41,9 @@ def data_to_text_list(template: str, data: Data | list[Data]) -> tuple[list[str]
         msg = f"Template must be a string, but got {type(template)}"
         raise TypeError(msg)
 
+    if isinstance(data, DataBatch):
+        return data.format(template), data.to_data_list()
+
     if isinstance(data, (Data)):
         data = [data]
     # Check if there are any format strings in the template
@@ -59,18 +62,22 @@ def data_to_text_list(template: str, data: Data | list[Data]) -> tuple[list[str]
     return formatted_text, data_
 
 
-def data_to_text(template: str, data: Data | list[Data], sep: str = "\n") -> str:
+def data_to_text(template: str, data: Data | list[Data] | DataBatch, sep: str = "\n") -> str:
     r"""Converts data into a formatted text string based on a given template.
 
     Args:
         template (str): The template string used to format each data item.
-        data (Data | list[Data]): A single data item or a list of data items to be formatted.
+        data (Data | list[Data] | DataBatch): A single data item or a list of data items to be formatted.
         sep (str, optional): The separator to use between formatted data items. Defaults to "\n".
 
     Returns:
         str: A string containing the formatted data items separated by the specified separator.
     """
-    formatted_text, _ = data_to_text_list(template, data)
+    if isinstance(data, DataBatch):
+        # Formatted column by column, without building a Data for every record
+        formatted_text = data.format(template)
+    else:
+        formatted_text, _ = data_to_text_list(template, data)
     sep = "\n" if sep is None else sep
     return sep.join(formatted_text)
 
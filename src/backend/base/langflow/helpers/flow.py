@@ -319,18 +319,42 @@ async def generate_unique_flow_name(flow_name, user_id, session):
 
 def json_schema_from_flow(flow: Flow) -> dict:
     """Generate JSON schema from flow input nodes."""
-    from langflow.graph.graph.base import Graph
+    if flow.mcp_tool_schema is not None:
+        return flow.mcp_tool_schema
+    return json_schema_from_flow_data(flow.data)
 
-    # Get the flow's data which contains the nodes and their configurations
-    flow_data = flow.data if flow.data else {}
 
-    graph = Graph.from_payload(flow_data)
-    input_nodes = [vertex for vertex in graph.vertices if vertex.is_input]
+def json_schema_from_flow_data(flow_data: dict | None) -> dict:
+    """Generate JSON schema from the input nodes of the data of a flow.
+
+    The nodes are read from the JSON of the flow, so no graph is built.
+    """
+    from langflow.graph.graph.utils import process_flow
+    from langflow.graph.schema import INPUT_COMPONENTS
+    from langflow.graph.vertex.schema import NodeTypeEnum
+
+    # Get the flow's data which contains the nodes and their configurations
+    flow_data = flow_data or {}
+    if "data" in flow_data:
+        flow_data = flow_data["data"]
+    nodes = flow_data.get("nodes", [])
+    if any(node.get("data", {}).get("node", {}).get("flow") for node in nodes):
+        # Group nodes are replaced by the nodes they hold, as when building the graph
+        nodes = process_flow({"nodes": nodes, "edges": flow_data.get("edges", [])})["nodes"]
+
+    input_nodes = [
+        node["data"]["node"]
+        for node in nodes
+        if node.get("type") != NodeTypeEnum.NoteNode
+        and (
+            any(input_component_name in node["id"] for input_component_name in INPUT_COMPONENTS)
+            or node["data"]["node"].get("is_input")
+        )
+    ]
 
     properties = {}
     required = []
-    for node in input_nodes:
-        node_data = node.data["node"]
+    for node_data in input_nodes:
         template = node_data["template"]
 
         for field_name, field_data in template.items():
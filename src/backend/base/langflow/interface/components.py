@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
+import hashlib
 import json
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+import orjson
+from fastapi.encoders import jsonable_encoder
 from loguru import logger
 
+from langflow.custom.directory_reader.index_cache import ComponentIndexCache
 from langflow.custom.utils import abuild_custom_components, build_custom_components
 
 if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
 
 
-async def aget_all_types_dict(components_paths):
+async def aget_all_types_dict(components_paths, index_cache: ComponentIndexCache | None = None):
     """Get all types dictionary combining native and custom components."""
-    return await abuild_custom_components(components_paths=components_paths)
+    return await abuild_custom_components(components_paths=components_paths, index_cache=index_cache)
 
 
 def get_all_types_dict(components_paths):
@@ -56,6 +64,10 @@ def get_all_components(components_paths, *, as_dict=False):
 
 
 all_types_dict_cache = None
+all_types_catalog_cache: RenderedCatalog | None = None
+COMPONENT_INDEX_FILE = "component_index.json"
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 9
 
 
 async def get_and_cache_all_types_dict(
@@ -64,6 +76,77 @@ async def get_and_cache_all_types_dict(
     global all_types_dict_cache  # noqa: PLW0603
     if all_types_dict_cache is None:
         logger.debug("Building langchain types dict")
-        all_types_dict_cache = await aget_all_types_dict(settings_service.settings.components_path)
+        settings = settings_service.settings
+        index_cache = None
+        if settings.component_index_cache and settings.config_dir:
+            index_cache = ComponentIndexCache(Path(settings.config_dir) / COMPONENT_INDEX_FILE)
+            await asyncio.to_thread(index_cache.load)
+        all_types_dict_cache = await aget_all_types_dict(settings.components_path, index_cache=index_cache)
+        if index_cache is not None:
+            logger.debug(f"Reused {index_cache.hits} and built {index_cache.misses} component(s)")
+            await asyncio.to_thread(index_cache.save)
 
     return all_types_dict_cache
+
+
+@dataclass(frozen=True)
+class RenderedCatalog:
+    """The all types dict serialized once, with its compressed variants and a strong ETag."""
+
+    body: bytes
+    etag: str
+    encodings: dict[str, bytes] = field(default_factory=dict)
+    source: dict | None = field(default=None, compare=False, repr=False)
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """Whether an `If-None-Match` header names the current catalog."""
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or self.etag in tags
+
+    def negotiate(self, accept_encoding: str | None) -> str | None:
+        """Returns the precomputed encoding the client accepts, brotli first, or None for the plain body."""
+        accepted = set()
+        for coding in (accept_encoding or "").split(","):
+            name, _, params = coding.strip().partition(";")
+            try:
+                quality = float(params.strip().removeprefix("q=")) if params.strip().startswith("q=") else 1.0
+            except ValueError:
+                quality = 1.0
+            if quality > 0:
+                accepted.add(name.strip().lower())
+        for encoding in ("br", "gzip"):
+            if encoding in self.encodings and (encoding in accepted or "*" in accepted):
+                return encoding
+        return None
+
+
+def render_all_types_dict(all_types_dict: dict) -> RenderedCatalog:
+    """Serializes the all types dict and compresses it for every encoding available."""
+    option = orjson.OPT_NON_STR_KEYS
+    body = orjson.dumps(all_types_dict, default=jsonable_encoder, option=option)
+    # Hashed with sorted keys so that workers which loaded the components in another order agree on the tag
+    manifest = orjson.dumps(all_types_dict, default=jsonable_encoder, option=option | orjson.OPT_SORT_KEYS)
+    encodings = {"gzip": gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)}
+    try:
+        import brotli
+    except ImportError:
+        pass
+    else:
+        encodings["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+    return RenderedCatalog(
+        body=body,
+        etag=f'"{hashlib.sha256(manifest).hexdigest()}"',
+        encodings=encodings,
+        source=all_types_dict,
+    )
+
+
+async def get_and_cache_all_types_catalog(settings_service: SettingsService) -> RenderedCatalog:
+    """Returns the rendered all types dict, rendered again only when the components were loaded again."""
+    global all_types_catalog_cache  # noqa: PLW0603
+    all_types_dict = await get_and_cache_all_types_dict(settings_service)
+    if all_types_catalog_cache is None or all_types_catalog_cache.source is not all_types_dict:
+        all_types_catalog_cache = await asyncio.to_thread(render_all_types_dict, all_types_dict)
+    return all_types_catalog_cache
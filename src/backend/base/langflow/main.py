@@ -34,7 +34,12 @@ from langflow.interface.components import get_and_cache_all_types_dict
 from langflow.interface.utils import setup_llm_caching
 from langflow.logging.logger import configure
 from langflow.middleware import ContentSizeLimitMiddleware
-from langflow.services.deps import get_settings_service, get_telemetry_service
+from langflow.services.deps import (
+    get_process_pool_service,
+    get_settings_service,
+    get_telemetry_service,
+    get_webhook_queue_service,
+)
 from langflow.services.utils import initialize_services, teardown_services
 
 if TYPE_CHECKING:
@@ -127,6 +132,8 @@ def get_lifespan(*, fix_migration=False, version=None):
             await create_or_update_starter_projects(all_types_dict)
             telemetry_service.start()
             await load_flows_from_directory()
+            await get_webhook_queue_service().start()
+            await get_process_pool_service().start()
             yield
 
         except Exception as exc:
@@ -10,6 +10,7 @@ from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.schema.message import Message
+from langflow.services.database.models.message.crud import encode_message_cursor, paginate_messages
 from langflow.services.database.models.message.model import MessageRead, MessageTable
 from langflow.services.deps import session_scope
 from langflow.utils.async_helpers import run_until_complete
@@ -23,6 +24,9 @@ def _get_variable_query(
     order: str | None = "DESC",
     flow_id: UUID | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
+    *,
+    keyset: bool = False,
 ):
     stmt = select(MessageTable).where(MessageTable.error == False)  # noqa: E712
     if sender:
@@ -33,7 +37,12 @@ def _get_variable_query(
         stmt = stmt.where(MessageTable.session_id == session_id)
     if flow_id:
         stmt = stmt.where(MessageTable.flow_id == flow_id)
-    if order_by:
+    if keyset or cursor:
+        if order_by != "timestamp":
+            msg = "Cursor pagination requires ordering by timestamp"
+            raise ValueError(msg)
+        stmt = paginate_messages(stmt, cursor, descending=order == "DESC")
+    elif order_by:
         col = getattr(MessageTable, order_by).desc() if order == "DESC" else getattr(MessageTable, order_by).asc()
         stmt = stmt.order_by(col)
     if limit:
@@ -77,6 +86,7 @@ async def aget_messages(
     order: str | None = "DESC",
     flow_id: UUID | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
 ) -> list[Message]:
     """Retrieves messages from the monitor service based on the provided filters.
 
@@ -88,16 +98,42 @@ async def aget_messages(
         order (Optional[str]): The order in which to retrieve the messages. Defaults to "DESC".
         flow_id (Optional[UUID]): The flow ID associated with the messages.
         limit (Optional[int]): The maximum number of messages to retrieve.
+        cursor (Optional[str]): Only retrieve the messages after this cursor, as returned by
+            `aget_messages_page`. Requires ordering by timestamp.
 
     Returns:
         List[Data]: A list of Data objects representing the retrieved messages.
     """
     async with session_scope() as session:
-        stmt = _get_variable_query(sender, sender_name, session_id, order_by, order, flow_id, limit)
+        stmt = _get_variable_query(sender, sender_name, session_id, order_by, order, flow_id, limit, cursor)
         messages = await session.exec(stmt)
         return [await Message.create(**d.model_dump()) for d in messages]
 
 
+async def aget_messages_page(
+    sender: str | None = None,
+    sender_name: str | None = None,
+    session_id: str | UUID | None = None,
+    order: str | None = "DESC",
+    flow_id: UUID | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> tuple[list[Message], str | None]:
+    """Retrieves a page of messages ordered by timestamp using keyset pagination.
+
+    Returns the messages and the cursor to pass to the next call, which is None when
+    there are no more messages. With `order="DESC"` (the default) the first page holds
+    the last `limit` messages.
+    """
+    async with session_scope() as session:
+        stmt = _get_variable_query(
+            sender, sender_name, session_id, "timestamp", order, flow_id, limit, cursor, keyset=True
+        )
+        rows = list(await session.exec(stmt))
+        next_cursor = encode_message_cursor(rows[-1]) if limit and len(rows) == limit else None
+        return [await Message.create(**d.model_dump()) for d in rows], next_cursor
+
+
 def add_messages(messages: Message | list[Message], flow_id: str | UUID | None = None):
     """DEPRECATED - Add a message to the monitor service.
 
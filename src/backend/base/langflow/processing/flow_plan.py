@@ -0,0 +1,147 @@
+"""Cache of compiled flow plans used by the run endpoints.
+
+Building a `Graph` from a flow payload parses every node, validates every edge,
+computes the adjacency maps and instantiates every component. For flows that are
+run over and over through the API this work is identical on every request, so we
+keep a compiled template graph per flow version and fork it for each run.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from cachetools import LRUCache
+from loguru import logger
+
+from langflow.graph.graph.base import Graph
+from langflow.processing.process import process_tweaks
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from uuid import UUID
+
+    from langflow.schema.graph import Tweaks
+
+
+@dataclass(frozen=True)
+class FlowPlan:
+    """A compiled, read-only template of a flow.
+
+    The template graph is never run. Each run gets its own graph through `instantiate`.
+    """
+
+    flow_id: str
+    updated_at: str | None
+    tweaks_fingerprint: str
+    graph: Graph
+
+    def instantiate(self, user_id: str | None = None) -> Graph:
+        """Returns a new graph with a fresh run state for a single run of the flow."""
+        return self.graph.fork(user_id=user_id)
+
+
+def fingerprint_tweaks(tweaks: Tweaks | dict[str, Any] | None, *, stream: bool = False) -> str:
+    """Returns a stable hash of the tweaks applied to a flow."""
+    if tweaks is not None and not isinstance(tweaks, dict):
+        tweaks = tweaks.model_dump()
+    payload = orjson.dumps(
+        {"tweaks": tweaks or {}, "stream": stream},
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+class FlowPlanCache:
+    """A bounded LRU cache of `FlowPlan` objects.
+
+    Plans are keyed by flow id, the flow's `updated_at` and a fingerprint of the tweaks,
+    so editing a flow naturally produces a new key. `invalidate` drops every plan of a flow
+    so that stale versions do not linger until they are evicted.
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        self.max_size = max_size
+        self._cache: LRUCache[tuple[str, str | None, str], FlowPlan] = LRUCache(maxsize=max(max_size, 1))
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get_or_build(
+        self,
+        *,
+        flow_id: str,
+        flow_name: str | None,
+        flow_data: dict,
+        updated_at: datetime | str | None,
+        tweaks: Tweaks | dict[str, Any] | None,
+        stream: bool = False,
+    ) -> FlowPlan:
+        """Returns the plan for a flow version, building it on a miss."""
+        updated_at_key = updated_at.isoformat() if hasattr(updated_at, "isoformat") else updated_at
+        tweaks_fingerprint = fingerprint_tweaks(tweaks, stream=stream)
+        key = (flow_id, updated_at_key, tweaks_fingerprint)
+        if self.enabled:
+            with self._lock:
+                plan = self._cache.get(key)
+                if plan is not None:
+                    self.hits += 1
+                    return plan
+                self.misses += 1
+
+        graph_data = process_tweaks(copy.deepcopy(flow_data), tweaks or {}, stream=stream)
+        graph = Graph.from_payload(graph_data, flow_id=flow_id, flow_name=flow_name)
+        plan = FlowPlan(
+            flow_id=flow_id,
+            updated_at=updated_at_key,
+            tweaks_fingerprint=tweaks_fingerprint,
+            graph=graph,
+        )
+        if self.enabled:
+            with self._lock:
+                self._cache[key] = plan
+        return plan
+
+    def invalidate(self, flow_id: UUID | str) -> None:
+        """Removes every cached plan of a flow."""
+        flow_id_str = str(flow_id)
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == flow_id_str]:
+                self._cache.pop(key, None)
+        logger.debug(f"Invalidated flow plans for flow {flow_id_str}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_flow_plan_cache: FlowPlanCache | None = None
+
+
+def get_flow_plan_cache() -> FlowPlanCache:
+    """Returns the process-wide flow plan cache."""
+    global _flow_plan_cache  # noqa: PLW0603
+    if _flow_plan_cache is None:
+        _flow_plan_cache = FlowPlanCache(max_size=get_settings_service().settings.flow_plan_cache_size)
+    return _flow_plan_cache
+
+
+def invalidate_flow_plan(flow_id: UUID | str) -> None:
+    """Drops the cached plans of a flow, if the cache has been created."""
+    if _flow_plan_cache is not None:
+        _flow_plan_cache.invalidate(flow_id)
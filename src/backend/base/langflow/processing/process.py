@@ -62,6 +62,45 @@ async def run_graph_internal(
     return run_outputs, effective_session_id
 
 
+async def run_graph_batch_internal(
+    graph: Graph,
+    flow_id: str,
+    *,
+    session_id: str | None = None,
+    session_ids: list[str] | None = None,
+    inputs: list[InputValueRequest],
+    outputs: list[str] | None = None,
+    max_concurrency: int | None = None,
+) -> tuple[list[RunOutputs], list[str]]:
+    """Run the graph once per input, concurrently, and return the results in the order of the inputs.
+
+    Each input runs in its own session, given by `session_ids` or derived from the session ID,
+    which defaults to the flow ID, as `{session_id}-{index}`. The session IDs are returned with the results.
+    """
+    effective_session_id = session_id or flow_id
+    if session_ids is None:
+        session_ids = [f"{effective_session_id}-{index}" for index in range(len(inputs))]
+    components = []
+    inputs_list = []
+    types = []
+    for input_value_request in inputs:
+        components.append(input_value_request.components or [])
+        inputs_list.append({INPUT_FIELD_NAME: input_value_request.input_value or ""})
+        types.append(input_value_request.type)
+
+    fallback_to_env_vars = get_settings_service().settings.fallback_to_env_var
+    run_outputs = await graph.arun_batch(
+        inputs_list,
+        inputs_components=components,
+        types=types,
+        outputs=outputs or [],
+        session_ids=session_ids,
+        fallback_to_env_vars=fallback_to_env_vars,
+        max_concurrency=max_concurrency,
+    )
+    return run_outputs, session_ids
+
+
 async def run_graph(
     graph: Graph,
     input_value: str,
@@ -6,6 +6,7 @@ from loguru import logger
 from pydantic import BaseModel
 
 from langflow.schema.data import Data
+from langflow.schema.data_batch import DataBatch
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.encoders import CUSTOM_ENCODERS
 from langflow.schema.message import Message
@@ -41,7 +42,7 @@ def get_artifact_type(value, build_result=None) -> str:
         case dict():
             result = ArtifactType.OBJECT
 
-        case list() | DataFrame():
+        case list() | DataFrame() | DataBatch():
             result = ArtifactType.ARRAY
     if result == ArtifactType.UNKNOWN and (
         (build_result and isinstance(build_result, Generator))
@@ -68,7 +69,12 @@ def post_process_raw(raw, artifact_type: str):
     if artifact_type == ArtifactType.STREAM.value:
         raw = ""
     elif artifact_type == ArtifactType.ARRAY.value:
-        raw = raw.to_dict(orient="records") if isinstance(raw, DataFrame) else _to_list_of_dicts(raw)
+        if isinstance(raw, DataBatch):
+            raw = raw.to_records()
+        elif isinstance(raw, DataFrame):
+            raw = raw.to_dict(orient="records")
+        else:
+            raw = _to_list_of_dicts(raw)
     elif artifact_type == ArtifactType.UNKNOWN.value and raw is not None:
         if isinstance(raw, BaseModel | dict):
             try:
@@ -1,10 +1,13 @@
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 import pandas as pd
 from pandas import DataFrame as pandas_DataFrame
 
 from langflow.schema.data import Data
 
+if TYPE_CHECKING:
+    from langflow.schema.data_batch import DataBatch
+
 
 class DataFrame(pandas_DataFrame):
     """A pandas DataFrame subclass specialized for handling collections of Data objects.
@@ -54,6 +57,12 @@ class DataFrame(pandas_DataFrame):
         list_of_dicts = self.to_dict(orient="records")
         return [Data(data=row) for row in list_of_dicts]
 
+    def to_data_batch(self) -> "DataBatch":
+        """Converts the DataFrame to a DataBatch that shares its columns."""
+        from langflow.schema.data_batch import DataBatch
+
+        return DataBatch.from_dataframe(self)
+
     def add_row(self, data: dict | Data) -> "DataFrame":
         """Adds a single row to the dataset.
 
@@ -1,3 +1,3 @@
-from .serialization import serialize
+from .serialization import serialize, serialize_json
 
-__all__ = ["serialize"]
+__all__ = ["serialize", "serialize_json"]
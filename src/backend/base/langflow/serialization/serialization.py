@@ -1,16 +1,20 @@
-from collections.abc import AsyncIterator, Generator, Iterator
+import functools
+from collections.abc import AsyncIterator, Callable, Generator, Iterator
+from dataclasses import is_dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, cast
+from typing import Annotated, Any, ForwardRef, Literal, TypeVar, cast, get_args, get_origin
 from uuid import UUID
 
 import numpy as np
+import orjson
 import pandas as pd
 from langchain_core.documents import Document
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, PlainSerializer, RootModel, WrapSerializer
 from pydantic.v1 import BaseModel as BaseModelV1
 
+from langflow.schema.data_batch import DataBatch
 from langflow.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
 
 
@@ -24,6 +28,11 @@ class _UnserializableSentinel:
 
 UNSERIALIZABLE_SENTINEL = _UnserializableSentinel()
 
+Encoder = Callable[[Any, int | None, int | None], Any]
+
+# Values of these types are kept as they are by containers, without going through serialize
+_PASSTHROUGH_TYPES = frozenset({int, float, bool, type(None)})
+
 
 def _serialize_str(obj: str, max_length: int | None, _) -> str:
     """Truncate long strings with ellipsis if max_length provided."""
@@ -68,10 +77,80 @@ def _serialize_iterator(_: AsyncIterator | Generator | Iterator, *__) -> str:
     return "Unconsumed Stream"
 
 
+def _may_hold_model(annotation: Any) -> bool:
+    """Returns whether values of an annotation can be models or dataclasses.
+
+    model_dump only keeps the fields of the annotated class of those values, not the fields of their subclasses.
+    """
+    if isinstance(annotation, str | ForwardRef | TypeVar):
+        return True
+    origin = get_origin(annotation)
+    if origin is None and isinstance(annotation, type):
+        return issubclass(annotation, BaseModel | BaseModelV1) or is_dataclass(annotation)
+    if origin is Literal:
+        return False
+    if origin is Annotated:
+        return _may_hold_model(get_args(annotation)[0])
+    return any(_may_hold_model(arg) for arg in get_args(annotation))
+
+
+@functools.lru_cache(maxsize=1024)
+def _pydantic_fields(cls: type[BaseModel]) -> tuple[tuple[str, ...], frozenset[str]] | None:
+    """Returns the fields `model_dump` returns for a model class and those that must be dumped by it.
+
+    Fields that have a serializer or whose values can be models are dumped by model_dump. Returns None
+    when the whole model has a serializer, in which case it is dumped as a whole.
+    """
+    if issubclass(cls, RootModel):
+        return None
+    decorators = cls.__pydantic_decorators__
+    # Serializers only used for JSON do not change what model_dump returns
+    if any(decorator.info.when_used != "json" for decorator in decorators.model_serializers.values()):
+        return None
+    with_serializer = set()
+    for decorator in decorators.field_serializers.values():
+        if decorator.info.when_used != "json":
+            if "*" in decorator.info.fields:
+                return None
+            with_serializer.update(decorator.info.fields)
+    names = []
+    for name, field in cls.model_fields.items():
+        if field.exclude:
+            continue
+        names.append(name)
+        if _may_hold_model(field.annotation) or any(
+            isinstance(metadata, PlainSerializer | WrapSerializer) for metadata in field.metadata
+        ):
+            with_serializer.add(name)
+    for name, decorator in decorators.computed_fields.items():
+        if _may_hold_model(decorator.info.return_type):
+            with_serializer.add(name)
+    return (*names, *decorators.computed_fields), frozenset(with_serializer)
+
+
 def _serialize_pydantic(obj: BaseModel, max_length: int | None, max_items: int | None) -> Any:
-    """Handle modern Pydantic models."""
-    serialized = obj.model_dump()
-    return {k: serialize(v, max_length, max_items) for k, v in serialized.items()}
+    """Handle modern Pydantic models.
+
+    Fields are read from the model and serialized in one pass, only the fields that have a serializer
+    or can hold models go through model_dump.
+    """
+    fields = _pydantic_fields(type(obj))
+    if fields is None:
+        serialized = obj.model_dump()
+        return {k: serialize(v, max_length, max_items) for k, v in serialized.items()}
+    names, with_serializer = fields
+    dumped = obj.model_dump(include=set(with_serializer)) if with_serializer else {}
+    result = {}
+    for name in names:
+        value = dumped[name] if name in with_serializer else getattr(obj, name)
+        if is_dataclass(value) and not isinstance(value, type):
+            # model_dump turns dataclasses into dictionaries
+            value = obj.model_dump(include={name})[name]
+        result[name] = serialize(value, max_length, max_items)
+    if obj.__pydantic_extra__:
+        for name, value in obj.__pydantic_extra__.items():
+            result[name] = serialize(value, max_length, max_items)
+    return result
 
 
 def _serialize_pydantic_v1(obj: BaseModelV1, max_length: int | None, max_items: int | None) -> Any:
@@ -82,8 +161,15 @@ def _serialize_pydantic_v1(obj: BaseModelV1, max_length: int | None, max_items:
 
 
 def _serialize_dict(obj: dict, max_length: int | None, max_items: int | None) -> dict:
-    """Recursively process dictionary values."""
-    return {k: serialize(v, max_length, max_items) for k, v in obj.items()}
+    """Recursively process dictionary values, keeping primitives and short strings as they are."""
+    result = {}
+    for key, value in obj.items():
+        value_type = type(value)
+        if value_type in _PASSTHROUGH_TYPES or (value_type is str and (max_length is None or len(value) <= max_length)):
+            result[key] = value
+        else:
+            result[key] = serialize(value, max_length, max_items)
+    return result
 
 
 def _serialize_list_tuple(obj: list | tuple, max_length: int | None, max_items: int | None) -> list:
@@ -92,7 +178,14 @@ def _serialize_list_tuple(obj: list | tuple, max_length: int | None, max_items:
         truncated = list(obj)[:max_items]
         truncated.append(f"... [truncated {len(obj) - max_items} items]")
         obj = truncated
-    return [serialize(item, max_length, max_items) for item in obj]
+    result = []
+    for item in obj:
+        item_type = type(item)
+        if item_type in _PASSTHROUGH_TYPES or (item_type is str and (max_length is None or len(item) <= max_length)):
+            result.append(item)
+        else:
+            result.append(serialize(item, max_length, max_items))
+    return result
 
 
 def _serialize_primitive(obj: Any, *_) -> Any:
@@ -126,6 +219,11 @@ def _serialize_dataframe(obj: pd.DataFrame, max_length: int | None, max_items: i
     return serialize(data, max_length, max_items)
 
 
+def _serialize_data_batch(obj: DataBatch, max_length: int | None, max_items: int | None) -> list[dict]:
+    """Serialize a DataBatch as the DataFrame of its columns."""
+    return _serialize_dataframe(obj.to_dataframe(), max_length, max_items)
+
+
 def _serialize_series(obj: pd.Series, max_length: int | None, max_items: int | None) -> dict:
     """Serialize pandas Series to a dictionary format."""
     if max_items is not None and len(obj) > max_items:
@@ -187,6 +285,8 @@ def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | Non
             return _serialize_dict(obj, max_length, max_items)
         case pd.DataFrame():
             return _serialize_dataframe(obj, max_length, max_items)
+        case DataBatch():
+            return _serialize_data_batch(obj, max_length, max_items)
         case pd.Series():
             return _serialize_series(obj, max_length, max_items)
         case list() | tuple():
@@ -219,6 +319,42 @@ def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | Non
             return UNSERIALIZABLE_SENTINEL
 
 
+# The serializers tried by _serialize_dispatcher for instances, in the same order
+_ENCODERS_BY_TYPE: tuple[tuple[Any, Encoder], ...] = (
+    (int | float | bool | complex, _serialize_primitive),
+    (str, _serialize_str),
+    (bytes, _serialize_bytes),
+    (datetime, _serialize_datetime),
+    (Decimal, _serialize_decimal),
+    (UUID, _serialize_uuid),
+    (Document, _serialize_document),
+    (AsyncIterator | Generator | Iterator, _serialize_iterator),
+    (BaseModel, _serialize_pydantic),
+    (BaseModelV1, _serialize_pydantic_v1),
+    (dict, _serialize_dict),
+    (pd.DataFrame, _serialize_dataframe),
+    (DataBatch, _serialize_data_batch),
+    (pd.Series, _serialize_series),
+    (list | tuple, _serialize_list_tuple),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_encoder(cls: type) -> Encoder | None:
+    """Returns the serializer of the instances of a class, found once per class.
+
+    Returns None for metaclasses, classes themselves are dispatched on every call.
+    """
+    if issubclass(cls, type):
+        return None
+    for types, encoder in _ENCODERS_BY_TYPE:
+        if issubclass(cls, types):
+            return encoder
+    if cls.__module__ == np.__name__:
+        return _serialize_numpy_type
+    return _serialize_instance
+
+
 def serialize(
     obj: Any,
     max_length: int | None = MAX_TEXT_LENGTH,
@@ -228,7 +364,7 @@ def serialize(
 ) -> Any:
     """Unified serialization with optional truncation support.
 
-    Coordinates specialized serializers through a dispatcher pattern.
+    Coordinates specialized serializers through a dispatcher pattern, whose choice is cached per type.
     Maintains recursive processing for nested structures.
 
     Args:
@@ -241,7 +377,11 @@ def serialize(
         return None
     try:
         # First try type-specific serialization
-        result = _serialize_dispatcher(obj, max_length, max_items)
+        encoder = _get_encoder(type(obj))
+        if encoder is None:
+            result = _serialize_dispatcher(obj, max_length, max_items)
+        else:
+            result = encoder(obj, max_length, max_items)
         if result is not UNSERIALIZABLE_SENTINEL:  # Special check for None since it's a valid result
             return result
 
@@ -285,3 +425,20 @@ def serialize_or_str(
         max_items: Maximum items in list-like structures, None for no truncation
     """
     return serialize(obj, max_length, max_items, to_str=True)
+
+
+def serialize_json(
+    obj: Any, max_length: int | None = MAX_TEXT_LENGTH, max_items: int | None = MAX_ITEMS_LENGTH
+) -> bytes:
+    """Serializes an object as serialize_or_str does and encodes the result as JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        max_length: Maximum length for string values, None for no truncation
+        max_items: Maximum items in list-like structures, None for no truncation
+    """
+    return orjson.dumps(
+        serialize(obj, max_length, max_items, to_str=True),
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
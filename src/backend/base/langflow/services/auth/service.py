@@ -1,15 +1,142 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import contextlib
+import hashlib
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+from sqlalchemy import case, update
 
 from langflow.services.base import Service
+from langflow.services.cache.service import ThreadingInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.services.database.models.user.model import UserRead
     from langflow.services.settings.service import SettingsService
 
+AUTH_CACHE_MAX_SIZE = 10_000
+"""Maximum number of API keys, and separately of users, kept in the authentication cache."""
+
+
+def _api_key_digest(api_key: str) -> str:
+    # The keys themselves are not kept in memory
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
 
 class AuthService(Service):
+    """Caches authentication results and buffers the usage counters of API keys.
+
+    A valid API key is cached with its user, and the user of a JWT subject with its columns, for
+    `auth_cache_ttl` seconds, so authenticating a request does not query the database every time.
+    Entries are dropped when the key is deleted or the user changes. Uses of API keys are counted
+    in memory and written in one UPDATE every `api_key_usage_flush_interval` seconds.
+    """
+
     name = "auth_service"
 
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        settings = settings_service.settings
+        self.cache_ttl = settings.auth_cache_ttl
+        self.usage_flush_interval = settings.api_key_usage_flush_interval
+        self._api_keys = ThreadingInMemoryCache(max_size=AUTH_CACHE_MAX_SIZE, expiration_time=self.cache_ttl)
+        self._users = ThreadingInMemoryCache(max_size=AUTH_CACHE_MAX_SIZE, expiration_time=self.cache_ttl)
+        self._api_keys_by_user: defaultdict[UUID, set[str]] = defaultdict(set)
+        self._pending_uses: dict[UUID, tuple[int, datetime]] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    @property
+    def cache_enabled(self) -> bool:
+        return self.cache_ttl > 0
+
+    def get_api_key_user(self, api_key: str) -> tuple[UUID, UserRead] | None:
+        """Returns the id of a cached API key and a copy of its user."""
+        if not self.cache_enabled:
+            return None
+        cached = self._api_keys.get(_api_key_digest(api_key))
+        if cached is CACHE_MISS:
+            return None
+        api_key_id, user = cached
+        return api_key_id, user.model_copy()
+
+    def set_api_key_user(self, api_key: str, api_key_id: UUID, user: UserRead) -> None:
+        if not self.cache_enabled:
+            return
+        digest = _api_key_digest(api_key)
+        self._api_keys.set(digest, (api_key_id, user.model_copy()))
+        self._api_keys_by_user[user.id].add(digest)
+
+    def get_user_fields(self, user_id: UUID) -> dict[str, Any] | None:
+        """Returns the cached columns of a user."""
+        if not self.cache_enabled:
+            return None
+        cached = self._users.get(user_id)
+        return None if cached is CACHE_MISS else dict(cached)
+
+    def set_user_fields(self, user_id: UUID, fields: dict[str, Any]) -> None:
+        if self.cache_enabled:
+            self._users.set(user_id, dict(fields))
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        """Drops a user and the API keys of that user from the cache."""
+        self._users.delete(user_id)
+        for digest in self._api_keys_by_user.pop(user_id, set()):
+            self._api_keys.delete(digest)
+
+    def invalidate_api_key(self, api_key: str) -> None:
+        self._api_keys.delete(_api_key_digest(api_key))
+
+    async def record_api_key_use(self, api_key_id: UUID) -> None:
+        """Counts a use of an API key, written to the database by the next flush."""
+        uses, _ = self._pending_uses.get(api_key_id, (0, None))
+        self._pending_uses[api_key_id] = (uses + 1, datetime.now(timezone.utc))
+        if self.usage_flush_interval <= 0:
+            await self.flush_api_key_uses()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_periodically(), name="api_key_usage_flush")
+
+    async def flush_api_key_uses(self) -> None:
+        """Adds the counted uses to `total_uses` and updates `last_used_at` of every used API key."""
+        if not self._pending_uses:
+            return
+        pending, self._pending_uses = self._pending_uses, {}
+        from langflow.services.database.models.api_key.model import ApiKey
+        from langflow.services.database.utils import session_getter
+        from langflow.services.deps import get_db_service
+
+        stmt = (
+            update(ApiKey)
+            .where(ApiKey.id.in_(pending))  # type: ignore[attr-defined]
+            .values(
+                total_uses=ApiKey.total_uses + case({key: uses for key, (uses, _) in pending.items()}, value=ApiKey.id),
+                last_used_at=case({key: used_at for key, (_, used_at) in pending.items()}, value=ApiKey.id),
+            )
+        )
+        try:
+            async with session_getter(get_db_service()) as session:
+                await session.exec(stmt)  # type: ignore[call-overload]
+                await session.commit()
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).warning(f"Could not update the usage of {len(pending)} API keys")
+
+    async def _flush_periodically(self) -> None:
+        while self._pending_uses:
+            await asyncio.sleep(self.usage_flush_interval)
+            await self.flush_api_key_uses()
+
+    async def teardown(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        await self.flush_api_key_uses()
+        self._api_keys.clear()
+        self._users.clear()
+        self._api_keys_by_user.clear()
@@ -11,13 +11,14 @@ from fastapi import Depends, HTTPException, Security, status
 from fastapi.security import APIKeyHeader, APIKeyQuery, OAuth2PasswordBearer
 from jose import JWTError, jwt
 from loguru import logger
+from sqlalchemy.orm import make_transient_to_detached
 from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.websockets import WebSocket
 
 from langflow.services.database.models.api_key.crud import check_key
 from langflow.services.database.models.user.crud import get_user_by_id, get_user_by_username, update_user_last_login_at
 from langflow.services.database.models.user.model import User, UserRead
-from langflow.services.deps import get_db_service, get_session, get_settings_service
+from langflow.services.deps import get_auth_service, get_db_service, get_session, get_settings_service
 from langflow.services.settings.service import SettingsService
 
 if TYPE_CHECKING:
@@ -41,6 +42,14 @@ async def api_key_security(
     settings_service = get_settings_service()
     result: ApiKey | User | None
 
+    api_key = query_param or header_param
+    if api_key and not settings_service.auth_settings.AUTO_LOGIN:
+        auth_service = get_auth_service()
+        if cached := auth_service.get_api_key_user(api_key):
+            api_key_id, user = cached
+            await auth_service.record_api_key_use(api_key_id)
+            return user
+
     async with get_db_service().with_session() as db:
         if settings_service.auth_settings.AUTO_LOGIN:
             # Get the first user
@@ -143,7 +152,7 @@ async def get_current_user_by_jwt(
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
 
-    user = await get_user_by_id(db, user_id)
+    user = await get_user_by_jwt_subject(db, user_id)
     if user is None or not user.is_active:
         logger.info("User not found or inactive.")
         raise HTTPException(
@@ -154,6 +163,24 @@ async def get_current_user_by_jwt(
     return user
 
 
+async def get_user_by_jwt_subject(db: AsyncSession, user_id: UUID | str) -> User | None:
+    """Returns the user of a token, from the authentication cache when it is there.
+
+    A cached user is attached to `db` without querying the database, so it can be changed and
+    committed like a user that was read in the same session.
+    """
+    auth_service = get_auth_service()
+    user_uuid = user_id if isinstance(user_id, UUID) else UUID(str(user_id))
+    if fields := auth_service.get_user_fields(user_uuid):
+        cached_user = User(**fields)
+        make_transient_to_detached(cached_user)
+        return await db.merge(cached_user, load=False)
+    user = await get_user_by_id(db, user_uuid)
+    if user is not None:
+        auth_service.set_user_fields(user_uuid, user.model_dump())
+    return user
+
+
 async def get_current_user_for_websocket(
     websocket: WebSocket,
     db: Annotated[AsyncSession, Depends(get_session)],
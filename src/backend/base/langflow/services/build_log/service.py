@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.database.models.transactions.crud import log_transactions, trim_transactions
+from langflow.services.database.models.transactions.model import TransactionBase
+from langflow.services.database.models.vertex_builds.crud import log_vertex_builds, trim_vertex_builds
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+from langflow.services.database.utils import session_getter
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.services.database.service import DatabaseService
+    from langflow.services.settings.service import SettingsService
+
+BuildLogRow = TransactionBase | VertexBuildBase
+
+
+class BuildLogService(Service):
+    """Write-behind persistence for transactions and vertex builds.
+
+    Rows are buffered in a bounded queue and written in bulk every `build_log_flush_interval`
+    seconds or as soon as `build_log_batch_size` rows are waiting, whichever comes first.
+    When the queue is full, `put` waits for the writer to catch up. Trimming the history to the
+    configured limits runs every `build_log_retention_interval` seconds instead of on every insert,
+    and only for the flows and vertices that were written since the last run.
+    """
+
+    name = "build_log_service"
+
+    def __init__(self, settings_service: SettingsService, database_service: DatabaseService):
+        super().__init__()
+        self.settings_service = settings_service
+        self.database_service = database_service
+        settings = settings_service.settings
+        self.flush_interval = settings.build_log_flush_interval
+        self.batch_size = max(settings.build_log_batch_size, 1)
+        self.queue_size = settings.build_log_queue_size
+        self.retention_interval = settings.build_log_retention_interval
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[BuildLogRow] = asyncio.Queue(maxsize=self.queue_size)
+        # Rows taken from the queue by the writer that are not written yet, flushed with the queue
+        self._taken: list[BuildLogRow] = []
+        self._batch_ready = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._worker_task: asyncio.Task | None = None
+        self._retention_task: asyncio.Task | None = None
+        self._stopping = False
+        # Flows and vertices written since the last retention run
+        self._touched_flows: set[UUID] = set()
+        self._touched_vertices: set[tuple[UUID, str]] = set()
+
+    def start(self) -> None:
+        """Starts the writer and retention tasks on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._worker_task is not None and not self._worker_task.done():
+            return
+        if self._loop is not loop:
+            # asyncio primitives are bound to the loop they were first used on,
+            # so rows left behind by a closed loop are moved to new ones.
+            pending = self._drain(self._queue.qsize())
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+            for row in pending:
+                self._queue.put_nowait(row)
+            self._batch_ready = asyncio.Event()
+            self._write_lock = asyncio.Lock()
+            self._loop = loop
+        self._stopping = False
+        self._worker_task = asyncio.create_task(self._writer(), name="build_log_writer")
+        self._retention_task = asyncio.create_task(self._retention(), name="build_log_retention")
+
+    async def put(self, row: BuildLogRow) -> None:
+        """Queues a row to be written, waiting for room when the queue is full."""
+        if self._stopping:
+            await self._write([row])
+            return
+        self.start()
+        await self._queue.put(row)
+        if self._queue.qsize() >= self.batch_size:
+            self._batch_ready.set()
+
+    async def flush(self) -> None:
+        """Writes every queued row now."""
+        if self._loop is not None and self._loop is not asyncio.get_running_loop():
+            self.start()
+        if self._write_lock.locked():
+            # Wake the writer instead of waiting for the end of its flush interval
+            self._batch_ready.set()
+        async with self._write_lock:
+            batch = self._take(self._queue.qsize())
+            if batch:
+                await self._write(batch)
+
+    async def trim(self) -> None:
+        """Trims the transactions and vertex builds written since the last call to their limits."""
+        flow_ids, self._touched_flows = self._touched_flows, set()
+        vertices, self._touched_vertices = self._touched_vertices, set()
+        if not flow_ids and not vertices:
+            return
+        async with session_getter(self.database_service) as session:
+            if flow_ids:
+                await trim_transactions(session, flow_ids)
+            if vertices:
+                await trim_vertex_builds(session, vertices)
+
+    def _drain(self, max_rows: int) -> list[BuildLogRow]:
+        rows: list[BuildLogRow] = []
+        while len(rows) < max_rows:
+            try:
+                rows.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return rows
+
+    def _take(self, max_rows: int) -> list[BuildLogRow]:
+        """Returns the rows taken by the writer and up to `max_rows` queued rows, to be written by the caller."""
+        rows, self._taken = self._taken, []
+        return [*rows, *self._drain(max_rows)]
+
+    async def _writer(self) -> None:
+        while True:
+            # Kept where flush finds it while the writer waits for the lock
+            self._taken.append(await self._queue.get())
+            async with self._write_lock:
+                if not self._taken:
+                    # Written by a flush in the meantime
+                    continue
+                if self._queue.qsize() < self.batch_size - len(self._taken):
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+                self._batch_ready.clear()
+                batch = self._take(self.batch_size - len(self._taken))
+                try:
+                    await self._write(batch)
+                except Exception:  # noqa: BLE001
+                    logger.exception("Error writing build logs")
+
+    async def _retention(self) -> None:
+        while True:
+            await asyncio.sleep(self.retention_interval)
+            try:
+                await self.trim()
+            except Exception:  # noqa: BLE001
+                logger.exception("Error trimming build logs")
+
+    async def _write(self, batch: list[BuildLogRow]) -> None:
+        transactions = [row for row in batch if isinstance(row, TransactionBase)]
+        vertex_builds = [row for row in batch if isinstance(row, VertexBuildBase)]
+        if transactions:
+            await self._write_rows(log_transactions, transactions)
+            self._touched_flows.update(transaction.flow_id for transaction in transactions)
+        if vertex_builds:
+            await self._write_rows(log_vertex_builds, vertex_builds)
+            self._touched_vertices.update((build.flow_id, build.id) for build in vertex_builds)
+        logger.debug(f"Logged {len(transactions)} transactions and {len(vertex_builds)} vertex builds")
+
+    async def _write_rows(self, log_rows, rows: list) -> None:
+        try:
+            async with session_getter(self.database_service) as session:
+                await log_rows(session, rows)
+        except Exception:  # noqa: BLE001
+            if len(rows) == 1:
+                logger.exception("Error logging build row")
+                return
+            # One bad row (e.g. its flow was deleted) must not drop the whole batch
+            logger.opt(exception=True).debug("Bulk insert failed, inserting rows one by one")
+            for row in rows:
+                await self._write_rows(log_rows, [row])
+
+    async def teardown(self) -> None:
+        self._stopping = True
+        try:
+            await self.flush()
+        except Exception:  # noqa: BLE001
+            logger.exception("Error flushing build logs")
+        for task in (self._worker_task, self._retention_task):
+            if task is not None and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._worker_task = None
+        self._retention_task = None
+        try:
+            await self.flush()
+            await self.trim()
+        except Exception:  # noqa: BLE001
+            logger.exception("Error flushing build logs")
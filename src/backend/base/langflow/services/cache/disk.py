@@ -11,13 +11,14 @@ from langflow.services.cache.utils import CACHE_MISS
 
 
 class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
-    def __init__(self, cache_dir, max_size=None, expiration_time=3600) -> None:
+    def __init__(self, cache_dir, max_size=None, expiration_time=3600, *, persistent: bool = False) -> None:
         self.cache = Cache(cache_dir)
+        self.persistent = persistent
         # Let's clear the cache for now to maintain a similar
         # behavior as the in-memory cache
         # Later we should implement endpoints for the frontend to grab
         # output logs from the cache
-        if len(self.cache) > 0:
+        if not persistent and len(self.cache) > 0:
             self.cache.clear()
         self.lock = asyncio.Lock()
         self.max_size = max_size
@@ -48,7 +49,7 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
             await self._set(key, value)
 
     async def _set(self, key, value) -> None:
-        if self.max_size and len(self.cache) >= self.max_size:
+        if self.max_size and await asyncio.to_thread(len, self.cache) >= self.max_size:
             await asyncio.to_thread(self.cache.cull)
         item = {"value": pickle.dumps(value) if not isinstance(value, str | bytes) else value, "time": time.time()}
         await asyncio.to_thread(self.cache.set, key, item)
@@ -91,5 +92,8 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         return await asyncio.to_thread(self.cache.__contains__, key)
 
     async def teardown(self) -> None:
+        if self.persistent:
+            await asyncio.to_thread(self.cache.close)
+            return
         # Clean up the cache directory
         self.cache.clear(retry=True)
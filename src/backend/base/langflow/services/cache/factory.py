@@ -7,6 +7,7 @@ from typing_extensions import override
 from langflow.logging.logger import logger
 from langflow.services.cache.disk import AsyncDiskCache
 from langflow.services.cache.service import AsyncInMemoryCache, CacheService, RedisCache, ThreadingInMemoryCache
+from langflow.services.cache.tiered import TieredRedisCache
 from langflow.services.factory import ServiceFactory
 
 if TYPE_CHECKING:
@@ -33,6 +34,13 @@ class CacheServiceFactory(ServiceFactory):
             )
             if redis_cache.is_connected():
                 logger.debug("Redis cache is connected")
+                if settings_service.settings.redis_l1_cache_size > 0:
+                    return TieredRedisCache(
+                        redis_cache.client,
+                        max_size=settings_service.settings.redis_l1_cache_size,
+                        expiration_time=settings_service.settings.redis_cache_expire,
+                        channel=settings_service.settings.redis_invalidation_channel,
+                    )
                 return redis_cache
             # do not attempt to fallback to another cache type
             msg = "Failed to connect to Redis cache"
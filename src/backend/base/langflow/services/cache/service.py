@@ -218,6 +218,11 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):
             self._client = StrictRedis(host=host, port=port, db=db)
         self.expiration_time = expiration_time
 
+    @property
+    def client(self):
+        """The underlying `redis.asyncio` client."""
+        return self._client
+
     # check connection
     def is_connected(self) -> bool:
         """Check if the Redis client is connected."""
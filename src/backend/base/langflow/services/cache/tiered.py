@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import pickle
+import weakref
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple
+from uuid import uuid4
+
+import orjson
+from cachetools import TTLCache
+from loguru import logger
+
+from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType
+from langflow.services.cache.utils import CACHE_MISS
+
+if TYPE_CHECKING:
+    from langflow.graph.graph.base import Graph
+
+INVALIDATION_CHANNEL = "langflow:cache:invalidate"
+GRAPH_DEFINITION_PREFIX = "graph-definition:"
+VERTEX_STATES_SUFFIX = ":vertices"
+
+
+def _digest(blob: bytes) -> str:
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+
+class _StoredGraph(NamedTuple):
+    """What was last written to or read from Redis for the graph of a cache key."""
+
+    definition_key: str
+    digests: dict[str, str]
+    graph: weakref.ref[Graph]
+    vertex_changes: int
+
+
+class TieredRedisCache(AsyncBaseCacheService, Generic[AsyncLockType]):
+    """A Redis cache with a bounded in-process cache in front of it.
+
+    Values read or written by this worker are kept as live objects in the in-process cache,
+    so repeated reads do not touch Redis nor unpickle anything. Every write and delete is
+    published on a Redis channel and the other workers drop their local copy of the key.
+
+    Graphs cached by the chat service are not pickled as a whole. Redis holds the flow
+    payload once, a small snapshot of the graph's run state and the state of each vertex
+    in a hash, and a write only dumps and sends the vertices that changed since the last one,
+    as recorded by `Graph.mark_vertex_changed`.
+    Another worker restores the graph by forking one built from the payload.
+
+    Attributes:
+        max_size (int): Maximum number of items kept in the in-process cache.
+        expiration_time (int): Time in seconds after which a cached item expires.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        max_size: int = 256,
+        expiration_time: int = 60 * 60,
+        channel: str = INVALIDATION_CHANNEL,
+    ) -> None:
+        """Initialize a new TieredRedisCache instance.
+
+        Args:
+            client: A `redis.asyncio` client.
+            max_size (int, optional): Maximum number of items kept in the in-process cache.
+            expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+            channel (str, optional): The Redis channel used to publish invalidations.
+        """
+        self._client = client
+        self.max_size = max_size
+        self.expiration_time = expiration_time
+        self.channel = channel
+        self.node_id = uuid4().hex
+        self.lock = asyncio.Lock()
+        self._local: TTLCache[str, Any] = TTLCache(maxsize=max_size, ttl=expiration_time)
+        # Graph last written to or read from Redis, per cache key
+        self._vertex_digests: dict[str, _StoredGraph] = {}
+        self._listener_task: asyncio.Task | None = None
+
+    async def get(self, key, lock: asyncio.Lock | None = None):  # noqa: ARG002
+        if key is None:
+            return CACHE_MISS
+        self._start_listener()
+        key = str(key)
+        value = self._local.get(key, CACHE_MISS)
+        if value is not CACHE_MISS:
+            return value
+        value = await self._load(key)
+        if value is not CACHE_MISS:
+            self._local[key] = value
+        return value
+
+    async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:  # noqa: ARG002
+        self._start_listener()
+        key = str(key)
+        self._local[key] = value
+        await self._store(key, value)
+        await self._publish({"key": key})
+
+    async def upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
+        """Inserts or updates a value in the cache.
+
+        If the existing value and the new value are both dictionaries, they are merged.
+
+        Args:
+            key: The key of the item.
+            value: The value to insert or update.
+            lock: A lock to use for the operation.
+        """
+        if key is None:
+            return
+        async with lock or self.lock:
+            existing_value = await self.get(key)
+            if isinstance(existing_value, dict) and isinstance(value, dict):
+                existing_value.update(value)
+                value = existing_value
+            await self.set(key, value)
+
+    async def delete(self, key, lock: asyncio.Lock | None = None) -> None:  # noqa: ARG002
+        key = str(key)
+        self._local.pop(key, None)
+        self._vertex_digests.pop(key, None)
+        await self._client.delete(key, key + VERTEX_STATES_SUFFIX)
+        await self._publish({"key": key})
+
+    async def clear(self, lock: asyncio.Lock | None = None) -> None:  # noqa: ARG002
+        """Clear all items from the cache."""
+        self._local.clear()
+        self._vertex_digests.clear()
+        await self._client.flushdb()
+        await self._publish({"clear": True})
+
+    async def contains(self, key) -> bool:
+        """Check if the key is in the cache."""
+        if key is None:
+            return False
+        key = str(key)
+        if key in self._local:
+            return True
+        return bool(await self._client.exists(key))
+
+    async def teardown(self) -> None:
+        if self._listener_task is not None and not self._listener_task.done():
+            self._listener_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener_task
+        self._listener_task = None
+
+    def __repr__(self) -> str:
+        """Return a string representation of the TieredRedisCache instance."""
+        return f"TieredRedisCache(max_size={self.max_size}, expiration_time={self.expiration_time})"
+
+    async def _load(self, key: str):
+        raw = await self._client.get(key)
+        if not raw:
+            return CACHE_MISS
+        kind, *payload = pickle.loads(raw)
+        if kind != "graph":
+            return payload[0]
+        definition_key, graph_state, extra = payload
+        try:
+            graph = await self._load_graph(key, definition_key, graph_state)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).warning(f"Could not restore the cached graph for key '{key}'")
+            return CACHE_MISS
+        if graph is None:
+            return CACHE_MISS
+        return {"result": graph, **extra}
+
+    async def _load_graph(self, key: str, definition_key: str, graph_state: dict) -> Graph | None:
+        from langflow.graph.graph.snapshot import load_graph_definition, restore_graph
+
+        template_key = GRAPH_DEFINITION_PREFIX + definition_key
+        template = self._local.get(template_key)
+        if template is None:
+            raw_definition = await self._client.get(template_key)
+            if not raw_definition:
+                return None
+            template = load_graph_definition(pickle.loads(raw_definition))
+            self._local[template_key] = template
+
+        blobs = await self._client.hgetall(key + VERTEX_STATES_SUFFIX)
+        blobs = {
+            (vertex_id.decode() if isinstance(vertex_id, bytes) else vertex_id): blob
+            for vertex_id, blob in blobs.items()
+        }
+        vertex_states = {vertex_id: pickle.loads(blob) for vertex_id, blob in blobs.items()}
+        graph = restore_graph(template, graph_state, vertex_states)
+        digests = {vertex_id: _digest(blob) for vertex_id, blob in blobs.items()}
+        self._vertex_digests[key] = _StoredGraph(definition_key, digests, weakref.ref(graph), graph.vertex_changes)
+        return graph
+
+    async def _store(self, key: str, value: Any) -> None:
+        from langflow.graph.graph.base import Graph
+
+        if isinstance(value, dict) and isinstance(value.get("result"), Graph):
+            extra = {name: item for name, item in value.items() if name != "result"}
+            await self._store_graph(key, value["result"], extra)
+            return
+        self._vertex_digests.pop(key, None)
+        try:
+            pickled = pickle.dumps(("value", value))
+        except (TypeError, AttributeError, pickle.PicklingError) as exc:
+            msg = "TieredRedisCache only accepts values that can be pickled. "
+            raise TypeError(msg) from exc
+        await self._client.setex(key, self.expiration_time, pickled)
+
+    async def _store_graph(self, key: str, graph: Graph, extra: dict) -> None:
+        from langflow.graph.graph.snapshot import (
+            dump_graph_definition,
+            dump_graph_state,
+            dump_vertex_state,
+            graph_definition_key,
+        )
+
+        vertices_key = key + VERTEX_STATES_SUFFIX
+        definition_key = graph_definition_key(graph)
+        template_key = GRAPH_DEFINITION_PREFIX + definition_key
+        stored = self._vertex_digests.get(key)
+        written_digests = stored.digests if stored is not None and stored.definition_key == definition_key else {}
+        vertices = graph.vertices
+        if written_digests and stored.graph() is graph:
+            # The same graph was stored last, only the vertices changed since then can differ
+            changed_ids = graph.get_changed_vertex_ids(stored.vertex_changes)
+            vertices = [graph.vertex_map[vertex_id] for vertex_id in changed_ids if vertex_id in graph.vertex_map]
+        vertex_changes = graph.vertex_changes
+
+        try:
+            changed: dict[str, bytes] = {}
+            digests = dict(written_digests)
+            for vertex in vertices:
+                blob = pickle.dumps(dump_vertex_state(vertex))
+                digests[vertex.id] = _digest(blob)
+                if written_digests.get(vertex.id) != digests[vertex.id]:
+                    changed[vertex.id] = blob
+            snapshot = pickle.dumps(("graph", definition_key, dump_graph_state(graph), extra))
+        except (TypeError, AttributeError, pickle.PicklingError):
+            # Only this worker can use the graph, the others will miss and rebuild it
+            logger.opt(exception=True).debug(f"Could not snapshot the graph for key '{key}', keeping it local")
+            self._vertex_digests.pop(key, None)
+            await self._client.delete(key, vertices_key)
+            return
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            if not written_digests:
+                pipe.delete(vertices_key)
+                pipe.set(template_key, pickle.dumps(dump_graph_definition(graph)), ex=self.expiration_time)
+            else:
+                pipe.expire(template_key, self.expiration_time)
+            if changed:
+                pipe.hset(vertices_key, mapping=changed)
+            pipe.expire(vertices_key, self.expiration_time)
+            pipe.setex(key, self.expiration_time, snapshot)
+            await pipe.execute()
+        self._vertex_digests[key] = _StoredGraph(definition_key, digests, weakref.ref(graph), vertex_changes)
+
+    async def _publish(self, message: dict) -> None:
+        await self._client.publish(self.channel, orjson.dumps({"node": self.node_id, **message}))
+
+    def _invalidate(self, data: bytes | str) -> None:
+        message = orjson.loads(data)
+        if message.get("node") == self.node_id:
+            return
+        if message.get("clear"):
+            self._local.clear()
+            self._vertex_digests.clear()
+            return
+        key = message.get("key")
+        self._local.pop(key, None)
+        self._vertex_digests.pop(key, None)
+
+    def _start_listener(self) -> None:
+        if self._listener_task is not None and not self._listener_task.done():
+            return
+        self._listener_task = asyncio.get_running_loop().create_task(self._listen(), name="cache_invalidation_listener")
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._invalidate(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).warning("Cache invalidation listener failed, clearing the local cache")
+                # Invalidations may have been missed, so nothing cached locally can be trusted
+                self._local.clear()
+                self._vertex_digests.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.reset()
@@ -3,6 +3,7 @@ from collections import defaultdict
 from threading import RLock
 from typing import Any
 
+from langflow.events.event_log import BuildEventLogRegistry
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
 from langflow.services.deps import get_cache_service
@@ -17,6 +18,7 @@ class ChatService(Service):
         self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
+        self.build_event_logs = BuildEventLogRegistry()
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
         """Set the cache for a client.
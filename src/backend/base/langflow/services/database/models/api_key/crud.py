@@ -1,4 +1,3 @@
-import asyncio
 import datetime
 import secrets
 from typing import TYPE_CHECKING
@@ -10,8 +9,8 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models import User
 from langflow.services.database.models.api_key import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
-from langflow.services.database.utils import session_getter
-from langflow.services.deps import get_db_service
+from langflow.services.database.models.user.model import UserRead
+from langflow.services.deps import get_auth_service
 
 if TYPE_CHECKING:
     from sqlmodel.sql.expression import SelectOfScalar
@@ -49,9 +48,7 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
         raise ValueError(msg)
     await session.delete(api_key)
     await session.commit()
-
-
-update_total_uses_tasks: set[asyncio.Task] = set()
+    get_auth_service().invalidate_api_key(api_key.api_key)
 
 
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
@@ -59,21 +56,10 @@ async def check_key(session: AsyncSession, api_key: str) -> User | None:
     query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
     api_key_object: ApiKey | None = (await session.exec(query)).first()
     if api_key_object is not None:
-        task = asyncio.create_task(update_total_uses(api_key_object.id))
-        task.add_done_callback(update_total_uses_tasks.discard)
-        update_total_uses_tasks.add(task)
+        auth_service = get_auth_service()
+        await auth_service.record_api_key_use(api_key_object.id)
+        auth_service.set_api_key_user(
+            api_key, api_key_object.id, UserRead.model_validate(api_key_object.user, from_attributes=True)
+        )
         return api_key_object.user
     return None
-
-
-async def update_total_uses(api_key_id: UUID):
-    """Update the total uses and last used at."""
-    async with session_getter(get_db_service()) as session:
-        new_api_key = await session.get(ApiKey, api_key_id)
-        if new_api_key is None:
-            msg = "API Key not found"
-            raise ValueError(msg)
-        new_api_key.total_uses += 1
-        new_api_key.last_used_at = datetime.datetime.now(datetime.timezone.utc)
-        session.add(new_api_key)
-        await session.commit()
@@ -15,7 +15,7 @@ from pydantic import (
     field_serializer,
     field_validator,
 )
-from sqlalchemy import Text, UniqueConstraint
+from sqlalchemy import Text, UniqueConstraint, event, inspect
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 from langflow.schema import Data
@@ -173,6 +173,7 @@ class Flow(FlowBase, table=True):  # type: ignore[call-arg]
     messages: list["MessageTable"] = Relationship(back_populates="flow")
     transactions: list["TransactionTable"] = Relationship(back_populates="flow")
     vertex_builds: list["VertexBuildTable"] = Relationship(back_populates="flow")
+    mcp_tool_schema: dict | None = Field(default=None, sa_column=Column(JSON))
 
     def to_data(self):
         serialized = self.model_dump()
@@ -191,6 +192,22 @@ class Flow(FlowBase, table=True):  # type: ignore[call-arg]
     )
 
 
+@event.listens_for(Flow, "before_insert")
+@event.listens_for(Flow, "before_update")
+def update_mcp_tool_schema(_mapper, _connection, target: Flow) -> None:
+    """Keeps the MCP tool schema of a flow in line with its data, so listing tools does not read the data."""
+    if target.mcp_tool_schema is not None and not inspect(target).attrs.data.history.has_changes():
+        return
+    from langflow.helpers.flow import json_schema_from_flow_data
+
+    try:
+        target.mcp_tool_schema = json_schema_from_flow_data(target.data)
+    except Exception:  # noqa: BLE001
+        # Computed again when the tools are listed
+        logger.opt(exception=True).debug(f"Could not compute the MCP tool schema of flow {target.id}")
+        target.mcp_tool_schema = None
+
+
 class FlowCreate(FlowBase):
     user_id: UUID | None = None
     folder_id: UUID | None = None
@@ -1,5 +1,11 @@
+import base64
+import binascii
+from datetime import datetime, timezone
 from uuid import UUID
 
+from sqlalchemy import and_, or_
+from sqlmodel.sql.expression import SelectOfScalar
+
 from langflow.services.database.models.message.model import MessageTable, MessageUpdate
 from langflow.services.deps import session_scope
 from langflow.utils.async_helpers import run_until_complete
@@ -24,3 +30,50 @@ async def _update_message(message_id: UUID | str, message: MessageUpdate | dict)
 def update_message(message_id: UUID | str, message: MessageUpdate | dict):
     """DEPRECATED - Kept for backward compatibility. Do not use."""
     return run_until_complete(_update_message(message_id, message))
+
+
+def encode_message_cursor(message: MessageTable) -> str:
+    """Returns an opaque cursor pointing right after `message` in a timestamp-ordered history."""
+    timestamp = message.timestamp
+    timestamp = timestamp.replace(tzinfo=timezone.utc) if timestamp.tzinfo is None else timestamp
+    raw = f"{timestamp.astimezone(timezone.utc).isoformat()}|{message.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_message_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Returns the timestamp and id encoded in a cursor created by `encode_message_cursor`."""
+    try:
+        timestamp, message_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(timestamp), UUID(message_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        msg = f"Invalid message cursor: {cursor}"
+        raise ValueError(msg) from exc
+
+
+def paginate_messages(
+    stmt: SelectOfScalar[MessageTable], cursor: str | None = None, *, descending: bool = True
+) -> SelectOfScalar[MessageTable]:
+    """Orders `stmt` by (timestamp, id) and keeps only the messages after `cursor`.
+
+    Together with the (flow_id, session_id, timestamp) index this is a keyset page,
+    so the cost of fetching a page does not depend on how far into the history it is.
+    """
+    if cursor:
+        timestamp, message_id = decode_message_cursor(cursor)
+        if descending:
+            stmt = stmt.where(
+                or_(
+                    MessageTable.timestamp < timestamp,
+                    and_(MessageTable.timestamp == timestamp, MessageTable.id < message_id),
+                )
+            )
+        else:
+            stmt = stmt.where(
+                or_(
+                    MessageTable.timestamp > timestamp,
+                    and_(MessageTable.timestamp == timestamp, MessageTable.id > message_id),
+                )
+            )
+    if descending:
+        return stmt.order_by(MessageTable.timestamp.desc(), MessageTable.id.desc())
+    return stmt.order_by(MessageTable.timestamp.asc(), MessageTable.id.asc())
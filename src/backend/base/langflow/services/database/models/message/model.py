@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Annotated
 from uuid import UUID, uuid4
 
 from pydantic import field_serializer, field_validator
-from sqlalchemy import Text
+from sqlalchemy import Index, Text
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 from langflow.schema.content_block import ContentBlock
@@ -112,6 +112,7 @@ class MessageBase(SQLModel):
 
 class MessageTable(MessageBase, table=True):  # type: ignore[call-arg]
     __tablename__ = "message"
+    __table_args__ = (Index("ix_message_flow_id_session_id_timestamp", "flow_id", "session_id", "timestamp"),)
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     flow_id: UUID | None = Field(default=None, foreign_key="flow.id")
     flow: "Flow" = Relationship(back_populates="messages")
@@ -71,6 +71,48 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
     return table
 
 
+async def log_transactions(db: AsyncSession, transactions: list[TransactionBase]) -> list[TransactionTable]:
+    """Insert many transactions in a single commit without trimming older ones.
+
+    Use `trim_transactions` to enforce the `max_transactions_to_keep` limit afterwards.
+    """
+    tables = [TransactionTable(**transaction.model_dump()) for transaction in transactions]
+    try:
+        db.add_all(tables)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return tables
+
+
+async def trim_transactions(db: AsyncSession, flow_ids: set[UUID], max_entries: int | None = None) -> None:
+    """Delete the oldest transactions of each flow, keeping the newest `max_entries` per flow.
+
+    Args:
+        db: Database session
+        flow_ids: The flows to trim
+        max_entries: Number of transactions to keep per flow. If None, uses system settings.
+    """
+    max_entries = max_entries or get_settings_service().settings.max_transactions_to_keep
+    try:
+        for flow_id in flow_ids:
+            delete_older = delete(TransactionTable).where(
+                TransactionTable.flow_id == flow_id,
+                col(TransactionTable.id).in_(
+                    select(TransactionTable.id)
+                    .where(TransactionTable.flow_id == flow_id)
+                    .order_by(col(TransactionTable.timestamp).desc())
+                    .offset(max_entries)
+                ),
+            )
+            await db.exec(delete_older)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 def transform_transaction_table(
     transaction: list[TransactionTable] | TransactionTable,
 ) -> list[TransactionReadResponse]:
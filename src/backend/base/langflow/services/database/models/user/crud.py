@@ -9,6 +9,7 @@ from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models.user.model import User, UserUpdate
+from langflow.services.deps import get_auth_service
 
 
 async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
@@ -49,6 +50,8 @@ async def update_user(user_db: User | None, user: UserUpdate, db: AsyncSession)
     except IntegrityError as e:
         await db.rollback()
         raise HTTPException(status_code=400, detail=str(e)) from e
+    finally:
+        get_auth_service().invalidate_user(user_db.id)
 
     return user_db
 
@@ -12,9 +12,16 @@ if TYPE_CHECKING:
 
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+    from langflow.services.auth.service import AuthService
+    from langflow.services.build_log.service import BuildLogService
     from langflow.services.cache.service import AsyncBaseCacheService, CacheService
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
+    from langflow.services.http_client.service import HTTPClientService
+    from langflow.services.job.service import JobService
+    from langflow.services.llm_cache.service import LLMCacheService
+    from langflow.services.mcp_session_pool.service import MCPSessionPoolService
+    from langflow.services.process_pool.service import ProcessPoolService
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
     from langflow.services.socket.service import SocketIOService
@@ -25,6 +32,8 @@ if TYPE_CHECKING:
     from langflow.services.telemetry.service import TelemetryService
     from langflow.services.tracing.service import TracingService
     from langflow.services.variable.service import VariableService
+    from langflow.services.vertex_memo.service import VertexMemoService
+    from langflow.services.webhook_queue.service import WebhookQueueService
 
 
 def get_service(service_type: ServiceType, default=None):
@@ -59,6 +68,105 @@ def get_telemetry_service() -> TelemetryService:
     return get_service(ServiceType.TELEMETRY_SERVICE, TelemetryServiceFactory())
 
 
+def get_auth_service() -> AuthService:
+    """Retrieves the AuthService instance from the service manager.
+
+    Returns:
+        AuthService: The AuthService instance.
+    """
+    from langflow.services.auth.factory import AuthServiceFactory
+
+    return get_service(ServiceType.AUTH_SERVICE, AuthServiceFactory())
+
+
+def get_build_log_service() -> BuildLogService:
+    """Retrieves the BuildLogService instance from the service manager.
+
+    Returns:
+        BuildLogService: The BuildLogService instance.
+    """
+    from langflow.services.build_log.factory import BuildLogServiceFactory
+
+    return get_service(ServiceType.BUILD_LOG_SERVICE, BuildLogServiceFactory())
+
+
+def get_vertex_memo_service() -> VertexMemoService:
+    """Retrieves the VertexMemoService instance from the service manager.
+
+    Returns:
+        VertexMemoService: The VertexMemoService instance.
+    """
+    from langflow.services.vertex_memo.factory import VertexMemoServiceFactory
+
+    return get_service(ServiceType.VERTEX_MEMO_SERVICE, VertexMemoServiceFactory())
+
+
+def get_job_service() -> JobService:
+    """Retrieves the JobService instance from the service manager.
+
+    Returns:
+        JobService: The JobService instance.
+    """
+    from langflow.services.job.factory import JobServiceFactory
+
+    return get_service(ServiceType.JOB_SERVICE, JobServiceFactory())
+
+
+def get_webhook_queue_service() -> WebhookQueueService:
+    """Retrieves the WebhookQueueService instance from the service manager.
+
+    Returns:
+        WebhookQueueService: The WebhookQueueService instance.
+    """
+    from langflow.services.webhook_queue.factory import WebhookQueueServiceFactory
+
+    return get_service(ServiceType.WEBHOOK_QUEUE_SERVICE, WebhookQueueServiceFactory())
+
+
+def get_process_pool_service() -> ProcessPoolService:
+    """Retrieves the ProcessPoolService instance from the service manager.
+
+    Returns:
+        ProcessPoolService: The ProcessPoolService instance.
+    """
+    from langflow.services.process_pool.factory import ProcessPoolServiceFactory
+
+    return get_service(ServiceType.PROCESS_POOL_SERVICE, ProcessPoolServiceFactory())
+
+
+def get_mcp_session_pool_service() -> MCPSessionPoolService:
+    """Retrieves the MCPSessionPoolService instance from the service manager.
+
+    Returns:
+        MCPSessionPoolService: The MCPSessionPoolService instance.
+    """
+    from langflow.services.mcp_session_pool.factory import MCPSessionPoolServiceFactory
+
+    return get_service(ServiceType.MCP_SESSION_POOL_SERVICE, MCPSessionPoolServiceFactory())
+
+
+def get_http_client_service() -> HTTPClientService:
+    """Retrieves the HTTPClientService instance from the service manager.
+
+    Returns:
+        HTTPClientService: The HTTPClientService instance.
+    """
+    from langflow.services.http_client.factory import HTTPClientServiceFactory
+
+    return get_service(ServiceType.HTTP_CLIENT_SERVICE, HTTPClientServiceFactory())
+
+
+def get_llm_cache_service() -> LLMCacheService:
+    """Retrieves the LLMCacheService instance from the service manager.
+
+    Returns:
+        LLMCacheService: The LLMCacheService instance.
+    """
+    from langflow.services.llm_cache.factory import LLMCacheServiceFactory
+
+    return get_service(ServiceType.LLM_CACHE_SERVICE, LLMCacheServiceFactory())
+
+
 def get_tracing_service() -> TracingService:
     """Retrieves the TracingService instance from the service manager.
 
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import orjson
+from loguru import logger
+
+from langflow.services.base import Service
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+KEEPALIVE_EXPIRY = 60.0
+"""Seconds an idle connection of a pooled client is kept open for the next request."""
+
+# Options of httpx clients that configure their connections, and so are given to the transports
+_TRANSPORT_OPTIONS = frozenset({"verify", "cert", "trust_env", "http1", "http2", "proxy", "limits"})
+
+
+def client_key(*parts: Any) -> str:
+    """Returns the key of a client from what it is used for, such as a provider, a base URL and a credential."""
+    # Credentials are only kept as part of the digest
+    return hashlib.sha256(orjson.dumps(parts, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+
+
+class _LoopBoundTransport(httpx.AsyncBaseTransport):
+    """Sends the requests of an async client through connections of the event loop that sends them.
+
+    Connections cannot move between event loops, and a client is often built outside of the loop that
+    uses it, for example by a component running in a thread. Each loop that sends requests gets its
+    own transport.
+    """
+
+    def __init__(self, **options: Any) -> None:
+        self._options = options
+        self._transports: dict[int, tuple[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]] = {}
+        self._lock = threading.Lock()
+
+    def _get_transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._transports.get(id(loop))
+            if entry is None or entry[0] is not loop:
+                # The connections of loops that are gone are dropped with their transports
+                self._transports = {key: value for key, value in self._transports.items() if not value[0].is_closed()}
+                entry = self._transports[id(loop)] = (loop, httpx.AsyncHTTPTransport(**self._options))
+        return entry[1]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._get_transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            # The connections of other loops cannot be closed from this one, they are dropped
+            entry = self._transports.get(id(loop))
+            self._transports.clear()
+        if entry is not None and entry[0] is loop:
+            await entry[1].aclose()
+
+
+@dataclass
+class _PooledClient:
+    client: httpx.Client | httpx.AsyncClient
+    last_used_at: float = field(default_factory=time.monotonic)
+
+    def touch(self) -> None:
+        self.last_used_at = time.monotonic()
+
+
+class HTTPClientService(Service):
+    """Hands out HTTP clients shared by every run of the process, so that their connections are reused.
+
+    Clients are keyed by provider, base URL, credential, timeout and client options, and each keeps
+    at most `http_client_max_connections` connections. A client that sent no request for
+    `http_client_idle_timeout` seconds, or the least recently used one when `http_client_max_clients`
+    clients are pooled, is released: the pool stops handing it out, but it stays open for the models
+    and components that still hold it, and is closed once none does or when the service stops. An async
+    client can be used from any event loop, each loop gets its own connections.
+
+    Pooled clients do not keep cookies, so nothing set by a response leaks into the requests of
+    another run. Callers must not close the clients they get.
+    """
+
+    name = "http_client_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.max_clients = max(settings.http_client_max_clients, 1)
+        self.max_connections = max(settings.http_client_max_connections, 1)
+        self.idle_timeout = settings.http_client_idle_timeout
+        self._clients: OrderedDict[str, _PooledClient] = OrderedDict()
+        self._lock = threading.Lock()
+        # Released clients still held elsewhere, closed at teardown
+        self._released: weakref.WeakSet[httpx.Client | httpx.AsyncClient] = weakref.WeakSet()
+
+    def get_client(
+        self,
+        provider: str = "http",
+        *,
+        base_url: str | None = None,
+        credential: str | None = None,
+        timeout: float | None = None,
+        **options: Any,
+    ) -> httpx.Client:
+        """Returns the shared sync client for the given provider, base URL, credential and options.
+
+        `options` are passed to `httpx.Client`, for example `verify` or `proxy`.
+        """
+        return self._get(httpx.Client, provider, base_url, credential, timeout, options)  # type: ignore[return-value]
+
+    def get_async_client(
+        self,
+        provider: str = "http",
+        *,
+        base_url: str | None = None,
+        credential: str | None = None,
+        timeout: float | None = None,
+        **options: Any,
+    ) -> httpx.AsyncClient:
+        """Returns the shared async client, see `get_client`.
+
+        The client can be built outside of the event loop that sends its requests.
+        """
+        return self._get(httpx.AsyncClient, provider, base_url, credential, timeout, options)  # type: ignore[return-value]
+
+    def _get(
+        self,
+        client_class: type[httpx.Client | httpx.AsyncClient],
+        provider: str,
+        base_url: str | None,
+        credential: str | None,
+        timeout: float | None,
+        options: dict[str, Any],
+    ) -> httpx.Client | httpx.AsyncClient:
+        key = client_key(client_class.__name__, provider, base_url, credential, timeout, options)
+        with self._lock:
+            pooled = self._clients.get(key)
+            if pooled is None or pooled.client.is_closed:
+                pooled = self._create(client_class, timeout, options)
+                self._clients[key] = pooled
+            self._clients.move_to_end(key)
+            pooled.touch()
+            self._evict()
+        return pooled.client
+
+    def _create(
+        self,
+        client_class: type[httpx.Client | httpx.AsyncClient],
+        timeout: float | None,
+        options: dict[str, Any],
+    ) -> _PooledClient:
+        pooled = _PooledClient(client=None)  # type: ignore[arg-type]
+
+        def touch(_: httpx.Request) -> None:
+            pooled.touch()
+
+        async def atouch(_: httpx.Request) -> None:
+            pooled.touch()
+
+        kwargs: dict[str, Any] = {
+            "limits": httpx.Limits(max_connections=self.max_connections, keepalive_expiry=KEEPALIVE_EXPIRY),
+            # Rejects every cookie, the client is shared by unrelated runs
+            "cookies": CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            "event_hooks": {"request": [atouch if client_class is httpx.AsyncClient else touch]},
+            **options,
+        }
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        if client_class is httpx.AsyncClient and "transport" not in kwargs:
+            transport_options = {name: kwargs.pop(name) for name in _TRANSPORT_OPTIONS if name in kwargs}
+            kwargs["transport"] = _LoopBoundTransport(**transport_options)
+        pooled.client = client_class(**kwargs)
+        return pooled
+
+    def _evict(self) -> None:
+        """Releases the idle clients and the least recently used ones beyond `max_clients`.
+
+        Released clients are not closed, the models and components that hold them keep using them.
+        """
+        evicted = []
+        if self.idle_timeout > 0:
+            idle_before = time.monotonic() - self.idle_timeout
+            for key, pooled in list(self._clients.items()):
+                if pooled.last_used_at < idle_before:
+                    evicted.append(self._clients.pop(key))
+        while len(self._clients) > self.max_clients:
+            least_recently_used = min(self._clients, key=lambda key: self._clients[key].last_used_at)
+            evicted.append(self._clients.pop(least_recently_used))
+        for pooled in evicted:
+            self._released.add(pooled.client)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    async def teardown(self) -> None:
+        with self._lock:
+            clients = [pooled.client for pooled in self._clients.values()] + list(self._released)
+            self._clients.clear()
+            self._released.clear()
+        for client in clients:
+            try:
+                if isinstance(client, httpx.AsyncClient):
+                    await client.aclose()
+                else:
+                    client.close()
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug("Could not close an HTTP client")
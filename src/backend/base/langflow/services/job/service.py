@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+from loguru import logger
+
+from langflow.events.event_log import BuildEventLog
+from langflow.services.base import Service
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from langflow.services.settings.service import SettingsService
+
+JobStatus = Literal["queued", "running", "completed", "failed", "cancelled"]
+FINISHED_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+
+@dataclass
+class Job:
+    """A flow run or build that executes independently of the request that started it."""
+
+    id: str
+    flow_id: str
+    user_id: str | None
+    event_log: BuildEventLog
+    status: JobStatus = "queued"
+    result: Any = None
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+
+class JobService(Service):
+    """Runs flows detached from the HTTP connection that started them.
+
+    A job keeps running when its client disconnects. Clients follow its events through the job's
+    `BuildEventLog`, from the start or from the last sequence number they saw, or poll the job for
+    its result. At most `max_concurrent_jobs` jobs run at the same time, the others wait in line.
+    Finished jobs are kept for `job_retention_time` seconds.
+    """
+
+    name = "job_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.max_concurrent_jobs = max(settings.max_concurrent_jobs, 1)
+        self.retention_time = settings.job_retention_time
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_jobs)
+        self._jobs: dict[str, Job] = {}
+
+    def submit(
+        self,
+        run: Callable[[], Awaitable[Any]],
+        *,
+        flow_id: str,
+        user_id: str | None = None,
+        event_log: BuildEventLog | None = None,
+    ) -> Job:
+        """Starts a job that awaits `run` and keeps what it returns as its result.
+
+        `run` writes the events of the job into `event_log`, which is closed when the job ends.
+        """
+        self.prune()
+        job = Job(id=str(uuid.uuid4()), flow_id=flow_id, user_id=user_id, event_log=event_log or BuildEventLog())
+        self._jobs[job.id] = job
+        job.task = asyncio.create_task(self._run(job, run))
+        return job
+
+    async def _run(self, job: Job, run: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            async with self._semaphore:
+                job.status = "running"
+                job.started_at = time.time()
+                job.result = await run()
+                job.status = "completed"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+        except Exception as exc:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Job {job.id} failed")
+            job.status = "failed"
+            job.error = str(exc)
+        finally:
+            job.finished_at = time.time()
+            job.event_log.close()
+
+    def get(self, job_id: str, user_id: str | None = None) -> Job | None:
+        """Returns a job, or None if it does not exist, expired or belongs to another user."""
+        self.prune()
+        job = self._jobs.get(job_id)
+        if job is None or (user_id is not None and job.user_id is not None and job.user_id != user_id):
+            return None
+        return job
+
+    async def cancel(self, job: Job) -> None:
+        """Cancels a job and waits for it to stop."""
+        if job.task is None or job.task.done():
+            return
+        job.task.cancel()
+        await asyncio.wait([job.task])
+
+    def prune(self) -> None:
+        """Forgets the jobs that finished more than `job_retention_time` seconds ago."""
+        expired_before = time.time() - self.retention_time
+        for job_id, job in list(self._jobs.items()):
+            if job.finished and job.finished_at is not None and job.finished_at < expired_before:
+                del self._jobs[job_id]
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    async def teardown(self) -> None:
+        tasks = [job.task for job in self._jobs.values() if job.task is not None and not job.task.done()]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._jobs.clear()
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import orjson
+from diskcache import Cache
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.runnables import RunnableBinding
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.cache.service import ThreadingInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from langchain_core.messages import BaseMessage, BaseMessageChunk
+
+    from langflow.services.settings.service import SettingsService
+
+
+class CachedResponse(NamedTuple):
+    """The response of a model, as the chunks of its content and its metadata."""
+
+    chunks: tuple[str, ...]
+    response_metadata: dict[str, Any]
+
+    @property
+    def content(self) -> str:
+        return "".join(self.chunks)
+
+    def to_message(self) -> AIMessage:
+        return AIMessage(content=self.content, response_metadata=self.response_metadata)
+
+    def to_chunks(self) -> Iterator[AIMessageChunk]:
+        """Yields the chunks of the response as they were streamed by the model."""
+        for chunk in self.chunks:
+            yield AIMessageChunk(content=chunk)
+
+
+def normalize_message(message: BaseMessage) -> dict[str, Any]:
+    """Returns what a model sees of a message, leaving out its id and metadata."""
+    normalized = {"type": message.type, "content": message.content}
+    for attribute in ("name", "tool_calls", "tool_call_id"):
+        if value := getattr(message, attribute, None):
+            normalized[attribute] = value
+    return normalized
+
+
+def is_cacheable_message(message: BaseMessage) -> bool:
+    """Returns whether a response or a chunk of it can be cached.
+
+    Only the text of a response is cached, so responses with content blocks, such as images,
+    or tool calls are not, they could not be replayed.
+    """
+    if not isinstance(message.content, str):
+        return False
+    for attribute in ("tool_calls", "invalid_tool_calls", "tool_call_chunks"):
+        if getattr(message, attribute, None):
+            return False
+    # Holds legacy function calls, and keys such as `refusal` set to None when unused
+    return not any(message.additional_kwargs.values())
+
+
+def llm_cache_key(model: Any, messages: Sequence[BaseMessage]) -> str | None:
+    """Returns the key of the response of a chat model to messages, or None if the model cannot be cached.
+
+    The key covers the class and the parameters of the model, the arguments bound to it, such as tools
+    or a response format, and the messages.
+    """
+    kwargs: dict[str, Any] = {}
+    while isinstance(model, RunnableBinding):
+        kwargs = {**model.kwargs, **kwargs}
+        model = model.bound
+    if not isinstance(model, BaseChatModel):
+        return None
+    try:
+        # The identity LangChain caches use, credentials are left out
+        llm_string = model._get_llm_string(**kwargs)
+        payload = orjson.dumps(
+            [llm_string, [normalize_message(message) for message in messages]],
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).debug(f"Could not build the cache key of {type(model).__name__}")
+        return None
+    return hashlib.sha256(payload).hexdigest()
+
+
+class LLMCacheService(Service):
+    """Keeps the responses of chat models to exact same requests, so that repeated prompts are not paid twice.
+
+    Responses are keyed by `llm_cache_key`. The backend is chosen by the `llm_cache_backend` setting:
+    'disk' keeps them in a SQLite database in the config directory, shared by the workers and kept
+    across restarts, and 'memory' keeps them per worker. Up to `llm_cache_max_size` responses are
+    kept, for `llm_cache_ttl` seconds. Responses keep the chunks they were streamed in, so a cached
+    response is streamed the same way again.
+    """
+
+    name = "llm_cache_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.enabled = settings.llm_cache_max_size > 0
+        self.backend_name = settings.llm_cache_backend
+        self.max_size = settings.llm_cache_max_size
+        self.ttl = settings.llm_cache_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._memory: ThreadingInMemoryCache | None = None
+        self._disk: Cache | None = None
+        if not self.enabled:
+            return
+        if settings.llm_cache_backend == "disk" and settings.config_dir:
+            self._disk = Cache(str(Path(settings.config_dir) / "llm_cache"))
+        else:
+            self._memory = ThreadingInMemoryCache(max_size=self.max_size, expiration_time=self.ttl or None)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Returns the cached response for a key, or None on a miss."""
+        if not self.enabled:
+            return None
+        response = None
+        try:
+            if (payload := self._read(key)) is not None:
+                cached = orjson.loads(payload)
+                response = CachedResponse(tuple(cached["chunks"]), cached["response_metadata"])
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Could not read the cached LLM response for key {key}")
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        if not self.enabled:
+            return
+        try:
+            payload = orjson.dumps(
+                {"chunks": list(response.chunks), "response_metadata": response.response_metadata}, default=str
+            )
+            self._write(key, payload)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).warning(f"Could not cache the LLM response for key {key}")
+
+    def record(self, key: str, chunks: Iterator[BaseMessageChunk]) -> Iterator[BaseMessageChunk]:
+        """Yields the chunks of a streamed response and caches the response once it was fully streamed."""
+        contents: list[str] = []
+        response_metadata: dict[str, Any] = {}
+        cacheable = True
+        for chunk in chunks:
+            if not is_cacheable_message(chunk):
+                cacheable = False
+            elif cacheable:
+                contents.append(chunk.content)
+            response_metadata.update(chunk.response_metadata or {})
+            yield chunk
+        if cacheable:
+            self.set(key, CachedResponse(tuple(contents), response_metadata))
+
+    def _read(self, key: str) -> bytes | None:
+        if self._disk is not None:
+            return self._disk.get(key)
+        cached = self._memory.get(key) if self._memory is not None else CACHE_MISS
+        return None if cached is CACHE_MISS else cached["payload"]
+
+    def _write(self, key: str, payload: bytes) -> None:
+        if self._disk is None:
+            if self._memory is not None:
+                # Wrapped in a dict, bare bytes would be unpickled by the in-memory cache
+                self._memory.set(key, {"payload": payload})
+            return
+        self._disk.set(key, payload, expire=self.ttl or None)
+        while len(self._disk) > self.max_size:
+            try:
+                oldest, _ = self._disk.peekitem(last=False)
+            except KeyError:
+                break
+            self._disk.delete(oldest)
+
+    def __len__(self) -> int:
+        if self._disk is not None:
+            return len(self._disk)
+        return len(self._memory) if self._memory is not None else 0
+
+    async def teardown(self) -> None:
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk.close)
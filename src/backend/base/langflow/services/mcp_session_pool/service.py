@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from loguru import logger
+
+from langflow.services.base import Service
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from mcp import ClientSession, types
+
+    from langflow.services.settings.service import SettingsService
+
+    Connect = Callable[[AsyncExitStack], Awaitable[ClientSession]]
+
+HEALTH_CHECK_TIMEOUT = 5.0
+"""Seconds a session has to answer a ping before it is considered dead."""
+CLOSE_TIMEOUT = 10.0
+"""Seconds a session has to shut down its transport before it is abandoned."""
+
+
+def mcp_server_key(*parts: Any) -> str:
+    """Returns the key of an MCP server from what identifies its connection, such as a command or a URL and headers."""
+    # Headers may hold credentials, so only their digest is kept
+    return hashlib.sha256(orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+@dataclass
+class _PooledSession:
+    key: str
+    session: ClientSession
+    stop: asyncio.Event
+    task: asyncio.Task
+    last_used_at: float = field(default_factory=time.monotonic)
+    last_checked_at: float = field(default_factory=time.monotonic)
+    tools: list[types.Tool] | None = None
+    tools_fetched_at: float = 0.0
+
+    @property
+    def alive(self) -> bool:
+        return not self.task.done()
+
+
+class MCPServer:
+    """A handle to an MCP server whose requests go through a live session of the pool.
+
+    Tools hold the handle rather than a session, so they keep working after the pool replaced a
+    dead or idle session.
+    """
+
+    def __init__(self, pool: MCPSessionPoolService, key: str, connect: Connect) -> None:
+        self.pool = pool
+        self.key = key
+        self.connect = connect
+
+    async def list_tools(self) -> list[types.Tool]:
+        return await self.pool.list_tools(self.key, self.connect)
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> types.CallToolResult:
+        session = await self.pool.get_session(self.key, self.connect)
+        return await session.call_tool(name, arguments=arguments)
+
+
+class MCPSessionPoolService(Service):
+    """Keeps sessions with MCP servers open so that builds and tool calls reuse them.
+
+    Sessions are keyed by what identifies the server, its command for stdio servers or its URL and
+    headers for SSE servers, and shared by every flow and user of the process. A session that was
+    not used for `mcp_session_health_check_interval` seconds is pinged before it is reused and
+    replaced if it does not answer. Sessions idle for `mcp_session_idle_timeout` seconds are closed,
+    and when `mcp_max_sessions` are open the least recently used one is closed to make room. The
+    tools of a server are cached for `mcp_tools_cache_ttl` seconds.
+
+    Every session lives in its own task, which opens and closes its transport, because the transports
+    must be closed by the task that opened them.
+    """
+
+    name = "mcp_session_pool_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.max_sessions = max(settings.mcp_max_sessions, 1)
+        self.idle_timeout = settings.mcp_session_idle_timeout
+        self.health_check_interval = settings.mcp_session_health_check_interval
+        self.tools_cache_ttl = settings.mcp_tools_cache_ttl
+        self._sessions: dict[str, _PooledSession] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._reaper: asyncio.Task | None = None
+
+    def get_server(self, key: str, connect: Connect) -> MCPServer:
+        """Returns a handle to the server identified by `key`, connected with `connect` when needed.
+
+        `connect` enters the transport and the `ClientSession` into the given exit stack and returns
+        the initialized session.
+        """
+        return MCPServer(self, key, connect)
+
+    async def get_session(self, key: str, connect: Connect) -> ClientSession:
+        """Returns a live session with a server, opening one if there is none or the current one is dead."""
+        return (await self._get_pooled(key, connect)).session
+
+    async def list_tools(self, key: str, connect: Connect) -> list[types.Tool]:
+        pooled = await self._get_pooled(key, connect)
+        if pooled.tools is None or time.monotonic() - pooled.tools_fetched_at > self.tools_cache_ttl:
+            pooled.tools = (await pooled.session.list_tools()).tools
+            pooled.tools_fetched_at = time.monotonic()
+        return pooled.tools
+
+    async def _get_pooled(self, key: str, connect: Connect) -> _PooledSession:
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            pooled = self._sessions.get(key)
+            if pooled is not None and not await self._is_healthy(pooled):
+                await self._close(pooled)
+                pooled = None
+            if pooled is None:
+                pooled = await self._open(key, connect)
+            pooled.last_used_at = time.monotonic()
+            return pooled
+
+    async def _is_healthy(self, pooled: _PooledSession) -> bool:
+        if not pooled.alive:
+            return False
+        if time.monotonic() - pooled.last_checked_at < self.health_check_interval:
+            return True
+        try:
+            await asyncio.wait_for(pooled.session.send_ping(), HEALTH_CHECK_TIMEOUT)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("MCP session did not answer a ping, reconnecting")
+            return False
+        pooled.last_checked_at = time.monotonic()
+        return True
+
+    async def _open(self, key: str, connect: Connect) -> _PooledSession:
+        while len(self._sessions) >= self.max_sessions:
+            await self._close(min(self._sessions.values(), key=lambda pooled: pooled.last_used_at))
+
+        ready: asyncio.Future[ClientSession] = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+
+        async def hold_session() -> None:
+            try:
+                async with AsyncExitStack() as exit_stack:
+                    ready.set_result(await connect(exit_stack))
+                    await stop.wait()
+            except Exception as exc:  # noqa: BLE001
+                if not ready.done():
+                    ready.set_exception(exc)
+                else:
+                    logger.opt(exception=True).debug("MCP session closed with an error")
+            finally:
+                if not ready.done():
+                    ready.cancel()
+
+        task = asyncio.create_task(hold_session(), name="mcp_session")
+        try:
+            session = await ready
+        except BaseException:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+            raise
+        pooled = _PooledSession(key=key, session=session, stop=stop, task=task)
+        self._sessions[key] = pooled
+        task.add_done_callback(lambda _: self._forget(pooled))
+        self._start_reaper()
+        return pooled
+
+    def _forget(self, pooled: _PooledSession) -> None:
+        if self._sessions.get(pooled.key) is pooled:
+            del self._sessions[pooled.key]
+
+    async def _close(self, pooled: _PooledSession) -> None:
+        self._forget(pooled)
+        pooled.stop.set()
+        _, pending = await asyncio.wait({pooled.task}, timeout=CLOSE_TIMEOUT)
+        if pending:
+            logger.warning("An MCP session did not close in time, cancelling it")
+            pooled.task.cancel()
+
+    def _start_reaper(self) -> None:
+        if self.idle_timeout > 0 and (self._reaper is None or self._reaper.done()):
+            self._reaper = asyncio.create_task(self._close_idle_sessions(), name="mcp_session_reaper")
+
+    async def _close_idle_sessions(self) -> None:
+        while self._sessions:
+            await asyncio.sleep(min(self.idle_timeout, 60))
+            idle_before = time.monotonic() - self.idle_timeout
+            for pooled in list(self._sessions.values()):
+                if pooled.last_used_at < idle_before and not self._locks[pooled.key].locked():
+                    await self._close(pooled)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def teardown(self) -> None:
+        if self._reaper is not None:
+            self._reaper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reaper
+            self._reaper = None
+        await asyncio.gather(*(self._close(pooled) for pooled in list(self._sessions.values())))
+        self._locks.clear()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.process_pool.worker import UnpicklableResultError, initialize_worker, ping, run_component_output
+
+if TYPE_CHECKING:
+    from langflow.custom.custom_component.component import Component
+    from langflow.services.settings.service import SettingsService
+
+
+class ProcessPoolService(Service):
+    """Runs the outputs of CPU-bound components in a pool of worker processes.
+
+    Sync output methods normally run in a thread, where CPU-heavy work holds the GIL against the event
+    loop. When `component_process_pool_size` is above 0, the outputs of components that set
+    `cpu_bound = True` run in that many spawned workers instead. The code of the component, its
+    attributes and its result are pickled; an output whose attributes or result cannot be pickled runs
+    in a thread as before. The status and logs set by the method are copied back to the component.
+    """
+
+    name = "process_pool_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        self.max_workers = max(settings_service.settings.component_process_pool_size, 0)
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=initialize_worker,
+            )
+            # Start every worker now rather than on the first builds
+            for _ in range(self.max_workers):
+                self._executor.submit(ping)
+        return self._executor
+
+    async def start(self) -> None:
+        """Spawns the workers, which import the common modules while the server starts."""
+        if self.enabled:
+            await asyncio.to_thread(self._get_executor)
+
+    async def run_component_output(self, component: Component, method_name: str) -> Any:
+        """Runs a sync output method of a component in a worker and returns its result."""
+        method = getattr(component, method_name)
+        try:
+            payload = await asyncio.to_thread(
+                pickle.dumps, (component._code, component._attributes, method_name), pickle.HIGHEST_PROTOCOL
+            )
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            logger.debug(
+                f"Running {component.display_name}.{method_name} in a thread, its inputs cannot be pickled: {exc}"
+            )
+            return await asyncio.to_thread(method)
+
+        executor = await asyncio.to_thread(self._get_executor)
+        try:
+            outcome = await asyncio.wrap_future(executor.submit(run_component_output, payload))
+        except UnpicklableResultError as exc:
+            logger.debug(f"Running {component.display_name}.{method_name} in a thread: {exc}")
+            return await asyncio.to_thread(method)
+        except BrokenProcessPool:
+            logger.warning("The component process pool broke, starting a new one")
+            await self._shutdown()
+            return await asyncio.to_thread(method)
+        result, status, logs = pickle.loads(outcome)  # noqa: S301
+        component.status = status
+        component._logs.extend(logs)
+        return result
+
+    async def _shutdown(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    async def teardown(self) -> None:
+        await self._shutdown()
@@ -0,0 +1,47 @@
+"""Functions that run in the worker processes of the process pool.
+
+The workers are spawned, so this module must not depend on anything set up by the server process.
+"""
+
+from __future__ import annotations
+
+import importlib
+import pickle
+from typing import Any
+
+PRELOADED_MODULES = ("pandas", "langflow.graph", "langflow.custom.eval")
+"""Modules imported when a worker starts, so the first components it runs do not pay for them.
+The graph comes before the custom components, which cannot be imported first."""
+
+
+class UnpicklableResultError(TypeError):
+    """Raised in a worker when the result of a component cannot be sent back to the server process."""
+
+
+def initialize_worker(preloaded_modules: tuple[str, ...] = PRELOADED_MODULES) -> None:
+    for module in preloaded_modules:
+        importlib.import_module(module)
+
+
+def ping() -> bool:
+    return True
+
+
+def run_component_output(payload: bytes) -> bytes:
+    """Runs an output method of a component and returns its result, status and logs.
+
+    The payload holds the code of the component, its attributes and the name of the method, pickled
+    together. The class evaluated from the code is cached, so a worker evaluates each component once.
+    """
+    from langflow.custom.eval import eval_custom_component_code
+
+    code, attributes, method_name = pickle.loads(payload)  # noqa: S301
+    component = eval_custom_component_code(code)(_code=code)
+    component._attributes = attributes
+    result = getattr(component, method_name)()
+    outcome: tuple[Any, Any, list] = (result, component.status, component._logs)
+    try:
+        return pickle.dumps(outcome, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as exc:
+        msg = f"The result of {method_name} cannot be pickled: {exc}"
+        raise UnpicklableResultError(msg) from exc
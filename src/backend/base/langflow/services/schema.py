@@ -19,3 +19,11 @@ class ServiceType(str, Enum):
     STATE_SERVICE = "state_service"
     TRACING_SERVICE = "tracing_service"
     TELEMETRY_SERVICE = "telemetry_service"
+    BUILD_LOG_SERVICE = "build_log_service"
+    VERTEX_MEMO_SERVICE = "vertex_memo_service"
+    JOB_SERVICE = "job_service"
+    WEBHOOK_QUEUE_SERVICE = "webhook_queue_service"
+    PROCESS_POOL_SERVICE = "process_pool_service"
+    MCP_SESSION_POOL_SERVICE = "mcp_session_pool_service"
+    HTTP_CLIENT_SERVICE = "http_client_service"
+    LLM_CACHE_SERVICE = "llm_cache_service"
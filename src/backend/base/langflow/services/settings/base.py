@@ -101,6 +101,13 @@ class Settings(BaseSettings):
     """The cache type can be 'async' or 'redis'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    vertex_memo_backend: Literal["memory", "disk", "redis"] = "memory"
+    """Where the outputs of components that opt in to memoization are stored. 'disk' keeps them in the config
+    directory across restarts and 'redis' shares them between workers."""
+    vertex_memo_max_size: int = 1024
+    """The maximum number of memoized component outputs. Set to 0 to disable memoization."""
+    vertex_memo_ttl: int = 3600
+    """The time in seconds after which memoized component outputs expire."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
 
@@ -111,7 +118,17 @@ class Settings(BaseSettings):
 
     remove_api_keys: bool = False
     components_path: list[str] = []
+    component_index_cache: bool = True
+    """If set to True, the templates built from the components paths are kept in an index in the config directory
+    so that a start only rebuilds the components that changed."""
     langchain_cache: str = "InMemoryCache"
+    llm_cache_backend: Literal["memory", "disk"] = "disk"
+    """Where the responses of the model components are cached. 'disk' keeps them in a SQLite database in the
+    config directory, shared by the workers and kept across restarts."""
+    llm_cache_max_size: int = 0
+    """The maximum number of cached responses of the model components. Set to 0 to disable the cache."""
+    llm_cache_ttl: int = 86400
+    """The time in seconds after which cached model responses expire. Set to 0 to keep them until evicted."""
     load_flows_path: str | None = None
     bundle_urls: list[str] = []
 
@@ -121,6 +138,11 @@ class Settings(BaseSettings):
     redis_db: int = 0
     redis_url: str | None = None
     redis_cache_expire: int = 3600
+    redis_l1_cache_size: int = 256
+    """Maximum number of entries each worker keeps in memory in front of the Redis cache.
+    Set to 0 to read every entry from Redis."""
+    redis_invalidation_channel: str = "langflow:cache:invalidate"
+    """The Redis channel on which workers announce the cache entries they changed."""
 
     # Sentry
     sentry_dsn: str | None = None
@@ -135,6 +157,16 @@ class Settings(BaseSettings):
     storage_type: str = "local"
 
     celery_enabled: bool = False
+    task_max_workers: int = 10
+    """The maximum number of background tasks that run at the same time when Celery is not used.
+    Others wait in line."""
+    task_max_results: int = 1000
+    """The number of finished background tasks whose results are kept when Celery is not used."""
+    task_result_ttl: int = 3600
+    """Seconds the result of a finished background task is kept when Celery is not used."""
+    component_process_pool_size: int = 0
+    """The number of worker processes that run the outputs of CPU-bound components, such as text splitting
+    and DataFrame operations, away from the event loop. Set to 0 to run them in threads."""
 
     fallback_to_env_var: bool = True
     """If set to True, Global Variables set in the UI will fallback to a environment variable
@@ -195,6 +227,57 @@ class Settings(BaseSettings):
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    build_log_flush_interval: float = 0.5
+    """Seconds a transaction or vertex build waits in memory before it is written to the database."""
+    build_log_batch_size: int = 100
+    """Number of queued transactions and vertex builds that triggers a write before the flush interval."""
+    build_log_queue_size: int = 10000
+    """The maximum number of transactions and vertex builds waiting to be written. Builds wait when it is full."""
+    build_log_retention_interval: float = 60.0
+    """Seconds between runs that delete transactions and vertex builds above the configured limits."""
+    embedding_cache: bool = False
+    """If set to True, vector store components keep the embeddings they compute in the config directory,
+    so documents that were already ingested are not embedded again."""
+    embedding_cache_max_size: int = 1024
+    """The maximum size in MB of the embeddings kept for each embedding model. A full cache starts over.
+    Set to 0 for no limit."""
+    flow_plan_cache_size: int = 128
+    """The maximum number of compiled flows kept in memory to speed up the run endpoints. Set to 0 to disable."""
+    batch_run_max_concurrency: int = 8
+    """The maximum number of inputs of a batch run that run at the same time."""
+    graph_scheduler: Literal["dataflow", "layered"] = "dataflow"
+    """How a graph run schedules its vertices. 'dataflow' starts a vertex as soon as its predecessors are built,
+    'layered' waits for every vertex of a layer to finish before starting the next one."""
+    max_concurrent_vertex_builds: int = 0
+    """The maximum number of vertices built at the same time across all graph runs. Set to 0 for no limit."""
+    max_concurrent_vertex_builds_per_flow: int = 0
+    """The maximum number of vertices built at the same time in a single graph run. Set to 0 for no limit."""
+    auth_cache_ttl: float = 30.0
+    """Seconds a validated API key or the user of a JWT is cached before it is read from the database again.
+    Deleting the key or changing the user drops it earlier. Set to 0 to disable."""
+    api_key_usage_flush_interval: float = 5.0
+    """Seconds the uses of API keys are counted in memory before `total_uses` and `last_used_at` are written.
+    Set to 0 to write them on every request."""
+    variable_cache_ttl: float = 30.0
+    """Seconds the decrypted value of a global variable is cached before it is read again. Updating or deleting
+    the variable drops it earlier. Set to 0 to disable."""
+    max_concurrent_jobs: int = 10
+    """The maximum number of detached runs and builds that execute at the same time. Others wait in line."""
+    job_retention_time: int = 3600
+    """Seconds a finished detached run or build, with its result and events, is kept for clients to fetch."""
+    webhook_queue_max_size: int = 1000
+    """The maximum number of webhook runs waiting or executing. Webhooks received while the queue is full
+    are refused with a 429 status. Set to 0 for no limit."""
+    webhook_max_concurrency: int = 10
+    """The maximum number of webhook runs that execute at the same time."""
+    webhook_max_concurrency_per_flow: int = 2
+    """The maximum number of webhook runs of the same flow that execute at the same time."""
+    webhook_max_retries: int = 3
+    """The number of times a failed webhook run is retried."""
+    webhook_retry_backoff: float = 2.0
+    """Seconds to wait before the first retry of a failed webhook run, doubled for each following retry."""
+    webhook_task_retention_time: int = 86400
+    """Seconds a finished webhook run is kept, with its result, before it is removed from the queue."""
 
     # MCP Server
     mcp_server_enabled: bool = True
@@ -202,6 +285,26 @@ class Settings(BaseSettings):
     mcp_server_enable_progress_notifications: bool = False
     """If set to False, Langflow will not send progress notifications in the MCP server."""
 
+    # MCP Clients
+    mcp_max_sessions: int = 20
+    """The maximum number of sessions with MCP servers kept open by the MCP tool components. The least
+    recently used session is closed to open a new one."""
+    mcp_session_idle_timeout: float = 300
+    """Seconds a session with an MCP server stays open without being used. Set to 0 to keep sessions open."""
+    mcp_session_health_check_interval: float = 30
+    """Seconds after which a session with an MCP server is pinged before it is reused."""
+    mcp_tools_cache_ttl: float = 300
+    """Seconds the tools listed by an MCP server are reused before they are listed again."""
+
+    # HTTP Clients
+    http_client_max_clients: int = 100
+    """The maximum number of pooled HTTP clients shared by model and HTTP components. The least recently
+    used client is released to create a new one, and closed once no model or component holds it."""
+    http_client_max_connections: int = 100
+    """The maximum number of connections each pooled HTTP client keeps open at the same time."""
+    http_client_idle_timeout: float = 300
+    """Seconds a pooled HTTP client is kept without sending a request. Set to 0 to keep clients pooled."""
+
     @field_validator("dev")
     @classmethod
     def set_dev(cls, value):
@@ -7,9 +7,20 @@ class TaskBackend(ABC):
     name: str
 
     @abstractmethod
-    def launch_task(self, task_func: Callable[..., Any], *args: Any, **kwargs: Any):
+    async def launch_task(self, task_func: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[str, Any]:
         pass
 
     @abstractmethod
     def get_task(self, task_id: str) -> Any:
         pass
+
+    @abstractmethod
+    async def wait_for_result(self, task: Any) -> Any:
+        """Waits for a launched task without blocking the event loop and returns its result."""
+
+    def get_stats(self) -> dict[str, Any]:
+        """Returns the queue depth and the latencies of the backend, as far as it knows them."""
+        return {}
+
+    async def teardown(self) -> None:  # noqa: B027
+        """Stops the work the backend runs in this process."""
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
@@ -9,6 +10,10 @@ from langflow.worker import celery_app
 if TYPE_CHECKING:
     from celery import Task
 
+RESULT_POLL_INTERVAL = 0.05
+"""Seconds between the first checks of the result of a Celery task, doubled up to `MAX_RESULT_POLL_INTERVAL`."""
+MAX_RESULT_POLL_INTERVAL = 1.0
+
 
 class CeleryBackend(TaskBackend):
     name = "celery"
@@ -16,14 +21,23 @@ class CeleryBackend(TaskBackend):
     def __init__(self) -> None:
         self.celery_app = celery_app
 
-    def launch_task(self, task_func: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[str, AsyncResult]:
+    async def launch_task(self, task_func: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[str, AsyncResult]:
         # I need to type the delay method to make it easier
 
         if not hasattr(task_func, "delay"):
             msg = f"Task function {task_func} does not have a delay method"
             raise ValueError(msg)
-        task: Task = task_func.delay(*args, **kwargs)
+        # Sending the task talks to the broker
+        task: Task = await asyncio.to_thread(task_func.delay, *args, **kwargs)
         return task.id, AsyncResult(task.id, app=self.celery_app)
 
+    async def wait_for_result(self, task: AsyncResult) -> Any:
+        """Polls the result backend from a thread until the task is ready, then returns its result."""
+        interval = RESULT_POLL_INTERVAL
+        while not await asyncio.to_thread(task.ready):
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, MAX_RESULT_POLL_INTERVAL)
+        return await asyncio.to_thread(task.get)
+
     def get_task(self, task_id: str) -> Any:
         return AsyncResult(task_id, app=self.celery_app)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+import traceback
+import uuid
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.services.task.backends.base import TaskBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+LATENCY_WINDOW = 100
+"""Number of recent tasks the average queue and run latencies are computed over."""
+
+
+class LocalTaskResult:
+    """The state of a task of the local backend, with the interface of a Celery `AsyncResult`."""
+
+    def __init__(self, task_id: str) -> None:
+        self.id = task_id
+        self._status = "PENDING"
+        self._result: Any = None
+        self._traceback = ""
+        self.created_at = time.monotonic()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self._done = asyncio.Event()
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @property
+    def traceback(self) -> str:
+        return self._traceback
+
+    @property
+    def result(self) -> Any:
+        """The return value of the task, or the exception it raised."""
+        return self._result
+
+    def ready(self) -> bool:
+        return self._status in {"SUCCESS", "FAILURE"}
+
+    async def wait(self) -> Any:
+        """Waits for the task to finish and returns its result, raising the exception of a failed task."""
+        await self._done.wait()
+        if self._status == "FAILURE":
+            raise self._result
+        return self._result
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self._status = "STARTED"
+        self.started_at = time.monotonic()
+        try:
+            result = func(*args, **kwargs)
+            self._result = await result if asyncio.iscoroutine(result) else result
+            self._status = "SUCCESS"
+        except asyncio.CancelledError:
+            self._result = asyncio.CancelledError("The task was cancelled")
+            self._status = "FAILURE"
+            raise
+        except Exception as exc:  # noqa: BLE001
+            self._result = exc
+            self._traceback = "".join(traceback.format_tb(exc.__traceback__))
+            self._status = "FAILURE"
+        finally:
+            self.finished_at = time.monotonic()
+            self._done.set()
+
+
+class LocalBackend(TaskBackend):
+    """Runs tasks in the background of the event loop on a bounded pool of workers.
+
+    `launch_task` returns as soon as the task is queued. At most `max_workers` tasks run at the same
+    time, the others wait in the queue. Results are kept for `result_ttl` seconds, and only the
+    `max_results` most recently used ones.
+    """
+
+    name = "local"
+
+    def __init__(self, max_workers: int = 10, max_results: int = 1000, result_ttl: float = 3600) -> None:
+        self.max_workers = max(max_workers, 1)
+        self.max_results = max_results
+        self.result_ttl = result_ttl
+        self.tasks: OrderedDict[str, LocalTaskResult] = OrderedDict()
+        self._queue: asyncio.Queue[tuple[LocalTaskResult, Callable[..., Any], tuple, dict]] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        self._queue_latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._run_latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    async def launch_task(
+        self, task_func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> tuple[str, LocalTaskResult]:
+        """Queues a task and returns its id and result without waiting for it to run.
+
+        Parameters:
+            task_func: The function to run, a coroutine function or a function that does not block.
+            *args: Positional arguments to pass to task_func.
+            **kwargs: Keyword arguments to pass to task_func.
+
+        Returns:
+            A tuple containing a unique task ID and the task result object.
+        """
+        self._start_workers()
+        task_result = LocalTaskResult(str(uuid.uuid4()))
+        self.tasks[task_result.id] = task_result
+        self.prune()
+        self._queue.put_nowait((task_result, task_func, args, kwargs))
+        logger.debug(f"Task {task_result.id} queued.")
+        return task_result.id, task_result
+
+    def _start_workers(self) -> None:
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self.max_workers:
+            self._workers.append(asyncio.create_task(self._work(), name=f"task_worker_{len(self._workers)}"))
+
+    async def _work(self) -> None:
+        while True:
+            task_result, task_func, args, kwargs = await self._queue.get()
+            try:
+                await task_result.run(task_func, *args, **kwargs)
+            finally:
+                self._queue.task_done()
+                self._record_latencies(task_result)
+
+    def _record_latencies(self, task_result: LocalTaskResult) -> None:
+        if task_result.started_at is not None:
+            self._queue_latencies.append(task_result.started_at - task_result.created_at)
+            if task_result.finished_at is not None:
+                self._run_latencies.append(task_result.finished_at - task_result.started_at)
+
+    async def wait_for_result(self, task: LocalTaskResult) -> Any:
+        return await task.wait()
+
+    def get_task(self, task_id: str) -> LocalTaskResult | None:
+        self.prune()
+        task_result = self.tasks.get(task_id)
+        if task_result is not None:
+            self.tasks.move_to_end(task_id)
+        return task_result
+
+    def prune(self) -> None:
+        """Forgets the results that expired, then the least recently used ones above `max_results`."""
+        expired_before = time.monotonic() - self.result_ttl
+        for task_id, task_result in list(self.tasks.items()):
+            if task_result.finished_at is not None and task_result.finished_at < expired_before:
+                del self.tasks[task_id]
+        if self.max_results > 0 and len(self.tasks) > self.max_results:
+            # Tasks that did not finish yet are never evicted
+            finished = [task_id for task_id, task_result in self.tasks.items() if task_result.ready()]
+            for task_id in finished[: len(self.tasks) - self.max_results]:
+                del self.tasks[task_id]
+
+    def get_stats(self) -> dict[str, Any]:
+        running = sum(1 for task_result in self.tasks.values() if task_result.status == "STARTED")
+        return {
+            "queue_depth": self._queue.qsize(),
+            "running": running,
+            "results": len(self.tasks),
+            "queue_latency": _mean(self._queue_latencies),
+            "run_latency": _mean(self._run_latencies),
+        }
+
+    async def teardown(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        for worker in self._workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+        self._workers.clear()
+        self.tasks.clear()
+
+
+def _mean(values: deque[float]) -> float | None:
+    return sum(values) / len(values) if values else None
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
 from langflow.services.base import Service
-from langflow.services.task.backends.anyio import AnyIOBackend
+from langflow.services.task.backends.local import LocalBackend
 from langflow.services.task.utils import get_celery_worker_status
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from langflow.services.settings.service import SettingsService
     from langflow.services.task.backends.base import TaskBackend
 
@@ -27,6 +28,12 @@ def check_celery_availability():
 
 
 class TaskService(Service):
+    """Launches tasks on Celery when it is enabled and available, otherwise on a local worker pool.
+
+    The local pool runs at most `task_max_workers` tasks at the same time and keeps their results for
+    `task_result_ttl` seconds, at most `task_max_results` of them.
+    """
+
     name = "task_service"
 
     def __init__(self, settings_service: SettingsService):
@@ -54,34 +61,38 @@ class TaskService(Service):
 
             logger.debug("Using Celery backend")
             return CeleryBackend()
-        logger.debug("Using AnyIO backend")
-        return AnyIOBackend()
+        logger.debug("Using local backend")
+        settings = self.settings_service.settings
+        return LocalBackend(
+            max_workers=settings.task_max_workers,
+            max_results=settings.task_max_results,
+            result_ttl=settings.task_result_ttl,
+        )
 
-    # In your TaskService class
     async def launch_and_await_task(
         self,
         task_func: Callable[..., Any],
         *args: Any,
         **kwargs: Any,
     ) -> Any:
-        if not self.use_celery:
-            return None, await task_func(*args, **kwargs)
-        if not hasattr(task_func, "apply"):
-            msg = f"Task function {task_func} does not have an apply method"
-            raise ValueError(msg)
-        task = task_func.apply(args=args, kwargs=kwargs)
-
-        result = task.get()
-        # if result is coroutine
-        if isinstance(result, Coroutine):
-            result = await result
-        return task.id, result
+        """Launches a task and waits for its result without blocking the event loop.
+
+        Returns:
+            A tuple containing the task ID and the result of the task.
+        """
+        task_id, task = await self.launch_task(task_func, *args, **kwargs)
+        return task_id, await self.backend.wait_for_result(task)
 
     async def launch_task(self, task_func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         logger.debug(f"Launching task {task_func} with args {args} and kwargs {kwargs}")
         logger.debug(f"Using backend {self.backend}")
-        task = self.backend.launch_task(task_func, *args, **kwargs)
-        return await task if isinstance(task, Coroutine) else task
+        return await self.backend.launch_task(task_func, *args, **kwargs)
 
     def get_task(self, task_id: str) -> Any:
         return self.backend.get_task(task_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {"backend": self.backend_name, **self.backend.get_stats()}
+
+    async def teardown(self) -> None:
+        await self.backend.teardown()
@@ -138,6 +138,21 @@ async def teardown_services() -> None:
     try:
         from langflow.services.manager import service_manager
 
+        # Stop the webhook runs, then write the buffered transactions, vertex builds and API key uses,
+        # while the database is still available
+        for service_type in (
+            ServiceType.WEBHOOK_QUEUE_SERVICE,
+            ServiceType.BUILD_LOG_SERVICE,
+            ServiceType.AUTH_SERVICE,
+        ):
+            service = service_manager.services.get(service_type)
+            if service is not None:
+                await service.teardown()
+    except Exception as exc:  # noqa: BLE001
+        logger.exception(exc)
+    try:
+        from langflow.services.manager import service_manager
+
         await service_manager.teardown()
     except Exception as exc:  # noqa: BLE001
         logger.exception(exc)
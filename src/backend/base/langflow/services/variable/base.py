@@ -1,10 +1,23 @@
 import abc
+from collections.abc import Sequence
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.base import Service
 from langflow.services.database.models.variable.model import Variable, VariableRead
+from langflow.services.variable.cache import ResolvedVariable
+from langflow.services.variable.constants import CREDENTIAL_TYPE
+
+
+def check_variable_field(name: str, type_: str, field: str) -> None:
+    """Raises a TypeError if a variable of type `type_` cannot be used in `field`."""
+    if type_ == CREDENTIAL_TYPE and field == "session_id":
+        msg = (
+            f"variable {name} of type 'Credential' cannot be used in a Session ID field "
+            "because its purpose is to prevent the exposure of values."
+        )
+        raise TypeError(msg)
 
 
 class VariableService(Service):
@@ -35,6 +48,21 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    @abc.abstractmethod
+    async def get_variables(
+        self, user_id: UUID | str, names: Sequence[str], session: AsyncSession
+    ) -> dict[str, ResolvedVariable]:
+        """Async get the values of several variables at once.
+
+        Args:
+            user_id: The user ID.
+            names: The names of the variables.
+            session: The database session.
+
+        Returns:
+            The decrypted variables by name. Variables that do not exist or have no value are left out.
+        """
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
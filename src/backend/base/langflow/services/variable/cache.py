@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, NamedTuple
+
+from langflow.services.cache.service import ThreadingInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+VARIABLE_CACHE_MAX_SIZE = 10_000
+"""Maximum number of decrypted variables kept in the cache, for all users."""
+
+
+class ResolvedVariable(NamedTuple):
+    """The decrypted value of a variable and its type."""
+
+    type: str
+    value: str
+
+
+class VariableValueCache:
+    """Keeps the decrypted values of variables for `ttl` seconds, per user and variable name."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._cache = ThreadingInMemoryCache(max_size=VARIABLE_CACHE_MAX_SIZE, expiration_time=ttl)
+        self._names_by_user: defaultdict[str, set[str]] = defaultdict(set)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get_many(self, user_id: UUID | str, names: Iterable[str]) -> dict[str, ResolvedVariable]:
+        """Returns the cached variables among `names`."""
+        if not self.enabled:
+            return {}
+        found = {}
+        for name in names:
+            cached = self._cache.get((str(user_id), name))
+            if cached is not CACHE_MISS:
+                found[name] = cached
+        return found
+
+    def set_many(self, user_id: UUID | str, variables: dict[str, ResolvedVariable]) -> None:
+        if not self.enabled:
+            return
+        for name, variable in variables.items():
+            self._cache.set((str(user_id), name), variable)
+            self._names_by_user[str(user_id)].add(name)
+
+    def invalidate(self, user_id: UUID | str, *names: str) -> None:
+        """Drops variables of a user, or every variable of the user when no name is given."""
+        user_names = self._names_by_user[str(user_id)]
+        for name in names or tuple(user_names):
+            self._cache.delete((str(user_id), name))
+            user_names.discard(name)
+        if not user_names:
+            del self._names_by_user[str(user_id)]
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._names_by_user.clear()
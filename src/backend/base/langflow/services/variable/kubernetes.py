@@ -10,11 +10,13 @@ from typing_extensions import override
 from langflow.services.auth import utils as auth_utils
 from langflow.services.base import Service
 from langflow.services.database.models.variable.model import Variable, VariableCreate, VariableRead
-from langflow.services.variable.base import VariableService
+from langflow.services.variable.base import VariableService, check_variable_field
+from langflow.services.variable.cache import ResolvedVariable, VariableValueCache
 from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 from langflow.services.variable.kubernetes_secrets import KubernetesSecretManager, encode_user_id
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from uuid import UUID
 
     from sqlmodel import Session
@@ -23,11 +25,17 @@ if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
 
 
+def _resolved(key: str, value: str) -> ResolvedVariable:
+    type_ = CREDENTIAL_TYPE if key.startswith(CREDENTIAL_TYPE + "_") else GENERIC_TYPE
+    return ResolvedVariable(type=type_, value=value)
+
+
 class KubernetesSecretService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
         # TODO: settings_service to set kubernetes namespace
         self.kubernetes_secrets = KubernetesSecretManager()
+        self.cache = VariableValueCache(ttl=settings_service.settings.variable_cache_ttl)
 
     @override
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
@@ -52,6 +60,7 @@ class KubernetesSecretService(VariableService, Service):
                     name=secret_name,
                     data=variables,
                 )
+                self.cache.invalidate(user_id)
             except Exception:  # noqa: BLE001
                 logger.exception(f"Error creating {var} variable")
 
@@ -80,15 +89,33 @@ class KubernetesSecretService(VariableService, Service):
 
     @override
     async def get_variable(self, user_id: UUID | str, name: str, field: str, session: AsyncSession) -> str:
-        secret_name = encode_user_id(user_id)
-        key, value = await asyncio.to_thread(self.resolve_variable, secret_name, user_id, name)
-        if key.startswith(CREDENTIAL_TYPE + "_") and field == "session_id":
-            msg = (
-                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
-                "because its purpose is to prevent the exposure of values."
+        variable = (await self.get_variables(user_id, [name], session)).get(name)
+        if variable is None:
+            # Raises the error telling whether the secret or the key is missing
+            variable = _resolved(
+                *await asyncio.to_thread(self.resolve_variable, encode_user_id(user_id), user_id, name)
             )
-            raise TypeError(msg)
-        return value
+        check_variable_field(name, variable.type, field)
+        return variable.value
+
+    @override
+    async def get_variables(
+        self, user_id: UUID | str, names: Sequence[str], session: AsyncSession
+    ) -> dict[str, ResolvedVariable]:
+        variables = self.cache.get_many(user_id, names)
+        missing = [name for name in names if name not in variables]
+        if not missing:
+            return variables
+        # The secret of a user holds all of their variables, so it is read once for every name
+        secret = await asyncio.to_thread(self.kubernetes_secrets.get_secret, name=encode_user_id(user_id)) or {}
+        fetched = {}
+        for name in missing:
+            for key in (name, CREDENTIAL_TYPE + "_" + name):
+                if key in secret:
+                    fetched[name] = _resolved(key, secret[key])
+                    break
+        self.cache.set_many(user_id, fetched)
+        return variables | fetched
 
     @override
     async def list_variables(
@@ -126,7 +153,10 @@ class KubernetesSecretService(VariableService, Service):
         value: str,
         session: AsyncSession,
     ):
-        return await asyncio.to_thread(self._update_variable, user_id, name, value)
+        try:
+            return await asyncio.to_thread(self._update_variable, user_id, name, value)
+        finally:
+            self.cache.invalidate(user_id, name)
 
     def _delete_variable(self, user_id: UUID | str, name: str) -> None:
         secret_name = encode_user_id(user_id)
@@ -135,7 +165,10 @@ class KubernetesSecretService(VariableService, Service):
 
     @override
     async def delete_variable(self, user_id: UUID | str, name: str, session: AsyncSession) -> None:
-        await asyncio.to_thread(self._delete_variable, user_id, name)
+        try:
+            await asyncio.to_thread(self._delete_variable, user_id, name)
+        finally:
+            self.cache.invalidate(user_id, name)
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID | str, session: AsyncSession) -> None:
@@ -162,6 +195,7 @@ class KubernetesSecretService(VariableService, Service):
         await asyncio.to_thread(
             self.kubernetes_secrets.upsert_secret, secret_name=secret_name, data={secret_key: value}
         )
+        self.cache.invalidate(user_id, name)
 
         variable_base = VariableCreate(
             name=name,
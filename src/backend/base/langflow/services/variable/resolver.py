@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from langflow.services.deps import get_variable_service, session_scope
+from langflow.services.variable.base import check_variable_field
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+    from langflow.services.variable.cache import ResolvedVariable
+
+
+class VariableResolver:
+    """Resolves the variables used by a run for one user.
+
+    The names the run refers to are given up front and fetched together, in one call to the variable
+    service, by the first lookup. A name that was not given is fetched by its own lookup.
+    """
+
+    def __init__(self, user_id: UUID, names: Iterable[str] = ()) -> None:
+        self.user_id = user_id
+        self._pending = set(names)
+        self._fetched: set[str] = set()
+        self._variables: dict[str, ResolvedVariable] = {}
+        self._lock = asyncio.Lock()
+
+    async def get_variable(self, name: str, field: str) -> str:
+        """Returns the value of a variable, raising the errors of `VariableService.get_variable`."""
+        if name not in self._fetched:
+            async with self._lock:
+                if name not in self._fetched:
+                    await self._fetch(name)
+        variable = self._variables.get(name)
+        if variable is None:
+            # The variable service raises the error that tells why the variable is missing
+            async with session_scope() as session:
+                return await get_variable_service().get_variable(
+                    user_id=self.user_id, name=name, field=field, session=session
+                )
+        check_variable_field(name, variable.type, field)
+        return variable.value
+
+    async def _fetch(self, name: str) -> None:
+        names = sorted(self._pending | {name})
+        async with session_scope() as session:
+            self._variables |= await get_variable_service().get_variables(self.user_id, names, session)
+        self._fetched.update(names)
+        self._pending.clear()
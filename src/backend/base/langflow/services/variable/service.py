@@ -11,7 +11,8 @@ from typing_extensions import override
 from langflow.services.auth import utils as auth_utils
 from langflow.services.base import Service
 from langflow.services.database.models.variable.model import Variable, VariableCreate, VariableRead, VariableUpdate
-from langflow.services.variable.base import VariableService
+from langflow.services.variable.base import VariableService, check_variable_field
+from langflow.services.variable.cache import ResolvedVariable, VariableValueCache
 from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 
 if TYPE_CHECKING:
@@ -26,6 +27,7 @@ if TYPE_CHECKING:
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        self.cache = VariableValueCache(ttl=settings_service.settings.variable_cache_ttl)
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -61,24 +63,35 @@ class DatabaseVariableService(VariableService, Service):
         field: str,
         session: AsyncSession,
     ) -> str:
-        # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
-        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
-        variable = (await session.exec(stmt)).first()
-
-        if not variable or not variable.value:
+        variables = await self.get_variables(user_id, [name], session)
+        if name not in variables:
             msg = f"{name} variable not found."
             raise ValueError(msg)
+        check_variable_field(name, variables[name].type, field)
+        return variables[name].value
 
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
-            msg = (
-                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
-                "because its purpose is to prevent the exposure of values."
+    async def get_variables(
+        self,
+        user_id: UUID | str,
+        names: Sequence[str],
+        session: AsyncSession,
+    ) -> dict[str, ResolvedVariable]:
+        variables = self.cache.get_many(user_id, names)
+        missing = [name for name in names if name not in variables]
+        if not missing:
+            return variables
+        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name.in_(missing))  # type: ignore[attr-defined]
+        fetched = {
+            # we decrypt the value
+            variable.name: ResolvedVariable(
+                type=variable.type,
+                value=auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service),
             )
-            raise TypeError(msg)
-
-        # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+            for variable in (await session.exec(stmt)).all()
+            if variable.value
+        }
+        self.cache.set_many(user_id, fetched)
+        return variables | fetched
 
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
@@ -121,6 +134,7 @@ class DatabaseVariableService(VariableService, Service):
         variable.value = encrypted
         session.add(variable)
         await session.commit()
+        self.cache.invalidate(user_id, name)
         await session.refresh(variable)
         return variable
 
@@ -134,6 +148,7 @@ class DatabaseVariableService(VariableService, Service):
         query = select(Variable).where(Variable.id == variable_id, Variable.user_id == user_id)
         db_variable = (await session.exec(query)).one()
         db_variable.updated_at = datetime.now(timezone.utc)
+        previous_name = db_variable.name
 
         variable.value = variable.value or ""
         encrypted = auth_utils.encrypt_api_key(variable.value, settings_service=self.settings_service)
@@ -145,6 +160,7 @@ class DatabaseVariableService(VariableService, Service):
 
         session.add(db_variable)
         await session.commit()
+        self.cache.invalidate(user_id, previous_name, db_variable.name)
         await session.refresh(db_variable)
         return db_variable
 
@@ -162,6 +178,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.cache.invalidate(user_id, name)
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
@@ -170,8 +187,10 @@ class DatabaseVariableService(VariableService, Service):
         if not variable:
             msg = f"{variable_id} variable not found."
             raise ValueError(msg)
+        name = variable.name
         await session.delete(variable)
         await session.commit()
+        self.cache.invalidate(user_id, name)
 
     async def create_variable(
         self,
@@ -192,5 +211,6 @@ class DatabaseVariableService(VariableService, Service):
         variable = Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
         session.add(variable)
         await session.commit()
+        self.cache.invalidate(user_id, name)
         await session.refresh(variable)
         return variable
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.service import AsyncInMemoryCache, RedisCache
+from langflow.services.cache.utils import CACHE_MISS
+
+if TYPE_CHECKING:
+    from langflow.services.cache.base import AsyncBaseCacheService
+    from langflow.services.settings.service import SettingsService
+
+MEMO_KEY_PREFIX = "vertex-memo:"
+
+
+class VertexMemoService(Service):
+    """Stores the outputs of components that opted in to memoization, keyed by a hash of their inputs.
+
+    The backend is one of the cache implementations, chosen by the `vertex_memo_backend` setting:
+    'memory' keeps up to `vertex_memo_max_size` entries per worker, 'disk' keeps them in the config
+    directory across restarts and 'redis' shares them between workers. Entries expire after
+    `vertex_memo_ttl` seconds. Values are pickled on the way in, so every hit gets its own copy.
+    """
+
+    name = "vertex_memo_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.enabled = settings.vertex_memo_max_size > 0
+        self.backend_name = settings.vertex_memo_backend
+        self.hits = 0
+        self.misses = 0
+        self._backend: AsyncBaseCacheService | None = None
+        if not self.enabled:
+            return
+        if settings.vertex_memo_backend == "redis":
+            self._backend = RedisCache(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                db=settings.redis_db,
+                url=settings.redis_url,
+                expiration_time=settings.vertex_memo_ttl,
+            )
+        elif settings.vertex_memo_backend == "disk" and settings.config_dir:
+            self._backend = AsyncDiskCache(
+                cache_dir=Path(settings.config_dir) / "vertex_memo",
+                max_size=settings.vertex_memo_max_size,
+                expiration_time=settings.vertex_memo_ttl,
+                persistent=True,
+            )
+        else:
+            self._backend = AsyncInMemoryCache(
+                max_size=settings.vertex_memo_max_size, expiration_time=settings.vertex_memo_ttl
+            )
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Returns a fresh copy of the memoized outputs for a key, or None on a miss."""
+        if self._backend is None:
+            return None
+        try:
+            entry = await self._backend.get(MEMO_KEY_PREFIX + key)
+            if entry is CACHE_MISS or not isinstance(entry, dict):
+                self.misses += 1
+                return None
+            value = pickle.loads(entry["payload"])  # noqa: S301
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Could not read the memoized outputs for key {key}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """Memoizes the outputs for a key. Outputs that cannot be pickled are not memoized."""
+        if self._backend is None:
+            return
+        try:
+            payload = pickle.dumps(value)
+        except (TypeError, AttributeError, pickle.PicklingError):
+            logger.opt(exception=True).debug(f"Outputs for key {key} cannot be pickled, not memoizing them")
+            return
+        try:
+            # Wrapped in a dict so that every backend hands the pickled bytes back unchanged
+            await self._backend.set(MEMO_KEY_PREFIX + key, {"payload": payload})
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).warning(f"Could not memoize the outputs for key {key}")
+
+    async def teardown(self) -> None:
+        if self._backend is not None:
+            await self._backend.teardown()
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from langflow.services.factory import ServiceFactory
+from langflow.services.webhook_queue.service import WebhookQueueService
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+
+class WebhookQueueServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(WebhookQueueService)
+
+    @override
+    def create(self, settings_service: SettingsService):
+        return WebhookQueueService(settings_service)
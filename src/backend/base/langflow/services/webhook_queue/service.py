@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from loguru import logger
+
+from langflow.services.base import Service
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+WEBHOOK_QUEUE_FILE = "webhook_queue.db"
+WEBHOOK_LEASE_TIME = 60.0
+"""Seconds a started run stays held by its worker without being renewed. Once its lease expired, because
+its worker stopped, any worker runs it again."""
+WEBHOOK_MAINTENANCE_INTERVAL = 15.0
+"""Seconds between renewals of the leases of running runs and removals of finished runs past their retention."""
+UNFINISHED_STATUSES = ("PENDING", "RETRY", "STARTED")
+FINISHED_STATUSES = ("SUCCESS", "FAILURE")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS webhook_task (
+    id TEXT PRIMARY KEY,
+    flow_id TEXT NOT NULL,
+    user_id TEXT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    finished_at REAL,
+    result TEXT,
+    error TEXT,
+    traceback TEXT,
+    owner TEXT,
+    lease_expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS ix_webhook_task_status ON webhook_task (status, next_attempt_at);
+"""
+# Columns added after the first version of the table, with their definition
+_ADDED_COLUMNS = {"owner": "TEXT", "lease_expires_at": "REAL"}
+
+
+class WebhookQueueFullError(Exception):
+    """Raised when a webhook is received while the queue already holds `webhook_queue_max_size` runs."""
+
+
+class NonRetryableWebhookError(Exception):
+    """Raised by a run that would fail again if it were retried, such as the run of a deleted flow."""
+
+
+@dataclass
+class WebhookTask:
+    """A queued run of a flow, with the interface of the task results of the task service."""
+
+    id: str
+    flow_id: str
+    user_id: str | None
+    payload: str
+    status: str
+    attempts: int = 0
+    result: Any = None
+    error: str | None = None
+    traceback: str = ""
+
+    def ready(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> WebhookTask:
+        result = orjson.loads(row["result"]) if row["result"] is not None else None
+        if row["status"] == "FAILURE":
+            result = row["error"]
+        return cls(
+            id=row["id"],
+            flow_id=row["flow_id"],
+            user_id=row["user_id"],
+            payload=row["payload"],
+            status=row["status"],
+            attempts=row["attempts"],
+            result=result,
+            error=row["error"],
+            traceback=row["traceback"] or "",
+        )
+
+
+class WebhookQueueService(Service):
+    """Runs the flows triggered by webhooks from a persistent, bounded queue.
+
+    Webhook runs are stored in a SQLite file in the config dir before they are acknowledged, so
+    queued runs survive a restart. At most `webhook_max_concurrency` runs execute at the same time,
+    and at most `webhook_max_concurrency_per_flow` of them for the same flow. When the queue holds
+    `webhook_queue_max_size` unfinished runs, new webhooks are refused. A failed run is retried up to
+    `webhook_max_retries` times, waiting `webhook_retry_backoff` seconds, doubled on each attempt.
+
+    Workers sharing the config dir share the queue. A worker claims a run in a write transaction and
+    holds it with a lease of `WEBHOOK_LEASE_TIME` seconds, renewed while the run executes. A run
+    whose lease expired, because its worker stopped or crashed, is run again by any worker. Finished
+    runs are removed `webhook_task_retention_time` seconds after they finished.
+    """
+
+    name = "webhook_queue_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.max_size = settings.webhook_queue_max_size
+        self.max_concurrency = max(settings.webhook_max_concurrency, 1)
+        self.max_concurrency_per_flow = max(settings.webhook_max_concurrency_per_flow, 1)
+        self.max_retries = max(settings.webhook_max_retries, 0)
+        self.retry_backoff = settings.webhook_retry_backoff
+        self.retention_time = settings.webhook_task_retention_time
+        self.path = Path(settings.config_dir) / WEBHOOK_QUEUE_FILE if settings.config_dir else None
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._wakeup = asyncio.Event()
+        self._dispatcher: asyncio.Task | None = None
+        self._maintenance: asyncio.Task | None = None
+        # Identifies the runs held by this worker, the pid alone can be reused after a restart
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex}"
+        self._running: dict[str, asyncio.Task] = {}
+        self._running_per_flow: Counter[str] = Counter()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if self.path is not None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path or ":memory:", check_same_thread=False, isolation_level=None, timeout=30
+            )
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            columns = {row["name"] for row in connection.execute("PRAGMA table_info(webhook_task)")}
+            for column, definition in _ADDED_COLUMNS.items():
+                if column not in columns:
+                    connection.execute(f"ALTER TABLE webhook_task ADD COLUMN {column} {definition}")
+            self._connection = connection
+        return self._connection
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> None:
+        with self._lock:
+            self._connect().execute(sql, parameters)
+
+    def _fetchone(self, sql: str, parameters: tuple = ()) -> sqlite3.Row | None:
+        with self._lock:
+            return self._connect().execute(sql, parameters).fetchone()
+
+    async def start(self) -> None:
+        """Starts running the queue, with the runs of stopped workers."""
+        if self._dispatcher is not None and not self._dispatcher.done():
+            return
+        await asyncio.to_thread(self._prune)
+        self._dispatcher = asyncio.create_task(self._dispatch(), name="webhook_queue_dispatcher")
+        self._maintenance = asyncio.create_task(self._maintain(), name="webhook_queue_maintenance")
+
+    def _prune(self) -> None:
+        """Removes the finished runs past their retention time."""
+        if self.retention_time > 0:
+            self._execute(
+                "DELETE FROM webhook_task WHERE status IN (?, ?) AND finished_at < ?",
+                (*FINISHED_STATUSES, time.time() - self.retention_time),
+            )
+
+    def _renew_leases(self) -> None:
+        self._execute(
+            "UPDATE webhook_task SET lease_expires_at = ? WHERE owner = ? AND status = 'STARTED'",
+            (time.time() + WEBHOOK_LEASE_TIME, self.owner),
+        )
+
+    async def _maintain(self) -> None:
+        while True:
+            await asyncio.sleep(WEBHOOK_MAINTENANCE_INTERVAL)
+            try:
+                await asyncio.to_thread(self._renew_leases)
+                await asyncio.to_thread(self._prune)
+            except Exception:  # noqa: BLE001
+                logger.exception("Error maintaining the webhook queue")
+            # Runs of other workers may have been released in the meantime
+            self._wakeup.set()
+
+    async def enqueue(self, *, flow_id: str, user_id: str | None, payload: str) -> str:
+        """Stores a run of a flow and returns its task id.
+
+        Raises:
+            WebhookQueueFullError: If the queue already holds `webhook_queue_max_size` unfinished runs.
+        """
+        task_id = await asyncio.to_thread(self._insert, flow_id, user_id, payload)
+        await self.start()
+        self._wakeup.set()
+        return task_id
+
+    def _insert(self, flow_id: str, user_id: str | None, payload: str) -> str:
+        task_id = str(uuid.uuid4())
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                (unfinished,) = connection.execute(
+                    "SELECT COUNT(*) FROM webhook_task WHERE status IN (?, ?, ?)", UNFINISHED_STATUSES
+                ).fetchone()
+                if self.max_size > 0 and unfinished >= self.max_size:
+                    msg = f"The webhook queue is full ({unfinished} runs are waiting)"
+                    raise WebhookQueueFullError(msg)
+                connection.execute(
+                    "INSERT INTO webhook_task (id, flow_id, user_id, payload, status, next_attempt_at, created_at) "
+                    "VALUES (?, ?, ?, ?, 'PENDING', ?, ?)",
+                    (task_id, flow_id, user_id, payload, now, now),
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        return task_id
+
+    async def get_task(self, task_id: str) -> WebhookTask | None:
+        row = await asyncio.to_thread(self._fetchone, "SELECT * FROM webhook_task WHERE id = ?", (task_id,))
+        return WebhookTask.from_row(row) if row is not None else None
+
+    async def _dispatch(self) -> None:
+        while True:
+            self._wakeup.clear()
+            while len(self._running) < self.max_concurrency:
+                saturated = [
+                    flow_id
+                    for flow_id, count in self._running_per_flow.items()
+                    if count >= self.max_concurrency_per_flow
+                ]
+                task = await asyncio.to_thread(self._claim_next, saturated)
+                if task is None:
+                    break
+                self._running_per_flow[task.flow_id] += 1
+                self._running[task.id] = asyncio.create_task(self._run(task), name=f"webhook_task_{task.id}")
+            timeout = None
+            if len(self._running) < self.max_concurrency:
+                timeout = await asyncio.to_thread(self._seconds_until_next_retry)
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+
+    def _claim_next(self, saturated: list[str]) -> WebhookTask | None:
+        """Claims the next run to execute, a queued run or a run whose lease expired."""
+        placeholders = ", ".join("?" * len(saturated))
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            # Holds the write lock of the file so that no other worker claims the same run
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                # Runs whose worker stopped on each attempt, for example killed by the run, are not retried forever
+                connection.execute(
+                    "UPDATE webhook_task SET status = 'FAILURE', finished_at = ?, error = ? "
+                    "WHERE status = 'STARTED' AND COALESCE(lease_expires_at, 0) < ? AND attempts > ?",
+                    (now, "The worker running the webhook stopped on every attempt", now, self.max_retries),
+                )
+                row = connection.execute(
+                    "SELECT * FROM webhook_task WHERE (status IN ('PENDING', 'RETRY') AND next_attempt_at <= ? "  # noqa: S608
+                    "OR status = 'STARTED' AND COALESCE(lease_expires_at, 0) < ?) "
+                    f"AND flow_id NOT IN ({placeholders}) ORDER BY next_attempt_at, created_at LIMIT 1",
+                    (now, now, *saturated),
+                ).fetchone()
+                if row is not None:
+                    connection.execute(
+                        "UPDATE webhook_task SET status = 'STARTED', attempts = attempts + 1, owner = ?, "
+                        "lease_expires_at = ? WHERE id = ?",
+                        (self.owner, now + WEBHOOK_LEASE_TIME, row["id"]),
+                    )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        if row is None:
+            return None
+        task = WebhookTask.from_row(row)
+        task.status = "STARTED"
+        task.attempts += 1
+        return task
+
+    def _seconds_until_next_retry(self) -> float | None:
+        (next_attempt_at,) = self._fetchone(  # type: ignore[misc]
+            "SELECT MIN(next_attempt_at) FROM webhook_task WHERE status = 'RETRY' AND next_attempt_at > ?",
+            (time.time(),),
+        )
+        return None if next_attempt_at is None else max(next_attempt_at - time.time(), 0)
+
+    async def _run(self, task: WebhookTask) -> None:
+        try:
+            result = await self.run_flow(task)
+        except asyncio.CancelledError:
+            # Left as started, its lease is released by teardown
+            raise
+        except Exception as exc:  # noqa: BLE001
+            retry = not isinstance(exc, NonRetryableWebhookError) and task.attempts <= self.max_retries
+            if retry:
+                delay = self.retry_backoff * 2 ** (task.attempts - 1)
+                logger.warning(f"Webhook run {task.id} of flow {task.flow_id} failed, retrying in {delay:.1f}s: {exc}")
+                await asyncio.to_thread(
+                    self._execute,
+                    "UPDATE webhook_task SET status = 'RETRY', next_attempt_at = ?, error = ? "
+                    "WHERE id = ? AND owner = ?",
+                    (time.time() + delay, str(exc), task.id, self.owner),
+                )
+            else:
+                logger.error(f"Webhook run {task.id} of flow {task.flow_id} failed: {exc}")
+                await asyncio.to_thread(
+                    self._execute,
+                    "UPDATE webhook_task SET status = 'FAILURE', finished_at = ?, error = ?, traceback = ? "
+                    "WHERE id = ? AND owner = ?",
+                    (time.time(), str(exc), "".join(traceback.format_tb(exc.__traceback__)), task.id, self.owner),
+                )
+        else:
+            await asyncio.to_thread(
+                self._execute,
+                "UPDATE webhook_task SET status = 'SUCCESS', finished_at = ?, result = ?, error = NULL "
+                "WHERE id = ? AND owner = ?",
+                (time.time(), _encode_result(result), task.id, self.owner),
+            )
+        finally:
+            self._running.pop(task.id, None)
+            self._running_per_flow[task.flow_id] -= 1
+            if self._running_per_flow[task.flow_id] <= 0:
+                del self._running_per_flow[task.flow_id]
+            self._wakeup.set()
+
+    async def run_flow(self, task: WebhookTask) -> Any:
+        """Runs the flow of a queued webhook with the stored `SimplifiedAPIRequest`."""
+        from langflow.api.v1.endpoints import simple_run_flow
+        from langflow.api.v1.schemas import SimplifiedAPIRequest
+        from langflow.services.database.models.flow.model import Flow, FlowRead
+        from langflow.services.database.models.user.model import User, UserRead
+        from langflow.services.database.utils import session_getter
+        from langflow.services.deps import get_db_service
+
+        async with session_getter(get_db_service()) as session:
+            flow = await session.get(Flow, uuid.UUID(task.flow_id))
+            user = await session.get(User, uuid.UUID(task.user_id)) if task.user_id else None
+            if flow is None:
+                msg = f"Flow {task.flow_id} not found"
+                raise NonRetryableWebhookError(msg)
+            flow_read = FlowRead.model_validate(flow, from_attributes=True)
+            user_read = UserRead.model_validate(user, from_attributes=True) if user is not None else None
+
+        return await simple_run_flow(
+            flow=flow_read,  # type: ignore[arg-type]
+            input_request=SimplifiedAPIRequest.model_validate_json(task.payload),
+            api_key_user=user_read,  # type: ignore[arg-type]
+        )
+
+    async def teardown(self) -> None:
+        tasks = [task for task in (self._dispatcher, self._maintenance, *self._running.values()) if task is not None]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._dispatcher = None
+        self._maintenance = None
+        self._running.clear()
+        self._running_per_flow.clear()
+        # The interrupted runs can be run again by any worker right away, the interrupted attempt does not count
+        await asyncio.to_thread(
+            self._execute,
+            "UPDATE webhook_task SET lease_expires_at = 0, attempts = attempts - 1 "
+            "WHERE owner = ? AND status = 'STARTED'",
+            (self.owner,),
+        )
+        await asyncio.to_thread(self._close)
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def _encode_result(result: Any) -> str | None:
+    if result is None:
+        return None
+    try:
+        return orjson.dumps(jsonable_encoder(result)).decode()
+    except (TypeError, ValueError):
+        return orjson.dumps(str(result)).decode()
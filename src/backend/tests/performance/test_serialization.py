@@ -0,0 +1,39 @@
+import time
+
+import orjson
+import pandas as pd
+import pytest
+from langflow.schema.data import Data
+from langflow.schema.message import Message
+from langflow.serialization.serialization import serialize, serialize_json
+from loguru import logger
+
+ROUNDS = 20
+
+
+def _vertex_results() -> dict[str, object]:
+    """Typical shapes of the results of a vertex."""
+    return {
+        "message": {"message": Message(text="Hello " * 50, sender="Machine", sender_name="AI", session_id="session")},
+        "data_list": [Data(data={"text": f"chunk {i}", "score": i / 10, "source": "file.txt"}) for i in range(200)],
+        "dataframe": pd.DataFrame({"id": range(500), "text": [f"row {i}" for i in range(500)]}),
+        "long_text": {"text": "x" * 50_000},
+        "nested": {"outputs": [{"results": {"text": "ok", "metadata": {"tokens": i, "ok": True}}} for i in range(200)]},
+        "primitives": {"values": list(range(5_000)), "labels": [f"label {i}" for i in range(5_000)]},
+    }
+
+
+@pytest.mark.parametrize("shape", list(_vertex_results()))
+def test_serialize_json_vertex_results(shape):
+    """Benchmark serializing vertex results to JSON bytes."""
+    result = _vertex_results()[shape]
+    expected = orjson.loads(orjson.dumps(serialize(result, to_str=True), default=str))
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        encoded = serialize_json(result)
+    elapsed = (time.perf_counter() - start) / ROUNDS
+    logger.info(f"serialize_json of {shape}: {elapsed * 1000:.3f} ms")
+
+    assert isinstance(encoded, bytes)
+    assert orjson.loads(encoded) == expected
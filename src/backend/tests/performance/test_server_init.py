@@ -1,7 +1,10 @@
 import os
+import time
 
+import orjson
 import pytest
 from langflow.services.deps import get_settings_service
+from loguru import logger
 
 
 @pytest.fixture(autouse=True)
@@ -62,6 +65,38 @@ async def test_get_and_cache_all_types_dict():
     assert "test_performance.db" in settings_service.settings.database_url
 
 
+@pytest.fixture
+def component_index_dir(tmp_path, monkeypatch):
+    """Keep the component index of the test in a temporary config directory."""
+    settings_service = get_settings_service()
+    monkeypatch.setattr(settings_service.settings, "config_dir", str(tmp_path))
+    monkeypatch.setattr(settings_service.settings, "component_index_cache", True)
+    return tmp_path
+
+
+@pytest.mark.usefixtures("component_index_dir")
+async def test_get_and_cache_all_types_dict_cold_and_warm(monkeypatch):
+    """Benchmark building the types dict without and with a component index on disk."""
+    from langflow.interface import components
+
+    settings_service = get_settings_service()
+    monkeypatch.setattr(components, "all_types_dict_cache", None)
+    start = time.perf_counter()
+    cold = await components.get_and_cache_all_types_dict(settings_service)
+    cold_seconds = time.perf_counter() - start
+
+    # A new worker starts with an empty in-memory cache but finds the index
+    monkeypatch.setattr(components, "all_types_dict_cache", None)
+    start = time.perf_counter()
+    warm = await components.get_and_cache_all_types_dict(settings_service)
+    warm_seconds = time.perf_counter() - start
+
+    logger.info(f"Cold start: {cold_seconds:.3f}s, warm start: {warm_seconds:.3f}s")
+    assert warm == orjson.loads(orjson.dumps(cold))
+    assert warm_seconds < cold_seconds
+    assert "vectorstores" in warm
+
+
 async def test_create_starter_projects():
     """Benchmark creation of starter projects."""
     from langflow.initial_setup.setup import create_or_update_starter_projects
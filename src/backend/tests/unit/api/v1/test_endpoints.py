@@ -34,6 +34,27 @@ async def test_get_config(client: AsyncClient):
     assert "max_file_size_upload" in result, "The dictionary must contain a key called 'max_file_size_upload'"
 
 
+async def test_get_task_stats_and_status(client: AsyncClient, logged_in_headers: dict):
+    from langflow.services.deps import get_task_service
+
+    async def add(a, b):
+        return a + b
+
+    task_id, task = await get_task_service().launch_task(add, 1, 2)
+    await task.wait()
+
+    response = await client.get(f"api/v1/task/{task_id}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"status": "SUCCESS", "result": 3}
+
+    response = await client.get("api/v1/task/stats", headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK
+    stats = response.json()
+    assert stats["backend"] == "local"
+    assert stats["queue_depth"] == 0
+    assert stats["results"] >= 1
+
+
 async def test_update_component_outputs(client: AsyncClient, logged_in_headers: dict):
     path = Path(__file__).parent.parent.parent.parent / "data" / "dynamic_output_component.py"
     async with async_open(path, encoding="utf-8") as f:
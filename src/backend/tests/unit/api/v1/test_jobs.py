@@ -0,0 +1,63 @@
+import asyncio
+
+import orjson
+from fastapi import status
+from httpx import AsyncClient
+
+
+async def wait_for_job(client: AsyncClient, job_id: str, headers: dict) -> dict:
+    for _ in range(100):
+        response = await client.get(f"api/v1/jobs/{job_id}", headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        job = response.json()
+        if job["status"] not in {"queued", "running"}:
+            return job
+        await asyncio.sleep(0.1)
+    msg = f"Job {job_id} did not finish"
+    raise TimeoutError(msg)
+
+
+async def test_run_job_returns_the_result_and_replays_its_events(client: AsyncClient, simple_api_test, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+    payload = {"input_type": "chat", "output_type": "chat", "input_value": "value1"}
+
+    response = await client.post(f"api/v1/jobs/run/{simple_api_test['id']}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_202_ACCEPTED, response.text
+    job_id = response.json()["job_id"]
+
+    job = await wait_for_job(client, job_id, headers)
+    assert job["status"] == "completed"
+    assert job["result"]["outputs"][0]["outputs"][0]["results"]["message"]["text"] == "value1"
+
+    response = await client.get(f"api/v1/jobs/{job_id}/events", headers=headers)
+    events = [orjson.loads(line) for line in response.text.splitlines() if line]
+    assert events[-1]["event"] == "end"
+    assert events[-1]["seq"] == job["last_seq"]
+
+    response = await client.get(f"api/v1/jobs/{job_id}/events?after_seq={job['last_seq'] - 1}", headers=headers)
+    assert [orjson.loads(line) for line in response.text.splitlines() if line] == events[-1:]
+
+
+async def test_run_job_end_event_holds_long_texts(client: AsyncClient, simple_api_test, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+    long_text = "a" * 25_000
+    payload = {"input_type": "chat", "output_type": "chat", "input_value": long_text}
+
+    response = await client.post(f"api/v1/jobs/run/{simple_api_test['id']}", headers=headers, json=payload)
+    job = await wait_for_job(client, response.json()["job_id"], headers)
+    assert job["status"] == "completed"
+
+    response = await client.get(f"api/v1/jobs/{job['job_id']}/events", headers=headers)
+    end_event = [orjson.loads(line) for line in response.text.splitlines() if line][-1]
+    assert end_event["event"] == "end"
+    result_data = end_event["data"]["result"]["outputs"][0]["outputs"][0]
+    assert result_data["messages"][0]["message"] == long_text
+    assert result_data["artifacts"]["message"] == long_text
+
+
+async def test_unknown_job(client: AsyncClient, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+
+    response = await client.get("api/v1/jobs/unknown", headers=headers)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,87 @@
+from uuid import UUID
+
+import orjson
+import pytest
+from langflow.api.v1.mcp import current_user_ctx, handle_list_tools
+from langflow.graph.graph.base import Graph
+from langflow.helpers.flow import json_schema_from_flow_data
+from langflow.services.database.models.flow import Flow
+from langflow.services.deps import session_scope
+from sqlmodel import update
+
+
+def graph_json_schema(flow_data: dict) -> dict:
+    # The schema as it was computed from the vertices of the built graph
+    properties = {}
+    required = []
+    for vertex in Graph.from_payload(flow_data).vertices:
+        if not vertex.is_input:
+            continue
+        for field_name, field_data in vertex.data["node"]["template"].items():
+            if field_data != "Component" and field_data.get("show", False) and not field_data.get("advanced", False):
+                properties[field_name] = field_data.get("type", "string")
+                if field_data.get("required", False):
+                    required.append(field_name)
+    return {"properties": properties, "required": required}
+
+
+@pytest.mark.parametrize("json_fixture", ["json_memory_chatbot_no_llm", "json_simple_api_test", "json_webhook_test"])
+def test_json_schema_from_flow_data_matches_graph(json_fixture, request):
+    flow_data = orjson.loads(request.getfixturevalue(json_fixture))["data"]
+
+    schema = json_schema_from_flow_data(flow_data)
+
+    expected = graph_json_schema(flow_data)
+    assert list(schema["properties"]) == list(expected["properties"])
+    assert schema["required"] == expected["required"]
+
+
+async def list_tools_of(user):
+    token = current_user_ctx.set(user)
+    try:
+        return {tool.name: tool for tool in await handle_list_tools()}
+    finally:
+        current_user_ctx.reset(token)
+
+
+@pytest.fixture
+async def added_flow(client, json_memory_chatbot_no_llm, logged_in_headers):
+    data = orjson.loads(json_memory_chatbot_no_llm)["data"]
+    flow = {"name": "Memory Chatbot", "description": "description", "data": data}
+    response = await client.post("api/v1/flows/", json=flow, headers=logged_in_headers)
+    assert response.status_code == 201
+    yield response.json()
+    await client.delete(f"api/v1/flows/{response.json()['id']}", headers=logged_in_headers)
+
+
+async def test_list_tools_uses_stored_schemas(client, added_flow, active_user, logged_in_headers):
+    flow_id = added_flow["id"]
+
+    tools = await list_tools_of(active_user)
+
+    assert list(tools) == [flow_id]
+    assert tools[flow_id].description == "Memory Chatbot: description"
+    assert tools[flow_id].inputSchema == json_schema_from_flow_data(added_flow["data"])
+    assert "input_value" in tools[flow_id].inputSchema["properties"]
+
+    response = await client.patch(
+        f"api/v1/flows/{flow_id}", json={"data": {"nodes": [], "edges": []}}, headers=logged_in_headers
+    )
+    assert response.status_code == 200
+
+    tools = await list_tools_of(active_user)
+    assert tools[flow_id].inputSchema == {"type": "object", "properties": {}, "required": []}
+
+
+async def test_list_tools_computes_missing_schemas(added_flow, active_user):
+    flow_id = added_flow["id"]
+    async with session_scope() as session:
+        # As for flows saved before the schema was stored, bypassing the listeners of the model
+        await session.exec(update(Flow).where(Flow.id == UUID(flow_id)).values(mcp_tool_schema=None))
+
+    tools = await list_tools_of(active_user)
+
+    assert "input_value" in tools[flow_id].inputSchema["properties"]
+    async with session_scope() as session:
+        flow = await session.get(Flow, UUID(flow_id))
+        assert flow.mcp_tool_schema == tools[flow_id].inputSchema
@@ -0,0 +1,132 @@
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import InMemoryVectorStore
+from langflow.base.embeddings.cache import (
+    CachedEmbeddings,
+    EmbeddingStore,
+    embedding_model_identity,
+    get_embedding_store,
+)
+from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from langflow.io import HandleInput, IntInput
+from langflow.schema import Data
+from langflow.services.deps import get_settings_service
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self, model: str = "counting"):
+        self.model = model
+        self.embedded: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0, 0.5] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.embedded.append(text)
+        return [float(len(text)), 0.0, 0.5]
+
+
+def test_cached_embeddings_only_embeds_new_texts(tmp_path):
+    embeddings = CountingEmbeddings()
+    cached = CachedEmbeddings(embeddings, get_embedding_store(embeddings, tmp_path))
+
+    first = cached.embed_documents(["a", "bb", "a"])
+    second = cached.embed_documents(["bb", "ccc"])
+
+    assert first == [[1.0, 1.0, 0.5], [2.0, 1.0, 0.5], [1.0, 1.0, 0.5]]
+    assert second == [[2.0, 1.0, 0.5], [3.0, 1.0, 0.5]]
+    assert embeddings.embedded == ["a", "bb", "ccc"]
+    assert cached.model == "counting"
+
+
+def test_queries_and_documents_are_cached_separately(tmp_path):
+    embeddings = CountingEmbeddings()
+    cached = CachedEmbeddings(embeddings, get_embedding_store(embeddings, tmp_path))
+
+    cached.embed_documents(["a"])
+    assert cached.embed_query("a") == [1.0, 0.0, 0.5]
+    assert cached.embed_query("a") == [1.0, 0.0, 0.5]
+    assert embeddings.embedded == ["a", "a"]
+
+
+def test_store_is_per_model_and_persistent(tmp_path):
+    embeddings = CountingEmbeddings()
+    CachedEmbeddings(embeddings, get_embedding_store(embeddings, tmp_path)).embed_documents(["a", "bb"])
+
+    other_model = CountingEmbeddings(model="other")
+    assert get_embedding_store(other_model, tmp_path) is not get_embedding_store(embeddings, tmp_path)
+
+    # A new store on the same directory, as another worker would open it, reads the vectors from disk
+    store = get_embedding_store(embeddings, tmp_path)
+    reopened = EmbeddingStore(store.path, store.identity)
+    fresh = CountingEmbeddings()
+    assert CachedEmbeddings(fresh, reopened).embed_documents(["bb", "a"]) == [[2.0, 1.0, 0.5], [1.0, 1.0, 0.5]]
+    assert fresh.embedded == []
+    assert len(reopened) == 2
+
+
+def test_models_without_a_name_are_not_cached(tmp_path):
+    embeddings = CountingEmbeddings()
+    del embeddings.model
+
+    assert embedding_model_identity(embeddings) is None
+    assert get_embedding_store(embeddings, tmp_path) is None
+
+
+def test_full_store_starts_over(tmp_path):
+    embeddings = CountingEmbeddings(model="bounded")
+    # Room for the generation and two rows of 32 bytes of key and 3 float32
+    store = get_embedding_store(embeddings, tmp_path, max_bytes=16 + 2 * (32 + 12))
+    other_worker = EmbeddingStore(store.path, store.identity, store.max_bytes)
+    cached = CachedEmbeddings(embeddings, store)
+
+    cached.embed_documents(["a", "bb"])
+    assert CachedEmbeddings(CountingEmbeddings(), other_worker).embed_documents(["a"]) == [[1.0, 1.0, 0.5]]
+    cached.embed_documents(["ccc"])
+
+    assert len(store) == 1
+    assert store._size() <= store.max_bytes
+    assert cached.embed_documents(["a", "ccc"]) == [[1.0, 1.0, 0.5], [3.0, 1.0, 0.5]]
+    assert embeddings.embedded == ["a", "bb", "ccc", "a"]
+    # The other worker keeps reading the rows it mapped until it sees the new generation
+    bb_key = CachedEmbeddings._key("document", "bb")
+    assert other_worker.get_many([bb_key]) == {bb_key: [2.0, 1.0, 0.5]}
+    CachedEmbeddings(CountingEmbeddings(), other_worker).embed_documents(["ccc"])
+    assert other_worker.get_many([bb_key]) == {}
+    assert len(other_worker) == 2
+
+
+async def test_async_embeddings_use_the_cache(tmp_path):
+    embeddings = CountingEmbeddings()
+    cached = CachedEmbeddings(embeddings, get_embedding_store(embeddings, tmp_path))
+
+    assert await cached.aembed_documents(["a", "a"]) == [[1.0, 1.0, 0.5], [1.0, 1.0, 0.5]]
+    assert await cached.aembed_documents(["a"]) == [[1.0, 1.0, 0.5]]
+    assert embeddings.embedded == ["a"]
+
+
+class InMemoryVectorStoreComponent(LCVectorStoreComponent):
+    inputs = [
+        *LCVectorStoreComponent.inputs,
+        HandleInput(name="embedding", display_name="Embedding", input_types=["Embeddings"]),
+        IntInput(name="number_of_results", display_name="Number of Results", value=4),
+    ]
+
+    @check_cached_vector_store
+    def build_vector_store(self) -> InMemoryVectorStore:
+        documents = [data.to_lc_document() for data in self.ingest_data or []]
+        return InMemoryVectorStore.from_documents(documents, self.embedding)
+
+
+def test_vector_store_components_share_the_embedding_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "config_dir", str(tmp_path))
+    monkeypatch.setattr(get_settings_service().settings, "embedding_cache", True)
+    embeddings = CountingEmbeddings(model="vector-store")
+    ingest_data = [Data(text="first"), Data(text="second")]
+
+    InMemoryVectorStoreComponent().set(embedding=embeddings, ingest_data=ingest_data).build_vector_store()
+    InMemoryVectorStoreComponent().set(
+        embedding=embeddings, ingest_data=[*ingest_data, Data(text="third")]
+    ).build_vector_store()
+
+    assert embeddings.embedded == ["first", "second", "third"]
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import time
 from typing import Any
 from unittest.mock import MagicMock
@@ -252,3 +253,46 @@ async def test_component_streaming_message():
             tokens.append(event)
 
     assert len(tokens) > 0
+
+
+@pytest.mark.usefixtures("client")
+async def test_component_streaming_message_coalesced():
+    """Test that coalesced streaming sends the tokens of a message in frames."""
+    queue = asyncio.Queue()
+    event_manager = EventManager(queue, stream_mode="coalesced", token_frame_interval=10)
+    event_manager.register_event("on_token", "token")
+
+    vertex = MagicMock()
+    mock_graph = MagicMock()
+    mock_graph.flow_id = str(uuid4())
+    vertex.graph = mock_graph
+
+    component = ComponentForTesting(_vertex=vertex)
+    component.set_event_manager(event_manager)
+
+    class StreamChunk:
+        def __init__(self, content: str):
+            self.content = content
+
+    async def text_generator():
+        for chunk in ["Hello", " ", "World", "!"]:
+            yield StreamChunk(chunk)
+
+    message = Message(
+        sender="test_sender",
+        session_id="test_session",
+        sender_name="test_sender_name",
+        text=text_generator(),
+        properties=Properties(),
+    )
+
+    sent_message = await component.send_message(message)
+
+    assert sent_message.text == "Hello World!"
+    token_chunks = []
+    while not queue.empty():
+        _, event_data, _ = queue.get_nowait()
+        event = json.loads(event_data)
+        if event["event"] == "token":
+            token_chunks.append(event["data"]["chunk"])
+    assert token_chunks == ["Hello World!"]
@@ -0,0 +1,60 @@
+import pytest
+from langflow.custom.eval import ComponentClassCache, component_class_cache, eval_custom_component_code
+
+CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema import Data
+
+
+class CachedComponent(Component):
+    inputs = [MessageTextInput(name="value", display_name="Value")]
+    outputs = [Output(display_name="Output", name="output", method="build_output")]
+
+    def build_output(self) -> Data:
+        return Data(value=self.value)
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_class_cache():
+    component_class_cache.clear()
+    yield
+    component_class_cache.clear()
+
+
+def test_eval_custom_component_code_reuses_class():
+    first = eval_custom_component_code(CODE)
+    second = eval_custom_component_code(CODE)
+
+    assert first is second
+    assert first.__name__ == "CachedComponent"
+    assert component_class_cache.misses == 1
+    assert component_class_cache.hits == 1
+
+
+def test_eval_custom_component_code_different_code():
+    first = eval_custom_component_code(CODE)
+    second = eval_custom_component_code(CODE.replace("CachedComponent", "OtherComponent"))
+
+    assert first is not second
+    assert second.__name__ == "OtherComponent"
+    assert len(component_class_cache) == 2
+
+
+def test_eval_custom_component_code_does_not_cache_errors():
+    code = "class NotAComponent:\n    pass\n"
+    with pytest.raises(TypeError):
+        eval_custom_component_code(code)
+    assert len(component_class_cache) == 0
+
+
+def test_component_class_cache_is_bounded():
+    cache = ComponentClassCache(max_size=1)
+    cache.set("a", int)
+    cache.set("b", str)
+
+    assert len(cache) == 1
+    assert cache.get("a") is None
+    assert cache.get("b") is str
+    assert (cache.hits, cache.misses) == (1, 1)
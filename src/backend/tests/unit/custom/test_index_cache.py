@@ -0,0 +1,109 @@
+import asyncio
+import os
+import textwrap
+
+import pytest
+from langflow.custom.directory_reader import index_cache as index_cache_module
+from langflow.custom.directory_reader.index_cache import ComponentIndexCache, environment_fingerprint
+from langflow.custom.utils import abuild_custom_components
+
+COMPONENT_CODE = textwrap.dedent(
+    """
+    from langflow.custom import Component
+    from langflow.io import MessageTextInput, Output
+    from langflow.schema.message import Message
+
+
+    class {name}(Component):
+        display_name = "{name}"
+        inputs = [MessageTextInput(name="text", display_name="Text")]
+        outputs = [Output(display_name="Message", name="message", method="build_message")]
+
+        def build_message(self) -> Message:
+            return Message(text=self.text)
+    """
+)
+
+
+@pytest.fixture
+def components_path(tmp_path):
+    category = tmp_path / "components" / "custom_category"
+    category.mkdir(parents=True)
+    for name in ("First", "Second"):
+        (category / f"{name.lower()}.py").write_text(COMPONENT_CODE.format(name=name))
+    (category / "broken.py").write_text("def broken(:\n")
+    return tmp_path / "components"
+
+
+async def _build(components_path, index_path):
+    index_cache = ComponentIndexCache(index_path)
+    await asyncio.to_thread(index_cache.load)
+    types_dict = await abuild_custom_components([str(components_path)], index_cache=index_cache)
+    await asyncio.to_thread(index_cache.save)
+    return types_dict, index_cache
+
+
+async def test_index_cache_reuses_unchanged_components(components_path, tmp_path):
+    index_path = tmp_path / "component_index.json"
+    expected = await abuild_custom_components([str(components_path)])
+
+    cold, cold_cache = await _build(components_path, index_path)
+    assert cold == expected
+    assert cold_cache.misses == 3
+    assert await asyncio.to_thread(index_path.exists)
+
+    warm, warm_cache = await _build(components_path, index_path)
+    assert warm == expected
+    assert (warm_cache.hits, warm_cache.misses) == (3, 0)
+
+
+def _change_components(category):
+    second = category / "second.py"
+    second.write_text(COMPONENT_CODE.format(name="Second").replace('display_name = "Second"', 'display_name = "2nd"'))
+    # Touching a file without changing it does not rebuild it
+    first = category / "first.py"
+    os.utime(first, ns=(first.stat().st_atime_ns, first.stat().st_mtime_ns + 10**9))
+    (category / "broken.py").unlink()
+
+
+async def test_index_cache_rebuilds_changed_components(components_path, tmp_path):
+    index_path = tmp_path / "component_index.json"
+    await _build(components_path, index_path)
+
+    await asyncio.to_thread(_change_components, components_path / "custom_category")
+    types_dict, index_cache = await _build(components_path, index_path)
+
+    assert (index_cache.hits, index_cache.misses) == (1, 1)
+    assert types_dict["custom_category"]["Second"]["display_name"] == "2nd"
+    assert types_dict == await abuild_custom_components([str(components_path)])
+    assert len(index_cache) == 2
+
+
+async def test_index_cache_is_dropped_for_another_environment(components_path, tmp_path, monkeypatch):
+    index_path = tmp_path / "component_index.json"
+    await _build(components_path, index_path)
+
+    monkeypatch.setattr(
+        "langflow.custom.directory_reader.index_cache.environment_fingerprint", lambda: "another-version"
+    )
+    _, index_cache = await _build(components_path, index_path)
+    assert (index_cache.hits, index_cache.misses) == (0, 3)
+
+
+class FakeDistribution:
+    def __init__(self, name, version):
+        self.name = name
+        self.version = version
+
+
+def test_fingerprint_changes_when_a_distribution_is_installed_or_upgraded(monkeypatch):
+    distributions = [FakeDistribution("langchain-core", "0.3.0")]
+    monkeypatch.setattr(index_cache_module.metadata, "distributions", lambda: distributions)
+    fingerprint = environment_fingerprint()
+    assert environment_fingerprint() == fingerprint
+
+    distributions.append(FakeDistribution("langchain-astradb", "0.5.0"))
+    installed = environment_fingerprint()
+    distributions[0] = FakeDistribution("langchain-core", "0.3.1")
+
+    assert len({fingerprint, installed, environment_fingerprint()}) == 3
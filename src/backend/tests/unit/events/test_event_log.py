@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+import orjson
+from langflow.events.event_log import BuildEventLog, BuildEventLogRegistry
+from langflow.events.event_manager import create_default_event_manager
+
+
+async def collect(event_log: BuildEventLog, after: int = -1) -> list[dict]:
+    return [orjson.loads(payload) async for payload in event_log.subscribe(after=after)]
+
+
+async def test_event_log_numbers_events_and_replays_after_a_sequence():
+    event_log = BuildEventLog()
+    manager = create_default_event_manager(event_log)
+
+    manager.on_vertices_sorted(data={"ids": ["a"], "to_run": ["a"]})
+    manager.on_end_vertex(data={"build_data": orjson.Fragment(b'{"id":"a","valid":true}')})
+    manager.on_end(data={})
+    event_log.close()
+
+    events = await collect(event_log)
+    assert [(event["event"], event["seq"]) for event in events] == [
+        ("vertices_sorted", 0),
+        ("end_vertex", 1),
+        ("end", 2),
+    ]
+    assert events[1]["data"] == {"build_data": {"id": "a", "valid": True}}
+    assert [event["seq"] for event in await collect(event_log, after=1)] == [2]
+
+
+async def test_event_log_does_not_wait_for_subscribers():
+    event_log = BuildEventLog(max_size=3)
+    subscriber = asyncio.create_task(collect(event_log))
+    await asyncio.sleep(0)
+
+    for index in range(5):
+        event_log.put_nowait((f"event-{index}", orjson.dumps({"event": "token", "data": index}) + b"\n\n", time.time()))
+        await asyncio.sleep(0)
+    event_log.put_nowait((None, None, time.time()))
+
+    # The live subscriber keeps up, a late one only gets what is left in the ring
+    assert [event["data"] for event in await subscriber] == [0, 1, 2, 3, 4]
+    assert [event["seq"] for event in await collect(event_log)] == [2, 3, 4]
+    assert event_log.last_seq == 4
+
+
+def test_registry_evicts_finished_builds_first():
+    registry = BuildEventLogRegistry(max_logs=2)
+    running, finished = BuildEventLog(), BuildEventLog()
+    finished.close()
+
+    registry.add("running", running)
+    registry.add("finished", finished)
+    registry.add("new", BuildEventLog())
+
+    assert registry.get("running") is running
+    assert registry.get("finished") is None
+    assert len(registry) == 2
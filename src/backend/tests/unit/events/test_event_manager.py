@@ -210,3 +210,63 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+
+class TestTokenStreaming:
+    @staticmethod
+    def _drain(queue: asyncio.Queue) -> list[dict]:
+        events = []
+        while not queue.empty():
+            _, data, _ = queue.get_nowait()
+            events.append(json.loads(data))
+        return events
+
+    async def test_per_token_mode_sends_every_token(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+
+        for chunk in ["Hello", " ", "world"]:
+            manager.on_token(data={"chunk": chunk, "id": "message-1"})
+
+        events = self._drain(queue)
+        assert [event["data"]["chunk"] for event in events] == ["Hello", " ", "world"]
+        assert all(event["event"] == "token" for event in events)
+        assert all(event["data"]["id"] == "message-1" for event in events)
+        assert all("timestamp" in event["data"] for event in events)
+
+    async def test_coalesced_delivery_flushes_on_interval(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue, stream_mode="coalesced", token_frame_interval=0.01)
+        manager.register_event("on_token", "token")
+
+        for chunk in ["Hello", " ", "world"]:
+            manager.on_token(data={"chunk": chunk, "id": "message-1"})
+        assert queue.empty()
+
+        await asyncio.sleep(0.05)
+        events = self._drain(queue)
+        assert [event["data"]["chunk"] for event in events] == ["Hello world"]
+
+    async def test_coalesced_delivery_flushes_on_size(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue, stream_mode="coalesced", token_frame_interval=10, token_frame_size=4)
+        manager.register_event("on_token", "token")
+
+        for chunk in ["ab", "cd", "ef"]:
+            manager.on_token(data={"chunk": chunk, "id": "message-1"})
+
+        assert [event["data"]["chunk"] for event in self._drain(queue)] == ["abcd"]
+        manager.flush_tokens()
+        assert [event["data"]["chunk"] for event in self._drain(queue)] == ["ef"]
+
+    async def test_coalesced_tokens_are_sent_before_other_events(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue, stream_mode="coalesced", token_frame_interval=10)
+        manager.register_event("on_token", "token")
+        manager.register_event("on_end", "end")
+
+        manager.on_token(data={"chunk": "Hello", "id": "message-1"})
+        manager.on_end(data={})
+
+        assert [event["event"] for event in self._drain(queue)] == ["token", "end"]
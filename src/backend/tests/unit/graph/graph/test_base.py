@@ -136,3 +136,27 @@ def test_graph_set_with_valid_component():
     tool = YfinanceToolComponent()
     tool_calling_agent = ToolCallingAgentComponent()
     tool_calling_agent.set(tools=[tool])
+
+
+async def test_graph_fork_runs_independently():
+    chat_input = ChatInput(_id="ChatInput-abc12")
+    chat_input.set(should_store_message=False)
+    text_output = TextOutputComponent(_id="TextOutput-xyz12")
+    text_output.set(input_value=chat_input.message_response)
+    payload = Graph(chat_input, text_output).dump()["data"]
+    template = Graph.from_payload(payload, flow_id="flow-id")
+
+    first = template.fork()
+    second = template.fork()
+    assert first.vertex_map.keys() == template.vertex_map.keys()
+    assert all(vertex.graph is first for vertex in first.vertices)
+    assert first.get_vertex("TextOutput-xyz12").custom_component is not (
+        template.get_vertex("TextOutput-xyz12").custom_component
+    )
+
+    first_outputs = await first.arun([{"input_value": "hello"}], outputs=["TextOutput-xyz12"])
+    second_outputs = await second.arun([{"input_value": "bye"}], outputs=["TextOutput-xyz12"])
+
+    assert first_outputs[0].outputs[0].results["text"].text == "hello"
+    assert second_outputs[0].outputs[0].results["text"].text == "bye"
+    assert not any(vertex.built for vertex in template.vertices)
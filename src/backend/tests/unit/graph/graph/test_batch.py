@@ -0,0 +1,99 @@
+import asyncio
+from collections import Counter
+
+import pytest
+from langflow.components.inputs import ChatInput, TextInputComponent
+from langflow.components.outputs import ChatOutput, TextOutputComponent
+from langflow.components.processing import CombineTextComponent
+from langflow.graph import Graph
+from langflow.graph.vertex.base import Vertex
+from langflow.memory import aget_messages
+
+
+def build_graph() -> Graph:
+    chat_input = ChatInput(_id="ChatInput-batch")
+    chat_input.set(should_store_message=False)
+    text_input = TextInputComponent(_id="TextInput-shared")
+    text_input.set(input_value="re:")
+    combine = CombineTextComponent(_id="CombineText-batch")
+    combine.set(text1=text_input.text_response, text2=chat_input.message_response, delimiter=" ")
+    text_output = TextOutputComponent(_id="TextOutput-batch")
+    text_output.set(input_value=combine.combine_texts)
+    graph = Graph(chat_input, text_output)
+    graph.prepare()
+    return graph
+
+
+@pytest.fixture
+def vertex_builds(monkeypatch):
+    """Counts the builds of each vertex and tracks how many combine steps run at the same time."""
+    builds: Counter[str] = Counter()
+    running = {"now": 0, "max": 0}
+    build = Vertex.build
+
+    async def counting_build(self, *args, **kwargs):
+        builds[self.id] += 1
+        if self.id != "CombineText-batch":
+            return await build(self, *args, **kwargs)
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+        # Longer inputs finish first, so runs complete out of order
+        await asyncio.sleep(0.05 / len(self.graph.get_vertex("ChatInput-batch").raw_params["input_value"]))
+        running["now"] -= 1
+        return await build(self, *args, **kwargs)
+
+    monkeypatch.setattr(Vertex, "build", counting_build)
+    return builds, running
+
+
+async def test_arun_batch_returns_results_in_input_order(vertex_builds):
+    _, running = vertex_builds
+    graph = build_graph()
+    inputs = [{"input_value": "a" * size} for size in range(1, 7)]
+
+    results = await graph.arun_batch(inputs, outputs=["TextOutput-batch"], max_concurrency=3)
+
+    assert [result.inputs for result in results] == inputs
+    assert [result.outputs[0].results["text"].text for result in results] == [
+        "re: " + "a" * size for size in range(1, 7)
+    ]
+    assert running["max"] == 3
+    assert not any(vertex.built for vertex in graph.vertices)
+
+
+async def test_arun_batch_builds_shared_vertices_once(vertex_builds):
+    builds, _ = vertex_builds
+    graph = build_graph()
+
+    assert graph._get_batch_shared_vertex_ids([{"input_value": "a"}], [[]], ["chat"]) == {"TextInput-shared"}
+    # The text input is not shared when it receives the inputs
+    assert graph._get_batch_shared_vertex_ids([{"input_value": "a"}], [[]], ["any"]) == set()
+
+    results = await graph.arun_batch([{"input_value": text} for text in ("a", "b", "c")], outputs=["TextOutput-batch"])
+
+    assert [result.outputs[0].results["text"].text for result in results] == ["re: a", "re: b", "re: c"]
+    assert builds["TextInput-shared"] == 1
+    assert builds["CombineText-batch"] == 3
+
+
+@pytest.mark.usefixtures("client")
+async def test_arun_batch_runs_each_input_in_its_own_session():
+    chat_input = ChatInput(_id="ChatInput-session")
+    chat_output = ChatOutput(_id="ChatOutput-session")
+    chat_output.set(input_value=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    graph.prepare()
+
+    results = await graph.arun_batch(
+        [{"input_value": "first"}, {"input_value": "second"}], outputs=["ChatOutput-session"], session_id="batch"
+    )
+
+    assert [result.outputs[0].results["message"].session_id for result in results] == ["batch-0", "batch-1"]
+    for session_id, text in (("batch-0", "first"), ("batch-1", "second")):
+        history = await aget_messages(session_id=session_id)
+        assert history
+        assert {message.text for message in history} == {text}
+    assert await aget_messages(session_id="batch") == []
+
+    with pytest.raises(ValueError, match="one per input"):
+        await graph.arun_batch([{"input_value": "first"}], session_ids=["a", "b"])
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.io import FloatInput, MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class DelayedEcho(Component):
+    display_name = "Delayed Echo"
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text"),
+        FloatInput(name="delay", display_name="Delay", value=0.0),
+    ]
+    outputs = [
+        Output(display_name="Message", name="echo", method="echo"),
+    ]
+
+    async def echo(self) -> Message:
+        await asyncio.sleep(self.delay)
+        self.graph.context.setdefault("finished", []).append(self._id)
+        return Message(text=self.text)
+
+
+def build_graph() -> Graph:
+    """Builds a graph with a slow branch and an independent two step fast branch."""
+    chat_input = ChatInput(_id="chat_input")
+    slow = DelayedEcho(_id="slow")
+    slow.set(delay=0.3)
+    fast = DelayedEcho(_id="fast")
+    fast_successor = DelayedEcho(_id="fast_successor")
+    graph = Graph()
+    for component in (chat_input, slow, fast, fast_successor):
+        graph.add_component(component)
+    graph.add_component_edge("chat_input", ("message", "text"), "slow")
+    graph.add_component_edge("chat_input", ("message", "text"), "fast")
+    graph.add_component_edge("fast", ("echo", "text"), "fast_successor")
+    graph.prepare()
+    return graph
+
+
+@pytest.mark.parametrize(
+    ("scheduler", "expected_order"),
+    [
+        ("dataflow", ["fast", "fast_successor", "slow"]),
+        ("layered", ["fast", "slow", "fast_successor"]),
+    ],
+)
+async def test_process_scheduler_order(scheduler, expected_order):
+    graph = build_graph()
+
+    await graph.process(fallback_to_env_vars=False, scheduler=scheduler)
+
+    assert graph.context["finished"] == expected_order
+    assert all(vertex.built for vertex in graph.vertices)
+
+
+async def test_process_dataflow_builds_each_vertex_once():
+    graph = build_graph()
+
+    await graph.process(fallback_to_env_vars=False, scheduler="dataflow")
+
+    assert sorted(graph.context["finished"]) == ["fast", "fast_successor", "slow"]
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+from langflow.components.processing.filter_data import FilterDataComponent
+from langflow.components.processing.merge_data import MergeDataComponent
+from langflow.components.processing.parse_data import ParseDataComponent
+from langflow.helpers.data import data_to_text_list
+from langflow.schema import Data, DataBatch, DataFrame
+from langflow.serialization import serialize
+
+
+@pytest.fixture
+def sample_data_objects() -> list[Data]:
+    """Fixture providing Data objects that do not all have the same keys."""
+    return [
+        Data(data={"text": "John", "age": 30, "city": "New York"}),
+        Data(data={"text": "Jane", "age": 25}),
+        Data(data={"text": "Bob", "age": 35, "city": "Chicago"}),
+    ]
+
+
+@pytest.fixture
+def sample_batch(sample_data_objects) -> DataBatch:
+    return DataBatch.from_data(sample_data_objects)
+
+
+def test_from_data_keeps_records(sample_batch, sample_data_objects):
+    assert len(sample_batch) == 3
+    assert sample_batch.columns == ["text", "age", "city"]
+    assert sample_batch[1] == sample_data_objects[1]
+    assert sample_batch[-1].city == "Chicago"
+    assert list(sample_batch) == sample_data_objects
+    assert sample_batch.to_data_list() == sample_data_objects
+    assert sample_batch.values("city").tolist() == ["New York", "Chicago"]
+
+
+def test_rows_hold_python_values():
+    batch = DataBatch({"score": np.array([0.5, 0.7]), "count": np.array([1, 2])})
+
+    assert batch[0].data == {"score": 0.5, "count": 1}
+    assert type(batch[0].count) is int
+    assert type(batch.to_records()[1]["score"]) is float
+
+
+def test_columns_must_have_the_same_length():
+    with pytest.raises(ValueError, match="Column 'b' has 1 values, expected 2"):
+        DataBatch({"a": [1, 2], "b": [1]})
+
+
+def test_dataframe_conversion_shares_columns():
+    scores = np.arange(5.0)
+    batch = DataBatch({"score": scores, "text": [f"row {i}" for i in range(5)]})
+
+    dataframe = batch.to_dataframe()
+
+    assert isinstance(dataframe, DataFrame)
+    assert np.shares_memory(dataframe["score"].to_numpy(), scores)
+    assert np.shares_memory(dataframe.to_data_batch().column("score"), scores)
+    assert dataframe.to_data_list() == batch.to_data_list()
+
+
+def test_format_matches_data_to_text_list(sample_batch, sample_data_objects):
+    for template in ["{text} is {age}", "Name: {text}", "{data}", "{text} lives in {city}"]:
+        if template == "{text} lives in {city}":
+            # Jane has no city
+            with pytest.raises(KeyError):
+                sample_batch.format(template)
+            continue
+        assert sample_batch.format(template) == data_to_text_list(template, sample_data_objects)[0]
+
+
+def test_concat_and_select(sample_batch):
+    other = DataBatch({"text": ["Alice"], "country": ["France"]})
+
+    combined = DataBatch.concat([sample_batch, other])
+
+    assert len(combined) == 4
+    assert combined[3].data == {"text": "Alice", "country": "France"}
+    assert "country" not in combined[0]
+    assert combined.select(["text", "country"]).to_records() == [
+        {"text": "John"},
+        {"text": "Jane"},
+        {"text": "Bob"},
+        {"text": "Alice", "country": "France"},
+    ]
+
+
+def test_serialize_batch(sample_batch):
+    assert serialize(sample_batch) == [
+        {"text": "John", "age": 30, "city": "New York"},
+        {"text": "Jane", "age": 25, "city": None},
+        {"text": "Bob", "age": 35, "city": "Chicago"},
+    ]
+
+
+def test_parse_data_formats_batches(sample_batch, sample_data_objects):
+    component = ParseDataComponent()
+    component.set_attributes({"data": [sample_batch], "template": "{text}: {age}", "sep": "\n"})
+
+    assert component.parse_data().text == "John: 30\nJane: 25\nBob: 35"
+    assert [data.text for data in component.parse_data_as_list()] == ["John: 30", "Jane: 25", "Bob: 35"]
+
+    component.set_attributes({"data": sample_data_objects, "template": "{text}: {age}", "sep": "\n"})
+    assert component.parse_data().text == "John: 30\nJane: 25\nBob: 35"
+
+
+def test_parse_data_formats_data_connected_with_batches(sample_batch):
+    component = ParseDataComponent()
+    component.set_attributes(
+        {"data": [Data(data={"text": "Ann", "age": 40}), sample_batch], "template": "{text}: {age}", "sep": "\n"}
+    )
+
+    assert component.parse_data().text == "Ann: 40\nJohn: 30\nJane: 25\nBob: 35"
+    assert [data.text for data in component.parse_data_as_list()] == ["Ann: 40", "John: 30", "Jane: 25", "Bob: 35"]
+
+
+def test_filter_data_selects_batch_columns(sample_batch):
+    component = FilterDataComponent()
+    component.set_attributes({"data": sample_batch, "filter_criteria": ["text", "city"]})
+
+    filtered = component.filter_data()
+
+    assert isinstance(filtered, DataBatch)
+    assert filtered.columns == ["text", "city"]
+    assert filtered.column("text") is sample_batch.column("text")
+
+
+@pytest.mark.parametrize("operation", ["Append", "Concatenate", "Merge", "Join"])
+def test_merge_data_combines_batches_as_records(operation, sample_batch, sample_data_objects):
+    component = MergeDataComponent()
+    component.set_attributes({"data_inputs": sample_data_objects, "operation": operation})
+    expected = component.combine_data()
+
+    component.set_attributes({"data_inputs": [sample_batch], "operation": operation})
+    combined = component.combine_data()
+
+    assert combined.fillna(0).to_dict(orient="records") == expected.fillna(0).to_dict(orient="records")
@@ -3,13 +3,15 @@ from datetime import datetime, timezone
 from typing import Any
 
 import numpy as np
+import orjson
 import pandas as pd
 from hypothesis import given, settings
 from hypothesis import strategies as st
 from langchain_core.documents import Document
 from langflow.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
-from langflow.serialization.serialization import serialize, serialize_or_str
+from langflow.serialization.serialization import _get_encoder, serialize, serialize_json, serialize_or_str
 from pydantic import BaseModel as PydanticBaseModel
+from pydantic import computed_field, field_serializer
 from pydantic.v1 import BaseModel as PydanticV1BaseModel
 
 # Comprehensive hypothesis strategies
@@ -342,3 +344,68 @@ class TestSerializationHypothesis:
         assert isinstance(result, dict)
         assert len(result) == MAX_ITEMS_LENGTH
         assert all(isinstance(v, int) for v in result.values())
+
+    def test_encoder_is_cached_per_type(self) -> None:
+        """Test that the serializer of a type is found once and classes are still dispatched."""
+        _get_encoder.cache_clear()
+        serialize({"a": 1})
+        serialize({"b": 2})
+        assert _get_encoder.cache_info().hits >= 1
+        assert _get_encoder(type) is None
+        assert serialize(dict) == str(dict)
+
+    def test_pydantic_fields_single_pass(self) -> None:
+        """Test that models read field by field serialize as model_dump does."""
+
+        class Inner(PydanticBaseModel):
+            value: int
+
+        class Model(PydanticBaseModel):
+            name: str
+            inner: Inner
+            created_at: datetime
+
+            @computed_field
+            @property
+            def upper(self) -> str:
+                return self.name.upper()
+
+            @field_serializer("created_at")
+            def serialize_created_at(self, value: datetime) -> str:
+                return value.strftime("%Y")
+
+        model = Model(name="a" * 10, inner=Inner(value=1), created_at=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        result = serialize(model, max_length=5)
+        assert result == {"name": "aaaaa...", "inner": {"value": 1}, "created_at": "2024", "upper": "AAAAA..."}
+
+    def test_pydantic_fields_holding_subclasses_match_model_dump(self) -> None:
+        """Test that values of a declared model class keep only the fields model_dump keeps."""
+
+        class Base(PydanticBaseModel):
+            a: int = 1
+
+        class Sub(Base):
+            extra_field: str = "s"
+
+        class Holder(PydanticBaseModel):
+            child: Base
+            maybe: Base | None = None
+            children: list[Base] = []
+            anything: Any = None
+
+        holder = Holder(child=Sub(), maybe=Sub(), children=[Sub()], anything=Sub())
+        assert serialize(holder) == holder.model_dump()
+        assert serialize(holder)["child"] == {"a": 1}
+        assert serialize(holder)["anything"] == {"a": 1, "extra_field": "s"}
+
+    def test_serialize_json(self) -> None:
+        """Test that serialize_json returns the JSON of the serialized object as bytes."""
+        obj = {"text": "a" * 40, "items": list(range(5)), "number": np.int64(3), 1: None}
+        result = serialize_json(obj, max_length=30, max_items=3)
+        assert isinstance(result, bytes)
+        assert orjson.loads(result) == {
+            "text": "a" * 30 + "...",
+            "items": [0, 1, 2, "... [truncated 2 items]"],
+            "number": 3,
+            "1": None,
+        }
@@ -0,0 +1,53 @@
+from fastapi import status
+from httpx import AsyncClient
+from langflow.services.database.models.api_key.model import ApiKey
+from langflow.services.database.models.user.crud import update_user
+from langflow.services.database.models.user.model import User, UserUpdate
+from langflow.services.database.utils import session_getter
+from langflow.services.deps import get_auth_service, get_db_service
+
+
+async def test_api_key_uses_are_cached_and_counted_in_batches(client: AsyncClient, created_api_key, monkeypatch):
+    headers = {"x-api-key": created_api_key.api_key}
+    auth_service = get_auth_service()
+    monkeypatch.setattr(auth_service, "usage_flush_interval", 3600)
+
+    for _ in range(3):
+        response = await client.get("api/v1/jobs/unknown", headers=headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert auth_service.get_api_key_user(created_api_key.api_key) is not None
+
+    await auth_service.flush_api_key_uses()
+    async with session_getter(get_db_service()) as session:
+        api_key = await session.get(ApiKey, created_api_key.id)
+        assert api_key.total_uses == 3
+        assert api_key.last_used_at is not None
+
+
+async def test_deleted_api_key_is_rejected(client: AsyncClient, active_user, logged_in_headers):
+    response = await client.post("api/v1/api_key/", json={"name": "cached key"}, headers=logged_in_headers)
+    api_key = response.json()
+    headers = {"x-api-key": api_key["api_key"]}
+    assert (await client.get("api/v1/jobs/unknown", headers=headers)).status_code == status.HTTP_404_NOT_FOUND
+
+    response = await client.delete(f"api/v1/api_key/{api_key['id']}", headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK
+
+    assert (await client.get("api/v1/jobs/unknown", headers=headers)).status_code == status.HTTP_403_FORBIDDEN
+    assert get_auth_service().get_user_fields(active_user.id) is not None
+
+
+async def test_deactivated_user_token_is_rejected(client: AsyncClient, active_user, logged_in_headers):
+    assert (await client.get("api/v1/users/whoami", headers=logged_in_headers)).status_code == status.HTTP_200_OK
+    assert get_auth_service().get_user_fields(active_user.id) is not None
+    # Served from the cache
+    response = await client.get("api/v1/users/whoami", headers=logged_in_headers)
+    assert response.json()["id"] == str(active_user.id)
+
+    async with session_getter(get_db_service()) as session:
+        user = await session.get(User, active_user.id)
+        await update_user(user, UserUpdate(is_active=False), session)
+
+    assert get_auth_service().get_user_fields(active_user.id) is None
+    response = await client.get("api/v1/users/whoami", headers=logged_in_headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
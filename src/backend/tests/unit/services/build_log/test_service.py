@@ -0,0 +1,121 @@
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from langflow.services.build_log.service import BuildLogService
+from langflow.services.database.models.transactions.model import TransactionBase, TransactionTable
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from langflow.services.deps import get_settings_service
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def settings_service(monkeypatch):
+    settings_service = get_settings_service()
+    settings = settings_service.settings
+    monkeypatch.setattr(settings, "build_log_flush_interval", 10)
+    monkeypatch.setattr(settings, "build_log_batch_size", 3)
+    monkeypatch.setattr(settings, "build_log_queue_size", 10)
+    monkeypatch.setattr(settings, "build_log_retention_interval", 3600)
+    monkeypatch.setattr(settings, "max_vertex_builds_per_vertex", 2)
+    monkeypatch.setattr(settings, "max_transactions_to_keep", 2)
+    return settings_service
+
+
+@pytest.fixture
+async def build_log_service(engine, settings_service):
+    service = BuildLogService(settings_service, MagicMock(engine=engine))
+    yield service
+    await service.teardown()
+
+
+async def count_rows(engine, table) -> int:
+    async with AsyncSession(engine) as session:
+        return await session.scalar(select(func.count()).select_from(table))
+
+
+def vertex_build(flow_id, vertex_id="vertex") -> VertexBuildBase:
+    return VertexBuildBase(id=vertex_id, flow_id=flow_id, valid=True, artifacts={})
+
+
+def transaction(flow_id) -> TransactionBase:
+    return TransactionBase(vertex_id="vertex", status="success", flow_id=flow_id)
+
+
+async def test_rows_are_buffered_until_flush(build_log_service, engine):
+    flow_id = uuid4()
+    await build_log_service.put(vertex_build(flow_id))
+    await build_log_service.put(transaction(flow_id))
+    await asyncio.sleep(0.01)
+
+    assert await count_rows(engine, VertexBuildTable) == 0
+    assert await count_rows(engine, TransactionTable) == 0
+
+    await build_log_service.flush()
+
+    assert await count_rows(engine, VertexBuildTable) == 1
+    assert await count_rows(engine, TransactionTable) == 1
+
+
+async def test_full_batch_is_written_without_waiting(build_log_service, engine):
+    flow_id = uuid4()
+    for i in range(3):
+        await build_log_service.put(vertex_build(flow_id, vertex_id=f"vertex-{i}"))
+
+    for _ in range(50):
+        if await count_rows(engine, VertexBuildTable) == 3:
+            break
+        await asyncio.sleep(0.01)
+    assert await count_rows(engine, VertexBuildTable) == 3
+
+
+async def test_trim_enforces_limits(build_log_service, engine, settings_service):
+    settings = settings_service.settings
+    flow_id = uuid4()
+    for _ in range(5):
+        await build_log_service.put(vertex_build(flow_id))
+        await build_log_service.put(transaction(flow_id))
+    await build_log_service.flush()
+    assert await count_rows(engine, VertexBuildTable) == 5
+
+    await build_log_service.trim()
+
+    assert await count_rows(engine, VertexBuildTable) == settings.max_vertex_builds_per_vertex
+    assert await count_rows(engine, TransactionTable) == settings.max_transactions_to_keep
+
+
+async def test_flush_writes_the_row_taken_by_the_writer(build_log_service, engine):
+    flow_id = uuid4()
+    build_log_service.start()
+    # A flush holds the lock when the writer takes the row, then the writer is stopped
+    async with build_log_service._write_lock:
+        await build_log_service.put(vertex_build(flow_id))
+        await asyncio.sleep(0)
+        assert build_log_service._queue.empty()
+        build_log_service._worker_task.cancel()
+
+    await build_log_service.flush()
+
+    assert await count_rows(engine, VertexBuildTable) == 1
+
+
+async def test_teardown_writes_pending_rows(build_log_service, engine):
+    await build_log_service.put(vertex_build(uuid4()))
+
+    await build_log_service.teardown()
+
+    assert await count_rows(engine, VertexBuildTable) == 1
@@ -0,0 +1,218 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.graph import Graph
+from langflow.graph.graph import snapshot
+from langflow.services.cache.tiered import VERTEX_STATES_SUFFIX, TieredRedisCache
+from langflow.services.cache.utils import CACHE_MISS
+
+
+class FakeRedisServer:
+    """The subset of Redis used by TieredRedisCache, shared by every client of the server."""
+
+    def __init__(self):
+        self.data: dict[str, object] = {}
+        self.subscribers: dict[str, list[asyncio.Queue]] = {}
+        self.commands: list[tuple] = []
+
+
+class FakePubSub:
+    def __init__(self, server: FakeRedisServer):
+        self.server = server
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.server.subscribers.setdefault(channel, []).append(self.queue)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def reset(self):
+        for queues in self.server.subscribers.values():
+            if self.queue in queues:
+                queues.remove(self.queue)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    def __getattr__(self, name):
+        def buffered(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return buffered
+
+    async def execute(self):
+        return [await getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class FakeRedis:
+    def __init__(self, server: FakeRedisServer):
+        self.server = server
+
+    async def get(self, key):
+        self.server.commands.append(("get", key))
+        return self.server.data.get(key)
+
+    async def set(self, key, value, ex=None):  # noqa: ARG002
+        self.server.commands.append(("set", key))
+        self.server.data[key] = value
+        return True
+
+    async def setex(self, key, ttl, value):
+        return await self.set(key, value, ex=ttl)
+
+    async def expire(self, key, ttl):  # noqa: ARG002
+        return key in self.server.data
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.server.data.pop(key, None)
+
+    async def exists(self, key):
+        return int(key in self.server.data)
+
+    async def hset(self, key, mapping):
+        self.server.commands.append(("hset", key, sorted(mapping)))
+        self.server.data.setdefault(key, {}).update({k.encode(): v for k, v in mapping.items()})
+
+    async def hgetall(self, key):
+        return dict(self.server.data.get(key, {}))
+
+    async def flushdb(self):
+        self.server.data.clear()
+
+    async def publish(self, channel, message):
+        for queue in self.server.subscribers.get(channel, []):
+            queue.put_nowait({"type": "message", "data": message})
+
+    def pubsub(self):
+        return FakePubSub(self.server)
+
+    def pipeline(self, *, transaction=True):  # noqa: ARG002
+        return FakePipeline(self)
+
+
+@pytest.fixture
+async def caches():
+    server = FakeRedisServer()
+    first = TieredRedisCache(FakeRedis(server), max_size=10)
+    second = TieredRedisCache(FakeRedis(server), max_size=10)
+    yield server, first, second
+    await first.teardown()
+    await second.teardown()
+
+
+async def _settle():
+    # Let the invalidation listeners subscribe and process published messages
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(input_value=chat_input.message_response)
+    graph = Graph(chat_input, chat_output, flow_id="flow")
+    graph.prepare()
+    return graph
+
+
+def _mark_built(graph: Graph, vertex_id: str, result: str) -> None:
+    vertex = graph.get_vertex(vertex_id)
+    vertex.built = True
+    vertex.built_object = result
+    vertex.results = {"message": result}
+    graph.mark_vertex_changed(vertex_id)
+
+
+async def test_local_hits_do_not_read_redis(caches):
+    server, first, _ = caches
+    value = {"a": [1, 2]}
+    await first.set("key", value)
+    server.commands.clear()
+
+    assert await first.get("key") is value
+    assert server.commands == []
+
+
+async def test_set_invalidates_other_workers(caches):
+    _, first, second = caches
+    await first.get("key")
+    await second.get("key")
+    await _settle()
+
+    await first.set("key", "first")
+    assert await second.get("key") == "first"
+
+    await first.set("key", "second")
+    await _settle()
+    assert await second.get("key") == "second"
+
+    await second.delete("key")
+    await _settle()
+    assert await first.get("key") is CACHE_MISS
+
+
+async def test_graph_snapshot_restores_run_state(caches):
+    server, first, second = caches
+    await first.get("flow")
+    await second.get("flow")
+    await _settle()
+
+    graph = _graph()
+    _mark_built(graph, "chat_input", "hello")
+    await first.upsert("flow", {"result": graph, "type": Graph})
+
+    restored = (await second.get("flow"))["result"]
+    assert restored is not graph
+    assert restored.get_vertex("chat_input").built
+    assert restored.get_vertex("chat_input").results == {"message": "hello"}
+    assert not restored.get_vertex("chat_output").built
+    assert restored.vertices_layers == graph.vertices_layers
+    assert restored.run_manager.run_predecessors == graph.run_manager.run_predecessors
+
+    # Only the vertex that changed since the last snapshot is written again
+    server.commands.clear()
+    _mark_built(restored, "chat_output", "hello")
+    await second.set("flow", {"result": restored, "type": Graph})
+    assert ("hset", "flow" + VERTEX_STATES_SUFFIX, ["chat_output"]) in server.commands
+
+    await _settle()
+    updated = (await first.get("flow"))["result"]
+    assert updated is not graph
+    assert updated.get_vertex("chat_output").built_object == "hello"
+
+
+async def test_graph_set_only_dumps_changed_vertices(caches):
+    server, first, _ = caches
+    graph = _graph()
+    _mark_built(graph, "chat_input", "hello")
+    await first.set("flow", {"result": graph, "type": Graph})
+
+    server.commands.clear()
+    with (
+        patch.object(snapshot, "dump_vertex_state", wraps=snapshot.dump_vertex_state) as dump_vertex_state,
+        patch.object(Graph, "dump", autospec=True, side_effect=Graph.dump) as dump,
+    ):
+        await first.set("flow", {"result": graph, "type": Graph})
+        assert dump_vertex_state.call_count == 0
+
+        _mark_built(graph, "chat_output", "hello")
+        await first.set("flow", {"result": graph, "type": Graph})
+        assert [call.args[0].id for call in dump_vertex_state.call_args_list] == ["chat_output"]
+    assert dump.call_count == 0
+    assert ("hset", "flow" + VERTEX_STATES_SUFFIX, ["chat_output"]) in server.commands
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import httpx
+from langflow.services.deps import get_settings_service
+from langflow.services.http_client.service import HTTPClientService
+
+
+def set_cookie(request):
+    return httpx.Response(200, headers={"Set-Cookie": "session=secret"}, json={"cookie": request.headers.get("cookie")})
+
+
+async def test_clients_are_shared_by_key():
+    service = HTTPClientService(get_settings_service())
+
+    client = service.get_async_client("openai", base_url="https://api.openai.com/v1", credential="key", timeout=10)
+
+    assert client is service.get_async_client(
+        "openai", base_url="https://api.openai.com/v1", credential="key", timeout=10
+    )
+    assert client is not service.get_async_client(
+        "openai", base_url="https://api.openai.com/v1", credential="other key", timeout=10
+    )
+    assert client is not service.get_async_client("openai", base_url="https://example.com", credential="key")
+    assert client is not service.get_client(
+        "openai", base_url="https://api.openai.com/v1", credential="key", timeout=10
+    )
+    assert len(service) == 4
+    await service.teardown()
+    assert client.is_closed
+    assert len(service) == 0
+
+
+async def test_clients_do_not_keep_cookies():
+    service = HTTPClientService(get_settings_service())
+    client = service.get_async_client(transport=httpx.MockTransport(set_cookie))
+
+    await client.get("https://example.com/login")
+    response = await client.get("https://example.com/me")
+
+    assert response.json() == {"cookie": None}
+    assert not client.cookies
+    await service.teardown()
+
+
+async def test_least_recently_used_client_is_released(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "http_client_max_clients", 2)
+    service = HTTPClientService(get_settings_service())
+    transport = httpx.MockTransport(lambda _: httpx.Response(200))
+    first = service.get_async_client(base_url="https://first.example.com", transport=transport)
+    second = service.get_async_client(base_url="https://second.example.com", transport=transport)
+    assert service.get_async_client(base_url="https://first.example.com", transport=transport) is first
+
+    service.get_async_client(base_url="https://third.example.com", transport=transport)
+
+    assert len(service) == 2
+    # A model built with the released client keeps using it
+    assert not second.is_closed
+    assert (await second.get("https://second.example.com/")).status_code == 200
+    assert service.get_async_client(base_url="https://second.example.com", transport=transport) is not second
+    await service.teardown()
+    assert second.is_closed
+    assert first.is_closed
+
+
+async def test_idle_clients_are_released(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "http_client_idle_timeout", 60)
+    service = HTTPClientService(get_settings_service())
+    transport = httpx.MockTransport(lambda _: httpx.Response(200))
+    idle = service.get_client(base_url="https://idle.example.com")
+    used = service.get_async_client(base_url="https://used.example.com", transport=transport)
+    for pooled in service._clients.values():
+        pooled.last_used_at = time.monotonic() - 120
+    # Sending a request keeps a client alive
+    await used.get("https://used.example.com/")
+
+    service.get_client(base_url="https://other.example.com")
+
+    assert idle is not service.get_client(base_url="https://idle.example.com")
+    assert not idle.is_closed
+    assert used is service.get_async_client(base_url="https://used.example.com", transport=transport)
+    await service.teardown()
+    assert idle.is_closed
+
+
+def test_async_client_built_outside_of_a_loop_is_used_by_each_loop():
+    service = HTTPClientService(get_settings_service())
+    # Built without a running loop, as components running in threads do
+    client = service.get_async_client(base_url="https://example.com")
+    transport = client._transport
+    sent = []
+
+    async def handle(_):
+        sent.append(asyncio.get_running_loop())
+        return httpx.Response(200)
+
+    async def send():
+        with patch.object(httpx.AsyncHTTPTransport, "handle_async_request", side_effect=handle):
+            await client.get("https://example.com/")
+        return asyncio.get_running_loop()
+
+    first_loop = asyncio.run(send())
+    second_loop = asyncio.run(send())
+
+    assert sent == [first_loop, second_loop]
+    assert len(transport._transports) == 1
+    assert not client.is_closed
+    asyncio.run(service.teardown())
+    assert client.is_closed
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+from langflow.events.event_log import BuildEventLog
+from langflow.services.deps import get_settings_service
+from langflow.services.job.service import JobService
+
+
+@pytest.fixture
+def job_service(monkeypatch):
+    settings_service = get_settings_service()
+    monkeypatch.setattr(settings_service.settings, "max_concurrent_jobs", 2)
+    return JobService(settings_service)
+
+
+async def test_jobs_run_with_a_concurrency_limit(job_service):
+    running = {"now": 0, "max": 0}
+    release = asyncio.Event()
+
+    async def run(value):
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+        await release.wait()
+        running["now"] -= 1
+        return value
+
+    jobs = [job_service.submit(lambda value=value: run(value), flow_id="flow") for value in range(4)]
+    await asyncio.sleep(0.01)
+    assert [job.status for job in jobs] == ["running", "running", "queued", "queued"]
+
+    release.set()
+    await asyncio.gather(*(job.task for job in jobs))
+
+    assert running["max"] == 2
+    assert [job.result for job in jobs] == [0, 1, 2, 3]
+    assert all(job.status == "completed" and job.event_log.closed for job in jobs)
+
+
+async def test_failed_and_cancelled_jobs(job_service):
+    async def fail():
+        msg = "boom"
+        raise ValueError(msg)
+
+    failed = job_service.submit(fail, flow_id="flow")
+    cancelled = job_service.submit(lambda: asyncio.sleep(10), flow_id="flow", event_log=BuildEventLog())
+    await asyncio.sleep(0)
+    await job_service.cancel(cancelled)
+    await failed.task
+
+    assert (failed.status, failed.error) == ("failed", "boom")
+    assert cancelled.status == "cancelled"
+    assert cancelled.event_log.closed
+
+
+async def test_jobs_are_private_and_expire(job_service):
+    job = job_service.submit(lambda: asyncio.sleep(0), flow_id="flow", user_id="owner")
+    await job.task
+
+    assert job_service.get(job.id, user_id="owner") is job
+    assert job_service.get(job.id, user_id="someone else") is None
+
+    job.finished_at -= job_service.retention_time + 1
+    assert job_service.get(job.id, user_id="owner") is None
+    assert len(job_service) == 0
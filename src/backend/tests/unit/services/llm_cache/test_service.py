@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel, GenericFakeChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, SystemMessage
+from langflow.base.models import model as model_module
+from langflow.components.models.openai import OpenAIModelComponent
+from langflow.services.deps import get_settings_service
+from langflow.services.llm_cache.service import CachedResponse, LLMCacheService, llm_cache_key
+
+
+@pytest.fixture
+def settings_service(monkeypatch):
+    settings_service = get_settings_service()
+    monkeypatch.setattr(settings_service.settings, "llm_cache_backend", "memory")
+    monkeypatch.setattr(settings_service.settings, "llm_cache_max_size", 10)
+    return settings_service
+
+
+def test_key_covers_model_parameters_bound_arguments_and_messages():
+    messages = [SystemMessage(content="Be brief."), HumanMessage(content="Hi")]
+    model = FakeListChatModel(responses=["Hello"])
+
+    key = llm_cache_key(model, messages)
+
+    # Ids of the messages do not matter
+    assert key == llm_cache_key(model, [SystemMessage(content="Be brief.", id="1"), HumanMessage(content="Hi", id="2")])
+    assert key != llm_cache_key(model, [HumanMessage(content="Hi")])
+    assert key != llm_cache_key(FakeListChatModel(responses=["Bye"]), messages)
+    assert key != llm_cache_key(model.bind(response_format={"type": "json_object"}), messages)
+    assert llm_cache_key(model.bind(stop=["."]), messages) != llm_cache_key(model.bind(stop=["!"]), messages)
+    assert llm_cache_key(object(), messages) is None
+
+
+def test_responses_are_kept_up_to_the_size_cap(settings_service, monkeypatch):
+    monkeypatch.setattr(settings_service.settings, "llm_cache_max_size", 2)
+    cache = LLMCacheService(settings_service)
+    response = CachedResponse(("Hel", "lo"), {"finish_reason": "stop"})
+
+    assert cache.get("a") is None
+    cache.set("a", response)
+    cache.set("b", response)
+    cache.set("c", response)
+
+    assert cache.get("a") is None
+    assert cache.get("c") == response
+    assert response.content == "Hello"
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(cache) == 2
+
+
+def test_disk_backend_keeps_responses_across_restarts(settings_service, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings_service.settings, "llm_cache_backend", "disk")
+    monkeypatch.setattr(settings_service.settings, "llm_cache_max_size", 2)
+    monkeypatch.setattr(settings_service.settings, "config_dir", str(tmp_path))
+    cache = LLMCacheService(settings_service)
+    for key in ("a", "b", "c"):
+        cache.set(key, CachedResponse((key,), {}))
+    assert len(cache) == 2
+    asyncio.run(cache.teardown())
+
+    cache = LLMCacheService(settings_service)
+
+    assert cache.get("a") is None
+    assert cache.get("c") == CachedResponse(("c",), {})
+    asyncio.run(cache.teardown())
+
+
+def test_disabled_cache_keeps_nothing(settings_service, monkeypatch):
+    monkeypatch.setattr(settings_service.settings, "llm_cache_max_size", 0)
+    cache = LLMCacheService(settings_service)
+
+    cache.set("a", CachedResponse(("a",), {}))
+
+    assert cache.get("a") is None
+    assert not cache.enabled
+
+
+@pytest.fixture
+def llm_cache(settings_service, monkeypatch):
+    cache = LLMCacheService(settings_service)
+    monkeypatch.setattr(model_module, "get_llm_cache_service", lambda: cache)
+    return cache
+
+
+def make_component(model):
+    component = OpenAIModelComponent()
+    component.build_model = lambda: model
+    return component
+
+
+@pytest.mark.usefixtures("llm_cache")
+def test_model_component_reuses_cached_response():
+    model = FakeListChatModel(responses=["First answer", "Second answer"])
+    component = make_component(model)
+
+    first = component.get_chat_result(runnable=model, stream=False, input_value="Hi", system_message="Be brief.")
+    second = component.get_chat_result(runnable=model, stream=False, input_value="Hi", system_message="Be brief.")
+    other = component.get_chat_result(runnable=model, stream=False, input_value="Hello", system_message="Be brief.")
+
+    assert first == second == "First answer"
+    assert other == "Second answer"
+
+
+def test_model_component_replays_cached_stream(llm_cache):
+    model = FakeListChatModel(responses=["Hello", "Something else"])
+    component = make_component(model)
+
+    streamed = [chunk.content for chunk in component.get_chat_result(runnable=model, stream=True, input_value="Hi")]
+    replayed = list(component.get_chat_result(runnable=model, stream=True, input_value="Hi"))
+
+    assert streamed == ["H", "e", "l", "l", "o"]
+    assert [chunk.content for chunk in replayed] == streamed
+    assert llm_cache.hits == 1
+    # A streamed response is also reused by an invocation
+    assert component.get_chat_result(runnable=model, stream=False, input_value="Hi") == "Hello"
+
+
+def test_interrupted_stream_is_not_cached(llm_cache):
+    model = FakeListChatModel(responses=["Hello"])
+    component = make_component(model)
+
+    stream = component.get_chat_result(runnable=model, stream=True, input_value="Hi")
+    next(stream)
+    stream.close()
+
+    assert len(llm_cache) == 0
+
+
+def test_responses_with_tool_calls_are_not_cached(llm_cache):
+    tool_call = {"name": "search", "args": {"query": "langflow"}, "id": "call_1"}
+    model = GenericFakeChatModel(messages=iter([AIMessage(content="", tool_calls=[tool_call]), "Answer"]))
+    component = make_component(model)
+
+    assert component.get_chat_result(runnable=model, stream=False, input_value="Hi") == ""
+    assert component.get_chat_result(runnable=model, stream=False, input_value="Hi") == "Answer"
+    assert llm_cache.hits == 0
+
+    chunks = [
+        AIMessageChunk(content="Let me search. "),
+        AIMessageChunk(content="", tool_call_chunks=[{"name": "search", "args": "{}", "id": "call_1", "index": 0}]),
+    ]
+    assert list(llm_cache.record("key", iter(chunks))) == chunks
+    assert llm_cache.get("key") is None
+    # Only the text answer was cached
+    assert len(llm_cache) == 1
+
+
+def test_cached_message_keeps_response_metadata():
+    response = CachedResponse(("Hi",), {"finish_reason": "stop"})
+
+    assert response.to_message() == AIMessage(content="Hi", response_metadata={"finish_reason": "stop"})
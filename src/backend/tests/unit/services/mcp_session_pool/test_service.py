@@ -0,0 +1,168 @@
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+
+import pytest
+from langflow.components.tools import mcp_stdio
+from langflow.services.deps import get_settings_service
+from langflow.services.mcp_session_pool.service import MCPSessionPoolService, mcp_server_key
+from mcp import types
+
+
+class FakeSession:
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+        self.healthy = True
+        self.list_tools_calls = 0
+
+    async def send_ping(self):
+        if not self.healthy:
+            msg = "Server is gone"
+            raise ConnectionError(msg)
+
+    async def list_tools(self):
+        self.list_tools_calls += 1
+        return types.ListToolsResult(tools=[types.Tool(name="add", inputSchema={"type": "object"})])
+
+    async def call_tool(self, name, arguments=None):
+        return {"session": self.name, "tool": name, "arguments": arguments}
+
+
+class FakeServer:
+    """Opens fake sessions and checks they are closed by the task that opened them."""
+
+    def __init__(self):
+        self.sessions: list[FakeSession] = []
+
+    async def connect(self, exit_stack):
+        return await exit_stack.enter_async_context(self._session())
+
+    @asynccontextmanager
+    async def _session(self):
+        opened_in = asyncio.current_task()
+        session = FakeSession(f"session-{len(self.sessions)}")
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            assert asyncio.current_task() is opened_in
+            session.closed = True
+
+
+async def test_sessions_and_tools_are_reused():
+    pool, server = MCPSessionPoolService(get_settings_service()), FakeServer()
+    try:
+        handle = pool.get_server("server", server.connect)
+        assert [tool.name for tool in await handle.list_tools()] == ["add"]
+        await handle.list_tools()
+        result = await pool.get_server("server", server.connect).call_tool("add", {"a": 1})
+
+        assert len(server.sessions) == 1
+        assert server.sessions[0].list_tools_calls == 1
+        assert result == {"session": "session-0", "tool": "add", "arguments": {"a": 1}}
+    finally:
+        await pool.teardown()
+    assert server.sessions[0].closed
+    assert len(pool) == 0
+
+
+async def test_concurrent_requests_open_one_session():
+    pool, server = MCPSessionPoolService(get_settings_service()), FakeServer()
+    try:
+        await asyncio.gather(*(pool.get_session("server", server.connect) for _ in range(5)))
+        assert len(server.sessions) == 1
+    finally:
+        await pool.teardown()
+
+
+async def test_unhealthy_and_dead_sessions_are_replaced(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "mcp_session_health_check_interval", 0)
+    pool, server = MCPSessionPoolService(get_settings_service()), FakeServer()
+    try:
+        first = await pool.get_session("server", server.connect)
+        first.healthy = False
+        second = await pool.get_session("server", server.connect)
+        assert second is not first
+        assert first.closed
+
+        # The task holding the session ends when its transport fails
+        pool._sessions["server"].task.cancel()
+        await asyncio.sleep(0)
+        third = await pool.get_session("server", server.connect)
+        assert third is not second
+    finally:
+        await pool.teardown()
+
+
+async def test_least_recently_used_session_is_closed_at_the_limit(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "mcp_max_sessions", 2)
+    pool, server = MCPSessionPoolService(get_settings_service()), FakeServer()
+    try:
+        first = await pool.get_session("first", server.connect)
+        second = await pool.get_session("second", server.connect)
+        await pool.get_session("first", server.connect)
+        await pool.get_session("third", server.connect)
+
+        assert len(pool) == 2
+        assert second.closed
+        assert not first.closed
+    finally:
+        await pool.teardown()
+
+
+async def test_idle_sessions_are_closed(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "mcp_session_idle_timeout", 0.05)
+    pool, server = MCPSessionPoolService(get_settings_service()), FakeServer()
+    try:
+        session = await pool.get_session("server", server.connect)
+        for _ in range(50):
+            if session.closed:
+                break
+            await asyncio.sleep(0.02)
+        assert session.closed
+        assert len(pool) == 0
+    finally:
+        await pool.teardown()
+
+
+async def test_failed_connections_are_not_pooled():
+    pool = MCPSessionPoolService(get_settings_service())
+
+    async def connect(_exit_stack):
+        msg = "Cannot start the server"
+        raise OSError(msg)
+
+    with pytest.raises(OSError, match="Cannot start the server"):
+        await pool.get_session("server", connect)
+    assert len(pool) == 0
+    await pool.teardown()
+
+
+def test_server_keys_depend_on_all_parts():
+    assert mcp_server_key("sse", "http://a", {"x": "1"}) == mcp_server_key("sse", "http://a", {"x": "1"})
+    assert mcp_server_key("sse", "http://a", {"x": "1"}) != mcp_server_key("sse", "http://a", {"x": "2"})
+
+
+async def test_stdio_server_process_is_reused(tmp_path, monkeypatch):
+    script = tmp_path / "server.py"
+    await asyncio.to_thread(
+        script.write_text,
+        "from mcp.server.fastmcp import FastMCP\n"
+        "server = FastMCP('test')\n"
+        "@server.tool()\n"
+        "def add(a: int, b: int) -> int:\n"
+        "    return a + b\n"
+        "server.run()\n",
+    )
+    pool = MCPSessionPoolService(get_settings_service())
+    monkeypatch.setattr(mcp_stdio, "get_mcp_session_pool_service", lambda: pool)
+    client = mcp_stdio.MCPStdioClient()
+    try:
+        server = client.get_server(f"{sys.executable} {script}")
+        assert [tool.name for tool in await server.list_tools()] == ["add"]
+        result = await client.get_server(f"{sys.executable} {script}").call_tool("add", {"a": 1, "b": 2})
+        assert result.content[0].text == "3"
+        assert len(pool) == 1
+    finally:
+        await pool.teardown()
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from langflow.components.processing import SplitTextComponent
+from langflow.components.processing.dataframe_operations import DataFrameOperationsComponent
+from langflow.custom.custom_component import component as component_module
+from langflow.schema import Data, DataFrame
+from langflow.services.deps import get_settings_service
+from langflow.services.process_pool.service import ProcessPoolService
+
+
+@pytest.fixture
+async def process_pool(monkeypatch):
+    settings_service = get_settings_service()
+    monkeypatch.setattr(settings_service.settings, "component_process_pool_size", 1)
+    service = ProcessPoolService(settings_service)
+    monkeypatch.setattr(component_module, "get_process_pool_service", lambda: service)
+    await service.start()
+    yield service
+    await service.teardown()
+
+
+def split_text_component():
+    return SplitTextComponent(
+        data_inputs=[Data(text="This is a test.\nIt has multiple lines.\nEach line should be a chunk.")],
+        chunk_overlap=0,
+        chunk_size=15,
+        separator="\n",
+    )
+
+
+async def test_outputs_match_in_process_execution(process_pool):
+    expected = await asyncio.to_thread(split_text_component().split_text)
+
+    component = split_text_component()
+    result = await process_pool.run_component_output(component, "split_text")
+
+    assert result == expected
+    assert component.status == expected
+    assert process_pool._executor is not None
+
+
+async def test_cpu_bound_outputs_run_in_the_pool(process_pool, monkeypatch):
+    submitted = []
+    run_component_output = process_pool.run_component_output
+
+    async def spy(component, method_name):
+        submitted.append(method_name)
+        return await run_component_output(component, method_name)
+
+    monkeypatch.setattr(process_pool, "run_component_output", spy)
+    component = DataFrameOperationsComponent(
+        df=DataFrame(pd.DataFrame({"A": [3, 1, 2]})), operation="Sort", column_name="A", ascending=True
+    )
+
+    results, _ = await component.build_results()
+
+    assert submitted == ["perform_operation"]
+    assert results["output"]["A"].tolist() == [1, 2, 3]
+
+
+async def test_unpicklable_inputs_run_in_a_thread(process_pool, monkeypatch):
+    component = split_text_component()
+    component._attributes["lock"] = threading.Lock()
+    submit = MagicMock(side_effect=AssertionError("The pool should not be used"))
+    monkeypatch.setattr(process_pool._get_executor(), "submit", submit)
+
+    result = await process_pool.run_component_output(component, "split_text")
+
+    assert [data.text for data in result] == [
+        "This is a test.",
+        "It has multiple lines.",
+        "Each line should be a chunk.",
+    ]
+    submit.assert_not_called()
+
+
+async def test_disabled_pool_runs_outputs_in_threads(monkeypatch):
+    settings_service = get_settings_service()
+    monkeypatch.setattr(settings_service.settings, "component_process_pool_size", 0)
+    service = ProcessPoolService(settings_service)
+    monkeypatch.setattr(component_module, "get_process_pool_service", lambda: service)
+
+    results, _ = await split_text_component().build_results()
+
+    assert len(results["chunks"]) == 3
+    assert service._executor is None
@@ -0,0 +1,104 @@
+import asyncio
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from langflow.services.deps import get_settings_service
+from langflow.services.task.backends.local import LocalBackend
+from langflow.services.task.service import TaskService
+
+
+@pytest.fixture
+def task_service(monkeypatch):
+    settings_service = get_settings_service()
+    monkeypatch.setattr(settings_service.settings, "task_max_workers", 2)
+    monkeypatch.setattr(settings_service.settings, "task_max_results", 3)
+    return TaskService(settings_service)
+
+
+async def test_tasks_run_in_the_background_on_a_bounded_pool(task_service):
+    release = asyncio.Event()
+    running = {"now": 0, "max": 0}
+
+    async def work(value):
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+        await release.wait()
+        running["now"] -= 1
+        return value
+
+    try:
+        launched = [await task_service.launch_task(work, value) for value in range(3)]
+        await asyncio.sleep(0.01)
+        assert [task.status for _, task in launched] == ["STARTED", "STARTED", "PENDING"]
+        assert all(uuid.UUID(task_id) for task_id, _ in launched)
+        stats = task_service.get_stats()
+        assert (stats["backend"], stats["queue_depth"], stats["running"]) == ("local", 1, 2)
+
+        release.set()
+        results = [await task_service.backend.wait_for_result(task) for _, task in launched]
+        assert results == [0, 1, 2]
+        assert running["max"] == 2
+        assert task_service.get_task(launched[0][0]).result == 0
+        assert task_service.get_stats()["run_latency"] is not None
+    finally:
+        await task_service.teardown()
+
+
+async def test_failed_tasks_keep_their_exception(task_service):
+    async def fail():
+        msg = "Task failed"
+        raise ValueError(msg)
+
+    try:
+        with pytest.raises(ValueError, match="Task failed"):
+            await task_service.launch_and_await_task(fail)
+        task_id, task = await task_service.launch_task(fail)
+        with pytest.raises(ValueError, match="Task failed"):
+            await task.wait()
+        assert task_service.get_task(task_id).status == "FAILURE"
+        assert isinstance(task.result, ValueError)
+        assert "fail" in task.traceback
+    finally:
+        await task_service.teardown()
+
+
+async def test_results_are_evicted_by_ttl_and_lru():
+    backend = LocalBackend(max_workers=2, max_results=2, result_ttl=3600)
+
+    async def work(value):
+        return value
+
+    try:
+        launched = []
+        for value in range(2):
+            task_id, task = await backend.launch_task(work, value)
+            await task.wait()
+            launched.append(task_id)
+        # Reading the first result makes the second the least recently used
+        assert backend.get_task(launched[0]) is not None
+        third_id, third = await backend.launch_task(work, 2)
+        await third.wait()
+        assert backend.get_task(launched[1]) is None
+        assert backend.get_task(launched[0]) is not None
+
+        backend.result_ttl = 0
+        assert backend.get_task(third_id) is None
+        assert len(backend.tasks) == 0
+    finally:
+        await backend.teardown()
+
+
+async def test_celery_results_are_awaited_without_blocking(monkeypatch):
+    pytest.importorskip("celery")
+    from langflow.services.task.backends import celery as celery_backend
+
+    monkeypatch.setattr(celery_backend, "RESULT_POLL_INTERVAL", 0.001)
+    checks = iter([False, False, True])
+    result = MagicMock()
+    result.ready.side_effect = lambda: next(checks)
+    result.get.return_value = "done"
+
+    backend = celery_backend.CeleryBackend()
+    assert await backend.wait_for_result(result) == "done"
+    assert result.ready.call_count == 3
@@ -1,12 +1,17 @@
+from contextlib import asynccontextmanager
 from datetime import datetime
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from langflow.services.auth import utils as auth_utils
 from langflow.services.database.models.variable.model import VariableUpdate
 from langflow.services.deps import get_settings_service
 from langflow.services.settings.constants import VARIABLES_TO_GET_FROM_ENVIRONMENT
-from langflow.services.variable.constants import CREDENTIAL_TYPE
+from langflow.services.variable import resolver as resolver_module
+from langflow.services.variable.cache import ResolvedVariable
+from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
+from langflow.services.variable.resolver import VariableResolver
 from langflow.services.variable.service import DatabaseVariableService
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import SQLModel
@@ -240,3 +245,61 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+async def test_get_variables(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "first", "value1", session=session)
+    await service.create_variable(user_id, "second", "value2", type_=GENERIC_TYPE, session=session)
+    await service.create_variable(uuid4(), "third", "value3", session=session)
+
+    result = await service.get_variables(user_id, ["first", "second", "third", "missing"], session=session)
+
+    assert result == {
+        "first": ResolvedVariable(type=CREDENTIAL_TYPE, value="value1"),
+        "second": ResolvedVariable(type=GENERIC_TYPE, value="value2"),
+    }
+
+
+async def test_get_variable__cached_until_changed(service, session: AsyncSession):
+    user_id = uuid4()
+    name = "name"
+    variable = await service.create_variable(user_id, name, "value", session=session)
+    assert await service.get_variable(user_id, name, "", session=session) == "value"
+
+    # Changed behind the back of the service, the cached value is still returned
+    variable.value = auth_utils.encrypt_api_key("changed", settings_service=service.settings_service)
+    session.add(variable)
+    await session.commit()
+    assert await service.get_variable(user_id, name, "", session=session) == "value"
+
+    await service.update_variable(user_id, name, "updated", session=session)
+    assert await service.get_variable(user_id, name, "", session=session) == "updated"
+
+    await service.delete_variable(user_id, name, session=session)
+    with pytest.raises(ValueError, match=f"{name} variable not found."):
+        await service.get_variable(user_id, name, "", session=session)
+
+
+async def test_variable_resolver_fetches_names_at_once(service, session: AsyncSession, monkeypatch):
+    user_id = uuid4()
+    await service.create_variable(user_id, "first", "value1", session=session)
+    await service.create_variable(user_id, "second", "value2", session=session)
+
+    @asynccontextmanager
+    async def session_scope():
+        yield session
+
+    monkeypatch.setattr(resolver_module, "get_variable_service", lambda: service)
+    monkeypatch.setattr(resolver_module, "session_scope", session_scope)
+    resolver = VariableResolver(user_id, ["first", "second", "missing"])
+
+    with patch.object(service, "get_variables", wraps=service.get_variables) as get_variables:
+        assert await resolver.get_variable("first", "") == "value1"
+        assert await resolver.get_variable("second", "") == "value2"
+        with pytest.raises(TypeError):
+            await resolver.get_variable("second", "session_id")
+        get_variables.assert_called_once_with(user_id, ["first", "missing", "second"], session)
+
+        with pytest.raises(ValueError, match="missing variable not found."):
+            await resolver.get_variable("missing", "")
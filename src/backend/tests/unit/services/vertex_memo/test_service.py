@@ -0,0 +1,101 @@
+import asyncio
+import functools
+from uuid import uuid4
+
+import pytest
+from langflow.components.inputs import ChatInput, TextInputComponent
+from langflow.components.outputs import TextOutputComponent
+from langflow.components.processing import CombineTextComponent
+from langflow.graph import Graph
+from langflow.graph.vertex.memo import UnfingerprintableValueError, fingerprint_value
+from langflow.schema.message import Message
+from langflow.services.deps import get_settings_service
+from langflow.services.vertex_memo.service import VertexMemoService
+
+
+def test_fingerprint_ignores_message_ids_and_timestamps():
+    first = Message(text="hello", sender="User", session_id="session")
+    second = Message(text="hello", sender="User", session_id="session")
+    second.timestamp = "2020-01-01 00:00:00 UTC"
+
+    assert fingerprint_value(first) == fingerprint_value(second)
+    assert fingerprint_value(first) != fingerprint_value(Message(text="bye", sender="User", session_id="session"))
+    with pytest.raises(UnfingerprintableValueError):
+        fingerprint_value(object())
+
+
+@pytest.fixture(params=["memory", "disk"])
+def settings_service(request, monkeypatch, tmp_path):
+    settings_service = get_settings_service()
+    monkeypatch.setattr(settings_service.settings, "vertex_memo_backend", request.param)
+    monkeypatch.setattr(settings_service.settings, "config_dir", str(tmp_path))
+    return settings_service
+
+
+async def test_service_returns_a_copy_of_the_memoized_outputs(settings_service):
+    service = await asyncio.to_thread(VertexMemoService, settings_service)
+    outputs = {"results": {"text": Message(text="hello")}, "artifacts": {}}
+
+    assert await service.get("key") is None
+    await service.set("key", outputs)
+    memoized = await service.get("key")
+
+    assert memoized["results"]["text"].text == "hello"
+    assert memoized["results"]["text"] is not outputs["results"]["text"]
+    assert (service.hits, service.misses) == (1, 1)
+    # Outputs that cannot be pickled are skipped
+    await service.set("lambda", {"results": {"text": lambda: None}})
+    assert await service.get("lambda") is None
+    await service.teardown()
+
+
+async def test_disabled_service_memoizes_nothing(monkeypatch):
+    settings_service = get_settings_service()
+    monkeypatch.setattr(settings_service.settings, "vertex_memo_max_size", 0)
+    service = VertexMemoService(settings_service)
+
+    await service.set("key", {"results": {}})
+
+    assert not service.enabled
+    assert await service.get("key") is None
+
+
+def build_graph(text: str) -> Graph:
+    chat_input = ChatInput(_id="ChatInput-memo")
+    chat_input.set(should_store_message=False)
+    text_input = TextInputComponent(_id="TextInput-memo")
+    text_input.set(input_value=text)
+    combine = CombineTextComponent(_id="CombineText-memo")
+    combine.set(text1=text_input.text_response, text2=chat_input.message_response, delimiter=" ")
+    text_output = TextOutputComponent(_id="TextOutput-memo")
+    text_output.set(input_value=combine.combine_texts)
+    graph = Graph(chat_input, text_output)
+    graph.prepare()
+    return graph
+
+
+async def test_graph_reuses_memoized_outputs_for_the_same_inputs(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "vertex_memo_backend", "memory")
+    service = VertexMemoService(get_settings_service())
+    monkeypatch.setattr("langflow.graph.vertex.base.get_vertex_memo_service", lambda: service)
+    calls = []
+    combine_texts = CombineTextComponent.combine_texts
+
+    @functools.wraps(combine_texts)
+    def counting_combine_texts(self) -> Message:
+        calls.append(self.text2)
+        return combine_texts(self)
+
+    monkeypatch.setattr(CombineTextComponent, "combine_texts", counting_combine_texts)
+    prefix = uuid4().hex
+
+    async def run(text):
+        outputs = await build_graph(prefix).arun([{"input_value": text}], outputs=["TextOutput-memo"])
+        return outputs[0].outputs[0].results["text"].text
+
+    assert await run("a") == f"{prefix} a"
+    assert await run("a") == f"{prefix} a"
+    assert await run("b") == f"{prefix} b"
+
+    assert calls == ["a", "b"]
+    assert service.hits == 1
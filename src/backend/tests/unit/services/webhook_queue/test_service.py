@@ -0,0 +1,251 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from langflow.services.deps import get_settings_service
+from langflow.services.webhook_queue import service as webhook_queue_service
+from langflow.services.webhook_queue.service import (
+    NonRetryableWebhookError,
+    WebhookQueueFullError,
+    WebhookQueueService,
+)
+
+
+@pytest.fixture
+def settings_service(monkeypatch, tmp_path):
+    settings_service = get_settings_service()
+    monkeypatch.setattr(settings_service.settings, "config_dir", str(tmp_path))
+    monkeypatch.setattr(settings_service.settings, "webhook_retry_backoff", 0.01)
+    return settings_service
+
+
+async def wait_until_ready(service, task_id):
+    for _ in range(200):
+        task = await service.get_task(task_id)
+        if task.ready():
+            return task
+        await asyncio.sleep(0.01)
+    pytest.fail(f"Task {task_id} did not finish")
+
+
+async def test_runs_respect_global_and_per_flow_limits(settings_service, monkeypatch):
+    monkeypatch.setattr(settings_service.settings, "webhook_max_concurrency", 3)
+    monkeypatch.setattr(settings_service.settings, "webhook_max_concurrency_per_flow", 2)
+    service = WebhookQueueService(settings_service)
+    release = asyncio.Event()
+    running: dict[str, int] = {}
+    peaks = {"total": 0, "flow_a": 0}
+
+    async def run_flow(task):
+        running[task.flow_id] = running.get(task.flow_id, 0) + 1
+        peaks["total"] = max(peaks["total"], sum(running.values()))
+        peaks["flow_a"] = max(peaks["flow_a"], running.get("flow_a", 0))
+        await release.wait()
+        running[task.flow_id] -= 1
+        return {"payload": task.payload}
+
+    service.run_flow = run_flow
+    try:
+        task_ids = [await service.enqueue(flow_id="flow_a", user_id=None, payload=str(i)) for i in range(4)]
+        task_ids += [await service.enqueue(flow_id="flow_b", user_id=None, payload=str(i)) for i in range(2)]
+        await asyncio.sleep(0.1)
+        statuses = [(await service.get_task(task_id)).status for task_id in task_ids]
+        assert statuses.count("STARTED") == 3
+        assert statuses[:4].count("STARTED") == 2
+
+        release.set()
+        tasks = [await wait_until_ready(service, task_id) for task_id in task_ids]
+    finally:
+        await service.teardown()
+
+    assert peaks == {"total": 3, "flow_a": 2}
+    assert all(task.status == "SUCCESS" for task in tasks)
+    assert tasks[0].result == {"payload": "0"}
+
+
+async def test_queue_refuses_runs_when_full(settings_service, monkeypatch):
+    monkeypatch.setattr(settings_service.settings, "webhook_queue_max_size", 2)
+    service = WebhookQueueService(settings_service)
+    release = asyncio.Event()
+
+    async def run_flow(_task):
+        await release.wait()
+
+    service.run_flow = run_flow
+    try:
+        await service.enqueue(flow_id="flow", user_id=None, payload="")
+        task_id = await service.enqueue(flow_id="flow", user_id=None, payload="")
+        with pytest.raises(WebhookQueueFullError):
+            await service.enqueue(flow_id="flow", user_id=None, payload="")
+
+        release.set()
+        await wait_until_ready(service, task_id)
+        await service.enqueue(flow_id="flow", user_id=None, payload="")
+    finally:
+        await service.teardown()
+
+
+async def test_failed_runs_are_retried_with_backoff(settings_service, monkeypatch):
+    monkeypatch.setattr(settings_service.settings, "webhook_max_retries", 2)
+    service = WebhookQueueService(settings_service)
+    attempts: dict[str, int] = {}
+
+    async def run_flow(task):
+        attempts[task.payload] = task.attempts
+        if task.payload == "flaky" and task.attempts < 2:
+            msg = "Temporary failure"
+            raise RuntimeError(msg)
+        if task.payload == "broken":
+            msg = "Permanent failure"
+            raise RuntimeError(msg)
+        if task.payload == "deleted":
+            msg = "Flow not found"
+            raise NonRetryableWebhookError(msg)
+        return "done"
+
+    service.run_flow = run_flow
+    try:
+        flaky = await service.enqueue(flow_id="flow", user_id=None, payload="flaky")
+        broken = await service.enqueue(flow_id="flow", user_id=None, payload="broken")
+        deleted = await service.enqueue(flow_id="flow", user_id=None, payload="deleted")
+        flaky_task = await wait_until_ready(service, flaky)
+        broken_task = await wait_until_ready(service, broken)
+        deleted_task = await wait_until_ready(service, deleted)
+    finally:
+        await service.teardown()
+
+    assert (flaky_task.status, flaky_task.result) == ("SUCCESS", "done")
+    assert (broken_task.status, broken_task.result) == ("FAILURE", "Permanent failure")
+    assert "run_flow" in broken_task.traceback
+    assert deleted_task.status == "FAILURE"
+    assert attempts == {"flaky": 2, "broken": 3, "deleted": 1}
+
+
+async def test_queued_and_interrupted_runs_survive_a_restart(settings_service, monkeypatch):
+    monkeypatch.setattr(settings_service.settings, "webhook_max_concurrency", 1)
+    service = WebhookQueueService(settings_service)
+    started = asyncio.Event()
+
+    async def hang(_task):
+        started.set()
+        await asyncio.Event().wait()
+
+    service.run_flow = hang
+    first = await service.enqueue(flow_id="flow", user_id=None, payload="first")
+    second = await service.enqueue(flow_id="flow", user_id=None, payload="second")
+    await started.wait()
+    await service.teardown()
+
+    restarted = WebhookQueueService(settings_service)
+    assert (await restarted.get_task(first)).status == "STARTED"
+
+    async def run_flow(task):
+        return task.payload
+
+    restarted.run_flow = run_flow
+    try:
+        await restarted.start()
+        assert (await wait_until_ready(restarted, first)).result == "first"
+        assert (await wait_until_ready(restarted, second)).result == "second"
+    finally:
+        await restarted.teardown()
+    assert await restarted.get_task("unknown") is None
+
+
+def test_workers_never_claim_the_same_run(settings_service, monkeypatch):
+    monkeypatch.setattr(settings_service.settings, "webhook_queue_max_size", 0)
+    workers = [WebhookQueueService(settings_service) for _ in range(4)]
+    task_ids = [workers[0]._insert("flow", None, str(i)) for i in range(50)]
+
+    def claim_all(worker):
+        claimed = []
+        while (task := worker._claim_next([])) is not None:
+            claimed.append(task.id)
+        return claimed
+
+    try:
+        with ThreadPoolExecutor(len(workers)) as executor:
+            claimed = [task_id for task_ids_ in executor.map(claim_all, workers) for task_id in task_ids_]
+    finally:
+        for worker in workers:
+            worker._close()
+
+    assert sorted(claimed) == sorted(task_ids)
+
+
+async def test_runs_of_a_live_worker_are_only_taken_over_when_its_lease_expires(settings_service, monkeypatch):
+    monkeypatch.setattr(webhook_queue_service, "WEBHOOK_LEASE_TIME", 0.3)
+    monkeypatch.setattr(webhook_queue_service, "WEBHOOK_MAINTENANCE_INTERVAL", 0.05)
+    worker_a = WebhookQueueService(settings_service)
+    started = asyncio.Event()
+
+    async def hang(_task):
+        started.set()
+        await asyncio.Event().wait()
+
+    worker_a.run_flow = hang
+    worker_b = WebhookQueueService(settings_service)
+    ran_by_b = []
+
+    async def run_flow(task):
+        ran_by_b.append(task.payload)
+        return task.payload
+
+    worker_b.run_flow = run_flow
+    try:
+        task_id = await worker_a.enqueue(flow_id="flow", user_id=None, payload="first")
+        await started.wait()
+        await worker_b.start()
+        await asyncio.sleep(0.6)
+        assert (await worker_b.get_task(task_id)).status == "STARTED"
+        assert ran_by_b == []
+
+        # The worker stops without releasing its runs
+        for task in (worker_a._maintenance, worker_a._dispatcher, *worker_a._running.values()):
+            task.cancel()
+        task = await wait_until_ready(worker_b, task_id)
+    finally:
+        await worker_b.teardown()
+        await worker_a.teardown()
+
+    assert (task.status, task.result, task.attempts) == ("SUCCESS", "first", 2)
+    assert ran_by_b == ["first"]
+
+
+async def test_finished_runs_are_removed_after_their_retention(settings_service, monkeypatch):
+    monkeypatch.setattr(webhook_queue_service, "WEBHOOK_MAINTENANCE_INTERVAL", 0.05)
+    monkeypatch.setattr(settings_service.settings, "webhook_task_retention_time", 1)
+    service = WebhookQueueService(settings_service)
+
+    async def run_flow(task):
+        return task.payload
+
+    service.run_flow = run_flow
+    try:
+        task_id = await service.enqueue(flow_id="flow", user_id=None, payload="done")
+        await wait_until_ready(service, task_id)
+        deadline = time.monotonic() + 5
+        while await service.get_task(task_id) is not None:
+            assert time.monotonic() < deadline, "The finished run was not removed"
+            await asyncio.sleep(0.05)
+    finally:
+        await service.teardown()
+
+
+def test_runs_stopping_their_worker_are_not_retried_forever(settings_service, monkeypatch):
+    monkeypatch.setattr(settings_service.settings, "webhook_max_retries", 1)
+    service = WebhookQueueService(settings_service)
+    task_id = service._insert("flow", None, "")
+    try:
+        for attempt in (1, 2):
+            assert service._claim_next([]).attempts == attempt
+            # The worker is killed by the run, its lease expires
+            service._execute("UPDATE webhook_task SET lease_expires_at = 0")
+        assert service._claim_next([]) is None
+        row = service._fetchone("SELECT status, error FROM webhook_task WHERE id = ?", (task_id,))
+    finally:
+        service._close()
+
+    assert row["status"] == "FAILURE"
+    assert "stopped" in row["error"]
@@ -50,6 +50,44 @@ async def test_build_flow_with_frozen_path(client, json_memory_chatbot_no_llm, l
     await check_messages(flow_id)
 
 
+async def test_build_flow_events_can_be_replayed(client, json_memory_chatbot_no_llm, logged_in_headers):
+    flow_id = await _create_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
+
+    async with client.stream("POST", f"api/v1/build/{flow_id}/flow", json={}, headers=logged_in_headers) as r:
+        build_id = r.headers["X-Langflow-Build-Id"]
+        events = [json.loads(line) async for line in r.aiter_lines() if line]
+    assert [event["seq"] for event in events] == list(range(6))
+
+    response = await client.get(f"api/v1/build/{flow_id}/events/{build_id}?after_seq=3", headers=logged_in_headers)
+    replayed = [json.loads(line) for line in response.text.splitlines() if line]
+    assert replayed == events[4:]
+
+    response = await client.get(f"api/v1/build/{flow_id}/events/unknown", headers=logged_in_headers)
+    assert response.status_code == 404
+
+
+async def test_detached_build_survives_a_disconnect(client, json_memory_chatbot_no_llm, logged_in_headers):
+    flow_id = await _create_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
+
+    async with client.stream(
+        "POST", f"api/v1/build/{flow_id}/flow?detached=true", json={}, headers=logged_in_headers
+    ) as r:
+        build_id = r.headers["X-Langflow-Build-Id"]
+        async for line in r.aiter_lines():
+            if line:
+                # Disconnect after the first event
+                assert json.loads(line)["event"] == "vertices_sorted"
+                break
+
+    async with client.stream(
+        "GET", f"api/v1/build/{flow_id}/events/{build_id}?after_seq=0", headers=logged_in_headers
+    ) as r:
+        events = [json.loads(line) async for line in r.aiter_lines() if line]
+    assert [event["seq"] for event in events] == list(range(1, 6))
+    assert events[-1]["event"] == "end"
+    await check_messages(flow_id)
+
+
 async def check_messages(flow_id):
     messages = await aget_messages(flow_id=UUID(flow_id), order="ASC")
     assert len(messages) == 2
@@ -1,10 +1,13 @@
 import asyncio
+import gzip
 from uuid import UUID, uuid4
 
+import orjson
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 from langflow.custom.directory_reader.directory_reader import DirectoryReader
+from langflow.interface.components import render_all_types_dict
 from langflow.services.deps import get_settings_service
 
 
@@ -127,6 +130,49 @@ async def test_get_all(client: AsyncClient, logged_in_headers):
     assert "ChatOutput" in json_response["outputs"]
 
 
+async def test_get_all_is_compressed_and_revalidated(client: AsyncClient, logged_in_headers):
+    response = await client.get("api/v1/all", headers={**logged_in_headers, "Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    etag = response.headers["etag"]
+    assert etag.startswith('"')
+    assert "ChatInput" in response.json()["inputs"]
+
+    response = await client.get("api/v1/all", headers={**logged_in_headers, "Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == etag
+
+    response = await client.get("api/v1/all", headers={**logged_in_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert not response.content
+
+    response = await client.get("api/v1/all", headers={**logged_in_headers, "If-None-Match": '"stale"'})
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, deflate", "gzip"),
+        ("deflate, gzip;q=0", None),
+        ("*", "gzip"),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_all_types_catalog_negotiates_encoding(accept_encoding, expected):
+    catalog = render_all_types_dict({"inputs": {"ChatInput": {"display_name": "Chat Input"}}})
+
+    assert catalog.negotiate(accept_encoding) == expected
+    assert gzip.decompress(catalog.encodings["gzip"]) == catalog.body
+    assert catalog.matches(f'"other", {catalog.etag}')
+    assert catalog.matches(f"W/{catalog.etag}")
+    assert not catalog.matches('"other"')
+
+
 async def test_post_validate_code(client: AsyncClient):
     # Test case with a valid import and function
     code1 = """
@@ -452,6 +498,19 @@ async def test_successful_run_with_input_type_chat(client: AsyncClient, simple_a
     )
 
 
+async def test_streamed_run_ends_with_the_whole_result(client: AsyncClient, simple_api_test, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+    long_text = "a" * 25_000
+    payload = {"input_type": "chat", "output_type": "chat", "input_value": long_text}
+    response = await client.post(f"/api/v1/run/{simple_api_test['id']}?stream=true", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    events = [orjson.loads(line) for line in response.text.splitlines() if line.strip()]
+    assert events[-1]["event"] == "end"
+    result_data = events[-1]["data"]["result"]["outputs"][0]["outputs"][0]
+    assert result_data["messages"][0]["message"] == long_text
+    assert result_data["artifacts"]["message"] == long_text
+
+
 @pytest.mark.benchmark
 async def test_invalid_run_with_input_type_chat(client, simple_api_test, created_api_key):
     headers = {"x-api-key": created_api_key.api_key}
@@ -508,6 +567,44 @@ async def test_successful_run_with_input_type_any(client, simple_api_test, creat
     )
 
 
+async def test_successful_batch_run(client, simple_api_test, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    payload = {
+        "input_type": "chat",
+        "output_type": "chat",
+        "input_values": ["value1", "value2", "value3"],
+        "max_concurrency": 2,
+    }
+    response = await client.post(f"/api/v1/run/batch/{flow_id}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    json_response = response.json()
+    assert "session_id" in json_response
+    outer_outputs = json_response["outputs"]
+    assert [outputs_dict["inputs"] for outputs_dict in outer_outputs] == [
+        {"input_value": "value1"},
+        {"input_value": "value2"},
+        {"input_value": "value3"},
+    ]
+    for outputs_dict, input_value in zip(outer_outputs, ["value1", "value2", "value3"], strict=True):
+        assert len(outputs_dict["outputs"]) == 1
+        assert outputs_dict["outputs"][0]["results"]["message"]["text"] == input_value
+    # Each input runs in its own session
+    assert json_response["session_ids"] == [f"{flow_id}-{index}" for index in range(3)]
+
+    payload["session_ids"] = ["a", "b", "c"]
+    response = await client.post(f"/api/v1/run/batch/{flow_id}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["session_ids"] == ["a", "b", "c"]
+
+    payload["session_ids"] = ["a"]
+    response = await client.post(f"/api/v1/run/batch/{flow_id}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
+
+    response = await client.post(f"/api/v1/run/batch/{flow_id}", headers=headers, json={"input_values": []})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
+
+
 async def test_invalid_flow_id(client, created_api_key):
     headers = {"x-api-key": created_api_key.api_key}
     flow_id = "invalid-flow-id"
@@ -0,0 +1,57 @@
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import TextOutputComponent
+from langflow.graph import Graph
+from langflow.processing.flow_plan import FlowPlanCache, fingerprint_tweaks
+
+
+def _flow_data() -> dict:
+    chat_input = ChatInput(_id="ChatInput-abc12")
+    text_output = TextOutputComponent(_id="TextOutput-xyz12")
+    text_output.set(input_value=chat_input.message_response)
+    return Graph(chat_input, text_output).dump()["data"]
+
+
+def test_fingerprint_tweaks_is_order_independent():
+    assert fingerprint_tweaks({"a": 1, "b": {"c": 2}}) == fingerprint_tweaks({"b": {"c": 2}, "a": 1})
+    assert fingerprint_tweaks({"a": 1}) != fingerprint_tweaks({"a": 1}, stream=True)
+
+
+def test_flow_plan_cache_hits_and_invalidates():
+    cache = FlowPlanCache(max_size=2)
+    flow_data = _flow_data()
+    kwargs = {"flow_id": "flow-id", "flow_name": "Flow", "flow_data": flow_data, "updated_at": "2024-01-01"}
+
+    plan = cache.get_or_build(**kwargs, tweaks=None)
+    assert cache.get_or_build(**kwargs, tweaks=None) is plan
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    tweaked = cache.get_or_build(**kwargs, tweaks={"ChatInput-abc12": {"sender_name": "tweaked"}})
+    assert tweaked is not plan
+    assert tweaked.graph.get_vertex("ChatInput-abc12").raw_params["sender_name"] == "tweaked"
+    # The flow data of the caller is never modified by the tweaks
+    chat_input_node = next(node for node in flow_data["nodes"] if node["id"] == "ChatInput-abc12")
+    assert chat_input_node["data"]["node"]["template"]["sender_name"]["value"] != "tweaked"
+
+    cache.invalidate("flow-id")
+    assert len(cache) == 0
+    assert cache.get_or_build(**kwargs, tweaks=None) is not plan
+
+
+def test_flow_plan_cache_evicts_least_recently_used():
+    cache = FlowPlanCache(max_size=1)
+    flow_data = _flow_data()
+    first = cache.get_or_build(flow_id="a", flow_name=None, flow_data=flow_data, updated_at=None, tweaks=None)
+    cache.get_or_build(flow_id="b", flow_name=None, flow_data=flow_data, updated_at=None, tweaks=None)
+    assert len(cache) == 1
+    assert (
+        cache.get_or_build(flow_id="a", flow_name=None, flow_data=flow_data, updated_at=None, tweaks=None) is not first
+    )
+
+
+def test_flow_plan_instances_are_isolated():
+    cache = FlowPlanCache()
+    plan = cache.get_or_build(flow_id="flow-id", flow_name="Flow", flow_data=_flow_data(), updated_at=None, tweaks=None)
+    graph = plan.instantiate(user_id="user")
+    assert graph is not plan.graph
+    assert graph.user_id == "user"
+    assert graph.get_vertex("TextOutput-xyz12") is not plan.graph.get_vertex("TextOutput-xyz12")
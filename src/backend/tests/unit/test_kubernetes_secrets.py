@@ -4,6 +4,10 @@ from uuid import UUID
 
 import pytest
 from kubernetes.client import V1ObjectMeta, V1Secret
+from langflow.services.deps import get_settings_service
+from langflow.services.variable.cache import ResolvedVariable
+from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
+from langflow.services.variable.kubernetes import KubernetesSecretService
 from langflow.services.variable.kubernetes_secrets import KubernetesSecretManager, encode_user_id
 
 
@@ -105,3 +109,25 @@ def test_uuid_case_insensitivity():
     result_upper = encode_user_id(uuid_upper)
     result_lower = encode_user_id(uuid_lower)
     assert result_upper == result_lower
+
+
+@pytest.mark.usefixtures("_mock_kube_config")
+async def test_kubernetes_service_get_variables_reads_secret_once(mocker):
+    service = KubernetesSecretService(get_settings_service())
+    get_secret = mocker.patch.object(
+        service.kubernetes_secrets,
+        "get_secret",
+        return_value={"plain": "value1", f"{CREDENTIAL_TYPE}_secret": "value2"},
+    )
+    user_id = UUID("12345678-1234-5678-1234-567812345678")
+
+    variables = await service.get_variables(user_id, ["plain", "secret", "missing"], session=None)
+
+    assert variables == {
+        "plain": ResolvedVariable(type=GENERIC_TYPE, value="value1"),
+        "secret": ResolvedVariable(type=CREDENTIAL_TYPE, value="value2"),
+    }
+    assert await service.get_variable(user_id, "secret", "", session=None) == "value2"
+    with pytest.raises(TypeError):
+        await service.get_variable(user_id, "secret", "session_id", session=None)
+    get_secret.assert_called_once_with(name=encode_user_id(user_id))
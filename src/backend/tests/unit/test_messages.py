@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from uuid import UUID, uuid4
 
 import pytest
@@ -8,6 +8,7 @@ from langflow.memory import (
     add_messages,
     adelete_messages,
     aget_messages,
+    aget_messages_page,
     astore_message,
     aupdate_messages,
     delete_messages,
@@ -356,3 +357,50 @@ async def test_aupdate_message_with_nested_properties(created_message):
     assert updated[0].properties.allow_markdown is True
     assert updated[0].properties.state == "complete"
     assert updated[0].properties.targets == []
+
+
+@pytest.mark.usefixtures("client")
+async def test_aget_messages_page_keyset_pagination():
+    session_id = str(uuid4())
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # The second and third messages share a timestamp, so pages must break ties by id
+    timestamps = [start, start + timedelta(seconds=1), start + timedelta(seconds=1), start + timedelta(seconds=2)]
+    async with session_scope() as session:
+        await aadd_messagetables(
+            [
+                MessageTable(
+                    text=f"Message {i}",
+                    sender="User",
+                    sender_name="User",
+                    session_id=session_id,
+                    timestamp=timestamp,
+                    category="message",
+                )
+                for i, timestamp in enumerate(timestamps)
+            ],
+            session,
+        )
+
+    pages = []
+    cursor = None
+    while True:
+        messages, cursor = await aget_messages_page(session_id=session_id, limit=3, cursor=cursor)
+        pages.append([message.text for message in messages])
+        if cursor is None:
+            break
+
+    assert len(pages) == 2
+    texts = [text for page in pages for text in page]
+    assert texts[0] == "Message 3"
+    assert texts[-1] == "Message 0"
+    assert sorted(texts[1:3]) == ["Message 1", "Message 2"]
+
+    ascending, cursor = await aget_messages_page(session_id=session_id, order="ASC", limit=2)
+    assert [message.text for message in ascending] == ["Message 0", *texts[2:1:-1]]
+    rest = await aget_messages(session_id=session_id, order="ASC", cursor=cursor)
+    assert [message.text for message in rest] == [texts[1], "Message 3"]
+
+
+async def test_aget_messages_rejects_cursor_without_timestamp_order():
+    with pytest.raises(ValueError, match="requires ordering by timestamp"):
+        await aget_messages(order_by="sender", cursor="anything")
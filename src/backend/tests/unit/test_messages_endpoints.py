@@ -127,3 +127,27 @@ async def test_no_messages_found_with_given_session_id(client, logged_in_headers
 
     assert response.status_code == 404, response.text
     assert response.json()["detail"] == "Not Found"
+
+
+async def test_get_messages_keyset_pagination(client: AsyncClient, created_messages, logged_in_headers):  # noqa: ARG001
+    params = {"session_id": "session_id2", "limit": 2}
+    response = await client.get("api/v1/monitor/messages", headers=logged_in_headers, params=params)
+    assert response.status_code == 200, response.text
+    first_page = response.json()
+    assert len(first_page) == 2
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = await client.get(
+        "api/v1/monitor/messages", headers=logged_in_headers, params={**params, "cursor": cursor}
+    )
+    assert response.status_code == 200, response.text
+    second_page = response.json()
+    assert len(second_page) == 1
+    assert "X-Next-Cursor" not in response.headers
+    ids = {message["id"] for message in first_page + second_page}
+    assert len(ids) == 3
+
+
+async def test_get_messages_invalid_cursor(client: AsyncClient, logged_in_headers):
+    response = await client.get("api/v1/monitor/messages", headers=logged_in_headers, params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
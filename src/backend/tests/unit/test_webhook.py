@@ -1,3 +1,5 @@
+import asyncio
+
 import aiofiles
 import anyio
 import pytest
@@ -8,11 +10,25 @@ def _check_openai_api_key_in_environment_variables():
     pass
 
 
-async def test_webhook_endpoint(client, added_webhook_test):
+async def wait_for_task(client, task_id):
+    for _ in range(300):
+        response = await client.get(f"api/v1/task/{task_id}")
+        assert response.status_code == 200
+        if response.json()["status"] in {"SUCCESS", "FAILURE"}:
+            return response.json()
+        await asyncio.sleep(0.1)
+    pytest.fail(f"Task {task_id} did not finish")
+
+
+async def test_webhook_endpoint(client, added_webhook_test, monkeypatch):
     # The test is as follows:
     # 1. The flow when run will get a "path" from the payload and save a file with the path as the name.
     # We will create a temporary file path and send it to the webhook endpoint, then check if the file exists.
     # 2. we will delete the file, then send an invalid payload to the webhook endpoint and check if the file exists.
+    from langflow.services.deps import get_webhook_queue_service
+
+    # Only the file matters here, do not wait for retries of the run
+    monkeypatch.setattr(get_webhook_queue_service(), "max_retries", 0)
     endpoint_name = added_webhook_test["endpoint_name"]
     endpoint = f"api/v1/webhook/{endpoint_name}"
     # Create a temporary file
@@ -23,7 +39,8 @@ async def test_webhook_endpoint(client, added_webhook_test):
 
         response = await client.post(endpoint, json=payload)
         assert response.status_code == 202
-        # Wait a few seconds for the file to be created
+        # Wait for the queued run to finish
+        await wait_for_task(client, response.json()["task_id"])
         assert await file_path.exists(), f"File {file_path} does not exist"
     file_does_not_exist = not await file_path.exists()
     assert file_does_not_exist, f"File {file_path} still exists"
@@ -32,6 +49,7 @@ async def test_webhook_endpoint(client, added_webhook_test):
     payload = {"invalid_key": "invalid_value"}
     response = await client.post(endpoint, json=payload)
     assert response.status_code == 202
+    await wait_for_task(client, response.json()["task_id"])
     assert not await file_path.exists(), f"File {file_path} should not exist"
 
 
@@ -56,3 +74,30 @@ async def test_webhook_with_random_payload(client, added_webhook_test):
         json="Random Payload",
     )
     assert response.status_code == 202
+
+
+async def test_webhook_queue_full(client, added_webhook_test, monkeypatch, tmp_path):
+    from langflow.services.deps import get_webhook_queue_service
+
+    queue = get_webhook_queue_service()
+    # Start from an empty queue
+    await queue.teardown()
+    monkeypatch.setattr(queue, "path", tmp_path / "webhook_queue.db")
+    await queue.start()
+    release = asyncio.Event()
+
+    async def run_flow(_task):
+        await release.wait()
+
+    monkeypatch.setattr(queue, "run_flow", run_flow)
+    monkeypatch.setattr(queue, "max_size", 1)
+    endpoint = f"api/v1/webhook/{added_webhook_test['endpoint_name']}"
+    first = await client.post(endpoint, json={"path": "unused"})
+    assert first.status_code == 202
+    response = await client.post(endpoint, json={"path": "unused"})
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+
+    release.set()
+    task = await wait_for_task(client, first.json()["task_id"])
+    assert task["status"] == "SUCCESS"
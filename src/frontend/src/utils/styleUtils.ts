@@ -487,6 +487,7 @@ export const nodeColorsName: { [char: string]: string } = {
   BaseChatMessageHistory: "orange",
   Memory: "orange",
   DataFrame: "pink",
+  DataBatch: "red",
 };
 
 export const SIDEBAR_CATEGORIES = [